@@ -18,8 +18,16 @@ from pathlib import Path
 from flask import Flask, jsonify, request
 from flask_cors import CORS
 from werkzeug.utils import secure_filename
-from supabase_client import get_supabase_client
+from supabase_client import (
+    SUPABASE_PAGE_SIZE,
+    execute_concurrently,
+    get_read_coalescing_metrics,
+    get_supabase_client,
+    get_supabase_pool_metrics,
+    iter_query_rows,
+)
 from bet_resolution import resolve_all_pending_bets
+from query_metrics import get_query_metrics
 from runtime_state import (
     clear_dashboard_summary_failures,
     evaluate_runtime_alerts,
@@ -62,7 +70,6 @@ DRF_PARSE_TIMEOUT_SECONDS = int(os.getenv("DRF_PARSE_TIMEOUT_SECONDS", "240"))
 DRF_PARSE_WORKERS = max(int(os.getenv("DRF_PARSE_WORKERS", "1")), 1)
 FILTER_OPTIONS_CACHE_SECONDS = int(os.getenv("FILTER_OPTIONS_CACHE_SECONDS", "30"))
 SCHEDULER_HEARTBEAT_STALE_SECONDS = int(os.getenv("SCHEDULER_HEARTBEAT_STALE_SECONDS", "7200"))
-SUPABASE_PAGE_SIZE = int(os.getenv("SUPABASE_PAGE_SIZE", "1000"))
 parse_executor = ThreadPoolExecutor(max_workers=DRF_PARSE_WORKERS, thread_name_prefix="drf-parser")
 atexit.register(parse_executor.shutdown, wait=False, cancel_futures=True)
 
@@ -151,34 +158,46 @@ def _with_canonical_track_options(tracks):
 def _fetch_all_track_options(supabase, page_size=SUPABASE_PAGE_SIZE):
     """Return every track that has race data without relying on capped API defaults."""
     unique_tracks = {}
-    start = 0
-
-    while True:
-        end = start + page_size - 1
-        response = supabase.table('hranalyzer_races')\
-            .select('track_code, hranalyzer_tracks(track_name)')\
-            .order('track_code')\
-            .range(start, end)\
-            .execute()
+    query = supabase.table('hranalyzer_races')\
+        .select('track_code, hranalyzer_tracks(track_name)')\
+        .order('track_code')
 
-        rows = response.data or []
-        for row in rows:
-            code = (row.get('track_code') or '').strip()
-            if not code:
-                continue
-
-            unique_tracks[code] = {
-                'name': _track_name_from_row(row) or code,
-                'code': code
-            }
+    for row in iter_query_rows(query, page_size=page_size):
+        code = (row.get('track_code') or '').strip()
+        if not code:
+            continue
 
-        if len(rows) < page_size:
-            break
-        start += page_size
+        unique_tracks[code] = {
+            'name': _track_name_from_row(row) or code,
+            'code': code
+        }
 
     return _with_canonical_track_options(unique_tracks.values())
 
 
+def _fetch_race_dates(supabase, through_date, page_size=SUPABASE_PAGE_SIZE):
+    """
+    Every date with races up to `through_date`, newest first, read from the
+    hranalyzer_race_dates view (one row per date, see schema_updates_race_dates_view.sql).
+    Falls back to paging race rows when the view has not been deployed yet.
+    """
+    dates_query = supabase.table('hranalyzer_race_dates')\
+        .select('race_date')\
+        .lte('race_date', through_date)\
+        .order('race_date', desc=True)
+    try:
+        return [row['race_date'] for row in iter_query_rows(dates_query, page_size=page_size)]
+    except Exception as e:
+        logger.warning(f"hranalyzer_race_dates view unavailable, paging race rows instead: {e}")
+
+    race_rows_query = supabase.table('hranalyzer_races')\
+        .select('race_date')\
+        .lte('race_date', through_date)\
+        .order('race_date', desc=True)
+    unique_dates = set(row['race_date'] for row in iter_query_rows(race_rows_query, page_size=page_size))
+    return sorted(unique_dates, reverse=True)
+
+
 def allowed_file(filename):
     """Check if file extension is allowed"""
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
@@ -355,6 +374,27 @@ def live_health_check():
     })
 
 
+@app.route('/api/health/database-pool', methods=['GET'])
+def database_pool_health_check():
+    """Internal view of Supabase client pool occupancy, rotations, and retries."""
+    return jsonify({
+        'service': 'backend',
+        'pool': get_supabase_pool_metrics(),
+        'read_coalescing': get_read_coalescing_metrics(),
+    })
+
+
+@app.route('/api/health/database-queries', methods=['GET'])
+def database_query_metrics():
+    """Internal per-query latency histograms, heaviest PostgREST call shapes first."""
+    top = request.args.get('top', default=25, type=int)
+    sort_by = request.args.get('sort', default='total_ms')
+    return jsonify({
+        'service': 'backend',
+        'queries': get_query_metrics(top=top, sort_by=sort_by),
+    })
+
+
 @app.route('/api/auth/status', methods=['GET'])
 def auth_status():
     return jsonify({
@@ -785,22 +825,19 @@ def get_todays_races():
         if not raw_races:
             return jsonify({'races': [], 'count': 0, 'date': today})
 
-        # 2. Batch fetch ALL entries for these races (Single Query Optimization)
+        # 2. Batch fetch ALL entries and claims for these races in parallel
         race_ids = [r['id'] for r in raw_races]
-        
-        entries_response = supabase.table('hranalyzer_race_entries')\
-            .select('race_id, id, program_number, finish_position, hranalyzer_horses(horse_name), hranalyzer_trainers(trainer_name)')\
-            .in_('race_id', race_ids)\
-            .execute()
-            
-        all_entries = entries_response.data
 
-        # 2.5 Get Claims for these races
-        claims_response = supabase.table('hranalyzer_claims')\
-            .select('race_id')\
-            .in_('race_id', race_ids)\
-            .execute()
-        
+        entries_response, claims_response = execute_concurrently(
+            supabase.table('hranalyzer_race_entries')\
+                .select('race_id, id, program_number, finish_position, hranalyzer_horses(horse_name), hranalyzer_trainers(trainer_name)')\
+                .in_('race_id', race_ids),
+            supabase.table('hranalyzer_claims')\
+                .select('race_id')\
+                .in_('race_id', race_ids),
+        )
+
+        all_entries = entries_response.data
         races_with_claims = set(c['race_id'] for c in claims_response.data)
 
         # 3. Process entries in memory
@@ -927,15 +964,8 @@ def get_filter_options():
 
         supabase = get_supabase_client()
 
-        # 1. Get all distinct dates
-        dates_response = supabase.table('hranalyzer_races')\
-            .select('race_date')\
-            .order('race_date', desc=True)\
-            .limit(1500)\
-            .execute()
-        
-        all_unique_dates = set(r['race_date'] for r in dates_response.data)
-        unique_dates = sorted([d for d in all_unique_dates if d <= today], reverse=True)
+        # 1. Get all distinct dates from the date-level view, so older history is never cut off
+        unique_dates = _fetch_race_dates(supabase, today)
 
         # 2. Get every distinct track with race data. This must page through
         # Supabase rows; a single capped query can silently omit tracks.
@@ -1203,18 +1233,40 @@ def get_race_details(race_key):
 
         race = race_response.data
 
-        # Get all entries for this race
-        # Join with horses, jockeys, and trainers
-        entries_response = supabase.table('hranalyzer_race_entries')\
-            .select('''
-                *, 
-                hranalyzer_horses(horse_name, sire, dam, color, sex),
-                hranalyzer_jockeys(jockey_name),
-                hranalyzer_trainers(trainer_name)
-            ''')\
-            .eq('race_id', race['id'])\
-            .order('program_number')\
-            .execute()
+        # Robustness: Strip whitespace and ensure string format
+        track_c = str(race.get('track_code', '')).strip()
+        race_d = str(race.get('race_date', ''))
+
+        # Entries, sibling races (for navigation) and, for completed races, exotic
+        # payouts and claims are independent reads, so fetch them in parallel.
+        queries = [
+            supabase.table('hranalyzer_race_entries')\
+                .select('''
+                    *, 
+                    hranalyzer_horses(horse_name, sire, dam, color, sex),
+                    hranalyzer_jockeys(jockey_name),
+                    hranalyzer_trainers(trainer_name)
+                ''')\
+                .eq('race_id', race['id'])\
+                .order('program_number'),
+            supabase.table('hranalyzer_races')\
+                .select('race_key, race_number')\
+                .eq('track_code', track_c)\
+                .eq('race_date', race_d)\
+                .order('race_number'),
+        ]
+        if race['race_status'] == 'completed':
+            queries.extend([
+                supabase.table('hranalyzer_exotic_payouts')\
+                    .select('*')\
+                    .eq('race_id', race['id']),
+                supabase.table('hranalyzer_claims')\
+                    .select('*')\
+                    .eq('race_id', race['id']),
+            ])
+
+        responses = execute_concurrently(*queries)
+        entries_response, siblings_response = responses[0], responses[1]
 
         entries = []
         for entry in entries_response.data:
@@ -1250,37 +1302,15 @@ def get_race_details(race_key):
                 'show_payout': entry['show_payout']
             })
 
-        # Get exotic payouts and claims if this is a completed race
+        # Exotic payouts and claims are only fetched for completed races
         exotic_payouts = []
         claims = []
         if race['race_status'] == 'completed':
-            exotics_response = supabase.table('hranalyzer_exotic_payouts')\
-                .select('*')\
-                .eq('race_id', race['id'])\
-                .execute()
-            exotic_payouts = exotics_response.data
-            
-            claims_response = supabase.table('hranalyzer_claims')\
-                .select('*')\
-                .eq('race_id', race['id'])\
-                .execute()
-            claims = claims_response.data
-
-
+            exotic_payouts = responses[2].data
+            claims = responses[3].data
 
         # Add navigation logic (Next/Prev Race)
         # Find sibling races (same track, same date)
-        # Robustness: Strip whitespace and ensure string format
-        track_c = str(race.get('track_code', '')).strip()
-        race_d = str(race.get('race_date', ''))
-        
-        siblings_response = supabase.table('hranalyzer_races')\
-            .select('race_key, race_number')\
-            .eq('track_code', track_c)\
-            .eq('race_date', race_d)\
-            .order('race_number')\
-            .execute()
-            
         siblings = siblings_response.data
         if siblings:
             # Find current index
@@ -0,0 +1,99 @@
+"""
+Micro-benchmark for the precompiled late-change and chart text patterns.
+
+Runs every `*_RE` pattern from crawl_scratches and crawl_equibase over saved feed and
+chart text twice: once the old inline way (`re.search(pattern, text, flags)`, which pays
+the re-module cache lookup on every call) and once through the compiled registry.
+
+Usage: python backend/benchmark_patterns.py [--iterations N]
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent))
+
+import crawl_equibase
+import crawl_scratches
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+RSS_FIXTURE = REPO_ROOT / "dump_rss.xml"
+HTML_FIXTURES = (REPO_ROOT / "debug_gp_html.html", REPO_ROOT / "dump_cancellations.html")
+CHART_FIXTURE = REPO_ROOT / "debug_sa_race7.pdf"
+
+
+def _registry(module):
+    return [
+        value for name, value in sorted(vars(module).items())
+        if name.endswith("_RE") and isinstance(value, re.Pattern)
+    ]
+
+
+def _feed_lines():
+    lines = []
+    for _pub_date, desc in crawl_scratches._iter_rss_items_streaming(RSS_FIXTURE.read_text(encoding="utf-8")):
+        lines.extend(line for line in crawl_scratches.RSS_LINE_BREAK_RE.split(desc) if line.strip())
+    for path in HTML_FIXTURES:
+        if path.exists():
+            lines.extend(line for line in path.read_text(encoding="utf-8", errors="ignore").splitlines() if line.strip())
+    return lines
+
+
+def _chart_lines():
+    if not CHART_FIXTURE.exists():
+        return []
+    with crawl_equibase.pdfplumber.open(str(CHART_FIXTURE)) as pdf:
+        text = "\n".join(page.extract_text() or "" for page in pdf.pages)
+    return [line for line in text.split("\n") if line.strip()]
+
+
+def _time(fn, iterations):
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return time.perf_counter() - started
+
+
+def _compare(label, patterns, lines, iterations):
+    def inline():
+        for pattern in patterns:
+            source, flags = pattern.pattern, pattern.flags
+            for line in lines:
+                re.search(source, line, flags)
+
+    def compiled():
+        for pattern in patterns:
+            search = pattern.search
+            for line in lines:
+                search(line)
+
+    inline_s = _time(inline, iterations)
+    compiled_s = _time(compiled, iterations)
+    calls = len(patterns) * len(lines) * iterations
+    print(
+        f"{label:<28} {len(patterns):>3} patterns x {len(lines):>4} lines  "
+        f"inline {inline_s * 1e9 / calls:7.0f} ns/call  compiled {compiled_s * 1e9 / calls:7.0f} ns/call  "
+        f"speedup {inline_s / compiled_s:4.2f}x"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    feed_lines = _feed_lines()
+    chart_lines = _chart_lines()
+
+    _compare("crawl_scratches (feeds)", _registry(crawl_scratches), feed_lines, args.iterations)
+    if chart_lines:
+        _compare("crawl_equibase (chart)", _registry(crawl_equibase), chart_lines, args.iterations)
+    else:
+        print(f"Chart fixture missing at {CHART_FIXTURE}; skipping chart patterns")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,8 @@
 import logging
 from datetime import datetime, timedelta
 
+from supabase_client import fetch_all_rows
+
 logger = logging.getLogger(__name__)
 
 def resolve_all_pending_bets(supabase):
@@ -12,16 +14,19 @@ def resolve_all_pending_bets(supabase):
     Returns: Dict with resolution stats
     """
     try:
-        # 1. Get all pending bets
-        pending_bets = supabase.table('hranalyzer_bets')\
-            .select('*, hranalyzer_races(race_status, id, race_date, is_cancelled)')\
-            .eq('status', 'Pending')\
-            .execute()
-            
+        # 1. Get all pending bets. Page through them up front: resolving flips status away
+        # from Pending, which would shift offsets if pages were read while updating.
+        pending_bets = fetch_all_rows(
+            supabase.table('hranalyzer_bets')
+            .select('*, hranalyzer_races(race_status, id, race_date, is_cancelled)')
+            .eq('status', 'Pending')
+            .order('id')
+        )
+
         resolved_count = 0
         updated_bets = []
         
-        if not pending_bets.data:
+        if not pending_bets:
             return {
                 'success': True,
                 'resolved_count': 0,
@@ -33,7 +38,7 @@ def resolve_all_pending_bets(supabase):
         # Optimization: Group by race_id
         
         bets_by_race = {}
-        for bet in pending_bets.data:
+        for bet in pending_bets:
             race = bet.get('hranalyzer_races')
             if not race:
                 continue
@@ -0,0 +1,161 @@
+"""
+Browser Pool Module
+Long-lived headless browser workers, so a WAF fallback costs a page load instead of a browser boot.
+
+Each worker owns one browser on its own thread (Playwright's sync API is bound to the thread
+that started it), runs jobs serially, and recycles the browser by age, use count and idle time.
+
+Pools are per process and currently back only the late-changes (scratches) Playwright fallback.
+The results crawler runs in the Equibase worker process and keeps its own shared Selenium session
+(crawl_equibase.get_shared_equibase_webdriver); a pool here cannot hand browsers across that boundary.
+"""
+
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+logger = logging.getLogger(__name__)
+
+BROWSER_POOL_SIZE = max(int(os.getenv("BROWSER_POOL_SIZE", "1")), 1)
+BROWSER_POOL_IDLE_SECONDS = float(os.getenv("BROWSER_POOL_IDLE_SECONDS", "300"))
+
+
+class BrowserUnavailable(RuntimeError):
+    """Raised when a worker cannot provide a browser (headroom gate closed or launch failed)."""
+
+
+class BrowserWorker:
+    def __init__(self, name, launch, close, admit=None, max_age_seconds=900, max_uses=18,
+                 idle_seconds=BROWSER_POOL_IDLE_SECONDS):
+        self.name = name
+        self._launch = launch
+        self._close_resource = close
+        self._admit = admit
+        self.max_age_seconds = max_age_seconds
+        self.max_uses = max_uses
+        self.idle_seconds = idle_seconds
+        self._jobs = queue.Queue()
+        self._thread = None
+        self._thread_lock = threading.Lock()
+        self.resource = None
+        self.created_at = 0.0
+        self.uses = 0
+        self.launches = 0
+        self.recycles = 0
+
+    @property
+    def backlog(self):
+        return self._jobs.qsize()
+
+    def _ensure_thread(self):
+        with self._thread_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name=f"browser-{self.name}", daemon=True)
+                self._thread.start()
+
+    def submit(self, job, timeout):
+        """Run `job(resource)` on the worker thread and wait up to `timeout` seconds for its result."""
+        future = Future()
+        self._ensure_thread()
+        self._jobs.put((job, future))
+        return future.result(timeout=timeout)
+
+    def shutdown(self):
+        with self._thread_lock:
+            thread = self._thread
+        if thread is not None and thread.is_alive():
+            self._jobs.put(None)
+            thread.join(timeout=10)
+
+    def _recycle(self, reason):
+        if self.resource is None:
+            return
+        try:
+            self._close_resource(self.resource)
+        except Exception as exc:
+            logger.debug("Error closing %s browser: %s", self.name, exc)
+        self.resource = None
+        self.recycles += 1
+        logger.info("Recycled %s browser after %s use(s) (%s)", self.name, self.uses, reason)
+
+    def _checkout(self):
+        if self.resource is not None:
+            if time.time() - self.created_at > self.max_age_seconds:
+                self._recycle("max age")
+            elif self.uses >= self.max_uses:
+                self._recycle("max uses")
+
+        if self.resource is None:
+            if self._admit is not None and not self._admit():
+                raise BrowserUnavailable(f"{self.name} browser skipped: headroom gate closed")
+            resource = self._launch()
+            if resource is None:
+                raise BrowserUnavailable(f"{self.name} browser could not be launched")
+            self.resource = resource
+            self.created_at = time.time()
+            self.uses = 0
+            self.launches += 1
+            logger.info("Launched %s browser for the shared pool", self.name)
+        return self.resource
+
+    def _run(self):
+        while True:
+            try:
+                item = self._jobs.get(timeout=self.idle_seconds)
+            except queue.Empty:
+                self._recycle("idle")
+                continue
+
+            if item is None:
+                self._recycle("shutdown")
+                return
+
+            job, future = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                resource = self._checkout()
+                self.uses += 1
+                result = job(resource)
+            except BrowserUnavailable as exc:
+                future.set_exception(exc)
+            except Exception as exc:
+                # A job that blew up may have left the browser wedged; start fresh next time.
+                self._recycle(f"job error: {exc}")
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+
+
+class BrowserPool:
+    """A fixed set of BrowserWorkers; jobs go to the worker with the shortest backlog."""
+
+    def __init__(self, name, launch, close, admit=None, size=BROWSER_POOL_SIZE, **worker_options):
+        self.name = name
+        self.workers = [
+            BrowserWorker(f"{name}-{index}", launch, close, admit=admit, **worker_options)
+            for index in range(max(int(size), 1))
+        ]
+        atexit.register(self.shutdown)
+
+    def run(self, job, timeout):
+        worker = min(self.workers, key=lambda candidate: candidate.backlog)
+        return worker.submit(job, timeout)
+
+    def shutdown(self):
+        for worker in self.workers:
+            worker.shutdown()
+
+    def metrics(self):
+        return {
+            "name": self.name,
+            "workers": len(self.workers),
+            "live_browsers": sum(1 for worker in self.workers if worker.resource is not None),
+            "launches": sum(worker.launches for worker in self.workers),
+            "recycles": sum(worker.recycles for worker in self.workers),
+            "backlog": sum(worker.backlog for worker in self.workers),
+        }
@@ -0,0 +1,124 @@
+"""
+Cookie Store Module
+On-disk cookie jar shared by every crawler process, so one browser warm-up that clears the
+Equibase WAF lets the lightweight fetchers (requests, curl_cffi) replay its cookies until they expire.
+
+Entries are keyed by site (the last two host labels): Imperva scopes its cookies to
+`.equibase.com`, so a jar captured on www.equibase.com is valid for tvg/mobile too.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from urllib.parse import urlparse
+
+from runtime_state import RUNTIME_DIR
+
+logger = logging.getLogger(__name__)
+
+COOKIE_STORE_FILE = RUNTIME_DIR / "cookie_store.json"
+COOKIE_STORE_TTL_SECONDS = int(os.getenv("COOKIE_STORE_TTL_SECONDS", str(20 * 60)))
+
+_lock = threading.Lock()
+_cache = {"path": None, "mtime": None, "jars": {}}
+
+
+def site_for(url_or_host):
+    parsed = urlparse(url_or_host or "")
+    host = (parsed.hostname or url_or_host or "").lower().strip(".")
+    labels = host.split(".")
+    return ".".join(labels[-2:]) if len(labels) > 2 else host
+
+
+def _read_locked():
+    path = COOKIE_STORE_FILE
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        _cache.update(path=path, mtime=None, jars={})
+        return _cache["jars"]
+
+    if _cache["path"] == path and _cache["mtime"] == mtime:
+        return _cache["jars"]
+
+    jars = {}
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            raw = json.load(fh)
+        if isinstance(raw, dict):
+            jars = {site: entry for site, entry in raw.items() if isinstance(entry, dict)}
+    except Exception as exc:
+        logger.warning("Ignoring unreadable cookie store at %s: %s", path, exc)
+    _cache.update(path=path, mtime=mtime, jars=jars)
+    return jars
+
+
+def _write_locked(jars):
+    path = COOKIE_STORE_FILE
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=".cookie_store.", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(jars, fh, indent=2, sort_keys=True)
+        os.chmod(tmp_path, 0o600)
+        os.replace(tmp_path, path)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    _cache.update(path=path, mtime=os.stat(path).st_mtime_ns, jars=jars)
+
+
+def store_cookies(url_or_host, cookies, fetched_at=None):
+    """Persist a browser-acquired cookie jar for the site of `url_or_host`."""
+    if not cookies:
+        return
+    site = site_for(url_or_host)
+    with _lock:
+        # Re-read so a jar another process wrote for a different site is not clobbered.
+        jars = dict(_read_locked())
+        jars[site] = {
+            "cookies": {str(name): str(value) for name, value in cookies.items()},
+            "fetched_at": float(fetched_at if fetched_at is not None else time.time()),
+        }
+        try:
+            _write_locked(jars)
+        except Exception as exc:
+            logger.warning("Could not persist cookies for %s: %s", site, exc)
+
+
+def load_cookie_entry(url_or_host, ttl_seconds=None):
+    """Return `{'cookies': ..., 'fetched_at': ...}` for the site, or None when missing or expired."""
+    ttl = COOKIE_STORE_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+    with _lock:
+        entry = _read_locked().get(site_for(url_or_host))
+    if not entry or not entry.get("cookies"):
+        return None
+    if time.time() - float(entry.get("fetched_at", 0.0)) >= ttl:
+        return None
+    return {"cookies": dict(entry["cookies"]), "fetched_at": float(entry["fetched_at"])}
+
+
+def load_cookies(url_or_host, ttl_seconds=None):
+    """Cookies to replay against `url_or_host`, or None when no fresh jar is stored."""
+    entry = load_cookie_entry(url_or_host, ttl_seconds)
+    return entry["cookies"] if entry else None
+
+
+def clear_cookies(url_or_host=None):
+    """Drop the jar for one site (e.g. after it stopped working), or every jar."""
+    with _lock:
+        jars = dict(_read_locked())
+        if url_or_host is None:
+            jars = {}
+        elif jars.pop(site_for(url_or_host), None) is None:
+            return
+        try:
+            _write_locked(jars)
+        except Exception as exc:
+            logger.warning("Could not clear stored cookies: %s", exc)
@@ -1,19 +1,58 @@
 """
 Crawl Equibase Entries (Upcoming Races)
 Parses HTML from Equibase to get upcoming race data
-Uses requests to fetch static pages (bypassing WAF/Selenium instability)
+Fetches static pages in memory through browser-impersonating HTTP clients (bypassing WAF/Selenium
+instability), with PowerShell only as a gated last resort
 """
-import requests
+import hashlib
+import json
 import re
 import logging
+import threading
 import time
 import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from datetime import datetime, date
-from bs4 import BeautifulSoup
-import subprocess
+from urllib.parse import urlparse
+from bs4 import BeautifulSoup, SoupStrainer
 
 from supabase_client import get_supabase_client
-from crawl_equibase import get_or_create_track, get_or_create_participant, normalize_pgm, COMMON_TRACKS
+from cookie_store import clear_cookies, load_cookies
+from fetcher_stats import call_fetcher, order_fetchers, record_fetch, skip_fetch
+from http_sessions import get_cloudscraper_session, get_http_client, get_requests_session, lease_curl_session
+from runtime_state import RUNTIME_DIR
+from crawl_equibase import (
+    COMMON_TRACKS,
+    ENABLE_POWERSHELL_FALLBACK,
+    POWERSHELL_MIN_HEADROOM_BYTES,
+    get_or_create_participant,
+    get_or_create_track,
+    has_heavy_fallback_headroom,
+    heavy_fallback_available,
+    normalize_pgm,
+    record_heavy_fallback_failure,
+    record_heavy_fallback_success,
+    run_bounded_subprocess,
+)
+
+try:
+    import cloudscraper
+except ImportError:  # pragma: no cover - installed in production image
+    cloudscraper = None
+
+try:
+    from curl_cffi import requests as curl_requests
+except ImportError:  # pragma: no cover - installed in some environments only
+    curl_requests = None
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:  # pragma: no cover - stdlib html.parser is used instead
+    HTML_PARSER = 'html.parser'
 
 logger = logging.getLogger(__name__)
 
@@ -33,8 +72,35 @@ NO_CARD_PATTERNS = (
     "404 - file or directory not found",
     "<title>404",
 )
+STATIC_PAGE_HEADERS = {
+    'User-Agent': (
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
+        'AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+    ),
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+}
 
+# DRF schedule is shared on disk so the scheduler, spawned crawl children and restarts reuse one fetch.
+DRF_SCHEDULE_CACHE_FILE = RUNTIME_DIR / "drf_racing_dates.json"
+DRF_SCHEDULE_TTL_SECONDS = int(os.getenv("DRF_SCHEDULE_TTL_SECONDS", str(6 * 60 * 60)))
+# After a failed fetch, wait this long before trying DRF again.
+DRF_SCHEDULE_NEGATIVE_TTL_SECONDS = int(os.getenv("DRF_SCHEDULE_NEGATIVE_TTL_SECONDS", str(10 * 60)))
+# A schedule last fetched longer ago than this is not used at all, so DRF checks answer None
+# rather than a definite "no card" from an outdated schedule while DRF keeps failing.
+DRF_SCHEDULE_MAX_STALE_SECONDS = int(os.getenv("DRF_SCHEDULE_MAX_STALE_SECONDS", str(24 * 60 * 60)))
+
+_drf_schedule_lock = threading.Lock()
 _drf_schedule_cache = None
+_drf_refresh_in_flight = False
+
+ENTRIES_CRAWL_WORKERS = max(int(os.getenv("ENTRIES_CRAWL_WORKERS", "4")), 1)
+# Per-host politeness: at most N requests in flight and a minimum gap between request starts.
+ENTRIES_HOST_CONCURRENCY = max(int(os.getenv("ENTRIES_HOST_CONCURRENCY", "2")), 1)
+ENTRIES_HOST_MIN_INTERVAL_SECONDS = float(os.getenv("ENTRIES_HOST_MIN_INTERVAL_SECONDS", "2.5"))
+ENTRIES_ERROR_BACKOFF_SECONDS = float(os.getenv("ENTRIES_ERROR_BACKOFF_SECONDS", "10"))
+HRN_ENTRIES_HOST = "entries.horseracingnation.com"
+HRN_HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'}
 
 # Map Equibase codes to HRN slugs
 HRN_TRACK_MAP = {
@@ -58,6 +124,43 @@ HRN_TRACK_MAP = {
 }
 
 
+# Precompiled entries-page patterns, shared by every card parse.
+RACE_DIV_ID_RE = re.compile(r'^Race\d+$')
+RACE_DIV_NUMBER_RE = re.compile(r'Race(\d+)')
+ENTRIES_POST_TIME_RE = re.compile(r'(\d{1,2}:\d{2}\s+(?:AM|PM))', re.IGNORECASE)
+JOCKEY_LABEL_RE = re.compile(r'Jockey:', re.IGNORECASE)
+TRAINER_LABEL_RE = re.compile(r'Trainer:', re.IGNORECASE)
+ML_ODDS_LABEL_RE = re.compile(r'M/L Odds:', re.IGNORECASE)
+ML_ODDS_VALUE_RE = re.compile(r'M/L Odds:\s*([\d/]+|[\d\.]+)')
+HORSE_LINK_RE = re.compile(r'type=Horse')
+JOCKEY_LINK_RE = re.compile(r'searchType=J')
+TRAINER_LINK_RE = re.compile(r'searchType=T')
+PARENTHETICAL_SUFFIX_RE = re.compile(r'\s*\(.*?\)')
+FRACTIONAL_ODDS_RE = re.compile(r'^\d+/\d+$')
+NON_DIGIT_RE = re.compile(r'[^\d]')
+HRN_RACE_HEADER_ID_RE = re.compile(r'^race-\d+$')
+HRN_CURRENCY_HEAD_RE = re.compile(r'^\$\d{1,3}$')
+HRN_THREE_DIGITS_RE = re.compile(r'^\d{3}')
+HRN_LEADING_DIGIT_RE = re.compile(r'^\d')
+HRN_DISTANCE_UNIT_RE = re.compile(r'(m|f|y|mile|furlong|yds)')
+HRN_POST_TIME_RE = re.compile(r'(?:Post time:)?\s*(\d{1,2}:\d{2}\s*(?:AM|PM))', re.IGNORECASE)
+HRN_POST_TIME_LOOSE_RE = re.compile(r'\b(\d{1,2}:\d{2}\s*(?:A\.?M\.?|P\.?M\.?))', re.IGNORECASE)
+HRN_DISTANCE_RE = re.compile(r'(\d+(?:\.\d+)?\s*(?:f|furlongs|miles|yards|yds))', re.IGNORECASE)
+HRN_SURFACE_RE = re.compile(r'(Dirt|Turf|Synthetic|All Weather|Inner Turf|Main Track)', re.IGNORECASE)
+HRN_PURSE_RE = re.compile(r'Purse\s*[:\s]*(\$\d{1,3}(?:,\d{3})*)', re.IGNORECASE)
+HRN_CURRENCY_RE = re.compile(r'(\$\d{1,3}(?:,\d{3})+(?:\.\d{2})?)')
+HRN_ENTRY_HEADER_KEYWORDS = ('#', 'pp', 'horse', 'ml', 'jockey', 'trainer', 'morning')
+
+
+def _has_class_fragment(fragment):
+    return lambda value: value and fragment in value
+
+
+HAS_RACE_INFO_CLASS = _has_class_fragment('race-info')
+HAS_SADDLECLOTH_CLASS = _has_class_fragment('saddlecloth')
+HAS_PADDING_SADDLECLOTHS_CLASS = _has_class_fragment('paddingSaddleCloths')
+
+
 def clean_horse_name(raw_name):
     """Normalize display names scraped from entries pages."""
     if not raw_name:
@@ -115,13 +218,104 @@ def parse_drf_racing_dates(html_content):
     return schedule
 
 
-def fetch_drf_racing_dates(force_refresh=False):
-    """Fetch and cache DRF's published track/date schedule."""
+def _serialize_drf_schedule(schedule):
+    return {
+        track: [[start.isoformat(), end.isoformat()] for start, end in ranges]
+        for track, ranges in schedule.items()
+    }
+
+
+def _deserialize_drf_schedule(raw):
+    schedule = {}
+    for track, ranges in (raw or {}).items():
+        parsed = []
+        for start_text, end_text in ranges:
+            try:
+                parsed.append((date.fromisoformat(start_text), date.fromisoformat(end_text)))
+            except (TypeError, ValueError):
+                continue
+        if parsed:
+            schedule[track] = parsed
+    return schedule
+
+
+def _load_drf_schedule_entry():
+    """Return the on-disk schedule entry (re-read only when the file changed), or None."""
     global _drf_schedule_cache
 
-    if _drf_schedule_cache is not None and not force_refresh:
+    path = DRF_SCHEDULE_CACHE_FILE
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return _drf_schedule_cache
+    if _drf_schedule_cache is not None and _drf_schedule_cache.get("mtime") == mtime:
         return _drf_schedule_cache
 
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            raw = json.load(fh)
+        _drf_schedule_cache = {
+            "schedule": _deserialize_drf_schedule(raw.get("schedule")),
+            "fetched_at": raw.get("fetched_at"),
+            "checked_at": float(raw.get("checked_at", 0.0)),
+            "ok": bool(raw.get("ok")),
+            "mtime": mtime,
+        }
+    except Exception as exc:
+        logger.warning(f"Ignoring unreadable DRF schedule cache at {path}: {exc}")
+    return _drf_schedule_cache
+
+
+def _store_drf_schedule_entry(entry):
+    global _drf_schedule_cache
+
+    _drf_schedule_cache = dict(entry, mtime=None)
+    path = DRF_SCHEDULE_CACHE_FILE
+    payload = {
+        "schedule": _serialize_drf_schedule(entry["schedule"]),
+        "fetched_at": entry["fetched_at"],
+        "checked_at": entry["checked_at"],
+        "ok": entry["ok"],
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=".drf_racing_dates.", dir=path.parent)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(payload, fh, sort_keys=True)
+            os.replace(tmp_path, path)
+        except Exception:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        _drf_schedule_cache["mtime"] = os.stat(path).st_mtime_ns
+    except Exception as exc:
+        logger.warning(f"Could not persist DRF schedule cache: {exc}")
+
+
+def _drf_schedule_is_fresh(entry, now):
+    if entry["ok"]:
+        return now - float(entry["fetched_at"] or 0.0) < DRF_SCHEDULE_TTL_SECONDS
+    return now - entry["checked_at"] < DRF_SCHEDULE_NEGATIVE_TTL_SECONDS
+
+
+def _usable_drf_schedule(entry, now):
+    """The entry's schedule, or {} once its last good fetch is older than the max-stale age."""
+    if entry is None or entry["fetched_at"] is None:
+        return {}
+    if now - float(entry["fetched_at"]) >= DRF_SCHEDULE_MAX_STALE_SECONDS:
+        return {}
+    return entry["schedule"]
+
+
+def _refresh_drf_schedule():
+    """
+    Fetch DRF once and record the outcome; a failure keeps the last good schedule until it is
+    older than DRF_SCHEDULE_MAX_STALE_SECONDS, then drops it.
+    """
+    now = time.time()
     try:
         headers = {
             'User-Agent': (
@@ -129,14 +323,59 @@ def fetch_drf_racing_dates(force_refresh=False):
                 'AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
             )
         }
-        response = requests.get(DRF_RACING_DATES_URL, headers=headers, timeout=20)
+        response = get_http_client(DRF_RACING_DATES_URL).get(DRF_RACING_DATES_URL, headers=headers, timeout=20)
         response.raise_for_status()
-        _drf_schedule_cache = parse_drf_racing_dates(response.text)
+        schedule = parse_drf_racing_dates(response.text)
+        if not schedule:
+            raise ValueError("no tracks parsed from DRF racing dates page")
+        entry = {"schedule": schedule, "fetched_at": now, "checked_at": now, "ok": True}
     except Exception as exc:
         logger.warning(f"Failed to fetch DRF racing dates: {exc}")
-        _drf_schedule_cache = {}
+        with _drf_schedule_lock:
+            previous = _load_drf_schedule_entry()
+        schedule = _usable_drf_schedule(previous, now)
+        entry = {
+            "schedule": schedule,
+            "fetched_at": previous["fetched_at"] if schedule else None,
+            "checked_at": now,
+            "ok": False,
+        }
 
-    return _drf_schedule_cache
+    with _drf_schedule_lock:
+        _store_drf_schedule_entry(entry)
+    return entry["schedule"]
+
+
+def _background_drf_refresh():
+    global _drf_refresh_in_flight
+    try:
+        _refresh_drf_schedule()
+    finally:
+        with _drf_schedule_lock:
+            _drf_refresh_in_flight = False
+
+
+def fetch_drf_racing_dates(force_refresh=False):
+    """
+    DRF's published track/date schedule, cached in memory and on disk.
+    A stale schedule is returned immediately while one background refresh runs; only a cold
+    cache (or force_refresh) waits on DRF. Failed fetches are retried after the negative TTL, and
+    a schedule past DRF_SCHEDULE_MAX_STALE_SECONDS is served as empty.
+    """
+    global _drf_refresh_in_flight
+
+    if force_refresh:
+        return _refresh_drf_schedule()
+
+    with _drf_schedule_lock:
+        entry = _load_drf_schedule_entry()
+        if entry is not None:
+            if not _drf_schedule_is_fresh(entry, time.time()) and not _drf_refresh_in_flight:
+                _drf_refresh_in_flight = True
+                threading.Thread(target=_background_drf_refresh, name="drf-schedule-refresh", daemon=True).start()
+            return _usable_drf_schedule(entry, time.time())
+
+    return _refresh_drf_schedule()
 
 
 def track_has_card_via_drf(track_code, race_date, schedule=None):
@@ -164,6 +403,55 @@ def classify_static_page(content, size):
     return "success"
 
 
+class HostRateLimiter:
+    """Per-host concurrency cap plus a minimum spacing between request starts, shared across threads."""
+
+    def __init__(self, concurrency=ENTRIES_HOST_CONCURRENCY, min_interval=ENTRIES_HOST_MIN_INTERVAL_SECONDS):
+        self.concurrency = concurrency
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._semaphores = {}
+        self._next_start = {}
+
+    def _semaphore(self, host):
+        with self._lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.BoundedSemaphore(self.concurrency)
+            return self._semaphores[host]
+
+    def _reserve_start(self, host):
+        with self._lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_start.get(host, 0.0))
+            self._next_start[host] = start_at + self.min_interval
+        return start_at - now
+
+    def backoff(self, url_or_host, seconds):
+        """Push the host's next allowed start out, e.g. after an error."""
+        host = urlparse(url_or_host).hostname or url_or_host
+        with self._lock:
+            self._next_start[host] = max(self._next_start.get(host, 0.0), time.monotonic() + seconds)
+
+    @contextmanager
+    def slot(self, url):
+        host = urlparse(url).hostname or url
+        semaphore = self._semaphore(host)
+        with semaphore:
+            delay = self._reserve_start(host)
+            if delay > 0:
+                time.sleep(delay)
+            yield
+
+
+@contextmanager
+def _rate_limited(limiter, url):
+    if limiter is None:
+        yield
+        return
+    with limiter.slot(url):
+        yield
+
+
 def attach_source_to_races(races, source_name):
     annotated = []
     for race in races or []:
@@ -173,81 +461,163 @@ def attach_source_to_races(races, source_name):
     return annotated
 
 
-def fetch_static_page(url, retries=3):
+def fetch_static_page_via_cookie_replay(url, timeout=20):
     """
-    Fetch static page using PowerShell (Bypassing WAF)
-    Requests/Curl with specific headers failed. PowerShell IWR works.
+    Replay a browser-cleared cookie jar (persisted by any crawler process) with plain requests.
+    Returns a fetch result, or None when no fresh jar is stored or the replay did not get through.
     """
-    temp_file = f"temp_entry_{int(time.time())}.html"
-    last_error = None
-    
+    cookies = load_cookies(url)
+    if not cookies:
+        return None
+
+    try:
+        response = get_requests_session(url).get(url, headers=STATIC_PAGE_HEADERS, cookies=cookies, timeout=timeout)
+    except Exception as e:
+        logger.warning(f"Cookie replay failed for {url}: {e}")
+        return None
+
+    content = response.text
+    size = len(content.encode('utf-8'))
+    classification = classify_static_page(content, size)
+    if classification == "blocked":
+        # The jar has stopped clearing the WAF; drop it so no fetcher keeps replaying it until the TTL runs out.
+        logger.info(f"Stored cookies did not clear the WAF for {url}; dropping them and trying the other fetchers")
+        clear_cookies(url)
+        return None
+    if classification == "success" and response.status_code != 200:
+        return None
+
+    logger.info(f"Fetched {url} by replaying stored browser cookies")
+    return {
+        "status": classification,
+        "content": content,
+        "size": size,
+    }
+
+
+def _classify_fetched_page(status_code, content):
+    """Wrap an in-memory body in the fetch-result shape, using classify_static_page semantics."""
+    content = content or ""
+    size = len(content.encode('utf-8', errors='ignore'))
+    if status_code == 404:
+        return {"status": "no_card", "content": content, "size": size}
+    if status_code >= 500:
+        return None
+    return {"status": classify_static_page(content, size), "content": content, "size": size}
+
+
+def fetch_static_page_via_curl_cffi(url, timeout=20):
+    if curl_requests is None:
+        return skip_fetch()
+    try:
+        with lease_curl_session(url) as session:
+            response = session.get(url, headers=STATIC_PAGE_HEADERS, cookies=load_cookies(url), timeout=timeout)
+        return _classify_fetched_page(response.status_code, response.text)
+    except Exception as e:
+        logger.warning(f"curl_cffi fetch failed for {url}: {e}")
+    return None
+
+
+def fetch_static_page_via_cloudscraper(url, timeout=20):
+    if cloudscraper is None:
+        return skip_fetch()
+    try:
+        scraper = get_cloudscraper_session(url)
+        response = scraper.get(url, headers=STATIC_PAGE_HEADERS, cookies=load_cookies(url), timeout=timeout)
+        return _classify_fetched_page(response.status_code, response.text)
+    except Exception as e:
+        logger.warning(f"cloudscraper fetch failed for {url}: {e}")
+    return None
+
+
+def fetch_static_page_via_powershell(url, timeout=30):
+    """Last resort: Invoke-WebRequest with the body written to stdout, behind the heavy-fallback gates."""
+    if not ENABLE_POWERSHELL_FALLBACK:
+        return skip_fetch()
+    shell = shutil.which("pwsh") or shutil.which("powershell")
+    if shell is None:
+        return skip_fetch()
+    if not heavy_fallback_available('powershell'):
+        return skip_fetch()
+    if not has_heavy_fallback_headroom(POWERSHELL_MIN_HEADROOM_BYTES, "PowerShell entries fallback"):
+        return skip_fetch()
+
+    script = (
+        "$ProgressPreference='SilentlyContinue'; "
+        "[Console]::OutputEncoding=[System.Text.Encoding]::UTF8; "
+        f"(Invoke-WebRequest -Uri '{url}' -UseBasicParsing -TimeoutSec {timeout}).Content"
+    )
+    try:
+        logger.info(f"Fetching {url} via PowerShell")
+        result = run_bounded_subprocess([shell, "-NoLogo", "-NoProfile", "-Command", script], timeout=timeout + 10)
+        if result.returncode != 0:
+            logger.warning(f"PowerShell failed: {result.stderr.strip()}")
+            record_heavy_fallback_failure('powershell')
+            return None
+        page = _classify_fetched_page(200, result.stdout)
+        if page is not None and page["status"] != "blocked":
+            record_heavy_fallback_success('powershell')
+        else:
+            record_heavy_fallback_failure('powershell')
+        return page
+    except Exception as e:
+        logger.warning(f"PowerShell fetch failed for {url}: {e}")
+        record_heavy_fallback_failure('powershell')
+    return None
+
+
+STATIC_PAGE_FETCHERS = (
+    ("curl_cffi", fetch_static_page_via_curl_cffi),
+    ("cloudscraper", fetch_static_page_via_cloudscraper),
+)
+HEAVY_STATIC_PAGE_FETCHERS = (
+    ("powershell", fetch_static_page_via_powershell),
+)
+
+
+def fetch_static_page(url, retries=2):
+    """
+    Fetch a static entries page into memory and classify it (success / no_card / blocked / error).
+    A stored browser cookie jar is replayed first, then the browser-impersonating clients in
+    learned per-host order, and PowerShell only once those are exhausted.
+    """
+    replayed = fetch_static_page_via_cookie_replay(url)
+    if replayed:
+        return replayed
+
+    blocked_result = None
     for attempt in range(retries):
-        try:
-            logger.info(f"Fetching {url} via PowerShell (Attempt {attempt+1})")
-            
-            # Using default UserAgent of PowerShell 5.1/7 seems to work
-            cmd = ["powershell", "-Command", f"Invoke-WebRequest -Uri '{url}' -OutFile '{temp_file}'"]
-            
-            # Run command
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-            
-            if result.returncode == 0 and os.path.exists(temp_file):
-                size = os.path.getsize(temp_file)
-                with open(temp_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-
-                classification = classify_static_page(content, size)
-
-                # Cleanup
-                try:
-                    os.remove(temp_file)
-                except OSError:
-                    pass
-
-                if classification == "success":
-                    return {
-                        "status": "success",
-                        "content": content,
-                        "size": size,
-                    }
-
-                if classification == "no_card":
-                    logger.info(f"Static entries not found for {url} (404/no card).")
-                    return {
-                        "status": "no_card",
-                        "content": content,
-                        "size": size,
-                    }
-
-                logger.warning(f"Downloaded file too small ({size} bytes). Likely blocked.")
-                return {
-                    "status": "blocked",
-                    "content": content,
-                    "size": size,
-                }
-            else:
-                 last_error = result.stderr or "PowerShell failed"
-                 logger.warning(f"PowerShell failed: {result.stderr}")
-                 
-            time.sleep(2)
-            
-        except Exception as e:
-            last_error = str(e)
-            logger.error(f"Error fetching {url}: {e}")
+        chain = list(order_fetchers(url, STATIC_PAGE_FETCHERS)) + list(HEAVY_STATIC_PAGE_FETCHERS)
+        for fetcher_name, fetcher in chain:
+            result, latency, ran = call_fetcher(fetcher, url)
+            if ran:
+                usable = result is not None and result["status"] != "blocked"
+                record_fetch(url, fetcher_name, usable, latency)
+
+            if result is None:
+                continue
+            if result["status"] == "no_card":
+                logger.info(f"Static entries not found for {url} (404/no card).")
+                return result
+            if result["status"] == "success":
+                return result
+            blocked_result = result
+
+        if attempt < retries - 1:
             time.sleep(2)
-            
-    # Cleanup if failed
-    if os.path.exists(temp_file):
-        try: os.remove(temp_file)
-        except: pass
-        
+
+    if blocked_result:
+        logger.warning(f"Downloaded page too small ({blocked_result['size']} bytes). Likely blocked.")
+        return blocked_result
+
     return {
         "status": "error",
         "content": None,
         "size": 0,
-        "error": last_error,
+        "error": "all static page fetchers failed",
     }
 
+
 def parse_entries_html(html_content, track_code, race_date):
     """
     Parse the Equibase Entries HTML page (Static Version)
@@ -256,12 +626,13 @@ def parse_entries_html(html_content, track_code, race_date):
     if not html_content:
         return []
 
-    soup = BeautifulSoup(html_content, 'html.parser')
+    # Only the race containers are built into a tree; navigation, scripts and footers are skipped.
+    soup = BeautifulSoup(html_content, HTML_PARSER, parse_only=SoupStrainer('div', id=RACE_DIV_ID_RE))
     races = []
     
     # 1. Find all Race containers (div id="Race1", "Race2", etc.)
     # In static pages, they are often <div id="RaceX"> ... </div>
-    race_divs = soup.find_all('div', id=re.compile(r'^Race\d+$'))
+    race_divs = soup.find_all('div', id=RACE_DIV_ID_RE)
     
     # logger.info(f"Found {len(race_divs)} race divs in static content")
     
@@ -272,7 +643,7 @@ def parse_entries_html(html_content, track_code, race_date):
             if not race_id_str: continue
             
             # id="Race4"
-            race_number_match = re.search(r'Race(\d+)', race_id_str)
+            race_number_match = RACE_DIV_NUMBER_RE.search(race_id_str)
             if not race_number_match:
                 continue
             race_num = int(race_number_match.group(1))
@@ -281,7 +652,7 @@ def parse_entries_html(html_content, track_code, race_date):
             race_info = race_div.find('div', class_='race-info')
             if not race_info:
                 # Sometimes race-info is not direct child?
-                race_info = race_div.find('div', class_=lambda x: x and 'race-info' in x)
+                race_info = race_div.find('div', class_=HAS_RACE_INFO_CLASS)
             
             post_time = None
             distance_text = None
@@ -305,7 +676,7 @@ def parse_entries_html(html_content, track_code, race_date):
                         # Post Time
                         if "PM" in part or "AM" in part:
                             # 1:26 PM ET
-                            tm_match = re.search(r'(\d{1,2}:\d{2}\s+(?:AM|PM))', part, re.IGNORECASE)
+                            tm_match = ENTRIES_POST_TIME_RE.search(part)
                             if tm_match:
                                 post_time = tm_match.group(1)
                         
@@ -331,7 +702,7 @@ def parse_entries_html(html_content, track_code, race_date):
             if contenders_div:
                 for row in contenders_div.find_all('div', class_='row'):
                     # Check for saddlecloth
-                    saddle_div = row.find('div', class_=lambda x: x and 'saddlecloth' in x)
+                    saddle_div = row.find('div', class_=HAS_SADDLECLOTH_CLASS)
                     if not saddle_div: continue
                     
                     pgm = saddle_div.get_text(strip=True)
@@ -349,24 +720,24 @@ def parse_entries_html(html_content, track_code, race_date):
                     
                     # Jockey
                     jockey = None
-                    mj = row.find(string=re.compile(r'Jockey:', re.IGNORECASE))
+                    mj = row.find(string=JOCKEY_LABEL_RE)
                     if mj and mj.find_parent('div'):
                         a_j = mj.find_parent('div').find('a')
                         if a_j: jockey = a_j.get_text(strip=True)
 
                     # Trainer
                     trainer = None
-                    mt = row.find(string=re.compile(r'Trainer:', re.IGNORECASE))
+                    mt = row.find(string=TRAINER_LABEL_RE)
                     if mt and mt.find_parent('div'):
                          a_t = mt.find_parent('div').find('a')
                          if a_t: trainer = a_t.get_text(strip=True)
                             
                     # Odds
                     odds_ml = None
-                    mo = row.find(string=re.compile(r'M/L Odds:', re.IGNORECASE)) 
+                    mo = row.find(string=ML_ODDS_LABEL_RE)
                     if mo:
                         full_line = mo.parent.get_text() 
-                        omask = re.search(r'M/L Odds:\s*([\d/]+|[\d\.]+)', full_line)
+                        omask = ML_ODDS_VALUE_RE.search(full_line)
                         if omask:
                             odds_ml = omask.group(1)
                     
@@ -407,24 +778,25 @@ def parse_entries_html(html_content, track_code, race_date):
                              cols = row_t.find_all('td')
                              if len(cols) < 3: continue
                              
-                             pgm_div = row_t.find('div', class_=lambda x: x and 'paddingSaddleCloths' in x)
+                             pgm_div = row_t.find('div', class_=HAS_PADDING_SADDLECLOTHS_CLASS)
                              if not pgm_div: continue
                              pgm = pgm_div.get_text(strip=True)
                              
-                             h_link = row_t.find('a', href=re.compile(r'type=Horse'))
+                             h_link = row_t.find('a', href=HORSE_LINK_RE)
                              h_name = h_link.get_text(strip=True) if h_link else "Unknown"
-                             h_name = re.sub(r'\s*\(.*?\)', '', h_name).strip()
+                             h_name = PARENTHETICAL_SUFFIX_RE.sub('', h_name).strip()
                              
-                             j_link = row_t.find('a', href=re.compile(r'searchType=J'))
+                             j_link = row_t.find('a', href=JOCKEY_LINK_RE)
                              j_name = j_link.get_text(strip=True) if j_link else None
                              
-                             t_link = row_t.find('a', href=re.compile(r'searchType=T'))
+                             t_link = row_t.find('a', href=TRAINER_LINK_RE)
                              t_name = t_link.get_text(strip=True) if t_link else None
                              
                              o_ml = None
                              for col in cols:
-                                 if re.match(r'^\d+/\d+$', col.get_text(strip=True)):
-                                     o_ml = col.get_text(strip=True)
+                                 col_text = col.get_text(strip=True)
+                                 if FRACTIONAL_ODDS_RE.match(col_text):
+                                     o_ml = col_text
                                      break
                                      
                              entries.append({
@@ -439,7 +811,7 @@ def parse_entries_html(html_content, track_code, race_date):
             if entries:
                  # Clean Purse string
                  if purse_text:
-                     purse_text = re.sub(r'[^\d]', '', purse_text) 
+                     purse_text = NON_DIGIT_RE.sub('', purse_text)
                      if purse_text: purse_text = f"${purse_text}"
 
                  races.append({
@@ -458,278 +830,295 @@ def parse_entries_html(html_content, track_code, race_date):
             
     return races
 
-def fetch_hrn_entries(track_code, race_date):
+def parse_hrn_entries_html(html_content):
     """
-    Fallback: Fetch entries from HorseRacingNation
+    Parse a HorseRacingNation entries/results page into race dicts (one per entry table).
     """
-    slug = HRN_TRACK_MAP.get(track_code)
-    if not slug:
+    soup = BeautifulSoup(html_content, HTML_PARSER)
+    races = []
+    
+    all_tables = soup.find_all('table')
+    if not all_tables:
         return []
         
-    url = f"https://entries.horseracingnation.com/entries-results/{slug}/{race_date.strftime('%Y-%m-%d')}"
-    logger.info(f"Fallback: Fetching HRN {url}")
+    # Filter for tables that are actually entry tables
+    entry_tables = []
+    table_headers = {}
+    for table in all_tables:
+        headers = [th.get_text(strip=True).lower() for th in table.find_all('th')]
+        # Look for indicators of an entry table
+        # Match count strategy to avoid generic tables (like 'Power Picks') which only have 'Horse'
+        # We need at least 2 matches from the entry-specific columns
+        matches = sum(1 for h in headers if any(k in h for k in HRN_ENTRY_HEADER_KEYWORDS))
+        
+        if matches >= 2:
+            entry_tables.append(table)
+            table_headers[id(table)] = headers
+
+    # One pass over the document for the results-page race headers instead of one search per race.
+    race_headers = {}
+    for element in soup.find_all(id=HRN_RACE_HEADER_ID_RE):
+        race_headers.setdefault(element.get('id'), element)
     
-    try:
-        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'}
-        r = requests.get(url, headers=headers, timeout=20)
+    if not entry_tables:
+        logger.info("No entry tables found on HRN page.")
+        return []
         
-        if r.status_code != 200:
-            logger.warning(f"HRN status {r.status_code}")
-            return []
-            
-        soup = BeautifulSoup(r.text, 'html.parser')
-        races = []
+    for idx, table in enumerate(entry_tables):
+        race_num = idx + 1
+        entries = []
         
-        all_tables = soup.find_all('table')
-        if not all_tables:
-            return []
-            
-        # Filter for tables that are actually entry tables
-        entry_tables = []
-        for table in all_tables:
-            headers = [th.get_text(strip=True).lower() for th in table.find_all('th')]
-            # Look for indicators of an entry table
-            # Match count strategy to avoid generic tables (like 'Power Picks') which only have 'Horse'
-            # We need at least 2 matches from the entry-specific columns
-            matches = sum(1 for h in headers if any(k in h for k in ['#', 'pp', 'horse', 'ml', 'jockey', 'trainer', 'morning']))
-            
-            if matches >= 2:
-                entry_tables.append(table)
+        # Extract header info (Post Time, Purse, etc)
+        post_time = None
+        distance = None
+        surface = None
+        purse = None
+        race_type = None
         
-        if not entry_tables:
-            logger.info("No entry tables found on HRN page.")
-            return []
-            
-        for idx, table in enumerate(entry_tables):
-            race_num = idx + 1
-            entries = []
-            
-            # Extract header info (Post Time, Purse, etc)
-            post_time = None
-            distance = None
-            surface = None
-            purse = None
-            race_type = None
+        # 1. NEW: TRY CLASS-BASED DETECTION (RESULTS PAGE)
+        # Find the header element for this race
+        header_div = race_headers.get(f"race-{race_num}")
+        if header_div:
+            # Post Time
+            pt_tag = header_div.find('time', class_='race-time')
+            if pt_tag:
+                post_time = pt_tag.get_text(strip=True)
             
-            # 1. NEW: TRY CLASS-BASED DETECTION (RESULTS PAGE)
-            # Find the header element for this race
-            header_div = soup.find(id=f"race-{race_num}")
-            if header_div:
-                # Post Time
-                pt_tag = header_div.find('time', class_='race-time')
-                if pt_tag:
-                    post_time = pt_tag.get_text(strip=True)
-                
-                # Metadata (Purse, Dist)
-                # It's usually in a row following the parent h2
-                parent_h2 = header_div.find_parent('h2')
-                if parent_h2:
-                    details_row = parent_h2.find_next_sibling('div', class_='row')
-                    if details_row:
-                        # Purse
-                        purse_tag = details_row.find(class_='race-purse')
-                        if purse_tag:
-                            purse = purse_tag.get_text(strip=True).replace('Purse:', '').strip()
+            # Metadata (Purse, Dist)
+            # It's usually in a row following the parent h2
+            parent_h2 = header_div.find_parent('h2')
+            if parent_h2:
+                details_row = parent_h2.find_next_sibling('div', class_='row')
+                if details_row:
+                    # Purse
+                    purse_tag = details_row.find(class_='race-purse')
+                    if purse_tag:
+                        purse = purse_tag.get_text(strip=True).replace('Purse:', '').strip()
+                    
+                        # Improved Parsing Logic for HRN
+                        dist_tag = details_row.find(class_='race-distance')
+                        if dist_tag:
+                            # Use pipe to separate text nodes if possible, but get_text might not be perfect.
+                            text_content = dist_tag.get_text("|", strip=True) 
+                        # "6 f|Dirt|$15,000 Claiming"
                         
-                            # Improved Parsing Logic for HRN
-                            dist_tag = details_row.find(class_='race-distance')
-                            if dist_tag:
-                                # Use pipe to separate text nodes if possible, but get_text might not be perfect.
-                                text_content = dist_tag.get_text("|", strip=True) 
-                            # "6 f|Dirt|$15,000 Claiming"
-                            
-                            raw_parts = [p.strip() for p in text_content.split('|') if p.strip()]
-                            
-                            final_parts = []
-                            for p in raw_parts:
-                                clean_p = " ".join(p.split())
-                                # Split by comma but be smart about currency
-                                sub_parts = [sp.strip() for sp in clean_p.split(',')]
-                                for sp in sub_parts:
-                                    if not sp: continue
-                                    # Merge currency split (e.g. $5 and 000)
-                                    if final_parts and re.match(r'^\$\d{1,3}$', final_parts[-1]) and re.match(r'^\d{3}', sp):
-                                        final_parts[-1] += "," + sp
-                                    else:
-                                        final_parts.append(sp)
-
-                            # Parse final_parts
-                            for part in final_parts:
-                                part_lower = part.lower()
-                                
-                                # Distance Check: starts with digit, contains specific unit (relaxed regex)
-                                if not distance and re.match(r'^\d', part) and re.search(r'(m|f|y|mile|furlong|yds)', part_lower):
-                                     distance = part
-                                
-                                # Surface Check
-                                elif not surface and any(x in part_lower for x in ['dirt', 'turf', 'synthetic', 'all weather']):
-                                     surface = part
-                                     
-                                # Race Type: Not distance, not surface, not 'purse'
+                        raw_parts = [p.strip() for p in text_content.split('|') if p.strip()]
+                        
+                        final_parts = []
+                        for p in raw_parts:
+                            clean_p = " ".join(p.split())
+                            # Split by comma but be smart about currency
+                            sub_parts = [sp.strip() for sp in clean_p.split(',')]
+                            for sp in sub_parts:
+                                if not sp: continue
+                                # Merge currency split (e.g. $5 and 000)
+                                if final_parts and HRN_CURRENCY_HEAD_RE.match(final_parts[-1]) and HRN_THREE_DIGITS_RE.match(sp):
+                                    final_parts[-1] += "," + sp
                                 else:
-                                     if 'purse:' in part_lower:
-                                         continue
-                                     # Append to race type (handles multi-part types if any)
-                                     if not race_type:
-                                         race_type = part
-                                     else:
-                                         race_type += f" {part}"
-
-
-            # 2. FALLBACK: SIBLING SEARCH (ENTRY PAGE)
-            if not post_time or not distance:
-                prev = table.find_previous_sibling()
-                for _ in range(5):
-                    if not prev: break
-                    txt = prev.get_text(" ", strip=True)
-                    
-                    # Check Post Time (e.g. "Post time: 12:10 PM ET")
-                    if not post_time:
-                        # try strict first
-                        pt_match = re.search(r'(?:Post time:)?\s*(\d{1,2}:\d{2}\s*(?:AM|PM))', txt, re.IGNORECASE)
-                        if pt_match:
-                            post_time = pt_match.group(1)
-                        else:
-                            # Try flexible: "12:30 PM" without prefix, or "1:00" if clear
-                            pt_strict = re.search(r'\b(\d{1,2}:\d{2}\s*(?:A\.?M\.?|P\.?M\.?))', txt, re.IGNORECASE)
-                            if pt_strict:
-                                post_time = pt_strict.group(1)
-
-                    # Distance
-                    if not distance:
-                        dist_match = re.search(r'(\d+(?:\.\d+)?\s*(?:f|furlongs|miles|yards|yds))', txt, re.IGNORECASE)
-                        if dist_match: distance = dist_match.group(1)
-                    
-                    # Surface
-                    if not surface:
-                        surf_match = re.search(r'(Dirt|Turf|Synthetic|All Weather|Inner Turf|Main Track)', txt, re.IGNORECASE)
-                        if surf_match: surface = surf_match.group(1)
-                    
-                    # Purse
-                    if not purse:
-                        purse_match = re.search(r'Purse\s*[:\s]*(\$\d{1,3}(?:,\d{3})*)', txt, re.IGNORECASE)
-                        if purse_match:
-                            purse = purse_match.group(1)
-                        elif '$' in txt:
-                            # Look for isolated currency like $15,000
-                            pm = re.search(r'(\$\d{1,3}(?:,\d{3})+(?:\.\d{2})?)', txt)
-                            if pm: purse = pm.group(1)
+                                    final_parts.append(sp)
+
+                        # Parse final_parts
+                        for part in final_parts:
+                            part_lower = part.lower()
+                            
+                            # Distance Check: starts with digit, contains specific unit (relaxed regex)
+                            if not distance and HRN_LEADING_DIGIT_RE.match(part) and HRN_DISTANCE_UNIT_RE.search(part_lower):
+                                 distance = part
                             
-                    prev = prev.find_previous_sibling()
+                            # Surface Check
+                            elif not surface and any(x in part_lower for x in ['dirt', 'turf', 'synthetic', 'all weather']):
+                                 surface = part
+                                 
+                            # Race Type: Not distance, not surface, not 'purse'
+                            else:
+                                 if 'purse:' in part_lower:
+                                     continue
+                                 # Append to race type (handles multi-part types if any)
+                                 if not race_type:
+                                     race_type = part
+                                 else:
+                                     race_type += f" {part}"
+
+
+        # 2. FALLBACK: SIBLING SEARCH (ENTRY PAGE)
+        if not post_time or not distance:
+            prev = table.find_previous_sibling()
+            for _ in range(5):
+                if not prev: break
+                txt = prev.get_text(" ", strip=True)
+                
+                # Check Post Time (e.g. "Post time: 12:10 PM ET")
+                if not post_time:
+                    # try strict first
+                    pt_match = HRN_POST_TIME_RE.search(txt)
+                    if pt_match:
+                        post_time = pt_match.group(1)
+                    else:
+                        # Try flexible: "12:30 PM" without prefix, or "1:00" if clear
+                        pt_strict = HRN_POST_TIME_LOOSE_RE.search(txt)
+                        if pt_strict:
+                            post_time = pt_strict.group(1)
+
+                # Distance
+                if not distance:
+                    dist_match = HRN_DISTANCE_RE.search(txt)
+                    if dist_match: distance = dist_match.group(1)
+                
+                # Surface
+                if not surface:
+                    surf_match = HRN_SURFACE_RE.search(txt)
+                    if surf_match: surface = surf_match.group(1)
+                
+                # Purse
+                if not purse:
+                    purse_match = HRN_PURSE_RE.search(txt)
+                    if purse_match:
+                        purse = purse_match.group(1)
+                    elif '$' in txt:
+                        # Look for isolated currency like $15,000
+                        pm = HRN_CURRENCY_RE.search(txt)
+                        if pm: purse = pm.group(1)
+                        
+                prev = prev.find_previous_sibling()
 
-            # Parse Rows
-            rows = table.find_all('tr')
-            # Check header row
-            if not rows: continue
-            
-            # Identify columns
-            headers = [th.get_text(strip=True).lower() for th in table.find_all('th')]
-            # Expected: ['#', 'pp', 'horse', 'trainer / jockey', 'ml']
-            
-            # Map columns
-            idx_pgm = -1
-            idx_pp = -1
-            idx_horse = -1
-            idx_tj = -1
-            idx_ml = -1
-            
-            for i, h in enumerate(headers):
-                if '#' in h: idx_pgm = i
-                elif 'pp' in h: idx_pp = i
-                elif 'horse' in h: idx_horse = i
-                elif 'trainer' in h or 'jockey' in h: idx_tj = i
-                elif 'ml' in h: idx_ml = i
-            
-            # Fallback indices if header detection fails
-            if idx_pgm == -1: idx_pgm = 0
-            if idx_horse == -1: idx_horse = 2
-            if idx_tj == -1: idx_tj = 3
-            if idx_ml == -1: idx_ml = 4
+        # Parse Rows
+        rows = table.find_all('tr')
+        # Check header row
+        if not rows: continue
+        
+        # Identify columns
+        headers = table_headers[id(table)]
+        # Expected: ['#', 'pp', 'horse', 'trainer / jockey', 'ml']
+        
+        # Map columns
+        idx_pgm = -1
+        idx_pp = -1
+        idx_horse = -1
+        idx_tj = -1
+        idx_ml = -1
+        
+        for i, h in enumerate(headers):
+            if '#' in h: idx_pgm = i
+            elif 'pp' in h: idx_pp = i
+            elif 'horse' in h: idx_horse = i
+            elif 'trainer' in h or 'jockey' in h: idx_tj = i
+            elif 'ml' in h: idx_ml = i
+        
+        # Fallback indices if header detection fails
+        if idx_pgm == -1: idx_pgm = 0
+        if idx_horse == -1: idx_horse = 2
+        if idx_tj == -1: idx_tj = 3
+        if idx_ml == -1: idx_ml = 4
+        
+        for row in rows:
+            cols = row.find_all('td')
+            if not cols: continue # header
             
-            for row in rows:
-                cols = row.find_all('td')
-                if not cols: continue # header
+            try:
+                pgm = cols[idx_pgm].get_text(strip=True) if (idx_pgm != -1 and len(cols) > idx_pgm) else ""
                 
-                try:
-                    pgm = cols[idx_pgm].get_text(strip=True) if (idx_pgm != -1 and len(cols) > idx_pgm) else ""
-                    
-                    # Fallback to PP if PGM is empty
-                    if not pgm and idx_pp != -1 and len(cols) > idx_pp:
-                         pgm = cols[idx_pp].get_text(strip=True)
-                         
-                    if not pgm: pgm = "0"
-                    
-                    # Horse Name 
-                    horse_part = cols[idx_horse] if len(cols) > idx_horse else None
-                    horse_name = horse_part.get_text(strip=True) if horse_part else "Unknown"
-                    # HRN can render quarter-horse cards as:
-                    #   <td><h4>Horse Name</h4><p>Sire Name</p></td>
-                    # Using get_text(strip=True) would incorrectly concatenate horse+sire.
-                    if horse_part:
-                        preferred_name_tag = (
-                            horse_part.find('h4')
-                            or horse_part.find('strong')
-                            or horse_part.find('a')
-                        )
-                        if preferred_name_tag:
-                            horse_name = preferred_name_tag.get_text(" ", strip=True)
-                        else:
-                            stripped_text = list(horse_part.stripped_strings)
-                            horse_name = stripped_text[0] if stripped_text else "Unknown"
-                        horse_name = clean_horse_name(horse_name)
-
-                    # Trainer / Jockey
-                    tj_part = cols[idx_tj] if len(cols) > idx_tj else None
-                    trainer = None
-                    jockey = None
-                    if tj_part:
-                        # "Trainer Name | Jockey Name"
-                        txt = tj_part.get_text("|", strip=True) 
-                        parts = txt.split('|')
-                        if len(parts) >= 1: trainer = parts[0].strip()
-                        if len(parts) >= 2: jockey = parts[1].strip()
-                        
-                    # Odds
-                    odds = cols[idx_ml].get_text(strip=True) if (idx_ml != -1 and len(cols) > idx_ml) else None
+                # Fallback to PP if PGM is empty
+                if not pgm and idx_pp != -1 and len(cols) > idx_pp:
+                     pgm = cols[idx_pp].get_text(strip=True)
+                     
+                if not pgm: pgm = "0"
+                
+                # Horse Name 
+                horse_part = cols[idx_horse] if len(cols) > idx_horse else None
+                horse_name = horse_part.get_text(strip=True) if horse_part else "Unknown"
+                # HRN can render quarter-horse cards as:
+                #   <td><h4>Horse Name</h4><p>Sire Name</p></td>
+                # Using get_text(strip=True) would incorrectly concatenate horse+sire.
+                if horse_part:
+                    preferred_name_tag = (
+                        horse_part.find('h4')
+                        or horse_part.find('strong')
+                        or horse_part.find('a')
+                    )
+                    if preferred_name_tag:
+                        horse_name = preferred_name_tag.get_text(" ", strip=True)
+                    else:
+                        stripped_text = list(horse_part.stripped_strings)
+                        horse_name = stripped_text[0] if stripped_text else "Unknown"
+                    horse_name = clean_horse_name(horse_name)
+
+                # Trainer / Jockey
+                tj_part = cols[idx_tj] if len(cols) > idx_tj else None
+                trainer = None
+                jockey = None
+                if tj_part:
+                    # "Trainer Name | Jockey Name"
+                    txt = tj_part.get_text("|", strip=True) 
+                    parts = txt.split('|')
+                    if len(parts) >= 1: trainer = parts[0].strip()
+                    if len(parts) >= 2: jockey = parts[1].strip()
                     
-                    entries.append({
-                        'program_number': pgm,
-                        'horse_name': horse_name,
-                        'jockey': jockey,
-                        'trainer': trainer,
-                        'morning_line_odds': odds
-                    })
-                except:
-                    continue
-            
-            if entries:
-                races.append({
-                    'race_number': race_num,
-                    'post_time': post_time,
-                    'distance': distance,
-                    'surface': surface,
-                    'purse': purse,
-                    'race_type': race_type if race_type else 'Unknown',
-                    'entries': entries,
-                    'source': 'hrn_entries'
-                })
+                # Odds
+                odds = cols[idx_ml].get_text(strip=True) if (idx_ml != -1 and len(cols) > idx_ml) else None
                 
-        return races
+                entries.append({
+                    'program_number': pgm,
+                    'horse_name': horse_name,
+                    'jockey': jockey,
+                    'trainer': trainer,
+                    'morning_line_odds': odds
+                })
+            except:
+                continue
+        
+        if entries:
+            races.append({
+                'race_number': race_num,
+                'post_time': post_time,
+                'distance': distance,
+                'surface': surface,
+                'purse': purse,
+                'race_type': race_type if race_type else 'Unknown',
+                'entries': entries,
+                'source': 'hrn_entries'
+            })
+            
+    return races
+
+
+def fetch_hrn_entries(track_code, race_date, session=None, limiter=None):
+    """
+    Fallback: Fetch entries from HorseRacingNation
+    Requests go through the pooled keep-alive client for the HRN host unless a `session` is passed.
+    """
+    slug = HRN_TRACK_MAP.get(track_code)
+    if not slug:
+        return []
+        
+    url = f"https://{HRN_ENTRIES_HOST}/entries-results/{slug}/{race_date.strftime('%Y-%m-%d')}"
+    logger.info(f"Fallback: Fetching HRN {url}")
+    
+    try:
+        http = session if session is not None else get_http_client(url)
+        with _rate_limited(limiter, url):
+            r = http.get(url, headers=HRN_HEADERS, timeout=20)
+        
+        if r.status_code != 200:
+            logger.warning(f"HRN status {r.status_code}")
+            return []
+            
+        return parse_hrn_entries_html(r.text)
 
     except Exception as e:
         logger.error(f"HRN Fetch Error: {e}")
         return []
 
 
-def fetch_entry_card(track_code, race_date):
+def fetch_entry_card(track_code, race_date, session=None, limiter=None):
     """
     Layered source chain:
     1. HRN
     2. TVG Equibase static entries
     3. Legacy Equibase static entries
     Returns a result object with status + races + source metadata.
+    `session` is a shared HRN session; `limiter` a HostRateLimiter applied to every request.
     """
-    races = fetch_hrn_entries(track_code, race_date)
+    races = fetch_hrn_entries(track_code, race_date, session=session, limiter=limiter)
     if races:
         return {
             "status": "success",
@@ -741,7 +1130,8 @@ def fetch_entry_card(track_code, race_date):
 
     for host, source_name in STATIC_ENTRY_HOSTS:
         url = get_static_entry_url(track_code, race_date, host=host)
-        fetch_result = fetch_static_page(url)
+        with _rate_limited(limiter, url):
+            fetch_result = fetch_static_page(url)
 
         if fetch_result["status"] == "success":
             races = parse_entries_html(fetch_result["content"], track_code, race_date)
@@ -770,26 +1160,73 @@ def fetch_entry_card(track_code, race_date):
         "source": None,
     }
 
-def insert_upcoming_race(supabase, track_code, race_date, race_data, allow_completed_update=False):
+RACE_FINGERPRINT_FIELDS = ('distance', 'surface', 'purse', 'post_time', 'race_type', 'source')
+ENTRY_FINGERPRINT_FIELDS = ('horse_name', 'jockey', 'trainer', 'morning_line_odds', 'scratched')
+
+# Flipped off when hranalyzer_races has no card_fingerprint column yet (migration not applied).
+_card_fingerprint_column = {'available': True}
+
+
+def _digest(values):
+    payload = json.dumps(values, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def _entry_program_key(entry):
+    pgm_val = entry.get('program_number', '0')
+    if pgm_val:
+        pgm_val = str(pgm_val)[:10]
+    return normalize_pgm(pgm_val)
+
+
+def card_fingerprint(race_data):
+    """
+    Fingerprint of a parsed race card: one digest for the race fields and one per entry
+    (keyed by program number), so a refresh can tell exactly which rows changed.
+    """
+    entries = {}
+    for entry in race_data.get('entries') or []:
+        if not entry.get('horse_name'):
+            continue
+        entries[str(_entry_program_key(entry))] = _digest([entry.get(field) for field in ENTRY_FINGERPRINT_FIELDS])
+    return {
+        'race': _digest([race_data.get(field) for field in RACE_FINGERPRINT_FIELDS]),
+        'entries': entries,
+    }
+
+
+def _select_existing_race(supabase, race_key):
+    if _card_fingerprint_column['available']:
+        try:
+            return supabase.table('hranalyzer_races').select('id, race_status, card_fingerprint').eq('race_key', race_key).execute()
+        except Exception as e:
+            if 'card_fingerprint' not in str(e):
+                raise
+            logger.warning("hranalyzer_races.card_fingerprint is missing; apply schema_updates_card_fingerprint.sql. Writing full cards until then.")
+            _card_fingerprint_column['available'] = False
+    return supabase.table('hranalyzer_races').select('id, race_status').eq('race_key', race_key).execute()
+
+
+def insert_upcoming_race(supabase, track_code, race_date, race_data, allow_completed_update=False, stats=None):
     """
     Insert upcoming race into DB
     CRITICAL: By default, do NOT overwrite if race exists and is 'completed'
+    The card fingerprint stored on the race row is compared with the freshly parsed card:
+    an unchanged race costs no writes, and only changed entries are upserted.
+    `stats`, when given, counts 'races_unchanged' and 'entries_written'.
     """
+    race_key = None
     try:
-        # Get track ID
-        track_id = get_or_create_track(supabase, track_code)
-        if not track_id:
-            return False
-            
         race_num = race_data['race_number']
         race_key = f"{track_code}-{race_date.strftime('%Y%m%d')}-{race_num}"
-        
+
         # Check existing
-        existing = supabase.table('hranalyzer_races').select('*').eq('race_key', race_key).execute()
-        
+        existing = _select_existing_race(supabase, race_key)
+
         race_id = None
         current_status = None
-        
+        stored_fingerprint = None
+
         if existing.data:
             rec = existing.data[0]
             current_status = rec['race_status']
@@ -798,8 +1235,21 @@ def insert_upcoming_race(supabase, track_code, race_date, race_data, allow_compl
                 return True
             else:
                 race_id = rec['id']
+                stored_fingerprint = rec.get('card_fingerprint') or None
                 # Update info if needed (e.g. changes)
-        
+
+        fingerprint = card_fingerprint(race_data)
+        if stored_fingerprint == fingerprint:
+            logger.debug(f"Card unchanged for {race_key}; skipping writes")
+            if stats is not None:
+                stats['races_unchanged'] = stats.get('races_unchanged', 0) + 1
+            return True
+
+        # Get track ID
+        track_id = get_or_create_track(supabase, track_code)
+        if not track_id:
+            return False
+
         # Prepare Race Object with only non-None values to avoid overwriting existing data
         race_obj = {
             'race_key': race_key,
@@ -808,13 +1258,13 @@ def insert_upcoming_race(supabase, track_code, race_date, race_data, allow_compl
             'race_date': race_date.strftime('%Y-%m-%d'),
             'race_number': race_num
         }
-        
+
         # Preserve status if updating, otherwise default to 'upcoming'
         if not race_id:
             race_obj['race_status'] = 'upcoming'
         elif current_status:
             race_obj['race_status'] = current_status
-        
+
         if race_data.get('source'):
             race_obj['data_source'] = race_data['source']
         else:
@@ -824,23 +1274,31 @@ def insert_upcoming_race(supabase, track_code, race_date, race_data, allow_compl
         for field in ['distance', 'surface', 'purse', 'post_time', 'race_type']:
             if race_data.get(field):
                 race_obj[field] = race_data[field]
-        
-        if race_id:
-            supabase.table('hranalyzer_races').update(race_obj).eq('id', race_id).execute()
-        else:
+
+        race_changed = not stored_fingerprint or stored_fingerprint.get('race') != fingerprint['race']
+        inserted = False
+        if not race_id:
             res = supabase.table('hranalyzer_races').insert(race_obj).execute()
             if res.data:
                 race_id = res.data[0]['id']
-                
+                inserted = True
+
         if not race_id:
             return False
-            
+
+        stored_entries = (stored_fingerprint or {}).get('entries') or {}
+        entries_written = 0
+
         # Insert Entries
         for entry in race_data['entries']:
             # Get/Create Horse
             horse_name = entry['horse_name']
             if not horse_name: continue
-            
+
+            program_number = _entry_program_key(entry)
+            if stored_entries.get(str(program_number)) == fingerprint['entries'].get(str(program_number)):
+                continue
+
             # Simple horse get/create (re-use logic or direct)
             h_res = supabase.table('hranalyzer_horses').select('id').eq('horse_name', horse_name).execute()
             if h_res.data:
@@ -848,88 +1306,135 @@ def insert_upcoming_race(supabase, track_code, race_date, race_data, allow_compl
             else:
                 h_new = supabase.table('hranalyzer_horses').insert({'horse_name': horse_name}).execute()
                 horse_id = h_new.data[0]['id'] if h_new.data else None
-                
-            if not horse_id: continue
-            
+
+            if not horse_id:
+                # Leave it out of the fingerprint so the next refresh tries again.
+                fingerprint['entries'].pop(str(program_number), None)
+                continue
+
             # Jockey / Trainer
             jockey_id = get_or_create_participant(supabase, 'hranalyzer_jockeys', 'jockey_name', entry.get('jockey')) if entry.get('jockey') else None
             trainer_id = get_or_create_participant(supabase, 'hranalyzer_trainers', 'trainer_name', entry.get('trainer')) if entry.get('trainer') else None
-            
-            pgm_val = entry.get('program_number', '0')
-            if pgm_val:
-                pgm_val = str(pgm_val)[:10]
-                
+
             entry_obj = {
                 'race_id': race_id,
                 'horse_id': horse_id,
-                'program_number': normalize_pgm(pgm_val),
+                'program_number': program_number,
                 'jockey_id': jockey_id,
                 'trainer_id': trainer_id,
-                'trainer_id': trainer_id,
                 'morning_line_odds': entry.get('morning_line_odds'),
                 'scratched': entry.get('scratched', False)
             }
-            
+
             # Upsert entry
             supabase.table('hranalyzer_race_entries').upsert(entry_obj, on_conflict='race_id, program_number').execute()
-            
+            entries_written += 1
+
+        # The fingerprint is written last, so a card whose entries failed midway is retried next refresh.
+        race_update = dict(race_obj) if race_changed and not inserted else {}
+        if _card_fingerprint_column['available']:
+            race_update['card_fingerprint'] = fingerprint
+        if race_update:
+            supabase.table('hranalyzer_races').update(race_update).eq('id', race_id).execute()
+
+        if stats is not None:
+            stats['entries_written'] = stats.get('entries_written', 0) + entries_written
         return True
-        
+
     except Exception as e:
         logger.error(f"Error inserting upcoming race {race_key}: {e}")
         return False
 
-def crawl_entries(target_date=None, tracks=None, allow_completed_update=False):
-    """Main function to crawl entries using Static Pages (HRN Primary, Equibase Fallback)"""
-    if not target_date:
-        target_date = date.today()
-    if not tracks:
-        tracks = COMMON_TRACKS
-        
-    logger.info(f"Crawling entries for {target_date}")
-    supabase = get_supabase_client()
-    drf_schedule = fetch_drf_racing_dates()
-    
-    stats = {
+def _empty_entries_stats():
+    return {
         'races_found': 0,
         'races_inserted': 0,
         'tracks_skipped_no_card': 0,
+        'races_unchanged': 0,
+        'entries_written': 0,
     }
-    
-    for track_code in tracks:
-        try:
+
+
+def crawl_entries_for_dates(tracks_by_date, allow_completed_update=False, max_workers=ENTRIES_CRAWL_WORKERS):
+    """
+    Crawl entries for several days at once. `tracks_by_date` maps a date to its track list.
+    Card fetches for every (track, date) pair fan out over a thread pool under per-host rate
+    limits, sharing one DRF schedule and one HRN session; DB writes stay on the calling thread.
+    Returns {date: stats}.
+    """
+    supabase = get_supabase_client()
+    drf_schedule = fetch_drf_racing_dates()
+    stats_by_date = {target_date: _empty_entries_stats() for target_date in tracks_by_date}
+
+    pairs = []
+    for target_date, tracks in tracks_by_date.items():
+        logger.info(f"Crawling entries for {target_date}")
+        for track_code in tracks or COMMON_TRACKS:
             has_card = track_has_card_via_drf(track_code, target_date, drf_schedule)
             if has_card is False:
                 logger.info(f"Skipping {track_code} for {target_date}: DRF schedule shows no card.")
-                stats['tracks_skipped_no_card'] += 1
+                stats_by_date[target_date]['tracks_skipped_no_card'] += 1
                 continue
+            pairs.append((track_code, target_date, has_card))
 
-            fetch_result = fetch_entry_card(track_code, target_date)
-            races = fetch_result["races"]
-            
-            if races:
-                logger.info(f"Found {len(races)} races for {track_code}")
-                stats['races_found'] += len(races)
-                
-                for race in races:
-                    if insert_upcoming_race(supabase, track_code, target_date, race, allow_completed_update=allow_completed_update):
-                        stats['races_inserted'] += 1
-            else:
-                if has_card is True:
-                    logger.warning(f"Expected card for {track_code} on {target_date}, but all entry sources failed.")
+    if not pairs:
+        for target_date, stats in stats_by_date.items():
+            logger.info(f"Entries Crawl Complete for {target_date}. Stats: {stats}")
+        return stats_by_date
+
+    limiter = HostRateLimiter()
+    session = get_http_client(HRN_ENTRIES_HOST)
+
+    def fetch_pair(track_code, target_date):
+        try:
+            return fetch_entry_card(track_code, target_date, session=session, limiter=limiter)
+        except Exception:
+            # Give every host this pair touched a cool-down before the next request.
+            for host in (HRN_ENTRIES_HOST, *(host for host, _source in STATIC_ENTRY_HOSTS)):
+                limiter.backoff(host, ENTRIES_ERROR_BACKOFF_SECONDS)
+            raise
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(pairs)), thread_name_prefix="entries") as executor:
+        futures = {
+            executor.submit(fetch_pair, track_code, target_date): (track_code, target_date, has_card)
+            for track_code, target_date, has_card in pairs
+        }
+        for future in as_completed(futures):
+            track_code, target_date, has_card = futures[future]
+            stats = stats_by_date[target_date]
+            try:
+                races = future.result()["races"]
+                if races:
+                    logger.info(f"Found {len(races)} races for {track_code} on {target_date}")
+                    stats['races_found'] += len(races)
+
+                    for race in races:
+                        if insert_upcoming_race(supabase, track_code, target_date, race, allow_completed_update=allow_completed_update, stats=stats):
+                            stats['races_inserted'] += 1
                 else:
-                    logger.info(f"All sources empty for {track_code}")
-                
-            
-            # Sleep slightly to be polite to HRN/Equibase
-            time.sleep(5)
-            
-        except Exception as e:
-            logger.error(f"Error processing {track_code}: {e}")
-            time.sleep(10)
-            
-    logger.info(f"Entries Crawl Complete. Stats: {stats}")
-    return stats
+                    if has_card is True:
+                        logger.warning(f"Expected card for {track_code} on {target_date}, but all entry sources failed.")
+                    else:
+                        logger.info(f"All sources empty for {track_code} on {target_date}")
+            except Exception as e:
+                logger.error(f"Error processing {track_code} for {target_date}: {e}")
+
+    for target_date, stats in stats_by_date.items():
+        logger.info(f"Entries Crawl Complete for {target_date}. Stats: {stats}")
+    return stats_by_date
+
+
+def crawl_entries(target_date=None, tracks=None, allow_completed_update=False):
+    """Main function to crawl entries using Static Pages (HRN Primary, Equibase Fallback)"""
+    if not target_date:
+        target_date = date.today()
+    if not tracks:
+        tracks = COMMON_TRACKS
+
+    return crawl_entries_for_dates(
+        {target_date: tracks},
+        allow_completed_update=allow_completed_update,
+    )[target_date]
 
 if __name__ == "__main__":
     # Robust logging setup
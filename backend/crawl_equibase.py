@@ -15,9 +15,11 @@ import shutil
 import base64
 import signal
 import tempfile
+import threading
 import requests
 import subprocess
 from collections import defaultdict
+from contextlib import contextmanager
 import cloudscraper
 import pdfplumber
 from datetime import datetime, date
@@ -26,6 +28,8 @@ from io import BytesIO
 from supabase_client import get_supabase_client
 from dotenv import load_dotenv
 from runtime_state import record_scratch_event
+from fetcher_stats import call_fetcher, order_fetchers, record_fetch, skip_fetch
+from cookie_store import COOKIE_STORE_TTL_SECONDS, load_cookie_entry, load_cookies, store_cookies
 
 try:
     from curl_cffi import requests as curl_requests
@@ -68,7 +72,6 @@ DEFAULT_BROWSER_HEADERS = {
     'Accept': 'application/pdf,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
     'Referer': 'https://www.equibase.com/',
 }
-COOKIE_CACHE_TTL_SECONDS = 20 * 60
 _equibase_cookie_cache = {'cookies': None, 'fetched_at': 0.0}
 CHROMIUM_MIN_HEADROOM_BYTES = int(os.getenv('EQUIBASE_CHROMIUM_MIN_HEADROOM_MB', '512')) * 1024 * 1024
 POWERSHELL_MIN_HEADROOM_BYTES = int(os.getenv('EQUIBASE_PWSH_MIN_HEADROOM_MB', '192')) * 1024 * 1024
@@ -76,6 +79,7 @@ HEAVY_FALLBACK_MAX_PIDS = int(os.getenv('EQUIBASE_HEAVY_FALLBACK_MAX_PIDS', '300
 ENABLE_POWERSHELL_FALLBACK = os.getenv('EQUIBASE_ENABLE_PWSH_FALLBACK', '1').strip().lower() in {'1', 'true', 'yes', 'on'}
 SHARED_BROWSER_MAX_AGE_SECONDS = int(os.getenv('EQUIBASE_BROWSER_MAX_AGE_SECONDS', '900'))
 SHARED_BROWSER_MAX_DOWNLOADS = int(os.getenv('EQUIBASE_BROWSER_MAX_DOWNLOADS', '18'))
+SHARED_BROWSER_IDLE_SECONDS = int(os.getenv('EQUIBASE_BROWSER_IDLE_SECONDS', '300'))
 HEAVY_FALLBACK_FAILURE_THRESHOLD = int(os.getenv('EQUIBASE_HEAVY_FAILURE_THRESHOLD', '3'))
 HEAVY_FALLBACK_COOLDOWN_SECONDS = int(os.getenv('EQUIBASE_HEAVY_COOLDOWN_SECONDS', '900'))
 _equibase_browser_session = {
@@ -83,8 +87,11 @@ _equibase_browser_session = {
     'download_dir': None,
     'tempdir': None,
     'created_at': 0.0,
+    'last_used_at': 0.0,
     'uses': 0,
 }
+# Serializes use of the shared Chromium session; the scratch crawler borrows it from worker threads.
+_equibase_browser_lock = threading.RLock()
 _heavy_fallback_state = {
     'powershell': {'failures': 0, 'cooldown_until': 0.0},
     'selenium': {'failures': 0, 'cooldown_until': 0.0},
@@ -273,6 +280,11 @@ def record_heavy_fallback_failure(name: str) -> None:
 
 def close_shared_equibase_webdriver(reason: str = "") -> None:
     """Tear down the shared Chromium session and its download directory."""
+    with _equibase_browser_lock:
+        _close_shared_equibase_webdriver_locked(reason)
+
+
+def _close_shared_equibase_webdriver_locked(reason: str) -> None:
     driver = _equibase_browser_session.get('driver')
     tempdir = _equibase_browser_session.get('tempdir')
 
@@ -294,6 +306,7 @@ def close_shared_equibase_webdriver(reason: str = "") -> None:
             'download_dir': None,
             'tempdir': None,
             'created_at': 0.0,
+            'last_used_at': 0.0,
             'uses': 0,
         }
     )
@@ -357,19 +370,144 @@ def get_shared_equibase_webdriver(timeout: int = 45):
                 'download_dir': tempdir.name,
                 'tempdir': tempdir,
                 'created_at': time.time(),
+                'last_used_at': time.time(),
                 'uses': 0,
             }
         )
         logger.info("Created shared Chromium session for Equibase PDF retrieval")
 
     _equibase_browser_session['uses'] = _equibase_browser_session.get('uses', 0) + 1
+    _equibase_browser_session['last_used_at'] = time.time()
     clear_shared_browser_download_dir()
     return _equibase_browser_session['driver']
 
 
+@contextmanager
+def lease_shared_equibase_webdriver(timeout: int = 45, wait_seconds: Optional[float] = None):
+    """
+    Borrow the shared Chromium session exclusively, for callers outside the results crawler.
+
+    The session is per process and is not part of browser_pool.BrowserPool: leases are serialized
+    on the session lock, so concurrent callers wait up to `wait_seconds` (forever when None) for
+    their turn. Yields the driver, or None when the session is busy past `wait_seconds`, the
+    headroom gates refuse a launch, or Chromium is unavailable. Errors inside the block retire
+    the session so the next lease starts from a clean browser; a session left unused for
+    SHARED_BROWSER_IDLE_SECONDS is closed by `close_idle_shared_equibase_webdriver`.
+    """
+    acquired = _equibase_browser_lock.acquire(timeout=-1 if wait_seconds is None else wait_seconds)
+    if not acquired:
+        logger.info("Shared Chromium session busy; skipping browser fallback")
+        yield None
+        return
+
+    try:
+        driver = get_shared_equibase_webdriver(timeout=timeout)
+        try:
+            yield driver
+        except Exception:
+            close_shared_equibase_webdriver(reason="error while leased")
+            raise
+    finally:
+        if _equibase_browser_session.get('driver') is not None:
+            _equibase_browser_session['last_used_at'] = time.time()
+        _equibase_browser_lock.release()
+
+
+def close_idle_shared_equibase_webdriver(idle_seconds: Optional[float] = None) -> bool:
+    """
+    Close the shared Chromium session once it has sat unused for `idle_seconds`
+    (SHARED_BROWSER_IDLE_SECONDS by default), so a process that only borrows it now and then does
+    not keep Chromium resident between uses. A session that is leased right now is left alone.
+    Returns True when a session was closed.
+    """
+    limit = SHARED_BROWSER_IDLE_SECONDS if idle_seconds is None else idle_seconds
+    if not _equibase_browser_lock.acquire(blocking=False):
+        return False
+    try:
+        if _equibase_browser_session.get('driver') is None:
+            return False
+        idle_for = time.time() - (_equibase_browser_session.get('last_used_at') or 0.0)
+        if idle_for < limit:
+            return False
+        _close_shared_equibase_webdriver_locked(reason="idle")
+        return True
+    finally:
+        _equibase_browser_lock.release()
+
+
 atexit.register(close_shared_equibase_webdriver)
 
 
+# Chart text patterns, compiled once: chart parsing runs these per page and per line.
+PARENTHETICAL_RE = re.compile(r'\s*\(.*?\)')
+NON_ALNUM_RE = re.compile(r'[^a-zA-Z0-9]')
+PGM_INVALID_CHARS_RE = re.compile(r'[^A-Z0-9]')
+LEADING_ZEROS_RE = re.compile(r'^0+')
+WHITESPACE_RE = re.compile(r'\s+')
+HORSE_NAME_INVALID_CHARS_RE = re.compile(r'[^\w\s\'-]')
+STATIC_CHART_PDF_URL_RE = re.compile(r'/([A-Z]{2,4})(\d{2})(\d{2})(\d{2})(?:USA|CAN)(\d+)\.pdf(?:\?.*)?$')
+
+RACE_NUMBER_RE = re.compile(r'Race\s*(\d+)', re.IGNORECASE)
+RACE_SPACED_NUMBER_RE = re.compile(r'RACE\s+(\d+)', re.IGNORECASE)
+RACE_HASH_NUMBER_RE = re.compile(r'Race\s*#?\s*(\d+)', re.IGNORECASE)
+YEAR_RE = re.compile(r'\d{4}')
+CHART_DATE_RE = re.compile(r'(\d{1,2}/\d{1,2}/\d{4})')
+POST_TIME_RE = re.compile(r'POST TIME:\s*(\d{1,2}:\d{2})', re.IGNORECASE)
+DISTANCE_RE = re.compile(r'(\d+\s*(?:Furlongs?|Miles?|Yards?))', re.IGNORECASE)
+FRACTIONAL_DISTANCE_RE = re.compile(r'(\d+\s*1/\d+\s*(?:Miles?|Furlongs?))', re.IGNORECASE)
+PURSE_RE = re.compile(r'PURSE[:\s]+\$?([\d,]+)', re.IGNORECASE)
+FINAL_TIME_RE = re.compile(r'FINAL\s*TIME\s*:?\s*([\d:.]+)', re.IGNORECASE)
+DECIMAL_NUMBER_RE = re.compile(r'(\d+\.\d+)')
+
+RUNNING_LINE_SECTION_RE = re.compile(r'Past Performance Running Line Preview', re.IGNORECASE)
+RUNNING_LINE_ROW_START_RE = re.compile(
+    r'^\s*(\d+[A-Z]?)\s+([A-Za-z][A-Za-z\'&\-.]*(?:\s+[A-Za-z][A-Za-z\'&\-.]*)*)\s+(?:\d+|Head|Neck|Nose)\b'
+)
+RUNNING_LINE_STOP_RE = re.compile(
+    r'^(Trainers:|Owners:|Footnotes|Copyright|Denotes\b)',
+    re.IGNORECASE,
+)
+PGM_HORSE_NAME_HEADER_RE = re.compile(r'^Pgm\s+Horse\s+Name\b', re.IGNORECASE)
+TEXT_FALLBACK_ROW_RE = re.compile(r'^\s*\S+\s+(\d+)\s+([^(]+)\(([^)]+)\).*?(\d+\.\d+\*?)\s+')
+
+EXOTIC_PAYOUT_PATTERNS = {
+    wager_type: re.compile(rf'{label}.*?\$?([\d,]+\.\d{{2}})', re.IGNORECASE)
+    for wager_type, label in (
+        ('Exacta', 'EXACTA'),
+        ('Trifecta', 'TRIFECTA'),
+        ('Superfecta', 'SUPERFECTA'),
+        ('Daily Double', 'DAILY DOUBLE'),
+        ('Pick 3', 'PICK 3'),
+        ('Pick 4', 'PICK 4'),
+    )
+}
+WPS_HEADER_RE = re.compile(r'Pgm\s+Horse\s+Win\s+Place\s+Show', re.IGNORECASE)
+WPS_POOL_RE = re.compile(r'Total\s+WPS\s+Pool', re.IGNORECASE)
+PRICE_RE = re.compile(r'(\d+\.\d{2})')
+PRICE_TOKEN_RE = re.compile(r'^\d+\.\d{2}$')
+EXOTIC_TOKEN_RE = re.compile(r'Exacta|Trifecta|Superfecta|Daily|Pick', re.IGNORECASE)
+
+TRAINERS_SECTION_RE = re.compile(
+    r'Trainers:\s*(.*?)(?:\s+Owners:|\s+Footnotes|\s+Scratched|$)', re.IGNORECASE | re.DOTALL
+)
+PGM_THEN_NAME_RE = re.compile(r'^(\d+)\s+(.+)')
+SCRATCHED_SECTION_RE = re.compile(
+    r'Scratched\s*Horse\(s\)\s*:\s*(.*?)'
+    # Expanded stop tokens to prevent runaway captures
+    r'(?:\s+Trainers:|\s+Owner\(s\):|\s+Footnotes|\s+Claiming|\s+Total\s*WPS|\s+Pgm\s+Horse|\s+Claiming\s*Prices|\s+Mutuel\s+Prices|\s+Winner:|\s+Final\s+Time|$)',
+    re.IGNORECASE | re.DOTALL,
+)
+LIST_SEPARATOR_RE = re.compile(r'[;,]\s*')
+CLAIMING_PRICES_RE = re.compile(r'Claiming\s*Prices\s*:(.*?)(?:Scratched|Total|Footnotes|$)', re.DOTALL | re.IGNORECASE)
+CLAIMING_PRICE_ITEM_RE = re.compile(r'(\d+)\s*-\s*([^:]+):\s*\$\s*([\d,]+)')
+# Note: (\s*) allows for no space if PDF extraction removed it
+NEW_TRAINER_RE = re.compile(r'\s*(?:New\s*Trainer|NewTrainer)\s*:\s*', re.IGNORECASE)
+NEW_OWNER_RE = re.compile(r'\s*(?:New\s*Owner|NewOwner)\s*:\s*', re.IGNORECASE)
+CLAIMED_HORSE_RE = re.compile(r'Claimed\s*Horse\(s\)\s*:', re.IGNORECASE)
+CLAIMED_HORSE_PREFIX_RE = re.compile(r'^\d*\s*Claimed\s*Horse\(s\)\s*:\s*', re.IGNORECASE)
+CLAIMS_SECTION_END_RE = re.compile(r'(Claiming\s*Prices|Scratched|Total|Fractional|Final|Run-Up)', re.IGNORECASE)
+
+
 def normalize_name(name: str) -> str:
     """
     Normalize name for more reliable mapping (strip non-alphanumeric, lowercase)
@@ -379,9 +517,9 @@ def normalize_name(name: str) -> str:
         return ""
     
     # Remove parens and content inside them (e.g. "Horse Name (IRE)" -> "Horse Name")
-    name = re.sub(r'\s*\(.*?\)', '', name)
+    name = PARENTHETICAL_RE.sub('', name)
     
-    return re.sub(r'[^a-zA-Z0-9]', '', name).lower()
+    return NON_ALNUM_RE.sub('', name).lower()
 
 
 def normalize_pgm(pgm: str) -> str:
@@ -395,7 +533,7 @@ def normalize_pgm(pgm: str) -> str:
     
     # STRICTER CLEANING: Remove anything that is not alphanumeric
     # This handles "1*", "3 (Part)", etc.
-    pgm = re.sub(r'[^A-Z0-9]', '', pgm)
+    pgm = PGM_INVALID_CHARS_RE.sub('', pgm)
     
     # Remove leading zeros if it's numeric-ish (but keep '0' if it is just '0')
     # Actually just stripping leading zeros works for '01', '01A' -> '1A'
@@ -406,7 +544,7 @@ def normalize_pgm(pgm: str) -> str:
         
     # If alphanumeric, try to strip leading zeros from the numeric part? 
     # E.g. "01A" -> "1A". 
-    pgm = re.sub(r'^0+', '', pgm)
+    pgm = LEADING_ZEROS_RE.sub('', pgm)
     
     return pgm if pgm else "0"
 
@@ -439,7 +577,7 @@ def build_equibase_full_card_url(track_code: str, race_date: date) -> str:
 
 def parse_equibase_static_pdf_url(pdf_url: str) -> Optional[Tuple[str, date, int]]:
     """Extract track/date/race_number from a static chart PDF URL."""
-    match = re.search(r'/([A-Z]{2,4})(\d{2})(\d{2})(\d{2})(?:USA|CAN)(\d+)\.pdf(?:\?.*)?$', pdf_url)
+    match = STATIC_CHART_PDF_URL_RE.search(pdf_url)
     if not match:
         return None
 
@@ -661,12 +799,13 @@ def download_pdf_via_cookie_replay(
 
 def download_pdf_via_curl_cffi(pdf_url: str, timeout: int = 40) -> Optional[bytes]:
     if curl_requests is None:
-        return None
+        return skip_fetch()
 
     try:
         response = curl_requests.get(
             pdf_url,
             headers=DEFAULT_BROWSER_HEADERS,
+            cookies=load_cookies(pdf_url),
             impersonate='chrome',
             timeout=timeout,
         )
@@ -710,7 +849,12 @@ def download_pdf_via_cloudscraper(pdf_url: str, timeout: int = 40) -> Optional[b
 
 def download_pdf_via_requests(pdf_url: str, timeout: int = 40) -> Optional[bytes]:
     try:
-        response = requests.get(pdf_url, headers=DEFAULT_BROWSER_HEADERS, timeout=timeout)
+        response = requests.get(
+            pdf_url,
+            headers=DEFAULT_BROWSER_HEADERS,
+            cookies=load_cookies(pdf_url),
+            timeout=timeout,
+        )
         if response.status_code == 200 and is_pdf_bytes(response.content):
             logger.info(f"requests downloaded PDF ({len(response.content)} bytes)")
             return response.content
@@ -730,11 +874,41 @@ def download_pdf_via_requests(pdf_url: str, timeout: int = 40) -> Optional[bytes
 
 def get_equibase_browser_cookies(target_url: str, timeout: int = 45) -> Optional[Dict[str, str]]:
     """Use headless Chromium to satisfy Imperva and capture a valid Equibase cookie jar."""
+    cached = _cached_equibase_cookies(target_url)
+    if cached:
+        return cached
+
+    with _equibase_browser_lock:
+        # Another thread may have warmed the browser while we waited for the lock.
+        cached = _cached_equibase_cookies(target_url)
+        if cached:
+            return cached
+        return _get_equibase_browser_cookies_locked(target_url, timeout)
+
+
+def _cached_equibase_cookies(target_url: str) -> Optional[Dict[str, str]]:
+    """Cookies from this process's cache, else from a jar another crawler process persisted."""
     cached = _equibase_cookie_cache.get('cookies')
     fetched_at = _equibase_cookie_cache.get('fetched_at', 0.0)
-    if cached and (time.time() - fetched_at) < COOKIE_CACHE_TTL_SECONDS:
+    if cached and (time.time() - fetched_at) < COOKIE_STORE_TTL_SECONDS:
         return cached
 
+    stored = load_cookie_entry(target_url)
+    if stored:
+        _equibase_cookie_cache['cookies'] = stored['cookies']
+        _equibase_cookie_cache['fetched_at'] = stored['fetched_at']
+        logger.info(f"Reusing {len(stored['cookies'])} persisted Equibase browser cookies")
+        return stored['cookies']
+    return None
+
+
+def _remember_equibase_cookies(url: str, cookies: Dict[str, str]) -> None:
+    _equibase_cookie_cache['cookies'] = cookies
+    _equibase_cookie_cache['fetched_at'] = time.time()
+    store_cookies(url, cookies, fetched_at=_equibase_cookie_cache['fetched_at'])
+
+
+def _get_equibase_browser_cookies_locked(target_url: str, timeout: int) -> Optional[Dict[str, str]]:
     try:
         logger.info("Launching headless Chromium to satisfy Equibase protection")
         driver = get_shared_equibase_webdriver(timeout=timeout)
@@ -744,8 +918,7 @@ def get_equibase_browser_cookies(target_url: str, timeout: int = 45) -> Optional
 
         cookies = {cookie['name']: cookie['value'] for cookie in driver.get_cookies()}
         if cookies:
-            _equibase_cookie_cache['cookies'] = cookies
-            _equibase_cookie_cache['fetched_at'] = time.time()
+            _remember_equibase_cookies(target_url, cookies)
             logger.info(f"Captured {len(cookies)} Equibase browser cookies")
             return cookies
         logger.warning("Browser session completed without any Equibase cookies")
@@ -762,8 +935,13 @@ def get_equibase_browser_cookies(target_url: str, timeout: int = 45) -> Optional
 def download_pdf_via_selenium(pdf_url: str, timeout: int = 60) -> Optional[bytes]:
     """Last-resort downloader that uses a real browser session before falling back to cookie replay."""
     if not heavy_fallback_available('selenium'):
-        return None
+        return skip_fetch()
+
+    with _equibase_browser_lock:
+        return _download_pdf_via_selenium_locked(pdf_url, timeout)
+
 
+def _download_pdf_via_selenium_locked(pdf_url: str, timeout: int) -> Optional[bytes]:
     cookies = None
 
     try:
@@ -793,8 +971,7 @@ def download_pdf_via_selenium(pdf_url: str, timeout: int = 60) -> Optional[bytes
 
         cookies = {cookie['name']: cookie['value'] for cookie in driver.get_cookies()}
         if cookies:
-            _equibase_cookie_cache['cookies'] = cookies
-            _equibase_cookie_cache['fetched_at'] = time.time()
+            _remember_equibase_cookies(pdf_url, cookies)
     except WebDriverException as e:
         logger.warning(f"Chromium PDF retrieval failed for {pdf_url}: {e}")
         record_heavy_fallback_failure('selenium')
@@ -817,13 +994,13 @@ def download_pdf_via_powershell(pdf_url: str, timeout: int = 45) -> Optional[byt
     """Last-resort downloader using pwsh inside the production container image."""
     if not ENABLE_POWERSHELL_FALLBACK:
         logger.info("Skipping pwsh fallback because EQUIBASE_ENABLE_PWSH_FALLBACK is disabled")
-        return None
+        return skip_fetch()
     if shutil.which("pwsh") is None:
-        return None
+        return skip_fetch()
     if not heavy_fallback_available('powershell'):
-        return None
+        return skip_fetch()
     if not has_heavy_fallback_headroom(POWERSHELL_MIN_HEADROOM_BYTES, "PowerShell Equibase fallback"):
-        return None
+        return skip_fetch()
 
     temp_file = f"/tmp/equibase_{int(time.time())}_{os.getpid()}.pdf"
     script = (
@@ -941,24 +1118,24 @@ def download_pdf(pdf_url: str, timeout: int = 40) -> Optional[bytes]:
     logger.info(f"Downloading PDF from {pdf_url} using layered fallbacks")
 
     lightweight_downloaders = (
-        download_pdf_via_curl_cffi,
-        download_pdf_via_cloudscraper,
-        download_pdf_via_requests,
+        ("curl_cffi", download_pdf_via_curl_cffi),
+        ("cloudscraper", download_pdf_via_cloudscraper),
+        ("requests", download_pdf_via_requests),
     )
     heavy_downloaders = (
-        download_pdf_via_powershell,
-        download_pdf_via_selenium,
+        ("powershell", download_pdf_via_powershell),
+        ("selenium", download_pdf_via_selenium),
     )
 
-    for downloader in lightweight_downloaders:
-        content = downloader(pdf_url, timeout=timeout)
-        if content:
-            return content
-
-    for downloader in heavy_downloaders:
-        content = downloader(pdf_url, timeout=timeout)
-        if content:
-            return content
+    # Each tier is reordered by recent per-host success, but heavy downloaders stay behind
+    # the lightweight tier so their browser/headroom gates keep applying.
+    for tier in (lightweight_downloaders, heavy_downloaders):
+        for downloader_name, downloader in order_fetchers(pdf_url, tier):
+            content, latency, ran = call_fetcher(downloader, pdf_url, timeout=timeout)
+            if ran:
+                record_fetch(pdf_url, downloader_name, bool(content), latency)
+            if content:
+                return content
 
     logger.warning(f"All static PDF download methods failed for {pdf_url}")
     return None
@@ -996,7 +1173,7 @@ def parse_equibase_full_card(pdf_bytes: bytes) -> List[Dict]:
                 # A new race chart usually starts with something containing "Race N" at the top
                 # We saw patterns like "GULFSTREAMPARK-January9,2026-Race1 ?"
                 is_header = False
-                header_match = re.search(r'Race\s*(\d+)', text[:100], re.IGNORECASE)
+                header_match = RACE_NUMBER_RE.search(text[:100])
                 if header_match:
                     is_header = True
                 
@@ -1125,8 +1302,8 @@ def parse_race_chart_text(text: str) -> Dict:
         
         is_suspicious = False
         if len(raw_name) > 50: is_suspicious = True
-        if re.search(r'Race\s*\d+', raw_name, re.IGNORECASE): is_suspicious = True
-        if re.search(r'\d{4}', raw_name): is_suspicious = True # Year
+        if RACE_NUMBER_RE.search(raw_name): is_suspicious = True
+        if YEAR_RE.search(raw_name): is_suspicious = True # Year
         
         # Check against common track map (expanded)
         known_tracks = {
@@ -1190,22 +1367,22 @@ def parse_race_chart_text(text: str) -> Dict:
 
 
     # Extract race number
-    race_num_match = re.search(r'RACE\s+(\d+)', text, re.IGNORECASE)
+    race_num_match = RACE_SPACED_NUMBER_RE.search(text)
     if race_num_match:
         data['race_number'] = int(race_num_match.group(1))
     else:
         # Try alternate format
-        race_num_match = re.search(r'Race\s*#?\s*(\d+)', text, re.IGNORECASE)
+        race_num_match = RACE_HASH_NUMBER_RE.search(text)
         if race_num_match:
             data['race_number'] = int(race_num_match.group(1))
 
     # Extract date
-    date_match = re.search(r'(\d{1,2}/\d{1,2}/\d{4})', text)
+    date_match = CHART_DATE_RE.search(text)
     if date_match:
         data['race_date'] = date_match.group(1)
 
     # Extract post time
-    time_match = re.search(r'POST TIME:\s*(\d{1,2}:\d{2})', text, re.IGNORECASE)
+    time_match = POST_TIME_RE.search(text)
     if time_match:
         data['post_time'] = time_match.group(1)
 
@@ -1216,35 +1393,36 @@ def parse_race_chart_text(text: str) -> Dict:
             break
 
     # Extract distance
-    dist_match = re.search(r'(\d+\s*(?:Furlongs?|Miles?|Yards?))', text, re.IGNORECASE)
+    dist_match = DISTANCE_RE.search(text)
     if dist_match:
         data['distance'] = dist_match.group(1)
     else:
         # Try fractional distance
-        dist_match = re.search(r'(\d+\s*1/\d+\s*(?:Miles?|Furlongs?))', text, re.IGNORECASE)
+        dist_match = FRACTIONAL_DISTANCE_RE.search(text)
         if dist_match:
             data['distance'] = dist_match.group(1)
 
     # Extract purse
-    purse_match = re.search(r'PURSE[:\s]+\$?([\d,]+)', text, re.IGNORECASE)
+    purse_match = PURSE_RE.search(text)
     if purse_match:
         data['purse'] = f"${purse_match.group(1)}"
 
     # Extract race type
+    text_lower = text.lower()
     for race_type in ['Claiming', 'Allowance', 'Maiden', 'Stakes', 'Handicap']:
-        if race_type.lower() in text.lower():
+        if race_type.lower() in text_lower:
             data['race_type'] = race_type
             break
 
     # Extract final time
     # More flexible regex to catch cases without colons, different separators, or missing spaces
     # Fix for cases like "Final Time : 1:44.23" or "Final Time: 1:44.23"
-    time_match = re.search(r'FINAL\s*TIME\s*:?\s*([\d:.]+)', text, re.IGNORECASE)
+    time_match = FINAL_TIME_RE.search(text)
     if time_match:
         data['final_time'] = time_match.group(1).strip()
 
     # Extract fractional times
-    frac_match = re.findall(r'(\d+\.\d+)', text)
+    frac_match = DECIMAL_NUMBER_RE.findall(text)
     if len(frac_match) > 0:
         # Filter to reasonable fractional times (between 20-70 seconds usually)
         data['fractional_times'] = [t for t in frac_match if 20.0 < float(t) < 70.0][:4]
@@ -1267,34 +1445,26 @@ def parse_running_line_preview_horses(text: str) -> List[Dict]:
 
     section_start = -1
     for i, line in enumerate(lines):
-        if re.search(r'Past Performance Running Line Preview', line, re.IGNORECASE):
+        if RUNNING_LINE_SECTION_RE.search(line):
             section_start = i + 1
             break
 
     if section_start == -1:
         return horses
 
-    row_start_pattern = re.compile(
-        r'^\s*(\d+[A-Z]?)\s+([A-Za-z][A-Za-z\'&\-.]*(?:\s+[A-Za-z][A-Za-z\'&\-.]*)*)\s+(?:\d+|Head|Neck|Nose)\b'
-    )
-    stop_pattern = re.compile(
-        r'^(Trainers:|Owners:|Footnotes|Copyright|Denotes\b)',
-        re.IGNORECASE,
-    )
-
     current_row_lines = []
 
     def flush_row(row_lines: List[str]) -> None:
         if not row_lines:
             return
 
-        row_text = re.sub(r'\s+', ' ', ' '.join(row_lines)).strip()
-        match = row_start_pattern.match(row_text)
+        row_text = WHITESPACE_RE.sub(' ', ' '.join(row_lines)).strip()
+        match = RUNNING_LINE_ROW_START_RE.match(row_text)
         if not match:
             return
 
         program_number = normalize_pgm(match.group(1))
-        horse_name = re.sub(r'[^\w\s\'-]', '', match.group(2).strip())
+        horse_name = HORSE_NAME_INVALID_CHARS_RE.sub('', match.group(2).strip())
         if not program_number or not horse_name:
             return
 
@@ -1319,13 +1489,13 @@ def parse_running_line_preview_horses(text: str) -> List[Dict]:
         if not line:
             continue
 
-        if stop_pattern.match(line):
+        if RUNNING_LINE_STOP_RE.match(line):
             break
 
-        if re.match(r'^Pgm\s+Horse\s+Name\b', line, re.IGNORECASE):
+        if PGM_HORSE_NAME_HEADER_RE.match(line):
             continue
 
-        if row_start_pattern.match(line):
+        if RUNNING_LINE_ROW_START_RE.match(line):
             flush_row(current_row_lines)
             current_row_lines = [line]
         elif current_row_lines:
@@ -1420,7 +1590,7 @@ def parse_horse_table(tables: List, full_text: str) -> List[Dict]:
 
             # Clean up horse name
             if horse_data['horse_name']:
-                horse_data['horse_name'] = re.sub(r'[^\w\s\'-]', '', horse_data['horse_name'])
+                horse_data['horse_name'] = HORSE_NAME_INVALID_CHARS_RE.sub('', horse_data['horse_name'])
 
             if horse_data['horse_name']:
                 horses.append(horse_data)
@@ -1452,8 +1622,6 @@ def parse_horses_from_text(text: str) -> List[Dict]:
     # Regex to capture: Pgm, HorseName, Jockey, (skip), Odds
     # Example: 20Nov255AQU2 1 Coquito(Carmouche,Kendrick) 123 Lb ... 0.48* chased3w,edgedclear
     # We look for Pgm (number), Name(Jockey), and Odds (decimal at end)
-    pattern = re.compile(r'^\s*\S+\s+(\d+)\s+([^(]+)\(([^)]+)\).*?(\d+\.\d+\*?)\s+')
-    
     for line in lines:
         # Detect header
         if 'HorseName(Jockey)' in line or 'Horse Name (Jockey)' in line:
@@ -1471,7 +1639,7 @@ def parse_horses_from_text(text: str) -> List[Dict]:
         if not line.strip():
             continue
         
-        match = re.search(pattern, line)
+        match = TEXT_FALLBACK_ROW_RE.search(line)
         if match:
             try:
                 pgm = match.group(1)
@@ -1508,18 +1676,8 @@ def parse_exotic_payouts(text: str) -> List[Dict]:
     """
     payouts = []
 
-    # Common exotic bet patterns
-    patterns = {
-        'Exacta': r'EXACTA.*?\$?([\d,]+\.\d{2})',
-        'Trifecta': r'TRIFECTA.*?\$?([\d,]+\.\d{2})',
-        'Superfecta': r'SUPERFECTA.*?\$?([\d,]+\.\d{2})',
-        'Daily Double': r'DAILY DOUBLE.*?\$?([\d,]+\.\d{2})',
-        'Pick 3': r'PICK 3.*?\$?([\d,]+\.\d{2})',
-        'Pick 4': r'PICK 4.*?\$?([\d,]+\.\d{2})',
-    }
-
-    for wager_type, pattern in patterns.items():
-        match = re.search(pattern, text, re.IGNORECASE)
+    for wager_type, pattern in EXOTIC_PAYOUT_PATTERNS.items():
+        match = pattern.search(text)
         if match:
             payouts.append({
                 'wager_type': wager_type,
@@ -1542,18 +1700,15 @@ def parse_wps_payouts(text: str) -> Dict[str, Dict[str, float]]:
     lines = text.split('\n')
     start_idx = -1
     
-    header_pattern = re.compile(r'Pgm\s+Horse\s+Win\s+Place\s+Show', re.IGNORECASE)
-    
     for i, line in enumerate(lines):
-        if header_pattern.search(line):
+        if WPS_HEADER_RE.search(line):
             start_idx = i + 1
             break
             
     if start_idx == -1:
         # Try finding "Total WPS Pool" then look ahead a line or two
-        pool_pattern = re.compile(r'Total\s+WPS\s+Pool', re.IGNORECASE)
         for i, line in enumerate(lines):
-            if pool_pattern.search(line):
+            if WPS_POOL_RE.search(line):
                 # Header usually follows or is nearby
                 # Scan next few lines for header? Or assuming next lines are data if header is missing/implicit
                 # Let's try to assume data follows immediately after header row found by context
@@ -1595,7 +1750,7 @@ def parse_wps_payouts(text: str) -> Dict[str, Dict[str, float]]:
         
         # Regex for prices: look for numbers like "15.60"
         # Note: sometimes they are just "4.20"
-        prices = re.findall(r'(\d+\.\d{2})', line)
+        prices = PRICE_RE.findall(line)
         
         if not prices:
             continue
@@ -1663,13 +1818,13 @@ def parse_wps_payouts(text: str) -> Dict[str, Dict[str, float]]:
                 # Check if price
                 # handling "$15.60" or "15.60"
                 clean_token = token.replace('$', '')
-                if re.match(r'^\d+\.\d{2}$', clean_token):
+                if PRICE_TOKEN_RE.match(clean_token):
                      found_prices.append(float(clean_token))
                 elif token.startswith('$'): 
                      # Should be start of Wager Type section e.g. $1.00 Exacta
                      # Stop collecting prices
                      break
-                elif re.match(r'Exacta|Trifecta|Superfecta|Daily|Pick', token, re.IGNORECASE):
+                elif EXOTIC_TOKEN_RE.match(token):
                      break
             
             row_payouts = {'win': None, 'place': None, 'show': None}
@@ -1720,7 +1875,7 @@ def parse_trainers_section(text: str) -> Dict[str, str]:
     
     # Locate section
     # Regex: Trainers:\s*(.*?)(?:\s+Owners:|\s+Footnotes|\s+Scratched|$)
-    match = re.search(r'Trainers:\s*(.*?)(?:\s+Owners:|\s+Footnotes|\s+Scratched|$)', text, re.IGNORECASE | re.DOTALL)
+    match = TRAINERS_SECTION_RE.search(text)
     
     if match:
         content = match.group(1).replace('\n', ' ').strip()
@@ -1740,7 +1895,7 @@ def parse_trainers_section(text: str) -> Dict[str, str]:
             else:
                 # Fallback: maybe space separated? "3 Handal, Raymond"
                 # Check for first digit
-                m = re.match(r'^(\d+)\s+(.+)', entry)
+                m = PGM_THEN_NAME_RE.match(entry)
                 if m:
                     trainers[m.group(1)] = m.group(2).strip()
                     
@@ -1753,23 +1908,20 @@ def parse_scratched_horses(text: str) -> List[str]:
     Example: Scratched Horse(s): Horse Name (Reason)
     """
     scratches = []
-    # Expanded stop tokens to prevent runaway captures
-    stop_pattern = r'(?:\s+Trainers:|\s+Owner\(s\):|\s+Footnotes|\s+Claiming|\s+Total\s*WPS|\s+Pgm\s+Horse|\s+Claiming\s*Prices|\s+Mutuel\s+Prices|\s+Winner:|\s+Final\s+Time|$)'
-    
-    match = re.search(r'Scratched\s*Horse\(s\)\s*:\s*(.*?)' + stop_pattern, text, re.IGNORECASE | re.DOTALL)
+    match = SCRATCHED_SECTION_RE.search(text)
     
     if match:
         content = match.group(1).replace('\n', ' ').strip()
         
         # Split by semicolon or comma
-        parts = re.split(r'[;,]\s*', content)
+        parts = LIST_SEPARATOR_RE.split(content)
         
         for part in parts:
             part = part.strip()
             if not part: continue
             
             # Remove reason in parens "(Trainer)" and other noise
-            name = re.sub(r'\s*\(.*?\)', '', part).strip()
+            name = PARENTHETICAL_RE.sub('', part).strip()
             
             # Filter matches
             # 1. Must rename valid after normalization
@@ -1800,12 +1952,12 @@ def parse_claims_text(text: str) -> List[Dict]:
     price_map = {}
     
     # Flexible regex: Claiming\s*Prices\s*:
-    price_match = re.search(r'Claiming\s*Prices\s*:(.*?)(?:Scratched|Total|Footnotes|$)', text, re.DOTALL | re.IGNORECASE)
+    price_match = CLAIMING_PRICES_RE.search(text)
     if price_match:
         price_text = price_match.group(1).strip()
         # Split by semicolon or just find all matches
         # Pattern: number - Name: $price (Allow space after $)
-        price_items = re.findall(r'(\d+)\s*-\s*([^:]+):\s*\$\s*([\d,]+)', price_text)
+        price_items = CLAIMING_PRICE_ITEM_RE.findall(price_text)
         for num, name, price in price_items:
             # Normalize name
             norm_name = normalize_name(name)
@@ -1817,33 +1969,28 @@ def parse_claims_text(text: str) -> List[Dict]:
     in_claims = False
     current_claim = None
     
-    # Patterns
-    # Note: (\s*) allows for no space if PDF extraction removed it
-    trainer_pat = re.compile(r'\s*(?:New\s*Trainer|NewTrainer)\s*:\s*', re.IGNORECASE)
-    owner_pat = re.compile(r'\s*(?:New\s*Owner|NewOwner)\s*:\s*', re.IGNORECASE)
-    
     for line in lines:
         line = line.strip()
         if not line: continue
         
         # Start detection
-        if re.search(r'Claimed\s*Horse\(s\)\s*:', line, re.IGNORECASE):
+        if CLAIMED_HORSE_RE.search(line):
             in_claims = True
             # Remove the prefix "N Claimed Horse(s):" to process the first line content
-            line = re.sub(r'^\d*\s*Claimed\s*Horse\(s\)\s*:\s*', '', line, flags=re.IGNORECASE).strip()
+            line = CLAIMED_HORSE_PREFIX_RE.sub('', line).strip()
             
         if not in_claims: continue
         
         # End detection
         # Stop at ClaimingPrices, Scratched, Total, Fractional, Final Time, Run-Up match
-        if re.match(r'(Claiming\s*Prices|Scratched|Total|Fractional|Final|Run-Up)', line, re.IGNORECASE):
+        if CLAIMS_SECTION_END_RE.match(line):
             if current_claim: claims.append(current_claim)
             in_claims = False
             break
             
         # Process Line Logic
         # Check if line contains "New Trainer" -> Starts a new claim
-        trainer_match = trainer_pat.search(line)
+        trainer_match = NEW_TRAINER_RE.search(line)
         
         if trainer_match:
             # Save previous claim if valid
@@ -1860,7 +2007,7 @@ def parse_claims_text(text: str) -> List[Dict]:
             rest = line[end_idx:].strip()
             
             # Now search for Owner in 'rest'
-            owner_match = owner_pat.search(rest)
+            owner_match = NEW_OWNER_RE.search(rest)
             
             if owner_match:
                 # "TrainerName NewOwner: OwnerName"
@@ -1894,7 +2041,7 @@ def parse_claims_text(text: str) -> List[Dict]:
                 if prev_trainer.endswith("NewOw") or prev_trainer.endswith("New"):
                      # Attempt to combine and re-check owner pattern
                      combined = prev_trainer + line
-                     om = owner_pat.search(combined)
+                     om = NEW_OWNER_RE.search(combined)
                      if om:
                          o_start = om.start()
                          o_end = om.end()
@@ -1919,7 +2066,7 @@ def parse_claims_text(text: str) -> List[Dict]:
                         # Usually "New Owner" follows trainer.
                         # If we haven't seen New Owner label yet, and this line doesn't have it...
                         # Check if this line IS the owner label?
-                        om = owner_pat.search(line)
+                        om = NEW_OWNER_RE.search(line)
                         if om:
                              o_end = om.end()
                              owner_name = line[o_end:].strip()
@@ -1,22 +1,36 @@
 
+import asyncio
+import hashlib
 import logging
 import time
 import os
 import re
 import shutil
-import subprocess
+import threading
+import httpx
 import requests
 from bs4 import BeautifulSoup
+from contextlib import contextmanager
 from datetime import datetime, date
 from email.utils import parsedate_to_datetime
-from supabase_client import get_supabase_client
+from supabase_client import fetch_all_rows, get_supabase_client
+from fetcher_stats import call_fetcher, order_fetchers, record_fetch, skip_fetch
+from cookie_store import clear_cookies, load_cookies
+from http_sessions import HTTP2_AVAILABLE, get_http_client, get_requests_session
+from browser_pool import BrowserPool, BrowserUnavailable
 from crawl_equibase import (
+    CHROMIUM_MIN_HEADROOM_BYTES,
     COMMON_TRACKS,
     DEFAULT_BROWSER_HEADERS,
-    create_equibase_webdriver,
+    POWERSHELL_MIN_HEADROOM_BYTES,
+    SHARED_BROWSER_MAX_AGE_SECONDS,
+    SHARED_BROWSER_MAX_DOWNLOADS,
+    has_heavy_fallback_headroom,
+    lease_shared_equibase_webdriver,
     normalize_name,
     normalize_pgm,
     page_looks_like_imperva,
+    run_bounded_subprocess,
     warm_equibase_browser_session,
 )
 
@@ -30,6 +44,11 @@ try:
 except ImportError:  # pragma: no cover - installed in some environments only
     curl_requests = None
 
+try:
+    from lxml import etree as xml_etree
+except ImportError:  # pragma: no cover - stdlib ElementTree is used instead
+    import xml.etree.ElementTree as xml_etree
+
 try:
     from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
     from playwright.sync_api import sync_playwright
@@ -64,6 +83,40 @@ SCRATCH_PAGE_HEADERS = {
 
 HEAVY_SCRATCH_FETCHERS = ("powershell", "selenium", "playwright")
 
+# Late-change text patterns, compiled once: classification runs them on every feed line.
+INDEX_TRACK_LINK_RE = re.compile(r'latechanges([A-Z0-9]+)-USA\.html')
+MOBILE_RACE_BLOCK_RE = re.compile(
+    r'<table[^>]*bgcolor="#008000"[^>]*>.*?<b>Race\s+(\d+)</b>.*?</table>(.*?)(?=<table[^>]*bgcolor="#008000"[^>]*>.*?<b>Race\s+\d+</b>|$)',
+    re.IGNORECASE | re.DOTALL,
+)
+MOBILE_CHANGE_ITEM_RE = re.compile(
+    r'(?:<p>\s*<b>#\s*([^<:\s]+)\s+(.+?):\s*</b>\s*</p>\s*)?<p>\s*<ChangeDescWeb>\s*(.*?)\s*</ChangeDescWeb>\s*</p>',
+    re.IGNORECASE | re.DOTALL,
+)
+CANCELLATION_EXCLUSION_KEYWORDS = (
+    'wagering', 'simulcast', 'pool', 'turf racing',
+    'superfecta', 'trifecta', 'exacta', 'daily double', 'pick', 'quinella',
+    'win', 'place', 'show', 'omnibus',
+)
+WHITESPACE_RE = re.compile(r"\s+")
+SEMICOLON_SPACING_RE = re.compile(r"\s*;\s*")
+DASH_SPACING_RE = re.compile(r"\s*-\s+")
+TRAILING_YES_NO_RE = re.compile(r"\s+-\s+[YN]$", re.IGNORECASE)
+NEW_POST_TIME_RE = re.compile(r'changed to\s+(\d{1,2}:\d{2}\s*(?:AM|PM)?)', re.IGNORECASE)
+HEADER_SHORT_DATE_RE = re.compile(r'([A-Z][a-z]{2})\s+(\d{1,2}),\s+(\d{4})')
+RACE_HEADER_NUMBER_RE = re.compile(r'Race:?\s*(\d+)', re.IGNORECASE)
+RSS_XML_DECLARATION_RE = re.compile(r'^\s*<\?xml[^>]*\?>')
+RSS_PARSE_CHUNK_CHARS = 16 * 1024
+RSS_LINE_BREAK_RE = re.compile(r'<br\s*/?>')
+RSS_CANCELLED_RACE_RE = re.compile(r'Race\s*(\d+):.*?Race Cancelled.*?- (.*)', re.IGNORECASE | re.DOTALL)
+HTML_TAG_RE = re.compile(r'<[^>]+>')
+RSS_RACE_PREFIX_RE = re.compile(r'Race\s*(\d+):')
+RSS_HORSE_PREFIX_RE = re.compile(
+    r'#\s*(\w+)\s+(.*?)\s+(Scratched|Scratch Reason|Jockey|Weight|First Start|Gelding|Correction|Equipment|Workouts)',
+    re.IGNORECASE,
+)
+OTB_RACE_DATE_RE = re.compile(r'Race Date:\s*(\d{1,2}/\d{1,2}/\d{4})')
+
 
 def _env_flag(name, default=False):
     value = os.getenv(name)
@@ -94,9 +147,19 @@ def _heavy_scratch_fallbacks_enabled():
     return _env_flag("ENABLE_HEAVY_SCRATCH_FALLBACKS", default=False)
 
 
-def _update_fetch_telemetry(telemetry, fetcher_name, success):
+def _update_fetch_telemetry(telemetry, fetcher_name, success, unchanged=None):
     if telemetry is None:
         return
+
+    if unchanged is not None:
+        # Feed-level outcome once a body is in hand: new content, or identical to last cycle.
+        checks = telemetry.setdefault("feed_checks_by_fetcher", {})
+        checks[fetcher_name] = checks.get(fetcher_name, 0) + 1
+        if unchanged:
+            skips = telemetry.setdefault("unchanged_by_fetcher", {})
+            skips[fetcher_name] = skips.get(fetcher_name, 0) + 1
+        return
+
     attempts = telemetry.setdefault("attempts_by_fetcher", {})
     attempts[fetcher_name] = attempts.get(fetcher_name, 0) + 1
 
@@ -110,7 +173,7 @@ def _merge_fetch_telemetry(target, source):
     if target is None or not source:
         return
 
-    for key in ("attempts_by_fetcher", "successes_by_fetcher"):
+    for key in ("attempts_by_fetcher", "successes_by_fetcher", "feed_checks_by_fetcher", "unchanged_by_fetcher"):
         source_map = source.get(key, {})
         if not source_map:
             continue
@@ -134,11 +197,126 @@ def _summarize_fetchers(fetch_telemetry):
     successes = (fetch_telemetry or {}).get("successes_by_fetcher", {})
     if not successes:
         return "none"
-    order = ("requests", "cloudscraper", "curl_cffi", "powershell", "selenium", "playwright")
+    order = ("httpx_async", "requests", "cloudscraper", "curl_cffi", "powershell", "selenium", "playwright")
     parts = [f"{name}={successes[name]}" for name in order if successes.get(name)]
     return ", ".join(parts) if parts else "none"
 
 
+def _summarize_feed_skips(fetch_telemetry):
+    checks = sum(((fetch_telemetry or {}).get("feed_checks_by_fetcher") or {}).values())
+    skipped = sum(((fetch_telemetry or {}).get("unchanged_by_fetcher") or {}).values())
+    if not checks:
+        return "no feeds checked"
+    return f"{skipped}/{checks} unchanged ({(skipped / checks) * 100:.0f}% skipped)"
+
+
+LATE_CHANGES_FEED_CACHE_MAX_ENTRIES = max(int(os.getenv("LATE_CHANGES_FEED_CACHE_MAX_ENTRIES", "512")), 1)
+# Even an unchanged feed is fully reconciled again once its entry is this old, so changes the
+# database could not take earlier (e.g. a scratch before the entries crawl) are re-applied.
+LATE_CHANGES_FEED_CACHE_MAX_AGE_SECONDS = int(os.getenv("LATE_CHANGES_FEED_CACHE_MAX_AGE_SECONDS", "900"))
+
+# Per-URL validators and body hashes from the last fully processed fetch of each feed
+_feed_cache = {}
+_feed_cache_lock = threading.Lock()
+
+
+def _feed_cache_key(url, race_date):
+    return url, race_date.isoformat() if race_date else None
+
+
+def feed_content_digest(body):
+    return hashlib.sha256((body or "").encode("utf-8", errors="ignore")).hexdigest()
+
+
+def get_feed_cache_entry(url, race_date):
+    key = _feed_cache_key(url, race_date)
+    with _feed_cache_lock:
+        entry = _feed_cache.get(key)
+        if entry and time.monotonic() - entry["stored_at"] >= LATE_CHANGES_FEED_CACHE_MAX_AGE_SECONDS:
+            _feed_cache.pop(key, None)
+            entry = None
+        return dict(entry) if entry else None
+
+
+def conditional_request_headers(url, race_date):
+    entry = get_feed_cache_entry(url, race_date) or {}
+    headers = {}
+    if entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+
+def remember_feed(url, race_date, digest, etag=None, last_modified=None, parsed_items=0):
+    key = _feed_cache_key(url, race_date)
+    with _feed_cache_lock:
+        if key not in _feed_cache and len(_feed_cache) >= LATE_CHANGES_FEED_CACHE_MAX_ENTRIES:
+            _feed_cache.pop(next(iter(_feed_cache)))
+        _feed_cache[key] = {
+            "sha256": digest,
+            "etag": etag,
+            "last_modified": last_modified,
+            "parsed_items": parsed_items,
+            "stored_at": time.monotonic(),
+        }
+
+
+def clear_feed_cache():
+    with _feed_cache_lock:
+        _feed_cache.clear()
+
+
+def _process_feed_body(
+    url, race_date, body, handler, telemetry=None, fetcher_name="unknown", feed_meta=None, collector=None
+):
+    """
+    Run `handler(body) -> (records, ok, parsed_items)` unless the feed is unchanged.
+
+    A feed counts as unchanged on a 304 or when its body hashes the same as the last
+    fully processed copy; both skip parsing and DB work. Validators are only stored
+    after the handler reports success, so a failed reconcile is retried next cycle.
+    With a `collector` the writes happen later, so validators wait for its flush.
+    Returns (records_written, parsed_items).
+    """
+    feed_meta = feed_meta or {}
+    cached = get_feed_cache_entry(url, race_date)
+
+    if feed_meta.get("not_modified") and cached:
+        digest = cached["sha256"]
+        unchanged = True
+    else:
+        if not body:
+            return 0, 0
+        digest = feed_content_digest(body)
+        unchanged = bool(cached) and cached["sha256"] == digest
+
+    _update_fetch_telemetry(telemetry, fetcher_name, True, unchanged=unchanged)
+    if unchanged:
+        logger.info("Late-change feed unchanged since last cycle, skipping %s", url)
+        return 0, cached.get("parsed_items", 0)
+
+    if collector is not None:
+        with collector.feed_scope() as feed_tracks:
+            records, ok, parsed_items = handler(body)
+    else:
+        records, ok, parsed_items = handler(body)
+    if ok:
+        feed = {
+            "url": url,
+            "race_date": race_date,
+            "digest": digest,
+            "etag": feed_meta.get("etag"),
+            "last_modified": feed_meta.get("last_modified"),
+            "parsed_items": parsed_items,
+        }
+        if collector is not None:
+            collector.defer_feed(feed, feed_tracks)
+        else:
+            remember_feed(**feed)
+    return records, parsed_items
+
+
 def _discover_chromium_binary():
     explicit = os.getenv("PLAYWRIGHT_CHROMIUM_EXECUTABLE")
     if explicit and os.path.exists(explicit):
@@ -149,11 +327,22 @@ def _discover_chromium_binary():
     return None
 
 
+def _forget_cookies_if_blocked(url, cookies, text):
+    """Drop a replayed cookie jar that came back with the Imperva interstitial."""
+    if cookies and page_looks_like_imperva(text):
+        logger.info("Stored cookies did not clear the WAF for %s; dropping them", url)
+        clear_cookies(url)
+
+
 def fetch_page_via_requests(url, timeout=15):
     try:
-        response = requests.get(url, headers=SCRATCH_PAGE_HEADERS, timeout=timeout)
+        cookies = load_cookies(url)
+        response = get_requests_session(url).get(
+            url, headers=SCRATCH_PAGE_HEADERS, cookies=cookies, timeout=timeout
+        )
         if response.status_code == 200 and _html_response_is_usable(response.text):
             return response.text
+        _forget_cookies_if_blocked(url, cookies, response.text)
         logger.warning("requests fetch failed for %s with status %s", url, response.status_code)
     except requests.exceptions.Timeout:
         logger.warning("requests timed out for %s", url)
@@ -164,7 +353,7 @@ def fetch_page_via_requests(url, timeout=15):
 
 def fetch_page_via_cloudscraper(url, timeout=20):
     if cloudscraper is None:
-        return None
+        return skip_fetch()
     try:
         scraper = cloudscraper.create_scraper()
         response = scraper.get(url, headers=SCRATCH_PAGE_HEADERS, timeout=timeout)
@@ -178,16 +367,19 @@ def fetch_page_via_cloudscraper(url, timeout=20):
 
 def fetch_page_via_curl_cffi(url, timeout=20):
     if curl_requests is None:
-        return None
+        return skip_fetch()
     try:
+        cookies = load_cookies(url)
         response = curl_requests.get(
             url,
             headers=SCRATCH_PAGE_HEADERS,
+            cookies=cookies,
             impersonate='chrome',
             timeout=timeout,
         )
         if response.status_code == 200 and _html_response_is_usable(response.text):
             return response.text
+        _forget_cookies_if_blocked(url, cookies, response.text)
         logger.warning("curl_cffi fetch failed for %s with status %s", url, response.status_code)
     except Exception as exc:
         logger.warning("curl_cffi fetch failed for %s: %s", url, exc)
@@ -197,7 +389,9 @@ def fetch_page_via_curl_cffi(url, timeout=20):
 def fetch_page_via_powershell(url, timeout=20):
     shell = shutil.which("pwsh") or shutil.which("powershell")
     if shell is None:
-        return None
+        return skip_fetch()
+    if not has_heavy_fallback_headroom(POWERSHELL_MIN_HEADROOM_BYTES, "PowerShell scratch fallback"):
+        return skip_fetch()
 
     temp_file = f"/tmp/equibase_scratches_{int(time.time())}_{os.getpid()}.html"
     script = (
@@ -207,12 +401,9 @@ def fetch_page_via_powershell(url, timeout=20):
     )
 
     try:
-        result = subprocess.run(
+        result = run_bounded_subprocess(
             [shell, "-NoLogo", "-NoProfile", "-Command", script],
-            capture_output=True,
-            text=True,
             timeout=timeout + 10,
-            check=False,
         )
         if result.returncode != 0:
             logger.warning("PowerShell fetch failed for %s: %s", url, result.stderr.strip())
@@ -237,31 +428,29 @@ def fetch_page_via_powershell(url, timeout=20):
 
 
 def fetch_page_via_selenium(url, timeout=45):
-    driver = None
+    """
+    Load the page in this process's shared Selenium session (not the BrowserPool).
+
+    Concurrent scratch threads take turns on the session lease and wait up to `timeout` seconds
+    for it; a thread that cannot get it in time skips the fallback. The results crawler runs in
+    the Equibase worker process and has its own copy of this session. The scheduler's maintenance
+    job closes this process's session once it has sat idle, so Chromium is not kept resident.
+    """
     try:
-        driver = create_equibase_webdriver(timeout=timeout)
-        if driver is None:
-            return None
-        ready = warm_equibase_browser_session(driver, url, min(timeout, 30))
-        html = driver.page_source or ""
-        if ready and _html_response_is_usable(html):
-            return html
-        logger.warning("selenium returned unusable content for %s", url)
+        with lease_shared_equibase_webdriver(timeout=timeout, wait_seconds=timeout) as driver:
+            if driver is None:
+                return skip_fetch()
+            ready = warm_equibase_browser_session(driver, url, min(timeout, 30))
+            html = driver.page_source or ""
+            if ready and _html_response_is_usable(html):
+                return html
+            logger.warning("selenium returned unusable content for %s", url)
     except Exception as exc:
         logger.warning("selenium fetch failed for %s: %s", url, exc)
-    finally:
-        if driver is not None:
-            try:
-                driver.quit()
-            except Exception:
-                pass
     return None
 
 
-def fetch_page_via_playwright(url, timeout=45):
-    if sync_playwright is None:
-        return None
-
+def _playwright_launch_options():
     chromium_binary = _discover_chromium_binary()
     launch_options = {
         "headless": True,
@@ -274,32 +463,82 @@ def fetch_page_via_playwright(url, timeout=45):
     }
     if chromium_binary:
         launch_options["executable_path"] = chromium_binary
+    return launch_options
+
 
+def _launch_playwright_browser():
+    playwright = sync_playwright().start()
     try:
-        with sync_playwright() as playwright:
-            browser = playwright.chromium.launch(**launch_options)
-            context = browser.new_context(
-                user_agent=SCRATCH_PAGE_HEADERS["User-Agent"],
-                extra_http_headers={
-                    "Accept": SCRATCH_PAGE_HEADERS["Accept"],
-                    "Accept-Language": SCRATCH_PAGE_HEADERS["Accept-Language"],
-                    "Referer": SCRATCH_PAGE_HEADERS["Referer"],
-                },
-                viewport={"width": 1400, "height": 1200},
-            )
-            page = context.new_page()
-            page.goto(url, wait_until="domcontentloaded", timeout=timeout * 1000)
-            deadline = time.time() + timeout
-            while time.time() < deadline:
-                html = page.content()
-                if _html_response_is_usable(html):
-                    browser.close()
-                    return html
-                page.wait_for_timeout(1000)
-            browser.close()
-            logger.warning("Playwright remained blocked or empty for %s", url)
+        browser = playwright.chromium.launch(**_playwright_launch_options())
+    except Exception:
+        playwright.stop()
+        raise
+    return {"playwright": playwright, "browser": browser}
+
+
+def _close_playwright_browser(resource):
+    try:
+        resource["browser"].close()
+    finally:
+        resource["playwright"].stop()
+
+
+# Warm Playwright Chromium for the scratch fallback only, recycled on the same age/use budget as
+# the shared Selenium session. Results crawls run in the Equibase worker process and do not use it.
+_playwright_pool = BrowserPool(
+    "playwright",
+    launch=_launch_playwright_browser,
+    close=_close_playwright_browser,
+    admit=lambda: has_heavy_fallback_headroom(CHROMIUM_MIN_HEADROOM_BYTES, "Playwright scratch fallback"),
+    max_age_seconds=SHARED_BROWSER_MAX_AGE_SECONDS,
+    max_uses=SHARED_BROWSER_MAX_DOWNLOADS,
+)
+
+
+def _load_page_with_playwright(resource, url, timeout):
+    # A fresh context per URL keeps cookies/storage isolated while the browser stays warm.
+    context = resource["browser"].new_context(
+        user_agent=SCRATCH_PAGE_HEADERS["User-Agent"],
+        extra_http_headers={
+            "Accept": SCRATCH_PAGE_HEADERS["Accept"],
+            "Accept-Language": SCRATCH_PAGE_HEADERS["Accept-Language"],
+            "Referer": SCRATCH_PAGE_HEADERS["Referer"],
+        },
+        viewport={"width": 1400, "height": 1200},
+    )
+    try:
+        page = context.new_page()
+        page.goto(url, wait_until="domcontentloaded", timeout=timeout * 1000)
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            html = page.content()
+            if _html_response_is_usable(html):
+                return html
+            page.wait_for_timeout(1000)
+        logger.warning("Playwright remained blocked or empty for %s", url)
     except PlaywrightTimeoutError:
         logger.warning("Playwright timed out for %s", url)
+    finally:
+        try:
+            context.close()
+        except Exception:
+            pass
+    return None
+
+
+def fetch_page_via_playwright(url, timeout=45):
+    if sync_playwright is None:
+        return skip_fetch()
+
+    try:
+        # Budget for a browser launch on top of the page load when the pool is cold.
+        return _playwright_pool.run(
+            lambda resource: _load_page_with_playwright(resource, url, timeout),
+            timeout=timeout * 2 + 30,
+        )
+    except BrowserUnavailable as exc:
+        logger.warning("Playwright fetch skipped for %s: %s", url, exc)
+        return skip_fetch()
     except Exception as exc:
         logger.warning("Playwright fetch failed for %s: %s", url, exc)
     return None
@@ -310,8 +549,12 @@ def fetch_static_page(url, retries=2, telemetry=None):
     Fetch a late-changes HTML page using layered HTTP and browser fallbacks.
     """
     for attempt in range(retries):
-        for fetcher_name, fetcher in _fetcher_chain():
-            html = fetcher(url)
+        for fetcher_name, fetcher in order_fetchers(url, _fetcher_chain()):
+            html, latency, ran = call_fetcher(fetcher, url)
+            if not ran:
+                # Refused by its gate (flag, breaker, headroom, missing dependency): no attempt to score.
+                continue
+            record_fetch(url, fetcher_name, bool(html), latency)
             _update_fetch_telemetry(telemetry, fetcher_name, bool(html))
             if html:
                 return html
@@ -321,6 +564,217 @@ def fetch_static_page(url, retries=2, telemetry=None):
     logger.error(f"All fetch methods failed for {url}")
     return None
 
+RSS_FEED_URL = "https://www.equibase.com/static/latechanges/rss/{track_code}-USA.rss"
+RSS_FEED_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+}
+LATE_CHANGES_FETCH_CONCURRENCY = max(int(os.getenv("LATE_CHANGES_FETCH_CONCURRENCY", "6")), 1)
+LATE_CHANGES_FETCH_TIMEOUT_SECONDS = float(os.getenv("LATE_CHANGES_FETCH_TIMEOUT_SECONDS", "15"))
+ASYNC_FETCHER_NAME = "httpx_async"
+
+
+def _rss_response_is_usable(text):
+    return bool(text) and text.startswith('<?xml')
+
+
+def _build_async_feed_client():
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(LATE_CHANGES_FETCH_TIMEOUT_SECONDS),
+        follow_redirects=True,
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(
+            max_connections=LATE_CHANGES_FETCH_CONCURRENCY,
+            max_keepalive_connections=LATE_CHANGES_FETCH_CONCURRENCY,
+        ),
+    )
+
+
+async def _fetch_feed_async(client, semaphore, url, headers, is_usable, race_date=None):
+    """
+    Conditionally GET one feed. Returns (body, meta); meta carries the response
+    validators and `not_modified` when the server answered 304.
+    """
+    request_headers = {**headers, **conditional_request_headers(url, race_date)}
+    stored_cookies = load_cookies(url)
+    if stored_cookies:
+        # httpx deprecated per-request cookies; the client is shared across hosts, so send a header.
+        request_headers["Cookie"] = "; ".join(f"{name}={value}" for name, value in stored_cookies.items())
+    async with semaphore:
+        try:
+            response = await client.get(url, headers=request_headers)
+        except Exception as exc:
+            logger.warning("async fetch failed for %s: %s", url, exc)
+            return None, {}
+
+    meta = {
+        "etag": response.headers.get("etag"),
+        "last_modified": response.headers.get("last-modified"),
+    }
+    if response.status_code == 304:
+        return None, {**meta, "not_modified": True}
+    if response.status_code == 200 and is_usable(response.text):
+        return response.text, meta
+    _forget_cookies_if_blocked(url, stored_cookies, response.text)
+    logger.warning("async fetch failed for %s with status %s", url, response.status_code)
+    return None, {}
+
+
+async def _fetch_track_feeds_async(client, semaphore, track_code, telemetry, race_date=None):
+    """Fetch a track's RSS and direct late-changes HTML concurrently; legacy host only if TVG misses."""
+    rss_url = RSS_FEED_URL.format(track_code=track_code)
+    tvg_url = TVG_LATE_CHANGES_TRACK_URL.format(track_code=track_code)
+    (rss_xml, rss_meta), (direct_html, direct_meta) = await asyncio.gather(
+        _fetch_feed_async(client, semaphore, rss_url, RSS_FEED_HEADERS, _rss_response_is_usable, race_date),
+        _fetch_feed_async(client, semaphore, tvg_url, SCRATCH_PAGE_HEADERS, _html_response_is_usable, race_date),
+    )
+    direct_url = tvg_url
+    direct_ok = bool(direct_html) or bool(direct_meta.get("not_modified"))
+    _update_fetch_telemetry(telemetry, ASYNC_FETCHER_NAME, direct_ok)
+
+    if not direct_ok:
+        direct_url = LEGACY_LATE_CHANGES_TRACK_URL.format(track_code=track_code)
+        direct_html, direct_meta = await _fetch_feed_async(
+            client, semaphore, direct_url, SCRATCH_PAGE_HEADERS, _html_response_is_usable, race_date
+        )
+        direct_ok = bool(direct_html) or bool(direct_meta.get("not_modified"))
+        _update_fetch_telemetry(telemetry, ASYNC_FETCHER_NAME, direct_ok)
+
+    return {
+        'rss': rss_xml,
+        'rss_meta': rss_meta,
+        'direct_html': direct_html,
+        'direct_url': direct_url if direct_ok else None,
+        'direct_meta': direct_meta if direct_ok else {},
+    }
+
+
+def process_track_late_changes(track_code, race_date, prefetched=None, telemetry=None, collector=None):
+    """
+    Parse and reconcile one track's RSS plus direct (or mobile) HTML late changes.
+
+    `prefetched` carries bodies from the async fetch stage; anything missing falls back
+    to the layered synchronous fetchers. Feeds unchanged since the last cycle are
+    skipped before parsing. With a `collector`, changes are buffered for one merged
+    write instead of being reconciled here. Returns per-source record counts.
+    """
+    prefetched = prefetched or {}
+    counts = {'rss': 0, 'direct_html': 0, 'mobile_html': 0}
+
+    counts['rss'] = process_rss_for_track(
+        track_code,
+        xml=prefetched.get('rss'),
+        race_date=race_date,
+        telemetry=telemetry,
+        feed_meta=prefetched.get('rss_meta'),
+        collector=collector,
+    )
+
+    def reconcile_html(parser, source):
+        def handler(body):
+            changes = parser(body, track_code)
+            if not changes:
+                return 0, True, 0
+            records, ok = _reconcile_or_collect(track_code, race_date, changes, source, collector)
+            return records, ok, len(changes)
+        return handler
+
+    source_url = prefetched.get('direct_url')
+    direct_meta = prefetched.get('direct_meta') or {}
+    html = prefetched.get('direct_html')
+    if source_url:
+        # Attempts were already counted by the async stage; only the label is needed here.
+        direct_fetch_meta = {"successful_fetcher": ASYNC_FETCHER_NAME}
+    else:
+        direct_fetch_meta = {}
+        html, source_url = fetch_direct_track_changes_page(track_code, telemetry=direct_fetch_meta)
+        _merge_fetch_telemetry(telemetry, direct_fetch_meta)
+
+    source_name = 'direct_html'
+    fetcher_label = _format_fetcher_label(direct_fetch_meta)
+    count, parsed_items = 0, 0
+    if source_url:
+        count, parsed_items = _process_feed_body(
+            source_url,
+            race_date,
+            html,
+            reconcile_html(parse_track_changes, 'direct_html'),
+            telemetry=telemetry,
+            fetcher_name=fetcher_label,
+            feed_meta=direct_meta,
+            collector=collector,
+        )
+
+    if not parsed_items:
+        mobile_fetch_meta = {}
+        mobile_html, mobile_url = fetch_mobile_track_changes_page(track_code, telemetry=mobile_fetch_meta)
+        _merge_fetch_telemetry(telemetry, mobile_fetch_meta)
+        if mobile_html:
+            source_url = mobile_url
+            fetcher_label = _format_fetcher_label(mobile_fetch_meta)
+            source_name = 'mobile_html'
+            count, parsed_items = _process_feed_body(
+                mobile_url,
+                race_date,
+                mobile_html,
+                reconcile_html(parse_mobile_track_changes, 'mobile_html'),
+                telemetry=telemetry,
+                fetcher_name=fetcher_label,
+                collector=collector,
+            )
+
+    if count:
+        counts[source_name] += count
+        logger.info(
+            "Direct late-changes HTML processed %s record(s) for %s via %s using %s",
+            count,
+            track_code,
+            source_url,
+            fetcher_label,
+        )
+
+    return counts
+
+
+async def _crawl_tracks_async(track_codes, race_date, telemetry, collector=None):
+    semaphore = asyncio.Semaphore(LATE_CHANGES_FETCH_CONCURRENCY)
+    results = {}
+
+    async with _build_async_feed_client() as client:
+        async def crawl_one(track_code):
+            track_telemetry = {}
+            try:
+                prefetched = await _fetch_track_feeds_async(
+                    client, semaphore, track_code, track_telemetry, race_date
+                )
+                # Parsing and DB work run off the event loop so other tracks keep downloading.
+                counts = await asyncio.to_thread(
+                    process_track_late_changes, track_code, race_date, prefetched, track_telemetry,
+                    collector=collector,
+                )
+            except Exception as exc:
+                logger.error(f"Late-changes crawl failed for {track_code}: {exc}")
+                counts = {}
+            return track_code, counts, track_telemetry
+
+        for finished in asyncio.as_completed([crawl_one(code) for code in sorted(track_codes)]):
+            track_code, counts, track_telemetry = await finished
+            results[track_code] = counts
+            _merge_fetch_telemetry(telemetry, track_telemetry)
+
+    return results
+
+
+def crawl_tracks_concurrently(track_codes, race_date, telemetry=None, collector=None):
+    """
+    Fetch every track's late-change feeds concurrently (bounded by LATE_CHANGES_FETCH_CONCURRENCY)
+    and reconcile each track as soon as its feeds arrive (or buffer into `collector`).
+    Returns {track_code: source counts}.
+    """
+    if not track_codes:
+        return {}
+    return asyncio.run(_crawl_tracks_async(track_codes, race_date, telemetry, collector=collector))
+
+
 def parse_late_changes_index(telemetry=None):
     """
     Parse the main late changes page to find links for specific tracks
@@ -340,7 +794,7 @@ def parse_late_changes_index(telemetry=None):
         href = a['href']
         if 'latechanges' in href and '-USA.html' in href:
             # Extract track code: latechangesGP-USA.html -> GP
-            match = re.search(r'latechanges([A-Z0-9]+)-USA\.html', href)
+            match = INDEX_TRACK_LINK_RE.search(href)
             if match:
                 code = match.group(1)
                 full_url = EQUIBASE_BASE_URL + href if not href.startswith('http') else href
@@ -386,20 +840,12 @@ def parse_mobile_track_changes(html, track_code):
         return []
 
     changes = []
-    race_blocks = re.finditer(
-        r'<table[^>]*bgcolor="#008000"[^>]*>.*?<b>Race\s+(\d+)</b>.*?</table>(.*?)(?=<table[^>]*bgcolor="#008000"[^>]*>.*?<b>Race\s+\d+</b>|$)',
-        html,
-        re.IGNORECASE | re.DOTALL,
-    )
+    race_blocks = MOBILE_RACE_BLOCK_RE.finditer(html)
 
     for match in race_blocks:
         race_number = int(match.group(1))
         block = match.group(2)
-        item_matches = re.finditer(
-            r'(?:<p>\s*<b>#\s*([^<:\s]+)\s+(.+?):\s*</b>\s*</p>\s*)?<p>\s*<ChangeDescWeb>\s*(.*?)\s*</ChangeDescWeb>\s*</p>',
-            block,
-            re.IGNORECASE | re.DOTALL,
-        )
+        item_matches = MOBILE_CHANGE_ITEM_RE.finditer(block)
         for item in item_matches:
             program_number = normalize_pgm(item.group(1)) if item.group(1) else None
             horse_name = normalize_name(item.group(2)) if item.group(2) else ""
@@ -451,14 +897,14 @@ def normalize_change_description(description):
     if not description:
         return ""
 
-    description = re.sub(r"\s+", " ", description).strip()
-    description = re.sub(r"\s*;\s*", "; ", description)
-    description = re.sub(r"\s*-\s+", " - ", description)
+    description = WHITESPACE_RE.sub(" ", description).strip()
+    description = SEMICOLON_SPACING_RE.sub("; ", description)
+    description = DASH_SPACING_RE.sub(" - ", description)
 
     parts = []
     seen = set()
     for raw_part in [part.strip() for part in description.split(";") if part.strip()]:
-        cleaned_part = re.sub(r"\s+-\s+[YN]$", "", raw_part, flags=re.IGNORECASE).strip()
+        cleaned_part = TRAILING_YES_NO_RE.sub("", raw_part).strip()
         canonical = cleaned_part.lower()
         if canonical in seen:
             continue
@@ -484,13 +930,7 @@ def is_valid_cancellation(text):
     # 'turf' -> "Turf Racing Cancelled"
     # 'superfecta', 'trifecta', etc are covered by 'wagering' usually, but generic filtering is safer
     
-    exclusion_keywords = [
-        'wagering', 'simulcast', 'pool', 'turf racing', 
-        'superfecta', 'trifecta', 'exacta', 'daily double', 'pick', 'quinella',
-        'win', 'place', 'show', 'omnibus'
-    ]
-    
-    if any(k in text_lower for k in exclusion_keywords):
+    if any(k in text_lower for k in CANCELLATION_EXCLUSION_KEYWORDS):
         return False
         
     # Additional Safe Guard:
@@ -507,7 +947,7 @@ def extract_new_post_time(text):
     """
     # Regex for 1:30 PM or 12:45
     # Look for "changed to X:XX PM"
-    m = re.search(r'changed to\s+(\d{1,2}:\d{2}\s*(?:AM|PM)?)', text, re.IGNORECASE)
+    m = NEW_POST_TIME_RE.search(text)
     if m:
         time_str = m.group(1).upper()
         # Ensure AM/PM if missing (heuristic?) usually Equibase has it.
@@ -561,7 +1001,7 @@ def parse_track_changes(html, track_code):
             header_text = text_content[:1000] # First 1000 chars
             
             # Check for patterns like "Jan 21, 2026" when today is Jan 22
-            found_dates = re.findall(r'([A-Z][a-z]{2})\s+(\d{1,2}),\s+(\d{4})', header_text)
+            found_dates = HEADER_SHORT_DATE_RE.findall(header_text)
             for m in found_dates:
                 try:
                     d_str = f"{m[0]} {m[1]}, {m[2]}"
@@ -597,7 +1037,7 @@ def parse_track_changes(html, track_code):
         if header_th:
             txt = header_th.get_text(strip=True)
             # "Race: 1"
-            m = re.search(r'Race:?\s*(\d+)', txt, re.IGNORECASE)
+            m = RACE_HEADER_NUMBER_RE.search(txt)
             if m:
                 current_race = int(m.group(1))
             continue
@@ -698,7 +1138,7 @@ def parse_track_changes(html, track_code):
         txt = h.get_text(strip=True)
         if is_valid_cancellation(txt):
             # Extract race number
-            m = re.search(r'Race:?\s*(\d+)', txt, re.IGNORECASE)
+            m = RACE_HEADER_NUMBER_RE.search(txt)
             if m:
                 r_num = int(m.group(1))
                 changes.append({
@@ -715,33 +1155,106 @@ def fetch_rss_feed(track_code):
     """
     Fetch RSS feed for a track.
     """
-    url = f"https://www.equibase.com/static/latechanges/rss/{track_code}-USA.rss"
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-    }
+    url = RSS_FEED_URL.format(track_code=track_code)
     try:
-        r = requests.get(url, headers=headers, timeout=10)
-        if r.status_code == 200 and r.text.startswith('<?xml'):
+        r = get_http_client(url).get(url, headers=RSS_FEED_HEADERS, timeout=10)
+        if r.status_code == 200 and _rss_response_is_usable(r.text):
             return r.text
     except Exception as e:
         logger.warning(f"RSS fetch failed for {track_code}: {e}")
     return None
 
+def _rss_local_name(tag):
+    return tag.rsplit('}', 1)[-1].lower() if isinstance(tag, str) else ""
+
+
+def _drain_rss_items(parser, open_elements):
+    for event, element in parser.read_events():
+        if event == 'start':
+            open_elements.append(element)
+            continue
+        open_elements.pop()
+        if _rss_local_name(element.tag) != 'item':
+            continue
+        pub_date_str = None
+        desc = ""
+        found_pub_date = found_desc = False
+        for child in element.iter():
+            name = _rss_local_name(child.tag)
+            if name == 'pubdate' and not found_pub_date:
+                pub_date_str, found_pub_date = child.text or "", True
+            elif name == 'description' and not found_desc:
+                desc, found_desc = child.text or "", True
+        # Detach the finished item from <channel> so the partial tree never holds more than one.
+        if open_elements:
+            open_elements[-1].remove(element)
+        element.clear()
+        yield pub_date_str, desc
+
+
+def _iter_rss_items_streaming(xml_content):
+    """
+    Yield (pubDate text, description text) per <item> with an incremental XML parser.
+
+    The body is fed in RSS_PARSE_CHUNK_CHARS chunks and each finished item is yielded and
+    dropped from its parent before the next chunk, so only the item in progress is in memory.
+    Raises the parser's error on malformed feeds.
+    """
+    if isinstance(xml_content, bytes):
+        xml_content = xml_content.decode('utf-8', errors='replace')
+    # The body is already decoded text; a stale encoding declaration would confuse the parser.
+    xml_content = RSS_XML_DECLARATION_RE.sub('', xml_content, count=1)
+
+    parser = xml_etree.XMLPullParser(events=('start', 'end'))
+    open_elements = []
+    for offset in range(0, len(xml_content), RSS_PARSE_CHUNK_CHARS):
+        parser.feed(xml_content[offset:offset + RSS_PARSE_CHUNK_CHARS])
+        yield from _drain_rss_items(parser, open_elements)
+    parser.close()
+    yield from _drain_rss_items(parser, open_elements)
+
+
+def _iter_rss_items_soup(xml_content):
+    soup = BeautifulSoup(xml_content, 'html.parser')
+    for item in soup.find_all('item'):
+        pub_date_str = item.pubdate.text if item.pubdate else None
+        desc = item.description.text if item.description else ""
+        yield pub_date_str, desc
+
+
+class _RssStreamError(Exception):
+    """The streaming XML parser rejected the feed part-way through."""
+
+
+def _guard_rss_stream(xml_content):
+    # Parser errors surface from the generator; errors in the caller's loop body do not pass through here.
+    try:
+        yield from _iter_rss_items_streaming(xml_content)
+    except Exception as exc:
+        raise _RssStreamError(exc) from exc
+
+
 def parse_rss_changes(xml_content, track_code):
     """
     Parse RSS XML to extract changes.
     Validates <pubDate> to ensure relevance.
+    Well-formed feeds take the streaming XML path one item at a time; anything else falls back
+    to BeautifulSoup, discarding whatever the stream had produced.
     """
-    soup = BeautifulSoup(xml_content, 'html.parser') # xml parser missing, fallback to html.parser
-    items = soup.find_all('item')
-    changes = []
-    
     today = date.today()
-    
-    for item in items:
+    try:
+        return _rss_changes_from_items(_guard_rss_stream(xml_content), today)
+    except _RssStreamError as e:
+        logger.debug(f"Streaming RSS parse failed for {track_code}, using html.parser: {e}")
+    return _rss_changes_from_items(_iter_rss_items_soup(xml_content), today)
+
+
+def _rss_changes_from_items(items, today):
+    changes = []
+
+    for pub_date_str, desc in items:
         # DATE VALIDATION
         # <pubDate>Thu, 22 Jan 2026 09:30:00 EST</pubDate>
-        pub_date_str = item.pubdate.text if item.pubdate else None
         if not pub_date_str:
             # Fallback: try finding it in description or assume current if RSS cache is trusted?
             # Better to skip if uncertain to avoid the bug.
@@ -763,13 +1276,12 @@ def parse_rss_changes(xml_content, track_code):
                 # Let's SKIP to be safe.
                 continue
 
-        desc = item.description.text if item.description else ""
         # Description contains multiple lines separated by <br/> (encoded or not)
         # BeautifulSoup XML parser might decode it.
         # Example: "Race 05: <b>...</b> <i>Race Cancelled</i> ..."
         
         # Split by <br/> tags
-        lines = re.split(r'<br\s*/?>', desc)
+        lines = RSS_LINE_BREAK_RE.split(desc)
         
         for line in lines:
             if not line.strip(): continue
@@ -782,7 +1294,7 @@ def parse_rss_changes(xml_content, track_code):
             # Or use regex that tolerates tags.
             # "Race (\d+):.*Race Cancelled.*- (.*)"
             
-            m_cancel = re.search(r'Race\s*(\d+):.*?Race Cancelled.*?- (.*)', line, re.IGNORECASE | re.DOTALL)
+            m_cancel = RSS_CANCELLED_RACE_RE.search(line)
             if m_cancel:
                 desc = m_cancel.group(2).strip()
                 # Double check with validator just in case regex was too greedy
@@ -813,12 +1325,12 @@ def parse_rss_changes(xml_content, track_code):
             # Be careful with <b> and </b> items.
             
             # Let's simple remove tags to parse structure
-            clean_line = re.sub(r'<[^>]+>', '', line).strip()
+            clean_line = HTML_TAG_RE.sub('', line).strip()
             # "Race 02: # 5 A Lister Scratched - Reason Unavailable"
             # "Race 02: # 5 A Lister Scratch Reason - Reason Unavailable changed to PrivVet-Injured"
             
             # Parse Race Number
-            m_race = re.match(r'Race\s*(\d+):', clean_line)
+            m_race = RSS_RACE_PREFIX_RE.match(clean_line)
             if not m_race: continue
             r_num = int(m_race.group(1))
             
@@ -830,7 +1342,7 @@ def parse_rss_changes(xml_content, track_code):
             pgm = None
             horse_name = None
             
-            m_horse = re.match(r'#\s*(\w+)\s+(.*?)\s+(Scratched|Scratch Reason|Jockey|Weight|First Start|Gelding|Correction|Equipment|Workouts)', content, re.IGNORECASE)
+            m_horse = RSS_HORSE_PREFIX_RE.match(content)
             
             if m_horse:
                 pgm = m_horse.group(1)
@@ -874,232 +1386,485 @@ def parse_rss_changes(xml_content, track_code):
             
     return changes
 
-def process_rss_for_track(track_code):
+def process_rss_for_track(track_code, xml=None, race_date=None, telemetry=None, feed_meta=None, collector=None):
     """
     Crawl RSS for a specific track and return count of processed.
+    Pass `xml`/`feed_meta` to reuse a feed already fetched by the async fetch stage.
     """
     logger.info(f"Checking RSS for {track_code}...")
-    xml = fetch_rss_feed(track_code)
-    if not xml: return 0
-    
-    changes = parse_rss_changes(xml, track_code)
-    logger.info(f"RSS found {len(changes)} changes/cancellations for {track_code}")
-    
-    today = date.today()
-    processed = update_changes_in_db(track_code, today, changes)
+    race_date = race_date or date.today()
+    feed_meta = feed_meta or {}
+    fetcher_name = ASYNC_FETCHER_NAME
+    if xml is None and not feed_meta.get("not_modified"):
+        xml = fetch_rss_feed(track_code)
+        fetcher_name = "requests"
+        if not xml: return 0
+
+    def handler(body):
+        changes = parse_rss_changes(body, track_code)
+        logger.info(f"RSS found {len(changes)} changes/cancellations for {track_code}")
+        records, ok = _reconcile_or_collect(track_code, race_date, changes, 'rss', collector)
+        return records, ok, len(changes)
+
+    processed, _parsed = _process_feed_body(
+        RSS_FEED_URL.format(track_code=track_code),
+        race_date,
+        xml,
+        handler,
+        telemetry=telemetry,
+        fetcher_name=fetcher_name,
+        feed_meta=feed_meta,
+        collector=collector,
+    )
     logger.info(f"RSS processed {processed} record(s) for {track_code}")
     return processed
 
 CANCELLATIONS_URL = "https://www.equibase.com/static/latechanges/html/cancellations.html" # Keep for reference or if it starts working
 
 
-def update_changes_in_db(track_code, race_date, change_list):
+HORSE_SPECIFIC_CHANGE_TYPES = ('Scratch', 'Jockey Change', 'Weight Change', 'Equipment Change')
+CHANGE_DESCRIPTION_MAX_CHARS = 500
+
+
+def merge_change_description(existing_desc, new_desc):
     """
-    Update database for found changes (scratches and others)
+    Apply the late-change dedupe rules to an existing description.
+
+    Returns the merged description, or None when the existing record should be left alone.
     """
-    supabase = get_supabase_client()
-    count = 0
-    scratches_marked = 0
-    
-    for item in change_list:
-        try:
-            # 1. Find Race ID
-            race_key = f"{track_code}-{race_date.strftime('%Y%m%d')}-{item['race_number']}"
-            
-            # Get Race
-            r_res = supabase.table('hranalyzer_races').select('id, race_status').eq('race_key', race_key).execute()
-            if not r_res.data:
-                continue
-                
-            race_obj = r_res.data[0]
-            race_id = race_obj['id']
-            current_status = race_obj.get('race_status', 'open')
-            
-            # 2. Find Entry to mark
-            entry_id = None
-            resolved_program_number = item.get('program_number')
-            entry_was_scratched = False
-            
-            # Try PGM match
-            if item['program_number']:
-                e_res = supabase.table('hranalyzer_race_entries')\
-                    .select('id, scratched, program_number')\
-                    .eq('race_id', race_id)\
-                    .eq('program_number', item['program_number'])\
-                    .execute()
-                    
-                if e_res.data:
-                    entry = e_res.data[0]
-                    entry_id = entry['id']
-                    resolved_program_number = entry.get('program_number') or resolved_program_number
-                    entry_was_scratched = bool(entry.get('scratched'))
-            
-            # Fallback Name match
-            if not entry_id and item['horse_name']:
-                 all_entries = supabase.table('hranalyzer_race_entries')\
-                    .select('id, program_number, scratched, hranalyzer_horses!inner(horse_name)')\
-                    .eq('race_id', race_id)\
-                    .execute()
-                 
-                 target_norm = item['horse_name']
-                 for e in all_entries.data:
-                     h_name = e['hranalyzer_horses']['horse_name']
-                     if normalize_name(h_name) == target_norm:
-                         entry_id = e['id']
-                         resolved_program_number = e.get('program_number') or resolved_program_number
-                         entry_was_scratched = bool(e.get('scratched'))
-                         break
-            
-            # ORPHAN PREVENTION:
-            # If this is a horse-specific change but we found no horse, DO NOT insert as "Race-wide"
-            horse_specific_types = ['Scratch', 'Jockey Change', 'Weight Change', 'Equipment Change']
-            if item['change_type'] in horse_specific_types and not entry_id:
-                logger.warning(f"⚠️ Skipping orphan {item['change_type']} for {track_code} R{item['race_number']} ({item['horse_name']}/{item['program_number']})")
-                continue
+    existing_desc = existing_desc or ""
 
-            # 3. DEDUPLICATION / MERGE Logic
-            # Check if this change already exists (same race, entry, and type)
-            query = supabase.table('hranalyzer_changes')\
-                .select('id, description')\
-                .eq('race_id', race_id)\
-                .eq('change_type', item['change_type'])
-            
-            if entry_id:
-                query = query.eq('entry_id', entry_id)
-            else:
-                query = query.is_('entry_id', 'null')
-            
-            existing_res = query.execute()
-            
-            if existing_res.data:
-                # SMART DEDUPLICATION
-                existing_record = existing_res.data[0]
-                existing_desc = existing_record['description'] or ""
-                new_desc = normalize_change_description(item['description'])
-                
-                should_update = False
-                final_desc = existing_desc
+    # A) Priority Overwrite: If existing is "Unavailable" and new is specific, take new
+    if "Reason Unavailable" in existing_desc and "Reason Unavailable" not in new_desc:
+        return new_desc
 
-                # A) Priority Overwrite: If existing is "Unavailable" and new is specific, take new
-                if "Reason Unavailable" in existing_desc and "Reason Unavailable" not in new_desc:
-                    final_desc = new_desc
-                    should_update = True
-                
-                # B) Ignore: If existing is specific and new is "Unavailable", keep existing
-                elif "Reason Unavailable" not in existing_desc and "Reason Unavailable" in new_desc:
-                    should_update = False
-                    # Do nothing
-                    
-                # C) Merge: If both are valid, merge if different
-                else:
-                    normalized_existing = normalize_change_description(existing_desc)
-                    if new_desc and new_desc not in normalized_existing:
-                         final_desc = normalize_change_description(f"{normalized_existing}; {new_desc}")
-                         if len(final_desc) > 500: final_desc = final_desc[:497] + "..."
-                         should_update = True
-                
-                if should_update:
-                    supabase.table('hranalyzer_changes')\
-                        .update({'description': final_desc})\
-                        .eq('id', existing_record['id'])\
-                        .execute()
-                    count += 1
+    # B) Ignore: If existing is specific and new is "Unavailable", keep existing
+    if "Reason Unavailable" not in existing_desc and "Reason Unavailable" in new_desc:
+        return None
+
+    # C) Merge: If both are valid, merge if different
+    normalized_existing = normalize_change_description(existing_desc)
+    if new_desc and new_desc not in normalized_existing:
+        final_desc = normalize_change_description(f"{normalized_existing}; {new_desc}")
+        if len(final_desc) > CHANGE_DESCRIPTION_MAX_CHARS:
+            final_desc = final_desc[:CHANGE_DESCRIPTION_MAX_CHARS - 3] + "..."
+        return final_desc
+    return None
+
+
+class ChangeReconciler:
+    """
+    Reconcile one track/date worth of late changes against the database.
+
+    Races, entries and existing change rows are preloaded in a handful of queries,
+    every insert/update is planned in memory, and the plan is committed in bulk.
+    """
+
+    def __init__(self, supabase, track_code, race_date):
+        self.supabase = supabase
+        self.track_code = track_code
+        self.race_date = race_date
+        self.races_by_key = {}
+        self.entries_by_race = {}
+        self.changes_by_key = {}
+        self.pending_inserts = {}
+        self.pending_updates = {}
+        self.scratch_entry_ids = set()
+        self.race_updates = {}
+        self.count = 0
+        self.scratches_marked = 0
+        # Skipped because the card is not in the database yet; worth re-reading the feed for.
+        self.unmatched = 0
+        # Skipped although the card is loaded (unknown horse or race number); re-reading will not help.
+        self.orphaned = 0
+
+    def race_key_for(self, race_number):
+        return f"{self.track_code}-{self.race_date.strftime('%Y%m%d')}-{race_number}"
+
+    def preload(self, change_list):
+        race_keys = sorted({self.race_key_for(item['race_number']) for item in change_list})
+        if not race_keys:
+            return
+
+        races = self.supabase.table('hranalyzer_races')\
+            .select('id, race_key, race_status')\
+            .in_('race_key', race_keys)\
+            .execute().data or []
+        self.races_by_key = {race['race_key']: dict(race) for race in races}
+
+        race_ids = [race['id'] for race in self.races_by_key.values()]
+        if not race_ids:
+            return
+
+        entries = fetch_all_rows(
+            self.supabase.table('hranalyzer_race_entries')
+            .select('id, race_id, program_number, scratched, finish_position, hranalyzer_horses(horse_name)')
+            .in_('race_id', race_ids)
+            .order('id')
+        )
+        for entry in entries:
+            self.entries_by_race.setdefault(entry['race_id'], []).append(entry)
+
+        existing_changes = fetch_all_rows(
+            self.supabase.table('hranalyzer_changes')
+            .select('id, race_id, entry_id, change_type, description')
+            .in_('race_id', race_ids)
+            .order('id')
+        )
+        for change in existing_changes:
+            key = (change['race_id'], change.get('entry_id'), change['change_type'])
+            # Keep the first row per key, matching the old `existing_res.data[0]` behaviour.
+            self.changes_by_key.setdefault(key, change)
+
+    def _match_entry(self, race_id, item):
+        entries = self.entries_by_race.get(race_id, [])
+
+        # Try PGM match
+        if item['program_number']:
+            for entry in entries:
+                if entry.get('program_number') == item['program_number']:
+                    return entry
+
+        # Fallback Name match
+        if item['horse_name']:
+            target_norm = item['horse_name']
+            for entry in entries:
+                horse = entry.get('hranalyzer_horses') or {}
+                if horse.get('horse_name') and normalize_name(horse['horse_name']) == target_norm:
+                    return entry
+
+        return None
+
+    def _queue_race_update(self, race, updates):
+        self.race_updates.setdefault(race['id'], {}).update(updates)
+        race.update({key: value for key, value in updates.items() if key == 'race_status'})
+
+    def apply(self, item):
+        """
+        Plan the writes for one change. Returns False when the change could not be matched to a
+        stored race or entry and was skipped. Skips count as `unmatched` while the card is not
+        loaded yet (no referenced race, or a race without entries) and as `orphaned` otherwise.
+        """
+        race = self.races_by_key.get(self.race_key_for(item['race_number']))
+        if not race:
+            logger.warning(f"⚠️ Skipping change for unknown race {self.track_code} R{item['race_number']} on {self.race_date}")
+            if self.races_by_key:
+                self.orphaned += 1
             else:
-                # 4. INSERT into hranalyzer_changes
-                change_record = {
-                    'race_id': race_id,
-                    'entry_id': entry_id,
-                    'change_type': item['change_type'],
-                    'description': normalize_change_description(item['description'])
-                }
-                
-                try:
-                    supabase.table('hranalyzer_changes').insert(change_record).execute()
-                    count += 1
-                except Exception as e:
-                    logger.warning(f"Insert race condition (or duplicate) for {track_code} R{item['race_number']}: {e}")
+                self.unmatched += 1
+            return False
+
+        race_id = race['id']
+        entry = self._match_entry(race_id, item)
+        entry_id = entry['id'] if entry else None
+        resolved_program_number = (entry or {}).get('program_number') or item.get('program_number')
+        entry_was_scratched = bool((entry or {}).get('scratched'))
+
+        # ORPHAN PREVENTION:
+        # If this is a horse-specific change but we found no horse, DO NOT insert as "Race-wide"
+        if item['change_type'] in HORSE_SPECIFIC_CHANGE_TYPES and not entry_id:
+            logger.warning(f"⚠️ Skipping orphan {item['change_type']} for {self.track_code} R{item['race_number']} ({item['horse_name']}/{item['program_number']})")
+            if self.entries_by_race.get(race_id):
+                self.orphaned += 1
+            else:
+                self.unmatched += 1
+            return False
+
+        # DEDUPLICATION / MERGE Logic against stored and already-planned records
+        key = (race_id, entry_id, item['change_type'])
+        new_desc = normalize_change_description(item['description'])
+        if key in self.pending_inserts:
+            merged = merge_change_description(self.pending_inserts[key]['description'], new_desc)
+            if merged is not None:
+                self.pending_inserts[key]['description'] = merged
+        elif key in self.changes_by_key:
+            existing = self.changes_by_key[key]
+            merged = merge_change_description(existing.get('description'), new_desc)
+            if merged is not None:
+                existing['description'] = merged
+                self.pending_updates[existing['id']] = existing
+        else:
+            self.pending_inserts[key] = {
+                'race_id': race_id,
+                'entry_id': entry_id,
+                'change_type': item['change_type'],
+                'description': new_desc,
+            }
+
+        # Side effects (Scratched flag, Race Status)
+        if item['change_type'] == 'Scratch' and entry_id:
+            self.scratch_entry_ids.add(entry_id)
+            if entry_was_scratched:
+                logger.info(
+                    f"✂️ SCRATCH CONFIRMED: {self.track_code} R{item['race_number']} "
+                    f"#{resolved_program_number} ({item['description']})"
+                )
+            else:
+                logger.info(
+                    f"✂️ MARKED SCRATCH: {self.track_code} R{item['race_number']} "
+                    f"#{resolved_program_number} ({item['description']})"
+                )
+                entry['scratched'] = True
+                self.scratches_marked += 1
+        elif item['change_type'] == 'Race Cancelled':
+            # SAFEGUARD: Do not cancel if race is Completed OR has results
+            has_results = any(
+                entry_row.get('finish_position') in (1, 2, 3)
+                for entry_row in self.entries_by_race.get(race_id, [])
+            )
+            if race.get('race_status') == 'completed' or has_results:
+                logger.warning(f"🛡️ PREVENTED CANCELLATION STATUS for Completed/Resulted Race: {self.track_code} R{item['race_number']} (Flagged is_cancelled=True)")
+                # Still set the flag for record keeping
+                self._queue_race_update(race, {
+                    'is_cancelled': True,
+                    'cancellation_reason': item['description'],
+                })
+            else:
+                # No results? Then it is truly cancelled.
+                self._queue_race_update(race, {
+                    'race_status': 'cancelled',
+                    'is_cancelled': True,
+                    'cancellation_reason': item['description'],
+                })
+                logger.info(f"🚫 RACE CANCELLED: {self.track_code} R{item['race_number']} ({item['description']})")
+        elif item['change_type'] == 'Post Time Change':
+            new_time = extract_new_post_time(item['description'])
+            if new_time:
+                self._queue_race_update(race, {'race_status': 'delayed', 'post_time': new_time})
+                logger.info(f"⏰ POST TIME DELAY: {self.track_code} R{item['race_number']} -> {new_time}")
+            else:
+                self._queue_race_update(race, {'race_status': 'delayed'})
+                logger.info(f"⚠️ RACE DELAYED (Time Unknown): {self.track_code} R{item['race_number']}")
+        return True
 
-            # 5. Side effects (Scratched flag, Race Status)
-            if item['change_type'] == 'Scratch' and entry_id:
-                supabase.table('hranalyzer_race_entries')\
-                    .update({'scratched': True})\
-                    .eq('id', entry_id)\
-                    .execute()
+    def _insert_changes(self, records):
+        try:
+            self.supabase.table('hranalyzer_changes').insert(records).execute()
+            return len(records)
+        except Exception as e:
+            if len(records) == 1:
+                logger.warning(f"Insert race condition (or duplicate) for {self.track_code}: {e}")
+                return 0
+            # A concurrent writer beat us to one of the rows; fall back to row-by-row.
+            return sum(self._insert_changes([record]) for record in records)
 
-                if entry_was_scratched:
-                    logger.info(
-                        f"✂️ SCRATCH CONFIRMED: {track_code} R{item['race_number']} "
-                        f"#{resolved_program_number} ({item['description']})"
-                    )
-                else:
-                    logger.info(
-                        f"✂️ MARKED SCRATCH: {track_code} R{item['race_number']} "
-                        f"#{resolved_program_number} ({item['description']})"
-                    )
-                    scratches_marked += 1
-            elif item['change_type'] == 'Race Cancelled':
-                # SAFEGUARD: Do not cancel if race is Completed OR has results
-                # Check for existing results first
-                res_check = supabase.table('hranalyzer_race_entries')\
-                    .select('id')\
-                    .eq('race_id', race_id)\
-                    .in_('finish_position', [1, 2, 3])\
-                    .limit(1)\
+    def _run_commit_step(self, step, write):
+        """Run one commit step on its own so a failure does not drop the steps after it."""
+        try:
+            write()
+            return False
+        except Exception as e:
+            logger.error(f"Error committing {step} for {self.track_code} {self.race_date}: {e}")
+            return True
+
+    def commit(self):
+        """
+        Write the planned changes. Returns `(records_written, failed_steps)`, where `failed_steps`
+        maps each step (inserts, updates, scratches, races) to True when its write failed.
+        """
+        failed_steps = {'inserts': False, 'updates': False, 'scratches': False, 'races': False}
+
+        if self.pending_inserts:
+            def insert_changes():
+                self.count += self._insert_changes(list(self.pending_inserts.values()))
+            failed_steps['inserts'] = self._run_commit_step('change inserts', insert_changes)
+
+        if self.pending_updates:
+            def upsert_changes():
+                self.supabase.table('hranalyzer_changes')\
+                    .upsert([
+                        {
+                            'id': record['id'],
+                            'race_id': record['race_id'],
+                            'entry_id': record.get('entry_id'),
+                            'change_type': record['change_type'],
+                            'description': record['description'],
+                        }
+                        for record in self.pending_updates.values()
+                    ])\
                     .execute()
-                    
-                has_results = len(res_check.data) > 0
-
-                if current_status == 'completed' or has_results:
-                    logger.warning(f"🛡️ PREVENTED CANCELLATION STATUS for Completed/Resulted Race: {track_code} R{item['race_number']} (Flagged is_cancelled=True)")
-                    # Still set the flag for record keeping
-                    supabase.table('hranalyzer_races')\
-                        .update({
-                            'is_cancelled': True, 
-                            'cancellation_reason': item['description']
-                        })\
-                        .eq('id', race_id)\
-                        .execute()
-                else:
-                    # No results? Then it is truly cancelled.
-                    # Update status AND flag
-                    supabase.table('hranalyzer_races')\
-                        .update({
-                            'race_status': 'cancelled',
-                            'is_cancelled': True,
-                            'cancellation_reason': item['description']
-                        })\
-                        .eq('id', race_id)\
-                        .execute()
-                    logger.info(f"🚫 RACE CANCELLED: {track_code} R{item['race_number']} ({item['description']})")
-                    
-            elif item['change_type'] == 'Post Time Change':
-                new_time = extract_new_post_time(item['description'])
-                if new_time:
-                    # Update status to delayed AND update post time
-                    updates = {'race_status': 'delayed', 'post_time': new_time}
-                    
-                    # Convert 1:30 PM to 24hr for postgres TIME column if needed?
-                    # Postgres TIME usually handles '01:30 PM' fine.
-                    
-                    supabase.table('hranalyzer_races')\
-                        .update(updates)\
-                        .eq('id', race_id)\
-                        .execute()
-                    logger.info(f"⏰ POST TIME DELAY: {track_code} R{item['race_number']} -> {new_time}")
-                else:
-                    # Just mark delayed if we can't parse time
-                    supabase.table('hranalyzer_races')\
-                        .update({'race_status': 'delayed'})\
-                        .eq('id', race_id)\
-                        .execute()
-                    logger.info(f"⚠️ RACE DELAYED (Time Unknown): {track_code} R{item['race_number']}")
-            
+                # Only count merged descriptions once they are actually written.
+                self.count += len(self.pending_updates)
+            failed_steps['updates'] = self._run_commit_step('change updates', upsert_changes)
+
+        if self.scratch_entry_ids:
+            failed_steps['scratches'] = self._run_commit_step(
+                'scratch flags',
+                lambda: self.supabase.table('hranalyzer_race_entries')
+                .update({'scratched': True})
+                .in_('id', sorted(self.scratch_entry_ids))
+                .execute(),
+            )
+
+        # Races sharing an identical payload (e.g. a card-wide delay) go out in one UPDATE.
+        grouped_race_updates = {}
+        for race_id, updates in self.race_updates.items():
+            payload_key = tuple(sorted(updates.items()))
+            grouped_race_updates.setdefault(payload_key, []).append(race_id)
+        for payload_key, race_ids in grouped_race_updates.items():
+            if self._run_commit_step(
+                'race updates',
+                lambda payload_key=payload_key, race_ids=race_ids: self.supabase.table('hranalyzer_races')
+                .update(dict(payload_key))
+                .in_('id', race_ids)
+                .execute(),
+            ):
+                failed_steps['races'] = True
+
+        self.pending_inserts = {}
+        self.pending_updates = {}
+        self.scratch_entry_ids = set()
+        self.race_updates = {}
+        return self.count, failed_steps
+
+
+def reconcile_changes(track_code, race_date, change_list):
+    """
+    Reconcile a change list for one track/date.
+
+    Returns (records_written, ok); `ok` is False when any part of the batch failed, so
+    callers know not to treat the source as fully processed.
+    """
+    if not change_list:
+        return 0, True
+
+    reconciler = ChangeReconciler(get_supabase_client(), track_code, race_date)
+    try:
+        reconciler.preload(change_list)
+    except Exception as e:
+        logger.error(f"Error preloading changes for {track_code} {race_date}: {e}")
+        return 0, False
+
+    ok = True
+    for item in change_list:
+        try:
+            reconciler.apply(item)
         except Exception as e:
+            ok = False
             logger.error(f"Error processing change {item}: {e}")
-            
+
+    count, failed_steps = reconciler.commit()
+    # Changes waiting for their card keep the feed out of the digest cache so they are re-applied
+    # next cycle; orphans against a loaded card would only be skipped again.
+    return count, ok and not reconciler.unmatched and not any(failed_steps.values())
+
+
+def update_changes_in_db(track_code, race_date, change_list):
+    """
+    Update database for found changes (scratches and others)
+    """
+    count, _ok = reconcile_changes(track_code, race_date, change_list)
     return count
 
-def crawl_otb_changes(fetch_telemetry=None):
+
+class LateChangeCollector:
+    """
+    Buffer parsed late changes from every source (RSS, direct/mobile HTML, index, OTB)
+    for one crawl run.
+
+    Copies of the same change per (track, date, race, program/horse, change type) are
+    merged in memory with `merge_change_description`, and each track/date is reconciled
+    once in `flush()`. A feed's validators are remembered once every track/date it fed
+    reconciled cleanly, so one track's failure only re-reads the feeds that carried it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._batches = {}
+        self._deferred_feeds = []
+        self._scope = threading.local()
+        self.received = 0
+        self.merged = 0
+
+    @staticmethod
+    def _identities(item):
+        identities = []
+        program_number = str(item.get('program_number') or '').strip().upper()
+        if program_number:
+            identities.append(('program', program_number))
+        if item.get('horse_name'):
+            identities.append(('horse', item['horse_name']))
+        return identities or [None]
+
+    def add(self, track_code, race_date, change_list, source):
+        """Merge `change_list` into the run buffer; returns how many changes were new."""
+        new_changes = 0
+        feed_tracks = getattr(self._scope, 'tracks', None)
+        if feed_tracks is not None and change_list:
+            feed_tracks.add((track_code, race_date))
+        with self._lock:
+            batch = self._batches.setdefault((track_code, race_date), {'items': {}, 'aliases': {}})
+            for item in change_list:
+                self.received += 1
+                scope = (str(item.get('race_number')), item.get('change_type'))
+                # A horse may arrive by program number from one source and by name from another.
+                candidates = [scope + (identity,) for identity in self._identities(item)]
+                key = next((batch['aliases'][c] for c in candidates if c in batch['aliases']), None)
+                new_desc = normalize_change_description(item.get('description'))
+
+                if key is None:
+                    key = candidates[0]
+                    batch['items'][key] = {**item, 'description': new_desc, 'source': source}
+                    new_changes += 1
+                else:
+                    existing = batch['items'][key]
+                    merged = merge_change_description(existing['description'], new_desc)
+                    if merged is not None:
+                        existing['description'] = merged
+                    for field in ('program_number', 'horse_name'):
+                        if not existing.get(field) and item.get(field):
+                            existing[field] = item[field]
+                    self.merged += 1
+
+                for candidate in candidates:
+                    batch['aliases'].setdefault(candidate, key)
+        return new_changes
+
+    @contextmanager
+    def feed_scope(self):
+        """Collect the (track, date) keys that `add` receives on this thread while one feed is handled."""
+        previous = getattr(self._scope, 'tracks', None)
+        self._scope.tracks = set()
+        try:
+            yield self._scope.tracks
+        finally:
+            self._scope.tracks = previous
+
+    def defer_feed(self, feed, tracks=()):
+        with self._lock:
+            self._deferred_feeds.append((feed, frozenset(tracks)))
+
+    def pending_changes(self):
+        with self._lock:
+            return sum(len(batch['items']) for batch in self._batches.values())
+
+    def flush(self):
+        """Reconcile every buffered track/date once. Returns (records_written, ok)."""
+        with self._lock:
+            batches, self._batches = self._batches, {}
+            deferred_feeds, self._deferred_feeds = self._deferred_feeds, []
+
+        total, track_results = 0, {}
+        for (track_code, race_date), batch in sorted(batches.items(), key=lambda pair: (pair[0][0], str(pair[0][1]))):
+            change_list = [
+                {field: value for field, value in item.items() if field != 'source'}
+                for item in batch['items'].values()
+            ]
+            records, track_results[(track_code, race_date)] = reconcile_changes(track_code, race_date, change_list)
+            total += records
+
+        for feed, tracks in deferred_feeds:
+            if all(track_results.get(track, True) for track in tracks):
+                remember_feed(**feed)
+        return total, all(track_results.values())
+
+
+def _reconcile_or_collect(track_code, race_date, change_list, source, collector=None):
+    if collector is not None:
+        return collector.add(track_code, race_date, change_list, source), True
+    return reconcile_changes(track_code, race_date, change_list)
+
+def crawl_otb_changes(fetch_telemetry=None, collector=None):
     """
     Fallback crawler for OffTrackBetting.com
     Returns number of changes processed.
@@ -1118,7 +1883,45 @@ def crawl_otb_changes(fetch_telemetry=None):
     if not html:
         logger.error("Failed to fetch OTB page")
         return 0
-        
+
+    today = date.today()
+
+    def handler(body):
+        changes_found = parse_otb_changes(body, today)
+        total_saved = 0
+        ok = True
+        changes_by_track = {}
+        for c in changes_found:
+            changes_by_track.setdefault(c['track_code'], []).append(c)
+        for trk, chgs in changes_by_track.items():
+            saved, track_ok = _reconcile_or_collect(trk, today, chgs, 'otb', collector)
+            total_saved += saved
+            ok = ok and track_ok
+        return total_saved, ok, len(changes_found)
+
+    total_saved, _parsed = _process_feed_body(
+        url,
+        today,
+        html,
+        handler,
+        telemetry=fetch_telemetry,
+        fetcher_name=_format_fetcher_label(fetch_telemetry),
+        collector=collector,
+    )
+
+    logger.info(
+        "OTB processed %s record(s) using %s",
+        total_saved,
+        _format_fetcher_label(fetch_telemetry),
+    )
+    return total_saved
+
+
+def parse_otb_changes(html, today):
+    """
+    Parse the OffTrackBetting scratches/changes page into change dicts (with track_code).
+    Returns [] when the page is missing its race-date header or is for another day.
+    """
     soup = BeautifulSoup(html, 'html.parser')
     tables = soup.find_all('table')
     
@@ -1128,19 +1931,17 @@ def crawl_otb_changes(fetch_telemetry=None):
             main_table = t
             break
             
-    today = date.today() # Target date
-    
     # 1. Validate Date
-    if 'Race Date:' not in main_table.get_text():
+    if main_table is None or 'Race Date:' not in main_table.get_text():
         logger.warning("OTB: Could not find Race Date header.")
-        return 0
+        return []
         
     # Extract date text "Race Date: 01/18/2026"
     date_valid = False
     try:
         import re
         txt = main_table.get_text()
-        m = re.search(r'Race Date:\s*(\d{1,2}/\d{1,2}/\d{4})', txt)
+        m = OTB_RACE_DATE_RE.search(txt)
         if m:
             page_date_str = m.group(1)
             # Parse MM/DD/YYYY
@@ -1149,13 +1950,13 @@ def crawl_otb_changes(fetch_telemetry=None):
                 date_valid = True
             else:
                 logger.warning(f"OTB: Stale date found. Page: {page_date}, Expected: {today}. SKIPPING OTB.")
-                return 0
+                return []
     except Exception as e:
         logger.warning(f"OTB: Date validation error: {e}")
-        return 0
+        return []
         
     if not date_valid:
-        return 0
+        return []
 
     rows = main_table.find_all('tr')
     
@@ -1216,29 +2017,17 @@ def crawl_otb_changes(fetch_telemetry=None):
                 'change_type': ctype,
                 'description': raw_desc
             })
-    
-    changes_by_track = {}
-    for c in changes_found:
-        t = c['track_code']
-        if t not in changes_by_track: changes_by_track[t] = []
-        changes_by_track[t].append(c)
-        
-    total_saved = 0
-    today = date.today()
-    for trk, chgs in changes_by_track.items():
-        total_saved += update_changes_in_db(trk, today, chgs)
-        
-    logger.info(
-        "OTB processed %s record(s) using %s",
-        total_saved,
-        _format_fetcher_label(fetch_telemetry),
-    )
-    return total_saved
+
+    return changes_found
 
 
-def crawl_late_changes(reset_first=False, preferred_tracks=None):
+def crawl_late_changes(reset_first=False, preferred_tracks=None, include_broad_sources=True):
     """
     Main entry point for crawling changes.
+    `preferred_tracks` limits the per-track feed scan (an empty list scans none);
+    `include_broad_sources=False` skips the all-track index page and OTB sweeps,
+    for targeted polls of tracks near post. When the broad sources are read they cover
+    every track they list, whatever `preferred_tracks` holds.
     """
     logger.info(f"Starting Crawl: Equibase Late Changes (Reset={reset_first})")
     logger.info(
@@ -1256,6 +2045,8 @@ def crawl_late_changes(reset_first=False, preferred_tracks=None):
         'otb': 0,
     }
     fetch_telemetry = {}
+    # Every source feeds one buffer; duplicates across sources are merged before any DB write.
+    collector = LateChangeCollector()
     
     # Reset Logic
     if reset_first:
@@ -1289,7 +2080,7 @@ def crawl_late_changes(reset_first=False, preferred_tracks=None):
                 if len(parts) >= 1:
                     active_tracks.add(parts[0])
         
-        if preferred_tracks:
+        if preferred_tracks is not None:
             preferred_tracks = {code.upper() for code in preferred_tracks}
             active_tracks = {code for code in active_tracks if code in preferred_tracks}
 
@@ -1297,61 +2088,31 @@ def crawl_late_changes(reset_first=False, preferred_tracks=None):
         
         # EXECUTE RESET if requested
         if reset_first:
+            # Every feed must be re-applied onto the clean slate, unchanged or not.
+            clear_feed_cache()
             for trk in active_tracks:
                 reset_scratches_for_date(trk, today)
         
-        for trk in active_tracks:
-            cnt = process_rss_for_track(trk)
-            total_changes_processed += cnt
-            source_counts['rss'] += cnt
-            
-    except Exception as e:
-        logger.error(f"RSS Scan Loop failed: {e}")
-
-    # 0.5. Direct per-track HTML fetch on TVG/legacy static hosts
-    # This is more reliable than the legacy index page and covers tracks like GP
-    # even when the index is blocked or incomplete.
-    try:
-        for trk in active_tracks:
-            direct_fetch_meta = {}
-            html, source_url = fetch_direct_track_changes_page(trk, telemetry=direct_fetch_meta)
-            _merge_fetch_telemetry(fetch_telemetry, direct_fetch_meta)
-            source_name = 'direct_html'
-            if not html:
-                changes = []
-            else:
-                changes = parse_track_changes(html, trk)
-            if not changes:
-                mobile_fetch_meta = {}
-                mobile_html, mobile_url = fetch_mobile_track_changes_page(trk, telemetry=mobile_fetch_meta)
-                _merge_fetch_telemetry(fetch_telemetry, mobile_fetch_meta)
-                if mobile_html:
-                    changes = parse_mobile_track_changes(mobile_html, trk)
-                    source_url = mobile_url
-                    fetcher_label = _format_fetcher_label(mobile_fetch_meta)
-                    source_name = 'mobile_html'
-                else:
-                    fetcher_label = _format_fetcher_label(direct_fetch_meta)
-            else:
-                fetcher_label = _format_fetcher_label(direct_fetch_meta)
-            if changes:
-                count = update_changes_in_db(trk, today, changes)
-                total_changes_processed += count
+        # RSS plus direct per-track HTML (TVG/legacy hosts, mobile as last resort) for every
+        # active track, fetched concurrently and reconciled as each track's feeds arrive.
+        # This is more reliable than the legacy index page and covers tracks like GP
+        # even when the index is blocked or incomplete.
+        per_track_counts = crawl_tracks_concurrently(
+            active_tracks, today, telemetry=fetch_telemetry, collector=collector
+        )
+        for counts in per_track_counts.values():
+            for source_name, count in counts.items():
                 source_counts[source_name] += count
-                logger.info(
-                    "Direct late-changes HTML processed %s record(s) for %s via %s using %s",
-                    count,
-                    trk,
-                    source_url,
-                    fetcher_label,
-                )
+
     except Exception as e:
-        logger.error(f"Direct track late-changes fetch failed: {e}")
+        logger.error(f"Late-changes track scan failed: {e}")
 
     # 1. Try Equibase Track Pages (HTML Fallback)
     try:
         index_fetch_meta = {}
-        track_links = parse_late_changes_index(telemetry=index_fetch_meta) # This might be blocked too
+        track_links = []
+        if include_broad_sources:
+            track_links = parse_late_changes_index(telemetry=index_fetch_meta) # This might be blocked too
         _merge_fetch_telemetry(fetch_telemetry, index_fetch_meta)
         if track_links:
             logger.info(
@@ -1361,8 +2122,6 @@ def crawl_late_changes(reset_first=False, preferred_tracks=None):
             )
             for link in track_links:
                 code = link['track_code']
-                if preferred_tracks and code.upper() not in preferred_tracks:
-                    continue
                 # Skip if we already did RSS for this track? 
                 # Maybe good to double check but duplicates are handled.
                 # If RSS fails, this might work (via PowerShell)
@@ -1372,10 +2131,23 @@ def crawl_late_changes(reset_first=False, preferred_tracks=None):
                     html = fetch_static_page(url, telemetry=page_fetch_meta)
                     _merge_fetch_telemetry(fetch_telemetry, page_fetch_meta)
                     if html:
-                        changes = parse_track_changes(html, code)
-                        if changes:
-                            count = update_changes_in_db(code, today, changes)
-                            total_changes_processed += count
+                        def handler(body, code=code):
+                            changes = parse_track_changes(body, code)
+                            if not changes:
+                                return 0, True, 0
+                            records, ok = _reconcile_or_collect(code, today, changes, 'index_html', collector)
+                            return records, ok, len(changes)
+
+                        count, _parsed = _process_feed_body(
+                            url,
+                            today,
+                            html,
+                            handler,
+                            telemetry=fetch_telemetry,
+                            fetcher_name=_format_fetcher_label(page_fetch_meta),
+                            collector=collector,
+                        )
+                        if count:
                             source_counts['index_html'] += count
                             logger.info(
                                 "Equibase index HTML processed %s record(s) for %s via %s using %s",
@@ -1389,22 +2161,37 @@ def crawl_late_changes(reset_first=False, preferred_tracks=None):
     except Exception as e:
         logger.error(f"Equibase index fetch failed: {e}")
         
-    logger.info(f"Equibase phase complete. Total records: {total_changes_processed}")
+    logger.info(f"Equibase phase complete. Unique changes collected: {collector.pending_changes()}")
     
     # 2. Run OTB Fallback
-    logger.info("Starting OTB Fallback Crawl...")
+    if include_broad_sources:
+        logger.info("Starting OTB Fallback Crawl...")
+        try:
+            otb_fetch_meta = {}
+            otb_count = crawl_otb_changes(fetch_telemetry=otb_fetch_meta, collector=collector)
+            _merge_fetch_telemetry(fetch_telemetry, otb_fetch_meta)
+            source_counts['otb'] += otb_count
+            logger.info(f"OTB Helper added records.")
+        except Exception as e:
+            logger.error(f"OTB Crawl failed: {e}")
+    else:
+        logger.info("Targeted poll: skipping Equibase index and OTB sweeps")
+
     try:
-        otb_fetch_meta = {}
-        otb_count = crawl_otb_changes(fetch_telemetry=otb_fetch_meta)
-        _merge_fetch_telemetry(fetch_telemetry, otb_fetch_meta)
-        total_changes_processed += otb_count
-        source_counts['otb'] += otb_count
-        logger.info(f"OTB Helper added records.")
+        total_changes_processed, flush_ok = collector.flush()
+        logger.info(
+            "Merged %s parsed change(s) into %s unique; %s record(s) written%s",
+            collector.received,
+            collector.received - collector.merged,
+            total_changes_processed,
+            "" if flush_ok else " (partial, feeds will be re-read next cycle)",
+        )
     except Exception as e:
-        logger.error(f"OTB Crawl failed: {e}")
+        logger.error(f"Late-changes write stage failed: {e}")
 
     logger.info("Late-change contribution summary: %s", _summarize_contributions(source_counts))
     logger.info("HTML fetch success summary: %s", _summarize_fetchers(fetch_telemetry))
+    logger.info("Late-change feed skip summary: %s", _summarize_feed_skips(fetch_telemetry))
         
     return total_changes_processed
 
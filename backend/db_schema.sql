@@ -118,6 +118,7 @@ CREATE TABLE IF NOT EXISTS hranalyzer_races (
   created_at TIMESTAMPTZ DEFAULT NOW(),
   updated_at TIMESTAMPTZ DEFAULT NOW(),
   results_fetched_at TIMESTAMPTZ,  -- When Equibase results were added
+  card_fingerprint JSONB,          -- Entries crawler digest of the last written card
 
   CONSTRAINT unique_race UNIQUE(track_code, race_date, race_number)
 );
@@ -125,6 +126,12 @@ CREATE TABLE IF NOT EXISTS hranalyzer_races (
 CREATE INDEX IF NOT EXISTS idx_hranalyzer_races_status ON hranalyzer_races(race_status);
 CREATE INDEX IF NOT EXISTS idx_hranalyzer_races_date ON hranalyzer_races(race_date DESC);
 CREATE INDEX IF NOT EXISTS idx_hranalyzer_races_track_date ON hranalyzer_races(track_code, race_date);
+
+-- One row per race date, for the filter-options date list
+CREATE OR REPLACE VIEW hranalyzer_race_dates
+WITH (security_invoker = true) AS
+SELECT DISTINCT race_date
+FROM hranalyzer_races;
 CREATE INDEX IF NOT EXISTS idx_hranalyzer_races_key ON hranalyzer_races(race_key);
 
 -- ==============================================
@@ -0,0 +1,260 @@
+"""
+Equibase Worker Module
+A supervised, long-lived child process that serves heavy Equibase crawl tasks for the scheduler.
+
+Spawning a fresh process per sweep returned memory reliably but paid for re-importing pdfplumber,
+selenium and the Supabase client (and re-warming caches and cookies) on every cycle. The worker keeps
+one warm child and recycles it after EQUIBASE_WORKER_MAX_TASKS tasks, when its RSS crosses
+EQUIBASE_WORKER_MAX_RSS_MB, after a task times out or crashes, or once it has sat idle for
+EQUIBASE_WORKER_IDLE_SECONDS, so memory is still handed back to the container regularly.
+"""
+
+import atexit
+import logging
+import os
+import threading
+import time
+import traceback
+from datetime import date
+from multiprocessing import get_context
+
+logger = logging.getLogger(__name__)
+
+EQUIBASE_WORKER_MAX_TASKS = max(int(os.getenv("EQUIBASE_WORKER_MAX_TASKS", "25")), 1)
+EQUIBASE_WORKER_MAX_RSS_MB = int(os.getenv("EQUIBASE_WORKER_MAX_RSS_MB", "1024"))
+EQUIBASE_WORKER_IDLE_SECONDS = int(os.getenv("EQUIBASE_WORKER_IDLE_SECONDS", "1800"))
+EQUIBASE_TASK_TIMEOUT_SECONDS = int(os.getenv("EQUIBASE_CHILD_TIMEOUT_SECONDS", "5400"))
+EQUIBASE_WORKER_STOP_TIMEOUT_SECONDS = 30
+
+
+def read_process_rss_bytes():
+    """Resident set size of the calling process from /proc, or None where unavailable."""
+    try:
+        with open("/proc/self/status", "r", encoding="utf-8") as fh:
+            for line in fh:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def run_equibase_task(task_name, payload):
+    from crawl_equibase import crawl_historical_races, crawl_specific_races
+
+    if task_name == "historical":
+        return crawl_historical_races(
+            date.fromisoformat(payload["target_date"]),
+            payload.get("tracks"),
+        )
+    if task_name == "specific":
+        return crawl_specific_races(
+            date.fromisoformat(payload["target_date"]),
+            payload.get("race_targets") or [],
+        )
+    raise ValueError(f"Unsupported Equibase task: {task_name}")
+
+
+def _worker_main(conn, runner):
+    """Child loop: serve `(task_name, payload)` requests until told to stop (None) or the pipe closes."""
+    try:
+        while True:
+            try:
+                request = conn.recv()
+            except EOFError:
+                break
+            if request is None:
+                break
+
+            task_name, payload = request
+            try:
+                reply = {"ok": True, "result": runner(task_name, payload)}
+            except Exception as e:
+                reply = {"ok": False, "error": str(e), "traceback": traceback.format_exc()}
+            reply["rss_bytes"] = read_process_rss_bytes()
+            conn.send(reply)
+    finally:
+        conn.close()
+
+
+class EquibaseWorker:
+    """
+    Runs tasks one at a time in a warm child process; concurrent callers queue on a lock, which keeps
+    the heavy Equibase work to a single process even when several scheduler jobs want it.
+    """
+
+    def __init__(
+        self,
+        runner=run_equibase_task,
+        max_tasks=EQUIBASE_WORKER_MAX_TASKS,
+        max_rss_bytes=EQUIBASE_WORKER_MAX_RSS_MB * 1024 * 1024,
+        idle_seconds=EQUIBASE_WORKER_IDLE_SECONDS,
+        task_timeout=EQUIBASE_TASK_TIMEOUT_SECONDS,
+        context="spawn",
+    ):
+        self.runner = runner
+        self.max_tasks = max_tasks
+        self.max_rss_bytes = max_rss_bytes
+        self.idle_seconds = idle_seconds
+        self.task_timeout = task_timeout
+        self._ctx = get_context(context)
+        self._lock = threading.Lock()
+        self._proc = None
+        self._conn = None
+        self._tasks_served = 0
+        self._last_used_at = None
+        self._last_rss_bytes = None
+        self._workers_started = 0
+        self._recycles = {}
+
+    def _start_locked(self):
+        parent_conn, child_conn = self._ctx.Pipe(duplex=True)
+        proc = self._ctx.Process(
+            target=_worker_main,
+            args=(child_conn, self.runner),
+            name="equibase-worker",
+            daemon=False,
+        )
+        proc.start()
+        child_conn.close()
+        self._proc = proc
+        self._conn = parent_conn
+        self._tasks_served = 0
+        self._last_rss_bytes = None
+        self._workers_started += 1
+        logger.info("Started Equibase worker process pid=%s", proc.pid)
+
+    def _stop_locked(self, reason, graceful=True):
+        proc, conn = self._proc, self._conn
+        self._proc = None
+        self._conn = None
+        if proc is None:
+            return
+
+        self._recycles[reason] = self._recycles.get(reason, 0) + 1
+        logger.info(
+            "Stopping Equibase worker pid=%s (%s) after %s task(s), rss=%s MB",
+            proc.pid,
+            reason,
+            self._tasks_served,
+            round(self._last_rss_bytes / (1024 * 1024), 1) if self._last_rss_bytes else "n/a",
+        )
+        if graceful and proc.is_alive():
+            try:
+                conn.send(None)
+            except (OSError, ValueError):
+                pass
+            proc.join(timeout=EQUIBASE_WORKER_STOP_TIMEOUT_SECONDS)
+        if proc.is_alive():
+            proc.terminate()
+            proc.join(timeout=EQUIBASE_WORKER_STOP_TIMEOUT_SECONDS)
+        if proc.is_alive():
+            logger.error("Equibase worker pid=%s did not exit after terminate; killing", proc.pid)
+            proc.kill()
+            proc.join(timeout=5)
+        try:
+            conn.close()
+        except OSError:
+            pass
+
+    def _recycle_reason_locked(self):
+        if self._tasks_served >= self.max_tasks:
+            return "max_tasks"
+        if self.max_rss_bytes and self._last_rss_bytes and self._last_rss_bytes >= self.max_rss_bytes:
+            return "max_rss"
+        return None
+
+    def run_task(self, task_name, **payload):
+        with self._lock:
+            if self._proc is not None and (
+                not self._proc.is_alive()
+                or (self._last_used_at is not None and time.monotonic() - self._last_used_at >= self.idle_seconds)
+            ):
+                self._stop_locked("idle" if self._proc.is_alive() else "exited")
+            if self._proc is None:
+                self._start_locked()
+
+            logger.info("Running Equibase task %s in worker pid=%s with payload %s", task_name, self._proc.pid, payload)
+            message = None
+            try:
+                self._conn.send((task_name, payload))
+                if self._conn.poll(self.task_timeout):
+                    message = self._conn.recv()
+                else:
+                    logger.error("Equibase task %s exceeded timeout (%ss); terminating worker", task_name, self.task_timeout)
+                    self._stop_locked("timeout", graceful=False)
+            except (EOFError, OSError) as e:
+                logger.error("Equibase worker pipe failed during task %s: %s", task_name, e)
+
+            if message is None:
+                proc = self._proc
+                self._stop_locked("crashed", graceful=False)
+                exitcode = proc.exitcode if proc is not None else None
+                raise RuntimeError(f"Equibase task {task_name} exited without a result (exitcode={exitcode})")
+
+            self._tasks_served += 1
+            self._last_used_at = time.monotonic()
+            self._last_rss_bytes = message.get("rss_bytes")
+            reason = self._recycle_reason_locked()
+            if reason:
+                self._stop_locked(reason)
+
+        if not message.get("ok"):
+            logger.error("Equibase task %s failed in worker process:\n%s", task_name, message.get("traceback", message.get("error")))
+            raise RuntimeError(message.get("error") or f"Equibase task {task_name} failed")
+
+        logger.info("Equibase task %s completed in worker process", task_name)
+        return message["result"]
+
+    def recycle_if_idle(self):
+        """Stop a worker that has been idle past its limit, returning its memory between busy periods."""
+        if not self._lock.acquire(blocking=False):
+            return False
+        try:
+            if (
+                self._proc is not None
+                and self._last_used_at is not None
+                and time.monotonic() - self._last_used_at >= self.idle_seconds
+            ):
+                self._stop_locked("idle")
+                return True
+            return False
+        finally:
+            self._lock.release()
+
+    def stats(self):
+        # Read without the lock: a long sweep holds it, and metrics must not wait on one.
+        proc = self._proc
+        return {
+            "alive": proc is not None and proc.is_alive(),
+            "pid": proc.pid if proc is not None else None,
+            "tasks_served": self._tasks_served,
+            "last_rss_mb": round(self._last_rss_bytes / (1024 * 1024), 1) if self._last_rss_bytes else None,
+            "workers_started": self._workers_started,
+            "recycles": dict(self._recycles),
+        }
+
+    def shutdown(self):
+        if self._lock.acquire(timeout=5):
+            try:
+                self._stop_locked("shutdown")
+            finally:
+                self._lock.release()
+            return
+        # A task is mid-flight on another thread; do not wait out the sweep.
+        proc = self._proc
+        if proc is not None and proc.is_alive():
+            proc.terminate()
+
+
+_default_worker = None
+_default_worker_lock = threading.Lock()
+
+
+def get_equibase_worker():
+    global _default_worker
+    with _default_worker_lock:
+        if _default_worker is None:
+            _default_worker = EquibaseWorker()
+            atexit.register(_default_worker.shutdown)
+        return _default_worker
@@ -0,0 +1,251 @@
+"""
+Fetcher Stats Module
+Tracks per-host, per-fetcher success rates and latencies so fallback chains try the
+fetcher that is currently working first instead of walking a fixed order.
+"""
+
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+from runtime_state import RUNTIME_DIR
+
+logger = logging.getLogger(__name__)
+
+FETCHER_STATS_FILE = RUNTIME_DIR / "fetcher_stats.json"
+FETCHER_STATS_ALPHA = float(os.getenv("FETCHER_STATS_ALPHA", "0.2"))
+FETCHER_STATS_MIN_SAMPLES = max(int(os.getenv("FETCHER_STATS_MIN_SAMPLES", "3")), 1)
+FETCHER_STATS_FLUSH_SECONDS = float(os.getenv("FETCHER_STATS_FLUSH_SECONDS", "30"))
+# Every Nth ordering for a host falls back to the default chain so demoted fetchers get re-tested.
+FETCHER_EXPLORE_EVERY = max(int(os.getenv("FETCHER_EXPLORE_EVERY", "10")), 0)
+FETCHER_PRIOR_SCORE = 0.5
+FETCHER_MAX_LATENCY_PENALTY = 0.25
+FETCHER_LATENCY_PENALTY_SECONDS = 60.0
+
+
+def host_for(url_or_host):
+    parsed = urlparse(url_or_host or "")
+    return (parsed.hostname or url_or_host or "").lower()
+
+
+def _read_stats_file(path):
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            raw = json.load(fh)
+    except FileNotFoundError:
+        return {}
+    except Exception as exc:
+        logger.warning("Ignoring unreadable fetcher stats at %s: %s", path, exc)
+        return {}
+    if not isinstance(raw, dict):
+        return {}
+    return {host: dict(fetchers) for host, fetchers in raw.items() if isinstance(fetchers, dict)}
+
+
+def _file_mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _apply_sample(stats, host, fetcher_name, success, latency_seconds, at):
+    entry = stats.setdefault(host, {}).get(fetcher_name)
+    if entry is None:
+        entry = {
+            "attempts": 0,
+            "successes": 0,
+            "success_ewma": 1.0 if success else 0.0,
+            "latency_ewma": float(latency_seconds),
+        }
+        stats[host][fetcher_name] = entry
+    else:
+        entry = dict(entry)
+        stats[host][fetcher_name] = entry
+        entry["success_ewma"] += FETCHER_STATS_ALPHA * ((1.0 if success else 0.0) - entry["success_ewma"])
+        entry["latency_ewma"] += FETCHER_STATS_ALPHA * (float(latency_seconds) - entry["latency_ewma"])
+    entry["attempts"] += 1
+    if success:
+        entry["successes"] += 1
+        entry["last_success_at"] = at
+
+
+class FetcherStats:
+    """
+    EWMA success/latency per (host, fetcher), persisted as JSON under RUNTIME_DIR.
+
+    Several processes share the file (the scheduler's scratch chain and the Equibase worker's PDF
+    chain both score www.equibase.com), so samples recorded since the last flush are kept aside and
+    replayed on top of a fresh read of the file when flushing, and the file is reloaded whenever
+    another process has rewritten it.
+    """
+
+    def __init__(self, path=FETCHER_STATS_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self._stats = {}
+        self._pending = []
+        self._orderings = {}
+        self._loaded = False
+        self._mtime = None
+        self._last_flush = 0.0
+
+    def _load_locked(self):
+        mtime = _file_mtime(self.path)
+        if self._loaded and mtime == self._mtime:
+            return
+        self._loaded = True
+        self._mtime = mtime
+        stats = _read_stats_file(self.path)
+        for sample in self._pending:
+            _apply_sample(stats, *sample)
+        self._stats = stats
+
+    def record(self, url_or_host, fetcher_name, success, latency_seconds):
+        host = host_for(url_or_host)
+        with self._lock:
+            self._load_locked()
+            sample = (host, fetcher_name, bool(success), float(latency_seconds), time.time())
+            self._pending.append(sample)
+            _apply_sample(self._stats, *sample)
+            should_flush = (time.monotonic() - self._last_flush) >= FETCHER_STATS_FLUSH_SECONDS
+
+        if should_flush:
+            self.flush()
+
+    def score(self, url_or_host, fetcher_name):
+        with self._lock:
+            self._load_locked()
+            entry = self._stats.get(host_for(url_or_host), {}).get(fetcher_name)
+        if not entry or entry.get("attempts", 0) < FETCHER_STATS_MIN_SAMPLES:
+            return None
+        latency_penalty = min(entry["latency_ewma"] / FETCHER_LATENCY_PENALTY_SECONDS, FETCHER_MAX_LATENCY_PENALTY)
+        return entry["success_ewma"] - latency_penalty
+
+    def order(self, url_or_host, fetchers, name_of=lambda item: item[0]):
+        """
+        Reorder `fetchers` best-first for this host.
+
+        Fetchers without enough samples keep their default position at a neutral score,
+        so a fresh install behaves exactly like the static chain.
+        """
+        fetchers = list(fetchers)
+        host = host_for(url_or_host)
+        with self._lock:
+            count = self._orderings.get(host, 0) + 1
+            self._orderings[host] = count
+        if FETCHER_EXPLORE_EVERY and count % FETCHER_EXPLORE_EVERY == 0:
+            return fetchers
+
+        def rank(indexed):
+            index, item = indexed
+            item_score = self.score(host, name_of(item))
+            return (-(FETCHER_PRIOR_SCORE if item_score is None else item_score), index)
+
+        return [item for _, item in sorted(enumerate(fetchers), key=rank)]
+
+    def snapshot(self):
+        with self._lock:
+            self._load_locked()
+            return json.loads(json.dumps(self._stats))
+
+    def reset(self):
+        """Forget learned stats in memory without touching the persisted file."""
+        with self._lock:
+            self._stats = {}
+            self._pending = []
+            self._orderings = {}
+            self._loaded = True
+            self._mtime = _file_mtime(self.path)
+            self._last_flush = time.monotonic()
+
+    def flush(self):
+        """Merge this process's new samples into the file as it is now, then replace it atomically."""
+        with self._lock:
+            self._last_flush = time.monotonic()
+            if not self._pending:
+                return
+            try:
+                os.makedirs(os.path.dirname(str(self.path)), exist_ok=True)
+                with _file_lock(f"{self.path}.lock"):
+                    merged = _read_stats_file(self.path)
+                    for sample in self._pending:
+                        _apply_sample(merged, *sample)
+                    tmp_path = f"{self.path}.{os.getpid()}.tmp"
+                    with open(tmp_path, "w", encoding="utf-8") as fh:
+                        fh.write(json.dumps(merged, indent=2, sort_keys=True))
+                    os.replace(tmp_path, self.path)
+                    self._mtime = _file_mtime(self.path)
+            except Exception as exc:
+                # Samples stay pending and are merged on the next flush.
+                logger.warning("Could not persist fetcher stats to %s: %s", self.path, exc)
+                return
+            self._stats = merged
+            self._pending = []
+            self._loaded = True
+
+
+@contextmanager
+def _file_lock(path):
+    """Serialize read-merge-write across processes where flock exists; a no-op elsewhere."""
+    if fcntl is None:
+        yield
+        return
+    with open(path, "a") as handle:
+        fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+_registry = FetcherStats()
+atexit.register(_registry.flush)
+_fetch_gate = threading.local()
+
+
+def skip_fetch():
+    """
+    Return value for a fetcher whose enable flag, circuit breaker or headroom gate refused to run it.
+    `call_fetcher` reports such calls as not run, so chains leave them out of the stats.
+    """
+    _fetch_gate.skipped = True
+    return None
+
+
+def call_fetcher(fetcher, *args, **kwargs):
+    """Run one fetcher and return `(result, latency_seconds, ran)`; `ran` is False after `skip_fetch`."""
+    _fetch_gate.skipped = False
+    started = time.perf_counter()
+    try:
+        result = fetcher(*args, **kwargs)
+    finally:
+        skipped = getattr(_fetch_gate, "skipped", False)
+        _fetch_gate.skipped = False
+    return result, time.perf_counter() - started, not skipped
+
+
+def record_fetch(url_or_host, fetcher_name, success, latency_seconds):
+    _registry.record(url_or_host, fetcher_name, success, latency_seconds)
+
+
+def order_fetchers(url_or_host, fetchers, name_of=lambda item: item[0]):
+    return _registry.order(url_or_host, fetchers, name_of=name_of)
+
+
+def get_fetcher_stats_snapshot():
+    return _registry.snapshot()
+
+
+def reset_fetcher_stats():
+    _registry.reset()
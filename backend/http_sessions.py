@@ -0,0 +1,157 @@
+"""
+HTTP Sessions Module
+Shared keep-alive connection pools, one per host, so repeated fetches against HRN, DRF and
+Equibase reuse TCP+TLS connections instead of handshaking on every call.
+
+`get_http_client` returns an httpx client (HTTP/2 when the optional `h2` package is installed);
+`get_requests_session` returns a requests session for fetchers whose WAF behaviour is tied to
+requests; `get_cloudscraper_session` and `lease_curl_session` do the same for the optional
+cloudscraper and curl_cffi fetchers. All are bounded to HTTP_POOL_MAX_CONNECTIONS connections per host.
+"""
+
+import atexit
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import cloudscraper
+except ImportError:
+    cloudscraper = None
+
+try:
+    from curl_cffi import requests as curl_requests
+except ImportError:
+    curl_requests = None
+
+logger = logging.getLogger(__name__)
+
+HTTP_POOL_MAX_CONNECTIONS = max(int(os.getenv("HTTP_POOL_MAX_CONNECTIONS", "4")), 1)
+HTTP_POOL_KEEPALIVE_SECONDS = float(os.getenv("HTTP_POOL_KEEPALIVE_SECONDS", "60"))
+HTTP_POOL_TIMEOUT_SECONDS = float(os.getenv("HTTP_POOL_TIMEOUT_SECONDS", "20"))
+
+_lock = threading.Lock()
+_http_clients = {}
+_requests_sessions = {}
+_cloudscraper_sessions = {}
+_curl_sessions = {}
+
+
+def _host(url_or_host):
+    parsed = urlparse(url_or_host or "")
+    return (parsed.hostname or url_or_host or "").lower()
+
+
+def get_http_client(url_or_host):
+    """Per-host httpx client with keep-alive and a bounded pool; safe to share across threads."""
+    host = _host(url_or_host)
+    with _lock:
+        client = _http_clients.get(host)
+        if client is None or client.is_closed:
+            client = httpx.Client(
+                http2=HTTP2_AVAILABLE,
+                follow_redirects=True,
+                timeout=httpx.Timeout(HTTP_POOL_TIMEOUT_SECONDS),
+                limits=httpx.Limits(
+                    max_connections=HTTP_POOL_MAX_CONNECTIONS,
+                    max_keepalive_connections=HTTP_POOL_MAX_CONNECTIONS,
+                    keepalive_expiry=HTTP_POOL_KEEPALIVE_SECONDS,
+                ),
+            )
+            _http_clients[host] = client
+            logger.debug("Opened pooled HTTP client for %s (http2=%s)", host, HTTP2_AVAILABLE)
+        return client
+
+
+def get_requests_session(url_or_host):
+    """Per-host requests session; the adapter blocks instead of opening more than the pool allows."""
+    host = _host(url_or_host)
+    with _lock:
+        session = _requests_sessions.get(host)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=HTTP_POOL_MAX_CONNECTIONS,
+                pool_block=True,
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _requests_sessions[host] = session
+        return session
+
+
+def get_cloudscraper_session(url_or_host):
+    """
+    Per-host cloudscraper session, or None when cloudscraper is not installed. Its own TLS adapter
+    is kept and only resized, so the pool blocks at HTTP_POOL_MAX_CONNECTIONS like requests.
+    """
+    if cloudscraper is None:
+        return None
+    host = _host(url_or_host)
+    with _lock:
+        scraper = _cloudscraper_sessions.get(host)
+        if scraper is None:
+            scraper = cloudscraper.create_scraper()
+            scraper.get_adapter("https://").init_poolmanager(1, HTTP_POOL_MAX_CONNECTIONS, block=True)
+            scraper.mount(
+                "http://",
+                HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_MAX_CONNECTIONS, pool_block=True),
+            )
+            _cloudscraper_sessions[host] = scraper
+        return scraper
+
+
+@contextmanager
+def lease_curl_session(url_or_host):
+    """
+    Borrow the per-host curl_cffi session (impersonating Chrome); yields None when curl_cffi is
+    not installed. The session gives each thread its own curl handle, so callers take one of
+    HTTP_POOL_MAX_CONNECTIONS slots for the host and wait for a free one, as the requests pool does.
+    """
+    if curl_requests is None:
+        yield None
+        return
+    host = _host(url_or_host)
+    with _lock:
+        pooled = _curl_sessions.get(host)
+        if pooled is None:
+            pooled = (
+                curl_requests.Session(impersonate="chrome"),
+                threading.BoundedSemaphore(HTTP_POOL_MAX_CONNECTIONS),
+            )
+            _curl_sessions[host] = pooled
+    session, slots = pooled
+    with slots:
+        yield session
+
+
+def close_http_sessions():
+    with _lock:
+        clients = list(_http_clients.values())
+        sessions = list(_requests_sessions.values()) + list(_cloudscraper_sessions.values())
+        sessions += [session for session, _slots in _curl_sessions.values()]
+        _http_clients.clear()
+        _requests_sessions.clear()
+        _cloudscraper_sessions.clear()
+        _curl_sessions.clear()
+    for pooled in clients + sessions:
+        try:
+            pooled.close()
+        except Exception as exc:
+            logger.debug("Error closing pooled HTTP session: %s", exc)
+
+
+atexit.register(close_http_sessions)
@@ -5,16 +5,28 @@ import sys
 import os
 import json
 import tempfile
-import traceback
+import threading
 import pytz
-from multiprocessing import get_context
 from datetime import datetime, date, timedelta
-from crawl_equibase import COMMON_TRACKS
-from crawl_entries import crawl_entries
+from crawl_equibase import COMMON_TRACKS, close_idle_shared_equibase_webdriver
+from crawl_entries import crawl_entries_for_dates
 from crawl_scratches import crawl_late_changes
+from equibase_worker import get_equibase_worker
 from bet_resolution import resolve_all_pending_bets
-from supabase_client import get_supabase_client
-from runtime_state import evaluate_runtime_alerts, mark_crawl_attempt, mark_runtime_boot, update_crawl_status
+from query_metrics import log_query_metrics_summary
+from supabase_client import check_supabase_pool_health, get_supabase_client
+from runtime_state import (
+    evaluate_runtime_alerts,
+    mark_crawl_attempt,
+    mark_runtime_boot,
+    start_startup_backfill,
+    update_crawl_status,
+    update_startup_backfill_phase,
+    update_scheduler_jobs_snapshot,
+)
+from results_scheduler import ResultsPollScheduler
+from scratch_scheduler import ScratchPollScheduler
+from task_scheduler import TaskScheduler
 
 # Configure logging
 log_dir = os.getenv('LOG_DIR', '.')
@@ -37,87 +49,40 @@ END_HOUR = 23 # Run 24/7 to ensure morning races are captured
 HEARTBEAT_FILE = os.path.join(tempfile.gettempdir(), "crawler_heartbeat")
 HOST_HEARTBEAT_FILE = os.path.join(log_dir, "scheduler_heartbeat.json")
 EQUIBASE_CHILD_TIMEOUT_SECONDS = int(os.getenv("EQUIBASE_CHILD_TIMEOUT_SECONDS", "5400"))
+SCRATCH_SCHEDULE_REFRESH_SECONDS = int(os.getenv("SCRATCH_SCHEDULE_REFRESH_SECONDS", "600"))
+SCRATCH_POLL_MIN_SLEEP_SECONDS = 15
+# Broad today/yesterday sweep; targeted post-time polls do the routine work in between.
+RESULTS_RECONCILE_INTERVAL_SECONDS = int(os.getenv("RESULTS_RECONCILE_INTERVAL_SECONDS", str(60 * 60)))
+RESULTS_SCHEDULE_REFRESH_SECONDS = int(os.getenv("RESULTS_SCHEDULE_REFRESH_SECONDS", "120"))
+RESULTS_POLL_MIN_SLEEP_SECONDS = 30
+RESULTS_POLL_IDLE_SECONDS = 300
+# Before this hour, yesterday's late races are still polled alongside today's.
+RESULTS_POLL_OVERNIGHT_HOUR = int(os.getenv("RESULTS_POLL_OVERNIGHT_HOUR", "4"))
+ENTRIES_REFRESH_INTERVAL_SECONDS = int(os.getenv("ENTRIES_REFRESH_INTERVAL_SECONDS", str(4 * 60 * 60)))
+BET_RESOLUTION_INTERVAL_SECONDS = int(os.getenv("BET_RESOLUTION_INTERVAL_SECONDS", "300"))
+MAINTENANCE_INTERVAL_SECONDS = int(os.getenv("MAINTENANCE_INTERVAL_SECONDS", "300"))
+# Main loop wakes at least this often to refresh the heartbeat and publish job metrics.
+SCHEDULER_TICK_SECONDS = float(os.getenv("SCHEDULER_TICK_SECONDS", "30"))
+TERMINAL_RACE_STATUSES = {"completed", "cancelled", "results_unavailable", "past_drf_only"}
+
+_scratch_scheduler = ScratchPollScheduler()
+_scratch_schedule_state = {"target_date": None, "loaded_at": None}
+_results_scheduler = ResultsPollScheduler()
+_results_schedule_state = {"target_dates": None, "loaded_at": None}
+# Set as each startup backfill lane finishes; the matching scheduled jobs wait on them.
+_startup_backfill_done = {"scratches": threading.Event(), "results": threading.Event(), "entries": threading.Event()}
 
 
 def record_crawl_result(crawl_type, success, **details):
     update_crawl_status(crawl_type, success=success, details=details)
 
 
-def _equibase_child_worker(conn, task_name, payload):
-    try:
-        from crawl_equibase import crawl_historical_races, crawl_specific_races
-
-        if task_name == "historical":
-            result = crawl_historical_races(
-                date.fromisoformat(payload["target_date"]),
-                payload.get("tracks"),
-            )
-        elif task_name == "specific":
-            result = crawl_specific_races(
-                date.fromisoformat(payload["target_date"]),
-                payload.get("race_targets") or [],
-            )
-        else:
-            raise ValueError(f"Unsupported Equibase task: {task_name}")
-
-        conn.send({"ok": True, "result": result})
-    except Exception as e:
-        conn.send(
-            {
-                "ok": False,
-                "error": str(e),
-                "traceback": traceback.format_exc(),
-            }
-        )
-    finally:
-        conn.close()
-
-
 def run_equibase_task_in_subprocess(task_name, **payload):
     """
-    Run heavy Equibase crawling in a short-lived child process so memory is returned
-    at the end of each sweep instead of accumulating in the long-lived scheduler.
+    Run heavy Equibase crawling in the supervised worker process, which is recycled on task count,
+    RSS and idle time so memory still returns to the container without a cold start every sweep.
     """
-    ctx = get_context("spawn")
-    parent_conn, child_conn = ctx.Pipe(duplex=False)
-    proc = ctx.Process(
-        target=_equibase_child_worker,
-        args=(child_conn, task_name, payload),
-        daemon=False,
-    )
-
-    logger.info("Starting isolated Equibase task %s with payload %s", task_name, payload)
-    proc.start()
-    child_conn.close()
-
-    message = None
-    try:
-        if parent_conn.poll(EQUIBASE_CHILD_TIMEOUT_SECONDS):
-            try:
-                message = parent_conn.recv()
-            except EOFError:
-                message = None
-        else:
-            logger.error("Equibase task %s exceeded timeout (%ss); terminating child", task_name, EQUIBASE_CHILD_TIMEOUT_SECONDS)
-            proc.terminate()
-    finally:
-        parent_conn.close()
-
-    proc.join(timeout=30)
-    if proc.is_alive():
-        logger.error("Equibase task %s child did not exit cleanly after terminate; killing", task_name)
-        proc.kill()
-        proc.join(timeout=5)
-
-    if message is None:
-        raise RuntimeError(f"Equibase task {task_name} exited without a result (exitcode={proc.exitcode})")
-
-    if not message.get("ok"):
-        logger.error("Equibase task %s failed in child process:\n%s", task_name, message.get("traceback", message.get("error")))
-        raise RuntimeError(message.get("error") or f"Equibase task {task_name} failed")
-
-    logger.info("Equibase task %s completed in isolated child process", task_name)
-    return message["result"]
+    return get_equibase_worker().run_task(task_name, **payload)
 
 
 def parse_post_time_to_iso(race_date_str, post_time_str, tz_name="America/New_York"):
@@ -209,7 +174,8 @@ def get_crawl_tracks_for_date(target_date, fallback_tracks=None):
     return list(fallback_tracks)
 
 
-def get_unresolved_race_targets_for_date(target_date):
+def get_race_result_rows_for_date(target_date):
+    """Races for a date with their live status, post time and how many finishers are stored."""
     supabase = get_supabase_client()
     target_date_str = target_date.strftime("%Y-%m-%d")
     response = (
@@ -221,8 +187,9 @@ def get_unresolved_race_targets_for_date(target_date):
         .execute()
     )
 
-    targets = []
+    rows = []
     for row in response.data or []:
+        tz_name = (row.get("hranalyzer_tracks") or {}).get("timezone") or "America/New_York"
         entries = row.get("hranalyzer_race_entries") or []
         finishers = [e for e in entries if isinstance(e.get("finish_position"), int) and e.get("finish_position") > 0]
         has_results = any(e.get("finish_position") in [1, 2, 3] for e in finishers)
@@ -230,45 +197,78 @@ def get_unresolved_race_targets_for_date(target_date):
             row.get("race_date"),
             row.get("post_time"),
             row.get("race_status"),
-            ((row.get("hranalyzer_tracks") or {}).get("timezone") or "America/New_York"),
+            tz_name,
             has_results=has_results,
         )
+        post_time_iso = parse_post_time_to_iso(row.get("race_date"), row.get("post_time"), tz_name)
+        rows.append({
+            "track_code": row.get("track_code"),
+            "race_number": row.get("race_number"),
+            "race_status": row.get("race_status"),
+            "current_status": current_status,
+            "finisher_count": len(finishers),
+            "post_dt": datetime.fromisoformat(post_time_iso) if post_time_iso else None,
+        })
+    return rows
 
-        if current_status == "past":
-            targets.append((row.get("track_code"), row.get("race_number")))
-            continue
 
-        if row.get("race_status") == "completed" and len(finishers) < 3:
-            targets.append((row.get("track_code"), row.get("race_number")))
+def needs_results_retry(row):
+    if row["current_status"] == "past":
+        return True
+    return row["race_status"] == "completed" and row["finisher_count"] < 3
+
 
+def get_unresolved_race_targets_for_date(target_date):
+    targets = [
+        (row["track_code"], row["race_number"])
+        for row in get_race_result_rows_for_date(target_date)
+        if needs_results_retry(row)
+    ]
     return dedupe_track_codes([f"{track}-{race}" for track, race in targets]), targets
 
 
-def run_entries_refresh_for_date(target_date):
-    primary_tracks = get_crawl_tracks_for_date(target_date)
-    stats = crawl_entries(target_date, primary_tracks)
-    fallback_used = False
-    if primary_tracks and stats.get('races_found', 0) == 0:
-        fallback_tracks = [track for track in COMMON_TRACKS if track not in primary_tracks]
-        if fallback_tracks:
-            logger.info(
-                "Known-track entries pass found no races for %s. Expanding to %s fallback tracks.",
-                target_date,
-                len(fallback_tracks),
-            )
-            fallback_stats = crawl_entries(target_date, fallback_tracks)
-            stats = {
+def run_entries_refresh_for_dates(target_dates):
+    """
+    Refresh entries for several days in one concurrent crawl. Days whose known-track pass finds
+    no races are expanded to the remaining configured tracks in a second, also concurrent, pass.
+    Returns {date: (stats, primary_tracks, fallback_used)}.
+    """
+    tracks_by_date = {target_date: get_crawl_tracks_for_date(target_date) for target_date in target_dates}
+    stats_by_date = crawl_entries_for_dates(tracks_by_date)
+
+    fallback_by_date = {}
+    for target_date, primary_tracks in tracks_by_date.items():
+        if primary_tracks and stats_by_date[target_date].get('races_found', 0) == 0:
+            fallback_tracks = [track for track in COMMON_TRACKS if track not in primary_tracks]
+            if fallback_tracks:
+                logger.info(
+                    "Known-track entries pass found no races for %s. Expanding to %s fallback tracks.",
+                    target_date,
+                    len(fallback_tracks),
+                )
+                fallback_by_date[target_date] = fallback_tracks
+
+    if fallback_by_date:
+        fallback_stats_by_date = crawl_entries_for_dates(fallback_by_date)
+        for target_date, fallback_stats in fallback_stats_by_date.items():
+            stats = stats_by_date[target_date]
+            stats_by_date[target_date] = {
                 'races_found': stats.get('races_found', 0) + fallback_stats.get('races_found', 0),
                 'races_inserted': stats.get('races_inserted', 0) + fallback_stats.get('races_inserted', 0),
             }
-            fallback_used = True
-    return stats, primary_tracks, fallback_used
+
+    return {
+        target_date: (stats_by_date[target_date], tracks_by_date[target_date], target_date in fallback_by_date)
+        for target_date in target_dates
+    }
 
 
 def run_entries_refresh(today_date):
-    s1, today_tracks, today_fallback_used = run_entries_refresh_for_date(today_date)
-    s2, tomorrow_tracks, tomorrow_fallback_used = run_entries_refresh_for_date(today_date + timedelta(days=1))
-    s3, day_after_tracks, day_after_fallback_used = run_entries_refresh_for_date(today_date + timedelta(days=2))
+    target_dates = [today_date + timedelta(days=offset) for offset in range(3)]
+    refreshed = run_entries_refresh_for_dates(target_dates)
+    s1, today_tracks, today_fallback_used = refreshed[target_dates[0]]
+    s2, tomorrow_tracks, tomorrow_fallback_used = refreshed[target_dates[1]]
+    s3, day_after_tracks, day_after_fallback_used = refreshed[target_dates[2]]
     total_found = s1.get('races_found', 0) + s2.get('races_found', 0) + s3.get('races_found', 0)
     record_crawl_result(
         'entries',
@@ -285,112 +285,512 @@ def run_entries_refresh(today_date):
     return {'races_found': total_found}
 
 
+def is_results_racing_window(current_hour):
+    return current_hour >= 11 or current_hour < 2
+
+
+def retry_unresolved_results(today_date):
+    """Focused retry of today's races that are past post or completed without a full order of finish."""
+    unresolved_labels, unresolved_targets = get_unresolved_race_targets_for_date(today_date)
+    if not unresolved_targets:
+        return unresolved_targets
+    logger.info(
+        "Retrying unresolved same-day races before broad results sweep: %s",
+        ", ".join(unresolved_labels),
+    )
+    unresolved_stats = run_equibase_task_in_subprocess(
+        "specific",
+        target_date=today_date.isoformat(),
+        race_targets=unresolved_targets,
+    )
+    logger.info(
+        "Unresolved retry results: requested=%s inserted=%s failed=%s skipped_verified=%s",
+        unresolved_stats.get("races_requested", 0),
+        unresolved_stats.get("races_inserted", 0),
+        unresolved_stats.get("races_failed", 0),
+        unresolved_stats.get("races_skipped_verified", 0),
+    )
+    return unresolved_targets
+
+
+def refresh_results_for_date(target_date, phase, **details):
+    """Broad results sweep over every known track for one date, recorded as a results crawl."""
+    tracks = get_crawl_tracks_for_date(target_date)
+    stats = run_equibase_task_in_subprocess(
+        "historical",
+        target_date=target_date.isoformat(),
+        tracks=tracks,
+    )
+    record_crawl_result(
+        'results',
+        success=True,
+        phase=phase,
+        target_date=target_date.isoformat(),
+        tracks_checked=len(tracks),
+        races_found=stats.get('races_found', 0),
+        **details,
+    )
+    return stats
+
+
 def run_results_refresh(today_date, current_hour):
     stats_today = {}
-    stats_yesterday = {}
-    today_tracks = get_crawl_tracks_for_date(today_date)
-    yesterday_tracks = get_crawl_tracks_for_date(today_date - timedelta(days=1))
-    unresolved_labels, unresolved_targets = get_unresolved_race_targets_for_date(today_date)
-    if current_hour >= 11 or current_hour < 2:
+    yesterday_date = today_date - timedelta(days=1)
+    if is_results_racing_window(current_hour):
         logger.info("Racing hours (or late night check) active. Crawling results...")
-        if unresolved_targets:
-            logger.info(
-                "Retrying unresolved same-day races before broad results sweep: %s",
-                ", ".join(unresolved_labels),
-            )
-            unresolved_stats = run_equibase_task_in_subprocess(
-                "specific",
-                target_date=today_date.isoformat(),
-                race_targets=unresolved_targets,
-            )
-            logger.info(
-                "Unresolved retry results: requested=%s inserted=%s failed=%s skipped_verified=%s",
-                unresolved_stats.get("races_requested", 0),
-                unresolved_stats.get("races_inserted", 0),
-                unresolved_stats.get("races_failed", 0),
-                unresolved_stats.get("races_skipped_verified", 0),
-            )
-        stats_today = run_equibase_task_in_subprocess(
-            "historical",
-            target_date=today_date.isoformat(),
-            tracks=today_tracks,
-        )
-        record_crawl_result(
-            'results',
-            success=True,
-            phase='today',
-            target_date=today_date.isoformat(),
-            tracks_checked=len(today_tracks),
-            races_found=stats_today.get('races_found', 0),
+        unresolved_targets = retry_unresolved_results(today_date)
+        stats_today = refresh_results_for_date(
+            today_date,
+            'today',
             unresolved_retry_count=len(unresolved_targets),
         )
-        stats_yesterday = run_equibase_task_in_subprocess(
-            "historical",
-            target_date=(today_date - timedelta(days=1)).isoformat(),
-            tracks=yesterday_tracks,
-        )
-        record_crawl_result(
-            'results',
-            success=True,
-            phase='yesterday-backfill',
-            target_date=(today_date - timedelta(days=1)).isoformat(),
-            tracks_checked=len(yesterday_tracks),
-            races_found=stats_yesterday.get('races_found', 0),
+        stats_yesterday = refresh_results_for_date(
+            yesterday_date,
+            'yesterday-backfill',
             today_races_found=stats_today.get('races_found', 0),
             unresolved_retry_count=len(unresolved_targets),
         )
     else:
         logger.info("Slow hours. Performing maintenance check on yesterday's results...")
-        stats_yesterday = run_equibase_task_in_subprocess(
-            "historical",
-            target_date=(today_date - timedelta(days=1)).isoformat(),
-            tracks=yesterday_tracks,
-        )
-        record_crawl_result(
-            'results',
-            success=True,
-            phase='yesterday-backfill',
-            target_date=(today_date - timedelta(days=1)).isoformat(),
-            tracks_checked=len(yesterday_tracks),
-            races_found=stats_yesterday.get('races_found', 0),
-        )
+        stats_yesterday = refresh_results_for_date(yesterday_date, 'yesterday-backfill')
     return stats_today, stats_yesterday
 
 
+def results_poll_dates(now):
+    today_date = now.date()
+    if now.hour < RESULTS_POLL_OVERNIGHT_HOUR:
+        return [today_date - timedelta(days=1), today_date]
+    return [today_date]
+
+
+def refresh_results_schedule(now, force=False):
+    """Reload post times and verification state into the results poll scheduler."""
+    target_dates = results_poll_dates(now)
+    loaded_at = _results_schedule_state["loaded_at"]
+    if (
+        not force
+        and _results_schedule_state["target_dates"] == target_dates
+        and loaded_at is not None
+        and (now - loaded_at).total_seconds() < RESULTS_SCHEDULE_REFRESH_SECONDS
+    ):
+        return
+
+    races = []
+    for target_date in target_dates:
+        for row in get_race_result_rows_for_date(target_date):
+            if row["current_status"] in {"cancelled", "results_unavailable"}:
+                verified = True
+            else:
+                verified = row["current_status"] == "completed" and not needs_results_retry(row)
+            key = (target_date.isoformat(), row["track_code"], row["race_number"])
+            races.append((key, row["post_dt"], verified))
+    _results_scheduler.update_races(races)
+    _results_schedule_state.update(target_dates=target_dates, loaded_at=now)
+
+
+def run_due_results_polls(now):
+    """
+    Fetch results only for races whose post-time-driven deadline has passed (first shortly after post,
+    then with back-off until verified). Returns the number of races polled.
+    """
+    try:
+        refresh_results_schedule(now)
+    except Exception as e:
+        logger.warning(f"Could not refresh results poll schedule, keeping previous one: {e}")
+
+    due = _results_scheduler.due_races(now)
+    races_by_date = {}
+    for race_date, track_code, race_number in due:
+        races_by_date.setdefault(race_date, []).append((track_code, race_number))
+
+    inserted = 0
+    for race_date, race_targets in races_by_date.items():
+        logger.info(
+            "Targeted results poll for %s: %s",
+            race_date,
+            ", ".join(f"{track}-{race}" for track, race in race_targets),
+        )
+        mark_crawl_attempt('results', {'phase': 'targeted', 'target_date': race_date})
+        try:
+            stats = run_equibase_task_in_subprocess("specific", target_date=race_date, race_targets=race_targets)
+            inserted += stats.get("races_inserted", 0)
+        finally:
+            # Back off even when the child fails, so a broken chart does not retry every tick.
+            _results_scheduler.mark_attempted(
+                [(race_date, track, race) for track, race in race_targets],
+                now,
+            )
+
+    if not due:
+        # An idle tick proves nothing about results freshness; that stays with the reconcile sweep.
+        return 0
+
+    # Pick up verification from the rows just written on the next run.
+    _results_schedule_state["loaded_at"] = None
+    record_crawl_result(
+        'results',
+        success=True,
+        phase='targeted',
+        races_polled=len(due),
+        races_inserted=inserted,
+        races_pending=_results_scheduler.pending_count(),
+        races_left_to_sweep=len(_results_scheduler.exhausted_races()),
+    )
+    return len(due)
+
+
 def run_scratches_refresh():
     logger.info("Checking for Late Scratches...")
     scratches_tracks = get_crawl_tracks_for_date(date.today())
     changes_processed = crawl_late_changes(preferred_tracks=scratches_tracks)
     logger.info(f"Scratch check complete. Changes processed: {changes_processed}")
     record_crawl_result('scratches', success=True, changes_processed=changes_processed, tracks_checked=len(scratches_tracks))
+    # A full sweep satisfies every track's poll deadline.
+    _scratch_scheduler.mark_polled(dedupe_track_codes(scratches_tracks), datetime.now(EST), broad_sweep=True)
     return changes_processed
 
 
-def run_startup_backfill(now):
-    today_date = now.date()
-    logger.info("Running startup self-heal backfill...")
+def get_scratch_post_times_for_date(target_date):
+    """Map track code -> [(aware post datetime or None, finished)] from the races already stored."""
+    supabase = get_supabase_client()
+    target_date_str = target_date.strftime("%Y-%m-%d")
+    response = (
+        supabase.table("hranalyzer_races")
+        .select("track_code, race_date, post_time, race_status, hranalyzer_tracks(timezone)")
+        .eq("race_date", target_date_str)
+        .execute()
+    )
+
+    post_times = {}
+    for row in response.data or []:
+        track_code = (row.get("track_code") or "").strip().upper()
+        if not track_code:
+            continue
+        post_time_iso = parse_post_time_to_iso(
+            row.get("race_date"),
+            row.get("post_time"),
+            ((row.get("hranalyzer_tracks") or {}).get("timezone") or "America/New_York"),
+        )
+        post_dt = datetime.fromisoformat(post_time_iso) if post_time_iso else None
+        finished = row.get("race_status") in TERMINAL_RACE_STATUSES
+        post_times.setdefault(track_code, []).append((post_dt, finished))
+    return post_times
+
+
+def refresh_scratch_schedule(now, force=False):
+    """Reload post times into the scratch poll scheduler when the day changes or the copy is stale."""
+    target_date = now.date()
+    loaded_at = _scratch_schedule_state["loaded_at"]
+    if (
+        not force
+        and _scratch_schedule_state["target_date"] == target_date
+        and loaded_at is not None
+        and (now - loaded_at).total_seconds() < SCRATCH_SCHEDULE_REFRESH_SECONDS
+    ):
+        return
+
+    post_times = get_scratch_post_times_for_date(target_date)
+    if not post_times:
+        logger.info("No races stored for %s yet; polling configured tracks at the default cadence.", target_date)
+        post_times = {track: [] for track in COMMON_TRACKS}
+    _scratch_scheduler.update_post_times(post_times)
+    _scratch_schedule_state.update(target_date=target_date, loaded_at=now)
+
+
+def run_due_scratch_polls(now):
+    """
+    Poll late changes only for tracks whose deadline has passed (tracks near post are due
+    every minute or two, finished cards rarely). Returns changes processed, or None when idle.
+    """
     try:
-        mark_crawl_attempt('scratches', {'phase': 'startup', 'target_date': today_date.isoformat()})
-        run_scratches_refresh()
+        refresh_scratch_schedule(now)
     except Exception as e:
-        logger.error(f"Startup scratches refresh failed: {e}")
+        logger.warning(f"Could not refresh scratch poll schedule, keeping previous one: {e}")
+
+    due_tracks = _scratch_scheduler.due_tracks(now)
+    broad_sweep = _scratch_scheduler.broad_sweep_due(now)
+    if not due_tracks and not broad_sweep:
+        return None
+
+    tier_counts = _scratch_scheduler.tier_counts(now)
+    logger.info(
+        "Scratch poll: %s track(s) due (%s)%s; track tiers %s",
+        len(due_tracks),
+        ", ".join(due_tracks) or "none",
+        " plus index/OTB sweep" if broad_sweep else "",
+        tier_counts,
+    )
+    mark_crawl_attempt('scratches', {'phase': 'targeted', 'target_date': now.date().isoformat()})
+    try:
+        changes_processed = crawl_late_changes(preferred_tracks=due_tracks, include_broad_sources=broad_sweep)
+    finally:
+        # Keep the cadence even when a poll fails, so a broken feed is not hammered every tick.
+        _scratch_scheduler.mark_polled(due_tracks, now, broad_sweep=broad_sweep)
+
+    record_crawl_result(
+        'scratches',
+        success=True,
+        changes_processed=changes_processed,
+        tracks_checked=len(due_tracks),
+        broad_sweep=broad_sweep,
+        poll_tiers=tier_counts,
+    )
+    return changes_processed
+
+
+def scratch_poll_interval_seconds():
+    """Adaptive cadence for the scratches job: wake when the next track or broad sweep is due."""
+    next_due = _scratch_scheduler.seconds_until_next_due(datetime.now(EST))
+    return max(next_due, SCRATCH_POLL_MIN_SLEEP_SECONDS)
+
+
+def scheduled_scratches_job():
+    try:
+        run_due_scratch_polls(datetime.now(EST))
+    except Exception as e:
+        logger.error(f"Scratch crawl failed: {e}")
         record_crawl_result('scratches', success=False, error=str(e))
+        raise
+
+
+def results_poll_interval_seconds():
+    """Adaptive cadence for targeted results polls: wake when the next race comes due."""
+    next_due = _results_scheduler.seconds_until_next_due(datetime.now(EST))
+    if next_due is None:
+        return RESULTS_POLL_IDLE_SECONDS
+    return min(max(next_due, RESULTS_POLL_MIN_SLEEP_SECONDS), RESULTS_POLL_IDLE_SECONDS)
 
+
+def scheduled_results_job():
     try:
-        mark_crawl_attempt('entries', {'phase': 'startup', 'target_date': today_date.isoformat()})
-        run_entries_refresh(today_date)
+        run_due_results_polls(datetime.now(EST))
     except Exception as e:
-        logger.error(f"Startup entries refresh failed: {e}")
-        record_crawl_result('entries', success=False, error=str(e))
+        logger.error(f"Targeted results poll failed: {e}")
+        record_crawl_result('results', success=False, error=str(e))
+        raise
 
+
+def scheduled_results_reconcile_job():
+    now = datetime.now(EST)
+    today_date = now.date()
+    # Result crawling is most relevant after 11 AM EST; run_results_refresh narrows to yesterday otherwise.
     try:
-        mark_crawl_attempt('results', {'phase': 'startup', 'target_date': today_date.isoformat()})
-        run_results_refresh(today_date, now.hour)
+        mark_crawl_attempt('results', {'phase': 'reconcile', 'target_date': today_date.isoformat()})
+        stats_today, stats_yesterday = run_results_refresh(today_date, now.hour)
     except Exception as e:
-        logger.error(f"Startup results refresh failed: {e}")
+        logger.error(f"Results crawl failed: {e}")
         record_crawl_result('results', success=False, error=str(e))
+        raise
+    logger.info(
+        "Results sweep finished. Results (Y/T): %s/%s",
+        stats_yesterday.get('races_found', 0),
+        stats_today.get('races_found', 0),
+    )
+
+
+def scheduled_entries_job():
+    now = datetime.now(EST)
+    today_date = now.date()
+    logger.info("Refreshing entries for Today, Tomorrow, and Day After...")
+    try:
+        mark_crawl_attempt('entries', {'phase': 'scheduled', 'target_date': today_date.isoformat()})
+        entry_stats = run_entries_refresh(today_date)
+    except Exception as e:
+        logger.error(f"Entries crawl failed: {e}")
+        record_crawl_result('entries', success=False, error=str(e))
+        raise
+    logger.info("Entries refresh finished. Entries: %s", entry_stats.get('races_found', 0))
+    evaluate_runtime_alerts(
+        today_summary_total=entry_stats.get('races_found'),
+        during_racing_hours=8 <= now.hour <= 23,
+    )
 
+
+def scheduled_bet_resolution_job():
+    logger.info("Resolving pending bets...")
+    try:
+        supabase = get_supabase_client()
+        resolution_stats = resolve_all_pending_bets(supabase)
+        if resolution_stats.get('resolved_count', 0) > 0:
+            logger.info(f"Resolved {resolution_stats['resolved_count']} bets.")
+    except Exception as e:
+        logger.error(f"Bet resolution failed: {e}")
+        raise
+
+
+def scheduled_maintenance_job():
+    now = datetime.now(EST)
     evaluate_runtime_alerts(during_racing_hours=8 <= now.hour <= 23)
+    try:
+        pool_health = check_supabase_pool_health()
+        if pool_health.get('rotated'):
+            logger.warning(f"Rotated {pool_health['rotated']} unhealthy Supabase client(s)")
+    except Exception as e:
+        logger.error(f"Supabase pool health check failed: {e}")
+    log_query_metrics_summary()
+
+    # The scratch crawler borrows this process's Chromium session only as a fallback; don't keep it around.
+    close_idle_shared_equibase_webdriver()
+
+    equibase_worker = get_equibase_worker()
+    equibase_worker.recycle_if_idle()
+    logger.info("Equibase worker: %s", equibase_worker.stats())
+
+
+def build_task_scheduler(backfilled=False):
+    """
+    Independent cadences per job type. Targeted results polls and the broad reconciliation sweep
+    share the "equibase" lane so only one heavy Equibase child runs at a time; scratches, entries and
+    bet resolution never wait behind them. After a startup backfill, scratch and results jobs wait for
+    the matching backfill lane to finish (it does the same work and, for results, uses the Equibase
+    worker outside this lane), and entries and the broad sweep wait one interval on top.
+    """
+    scheduler = TaskScheduler()
+    now_epoch = time.time()
+    scheduler.add_job(
+        'scratches',
+        scheduled_scratches_job,
+        scratch_poll_interval_seconds,
+        priority=0,
+        # Only marks tracks polled once it finishes, so targeted polls start after the backfill sweep.
+        wait_for=_startup_backfill_done["scratches"] if backfilled else None,
+    )
+    scheduler.add_job(
+        'results',
+        scheduled_results_job,
+        results_poll_interval_seconds,
+        priority=10,
+        lane='equibase',
+        max_runtime_seconds=EQUIBASE_CHILD_TIMEOUT_SECONDS,
+        wait_for=_startup_backfill_done["results"] if backfilled else None,
+    )
+    scheduler.add_job(
+        'results_reconcile',
+        scheduled_results_reconcile_job,
+        RESULTS_RECONCILE_INTERVAL_SECONDS,
+        priority=15,
+        lane='equibase',
+        max_runtime_seconds=EQUIBASE_CHILD_TIMEOUT_SECONDS,
+        first_run_at=now_epoch + RESULTS_RECONCILE_INTERVAL_SECONDS if backfilled else None,
+        wait_for=_startup_backfill_done["results"] if backfilled else None,
+    )
+    scheduler.add_job(
+        'entries',
+        scheduled_entries_job,
+        ENTRIES_REFRESH_INTERVAL_SECONDS,
+        priority=20,
+        first_run_at=now_epoch + ENTRIES_REFRESH_INTERVAL_SECONDS if backfilled else None,
+        wait_for=_startup_backfill_done["entries"] if backfilled else None,
+    )
+    scheduler.add_job('bet_resolution', scheduled_bet_resolution_job, BET_RESOLUTION_INTERVAL_SECONDS, priority=30)
+    scheduler.add_job('maintenance', scheduled_maintenance_job, MAINTENANCE_INTERVAL_SECONDS, priority=40)
+    return scheduler
+
+
+def publish_scheduler_metrics(scheduler):
+    try:
+        update_scheduler_jobs_snapshot(scheduler.snapshot())
+    except Exception as e:
+        logger.error(f"Failed to publish scheduler metrics: {e}")
+
+
+def _run_backfill_lane(phases, done):
+    """
+    Run one lane of backfill phases in order; a failed phase does not stop the ones after it.
+    `done` is set once the lane is over, whatever the outcome, so gated scheduler jobs can start.
+    """
+    try:
+        for phase, func in phases:
+            if func is None:
+                update_startup_backfill_phase(phase, "skipped")
+                continue
+            update_startup_backfill_phase(phase, "running")
+            try:
+                func()
+            except Exception as e:
+                update_startup_backfill_phase(phase, "failed", error=str(e))
+            else:
+                update_startup_backfill_phase(phase, "done")
+    finally:
+        done.set()
+
+
+def _backfill_phase(crawl_type, label, today_date, func):
+    def run():
+        mark_crawl_attempt(crawl_type, {'phase': 'startup', 'target_date': today_date.isoformat()})
+        try:
+            func()
+        except Exception as e:
+            logger.error(f"Startup {label} failed: {e}")
+            record_crawl_result(crawl_type, success=False, error=str(e))
+            raise
+    return run
+
+
+def run_startup_backfill(now, wait=False):
+    """
+    Self-heal after a restart without holding up the main loop. Lanes run concurrently: scratches on
+    their own, Equibase results with today's card ahead of yesterday's (they share one worker), and the
+    three-day entries refresh. Progress is reported under "startup_backfill" in runtime state, and each
+    lane sets its `_startup_backfill_done` event when it finishes. Returns the coordinating thread,
+    already joined when `wait` is True.
+    """
+    today_date = now.date()
+    yesterday_date = today_date - timedelta(days=1)
+    racing_window = is_results_racing_window(now.hour)
+    logger.info("Running startup self-heal backfill in the background...")
+
+    def results_today():
+        unresolved_targets = retry_unresolved_results(today_date)
+        refresh_results_for_date(today_date, 'today', unresolved_retry_count=len(unresolved_targets))
+
+    lanes = {
+        "scratches": [("scratches", _backfill_phase('scratches', "scratches refresh", today_date, run_scratches_refresh))],
+        "results": [
+            (
+                "results_today",
+                _backfill_phase('results', "results refresh (today)", today_date, results_today)
+                if racing_window else None,
+            ),
+            (
+                "results_yesterday",
+                _backfill_phase(
+                    'results',
+                    "results refresh (yesterday)",
+                    today_date,
+                    lambda: refresh_results_for_date(yesterday_date, 'yesterday-backfill'),
+                ),
+            ),
+        ],
+        "entries": [("entries", _backfill_phase('entries', "entries refresh", today_date, lambda: run_entries_refresh(today_date)))],
+    }
+    for lane_name in lanes:
+        _startup_backfill_done[lane_name].clear()
+    start_startup_backfill([phase for lane in lanes.values() for phase, _ in lane])
+
+    def coordinate():
+        started = time.monotonic()
+        threads = [
+            threading.Thread(
+                target=_run_backfill_lane,
+                args=(lane, _startup_backfill_done[lane_name]),
+                name=f"backfill-{lane_name}",
+                daemon=True,
+            )
+            for lane_name, lane in lanes.items()
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        logger.info("Startup backfill finished in %.1fs", time.monotonic() - started)
+        evaluate_runtime_alerts(during_racing_hours=8 <= datetime.now(EST).hour <= 23)
+
+    coordinator = threading.Thread(target=coordinate, name="startup-backfill", daemon=True)
+    coordinator.start()
+    if wait:
+        coordinator.join()
+    return coordinator
 
 def touch_heartbeat():
     """Update container-local and host-visible heartbeat files."""
@@ -420,104 +820,27 @@ def run_crawler():
     # Touch heartbeat immediately on startup
     touch_heartbeat()
     
-    last_entries_crawl_at = None
+    # The backfill runs in the background so the scheduler starts immediately.
     run_startup_backfill(datetime.now(EST))
+    scheduler = build_task_scheduler(backfilled=True)
     
     while True:
         try:
             now = datetime.now(EST)
-            current_hour = now.hour
-            
-            logger.info(f"Current time (EST): {now.strftime('%Y-%m-%d %H:%M:%S')}")
-
-            # Always touch heartbeat at start of loop
             touch_heartbeat()
 
-            if START_HOUR <= current_hour <= END_HOUR:
-                logger.info("Within operating hours. Checking tasks...")
-                
-                start_time = time.time()
-                try:
-                    today_date = now.date()
-                    # 1. Crawl Scratches first so late changes are not starved by long results sweeps.
-                    try:
-                        mark_crawl_attempt('scratches', {'phase': 'scheduled', 'target_date': today_date.isoformat()})
-                        scratches_found = run_scratches_refresh()
-                    except Exception as e:
-                        logger.error(f"Scratch crawl failed: {e}")
-                        record_crawl_result('scratches', success=False, error=str(e))
-
-                    # 2. Crawl Results (Hourly, only during racing hours)
-                    # Typical racing is 12 PM - 11 PM
-                    # We check Today and Yesterday to catch late-night results or missed races from downtime
-                    stats_today = {}
-                    stats_yesterday = {}
-                    
-                    # Result crawling is most relevant after 11 AM EST
-                    try:
-                        mark_crawl_attempt('results', {'phase': 'scheduled', 'target_date': today_date.isoformat()})
-                        stats_today, stats_yesterday = run_results_refresh(today_date, current_hour)
-                    except Exception as e:
-                        logger.error(f"Results crawl failed: {e}")
-                        record_crawl_result('results', success=False, error=str(e))
-
-                    # 3. Crawl Upcoming Entries (Once per day)
-                    entry_stats = {'races_found': 0}
-                    entry_total_for_alert = None
-                    
-                    entries_refresh_interval = timedelta(hours=4)
-                    should_refresh_entries = (
-                        last_entries_crawl_at is None
-                        or (now - last_entries_crawl_at) >= entries_refresh_interval
-                    )
-
-                    if should_refresh_entries:
-                        logger.info("Refreshing entries for Today, Tomorrow, and Day After...")
-                        try:
-                            mark_crawl_attempt('entries', {'phase': 'scheduled', 'target_date': today_date.isoformat()})
-                            entry_stats = run_entries_refresh(today_date)
-                            last_entries_crawl_at = now
-                            entry_total_for_alert = entry_stats.get('races_found')
-                        except Exception as e:
-                            logger.error(f"Entries crawl failed: {e}")
-                            record_crawl_result('entries', success=False, error=str(e))
-                    else:
-                        logger.info("Entries refreshed recently. Skipping for now.")
-
-                    duration = time.time() - start_time
-                    logger.info(f"Crawl finished in {duration:.1f}s. "
-                                f"Results (Y/T): {stats_yesterday.get('races_found', 0)}/{stats_today.get('races_found', 0)}, "
-                                f"Entries: {entry_stats.get('races_found', 0)}")
-
-                    evaluate_runtime_alerts(
-                        today_summary_total=entry_total_for_alert,
-                        during_racing_hours=8 <= current_hour <= 23,
-                    )
-                                
-                    # 3. Resolve Pending Bets
-                    logger.info("Resolving pending bets...")
-                    try:
-                        supabase = get_supabase_client()
-                        resolution_stats = resolve_all_pending_bets(supabase)
-                        if resolution_stats.get('resolved_count', 0) > 0:
-                            logger.info(f"Resolved {resolution_stats['resolved_count']} bets.")
-                    except Exception as e:
-                         logger.error(f"Bet resolution failed: {e}")
-                                
-                except Exception as e:
-                    logger.error(f"Crawl execution failed: {e}")
-                    # Do not exit, just log and sleep
-                
-                # Update heartbeat before sleeping
-                touch_heartbeat()
-                
-                # Sleep for 5 minutes (reduced from 15m for better responsiveness)
-                logger.info("Sleeping for 5 minutes...")
-                time.sleep(300)
+            if START_HOUR <= now.hour <= END_HOUR:
+                started = scheduler.run_pending()
+                if started:
+                    logger.info("Started scheduled job(s): %s", ", ".join(started))
+                publish_scheduler_metrics(scheduler)
+
+                next_run = scheduler.seconds_until_next_run()
+                wait_seconds = SCHEDULER_TICK_SECONDS if next_run is None else min(next_run, SCHEDULER_TICK_SECONDS)
+                time.sleep(max(wait_seconds, 1.0))
             else:
                 # Outside operating hours
                 logger.info("Outside operating hours (00:00 - 23:59). Sleeping 1 hour.")
-                touch_heartbeat()
                 time.sleep(3600)
 
         except Exception as e:
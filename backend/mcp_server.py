@@ -4,6 +4,7 @@ Provides read-only tools for AI agents to query horse racing data.
 Runs alongside the Flask backend on port 8001.
 """
 
+import logging
 import os
 import re
 import sys
@@ -18,7 +19,7 @@ load_dotenv()
 
 # Import the shared Supabase client
 sys.path.insert(0, os.path.dirname(__file__))
-from supabase_client import get_supabase_client
+from supabase_client import SUPABASE_PAGE_SIZE, fetch_all_rows, get_supabase_client, run_concurrently
 from runtime_state import (
     get_database_health_snapshot,
     parse_iso,
@@ -28,6 +29,7 @@ from runtime_state import (
     utc_now,
 )
 
+logger = logging.getLogger(__name__)
 
 mcp = FastMCP(
     "TrackData",
@@ -307,6 +309,15 @@ def _fetch_race_snapshots(supabase, race_ids):
     return snapshots
 
 
+def _try_build_change_record(item, entry_snapshots, race_snapshots, source, default_change_type=None):
+    """Build one change record, skipping (and logging) a malformed row instead of failing the page."""
+    try:
+        return _build_change_record(item, entry_snapshots, race_snapshots, source, default_change_type)
+    except Exception as exc:
+        logger.warning("Skipping malformed %s row %s: %s", source, item.get("id"), exc)
+        return None
+
+
 def _build_change_record(item, entry_snapshots, race_snapshots, source, default_change_type=None):
     """Normalize a raw change row into the shared MCP/API change shape."""
     entry = _get_entry_snapshot(item, entry_snapshots)
@@ -920,60 +931,37 @@ def _fetch_normalized_change_batch(
     """Fetch and normalize a bounded change batch so history mode can page incrementally."""
     all_changes = []
     entries_with_detailed_scratches = set()
-    change_rows = []
-
-    try:
-        changes_query = (
-            supabase.table("hranalyzer_changes")
-            .select(
-                """
-                    id,
-                    entry_id,
-                    race_id,
-                    change_type,
-                    description,
-                    created_at,
-                    race:hranalyzer_races!inner(id)
-                """
-            )
-        )
 
-        changes_query = _resolve_date_filtered_query(
-            changes_query,
-            mode,
-            today,
-            start_date=start_date,
-            end_date=end_date,
+    changes_query = (
+        supabase.table("hranalyzer_changes")
+        .select(
+            """
+                id,
+                entry_id,
+                race_id,
+                change_type,
+                description,
+                created_at,
+                race:hranalyzer_races!inner(id)
+            """
         )
+    )
 
-        if track != "All":
-            changes_query = changes_query.eq("race.track_code", track)
-        if race_number:
-            changes_query = changes_query.eq("race.race_number", race_number)
-        if change_range is not None:
-            changes_query = changes_query.order("created_at", desc=True).range(change_range[0], change_range[1])
-
-        changes_response = changes_query.execute()
-        change_rows = changes_response.data or []
-        entry_snapshots = _fetch_entry_snapshots(
-            supabase,
-            [item.get("entry_id") for item in change_rows if item.get("entry_id")],
-        )
-        race_snapshots = _fetch_race_snapshots(
-            supabase,
-            [
-                item.get("race_id") or (item.get("race") or {}).get("id")
-                for item in change_rows
-                if item.get("race_id") or (item.get("race") or {}).get("id")
-            ],
-        )
+    changes_query = _resolve_date_filtered_query(
+        changes_query,
+        mode,
+        today,
+        start_date=start_date,
+        end_date=end_date,
+    )
 
-        for item in change_rows:
-            if item.get("change_type") == "Scratch" and item.get("entry_id"):
-                entries_with_detailed_scratches.add(item["entry_id"])
-            all_changes.append(_build_change_record(item, entry_snapshots, race_snapshots, "changes"))
-    except Exception:
-        change_rows = []
+    if track != "All":
+        changes_query = changes_query.eq("race.track_code", track)
+    if race_number:
+        changes_query = changes_query.eq("race.race_number", race_number)
+    changes_query = changes_query.order("created_at", desc=True).order("id")
+    if change_range is not None:
+        changes_query = changes_query.range(change_range[0], change_range[1])
 
     scratch_query = (
         supabase.table("hranalyzer_race_entries")
@@ -1002,34 +990,75 @@ def _fetch_normalized_change_batch(
         scratch_query = scratch_query.eq("race.track_code", track)
     if race_number:
         scratch_query = scratch_query.eq("race.race_number", race_number)
+    scratch_query = scratch_query.order("updated_at", desc=True).order("id")
     if scratch_range is not None:
-        scratch_query = scratch_query.order("updated_at", desc=True).range(scratch_range[0], scratch_range[1])
+        scratch_query = scratch_query.range(scratch_range[0], scratch_range[1])
+
+    def _read_rows(query, bounded):
+        # Unbounded batches page through every row instead of stopping at the server's max-rows.
+        return (query.execute().data or []) if bounded else fetch_all_rows(query)
+
+    # The change and scratch reads are independent; a failing change read degrades to
+    # scratches only, while a failing scratch read still propagates to the caller.
+    change_rows, scratch_rows = run_concurrently(
+        lambda: _read_rows(changes_query, change_range is not None),
+        lambda: _read_rows(scratch_query, scratch_range is not None),
+        return_exceptions=True,
+    )
+    if isinstance(scratch_rows, Exception):
+        raise scratch_rows
+    if isinstance(change_rows, Exception):
+        change_rows = []
 
-    scratch_response = scratch_query.execute()
-    scratch_rows = scratch_response.data or []
-    scratch_entry_snapshots = _fetch_entry_snapshots(supabase, [item["id"] for item in scratch_rows if item.get("id")])
-    scratch_race_snapshots = _fetch_race_snapshots(
-        supabase,
-        [
+    def _race_ids_for(rows):
+        return [
             item.get("race_id") or (item.get("race") or {}).get("id")
-            for item in scratch_rows
+            for item in rows
             if item.get("race_id") or (item.get("race") or {}).get("id")
-        ],
+        ]
+
+    (
+        entry_snapshots,
+        race_snapshots,
+        scratch_entry_snapshots,
+        scratch_race_snapshots,
+    ) = run_concurrently(
+        lambda: _fetch_entry_snapshots(
+            supabase,
+            [item.get("entry_id") for item in change_rows if item.get("entry_id")],
+        ),
+        lambda: _fetch_race_snapshots(supabase, _race_ids_for(change_rows)),
+        lambda: _fetch_entry_snapshots(supabase, [item["id"] for item in scratch_rows if item.get("id")]),
+        lambda: _fetch_race_snapshots(supabase, _race_ids_for(scratch_rows)),
+        return_exceptions=True,
     )
+    for snapshot in (scratch_entry_snapshots, scratch_race_snapshots):
+        if isinstance(snapshot, Exception):
+            raise snapshot
+    if isinstance(entry_snapshots, Exception) or isinstance(race_snapshots, Exception):
+        change_rows = []
+
+    for item in change_rows:
+        record = _try_build_change_record(item, entry_snapshots, race_snapshots, "changes")
+        if record is None:
+            continue
+        if item.get("change_type") == "Scratch" and item.get("entry_id"):
+            entries_with_detailed_scratches.add(item["entry_id"])
+        all_changes.append(record)
 
     for item in scratch_rows:
-        if item["id"] in entries_with_detailed_scratches:
+        if item.get("id") in entries_with_detailed_scratches:
             continue
 
-        all_changes.append(
-            _build_change_record(
-                item,
-                scratch_entry_snapshots,
-                scratch_race_snapshots,
-                "entries",
-                default_change_type="Scratch",
-            )
+        record = _try_build_change_record(
+            item,
+            scratch_entry_snapshots,
+            scratch_race_snapshots,
+            "entries",
+            default_change_type="Scratch",
         )
+        if record is not None:
+            all_changes.append(record)
 
     normalized = _normalize_change_list(all_changes, sort_desc=mode in {"history", "all"} or bool(start_date or end_date))
     normalized = [
@@ -1071,11 +1100,16 @@ def fetch_change_feed(
     race_number=0,
     include_race_wide=True,
 ):
-    """Mirror backend change merge and dedupe logic for MCP consumers."""
+    """
+    Mirror backend change merge and dedupe logic for MCP consumers.
+
+    `limit=None` returns every matching change in one page for internal aggregations.
+    """
     supabase = get_supabase_client()
     today = date.today().isoformat()
-    start = max(page - 1, 0) * limit
-    end = start + limit
+    collect_all = limit is None
+    start = 0 if collect_all else max(page - 1, 0) * limit
+    end = None if collect_all else start + limit
     history_like = mode in {"history", "all"} or bool(start_date or end_date)
 
     if not history_like:
@@ -1094,11 +1128,12 @@ def fetch_change_feed(
             "count": len(final_list),
             "page": page,
             "limit": limit,
-            "total_pages": (len(final_list) + limit - 1) // limit if limit > 0 else 1,
-            "has_more": page * limit < len(final_list),
+            "total_pages": (len(final_list) + limit - 1) // limit if limit else 1,
+            "has_more": False if collect_all else page * limit < len(final_list),
         }
 
-    chunk_size = max(limit * 4, 100)
+    # Chunks above the server's max-rows would come back short and look exhausted.
+    chunk_size = SUPABASE_PAGE_SIZE if collect_all else min(max(limit * 4, 100), SUPABASE_PAGE_SIZE)
     offset = 0
     collected = []
     has_more = False
@@ -1128,7 +1163,7 @@ def fetch_change_feed(
         final_list = _apply_change_visibility(final_list, include_race_wide)
 
         exhausted = batch["raw_change_count"] < chunk_size and batch["raw_scratch_count"] < chunk_size
-        if len(final_list) > end:
+        if end is not None and len(final_list) > end:
             has_more = True
             break
         if exhausted:
@@ -1141,7 +1176,11 @@ def fetch_change_feed(
         "count": len(final_list),
         "page": page,
         "limit": limit,
-        "total_pages": (len(final_list) + limit - 1) // limit if exhausted and limit > 0 else max(page + (1 if has_more else 0), 1),
+        "total_pages": (
+            1 if collect_all
+            else (len(final_list) + limit - 1) // limit if exhausted and limit > 0
+            else max(page + (1 if has_more else 0), 1)
+        ),
         "has_more": has_more,
     }
 
@@ -1151,7 +1190,7 @@ def fetch_scratch_feed(mode="upcoming", page=1, limit=20, track="All", start_dat
     change_feed = fetch_change_feed(
         mode=mode,
         page=1,
-        limit=10000,
+        limit=None,
         track=track,
         start_date=start_date,
         end_date=end_date,
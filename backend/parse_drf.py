@@ -10,7 +10,7 @@ import re
 import logging
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
-from supabase_client import get_supabase_client, reset_supabase_client
+from supabase_client import get_supabase_client, release_idle_supabase_clients
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -1173,7 +1173,7 @@ def parse_drf_pdf(pdf_path: str, upload_log_id: Optional[str] = None) -> Dict:
     finally:
         gc.collect()
         try:
-            reset_supabase_client()
+            release_idle_supabase_clients()
         except Exception:
             pass
 
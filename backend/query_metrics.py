@@ -0,0 +1,198 @@
+"""
+Query Metrics Module
+Aggregates per-query PostgREST timings so the heaviest call sites show up in production data
+"""
+
+import json
+import logging
+import os
+import threading
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+QUERY_METRICS_ENABLED = os.getenv('QUERY_METRICS_ENABLED', 'true').lower() in {'1', 'true', 'yes', 'on'}
+QUERY_METRICS_SLOW_MS = float(os.getenv('QUERY_METRICS_SLOW_MS', '1000'))
+QUERY_METRICS_LOG_ALL = os.getenv('QUERY_METRICS_LOG_ALL', 'false').lower() in {'1', 'true', 'yes', 'on'}
+QUERY_METRICS_MAX_FINGERPRINTS = max(int(os.getenv('QUERY_METRICS_MAX_FINGERPRINTS', '500')), 1)
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# Methods whose first argument names a column (or column list) rather than a value.
+COLUMN_ARG_METHODS = {
+    'select', 'eq', 'neq', 'gt', 'gte', 'lt', 'lte', 'like', 'ilike', 'is_', 'in_',
+    'contains', 'contained_by', 'order', 'filter', 'match',
+}
+WRITE_METHODS = {'insert', 'upsert', 'update', 'delete'}
+FINGERPRINT_ARG_MAX_CHARS = 80
+
+_lock = threading.Lock()
+_stats: dict[tuple[str, str], dict[str, Any]] = {}
+_local = threading.local()
+
+
+def _describe_operation(kind: str, name: str, args: tuple) -> str:
+    if kind == 'attr':
+        return name
+    if name in COLUMN_ARG_METHODS and args and isinstance(args[0], str):
+        column = " ".join(args[0].split())
+        if len(column) > FINGERPRINT_ARG_MAX_CHARS:
+            column = column[:FINGERPRINT_ARG_MAX_CHARS] + "..."
+        return f"{name}({column})"
+    if name == 'match' and args and isinstance(args[0], dict):
+        return f"match({','.join(sorted(args[0]))})"
+    return name
+
+
+def fingerprint_operations(operations) -> str:
+    """Stable shape of a recorded query chain: methods and columns, never filter values."""
+    return ".".join(_describe_operation(kind, name, args) for kind, name, args, _kwargs in operations)
+
+
+def is_write_chain(operations) -> bool:
+    return any(kind == 'call' and name in WRITE_METHODS for kind, name, _args, _kwargs in operations)
+
+
+def count_rows(response) -> int:
+    data = getattr(response, 'data', None)
+    if isinstance(data, list):
+        return len(data)
+    if data:
+        return 1
+    return 0
+
+
+def _bucket_label(duration_ms: float) -> str:
+    for bound in LATENCY_BUCKETS_MS:
+        if duration_ms <= bound:
+            return f"le_{bound}ms"
+    return "gt_10000ms"
+
+
+def begin_payload_capture() -> None:
+    _local.payload_bytes = 0
+    _local.capturing = True
+
+
+def end_payload_capture():
+    """Bytes seen by the httpx response hook since the last begin, or None if nothing was captured."""
+    captured = getattr(_local, 'payload_bytes', 0) if getattr(_local, 'capturing', False) else 0
+    _local.capturing = False
+    _local.payload_bytes = 0
+    return captured or None
+
+
+def httpx_response_hook(response) -> None:
+    """httpx event hook that attributes response body sizes to the query running on this thread."""
+    if not getattr(_local, 'capturing', False):
+        return
+    try:
+        response.read()
+        _local.payload_bytes += len(response.content or b"")
+    except Exception:
+        content_length = response.headers.get('content-length') if hasattr(response, 'headers') else None
+        if content_length and str(content_length).isdigit():
+            _local.payload_bytes += int(content_length)
+
+
+def record_query(
+    table: str,
+    fingerprint: str,
+    duration_ms: float,
+    rows: int = 0,
+    payload_bytes: int = None,
+    retries: int = 0,
+    error: str = None,
+) -> None:
+    if not QUERY_METRICS_ENABLED:
+        return
+
+    key = (table, fingerprint)
+    with _lock:
+        entry = _stats.get(key)
+        if entry is None:
+            if len(_stats) >= QUERY_METRICS_MAX_FINGERPRINTS:
+                key = (table, "<overflow>")
+                entry = _stats.get(key)
+            if entry is None:
+                entry = {
+                    'count': 0,
+                    'errors': 0,
+                    'retries': 0,
+                    'total_ms': 0.0,
+                    'max_ms': 0.0,
+                    'rows': 0,
+                    'max_rows': 0,
+                    'bytes': 0,
+                    'histogram': {},
+                }
+                _stats[key] = entry
+
+        entry['count'] += 1
+        entry['retries'] += retries
+        entry['total_ms'] += duration_ms
+        entry['max_ms'] = max(entry['max_ms'], duration_ms)
+        entry['rows'] += rows
+        entry['max_rows'] = max(entry['max_rows'], rows)
+        if payload_bytes:
+            entry['bytes'] += payload_bytes
+        if error:
+            entry['errors'] += 1
+        bucket = _bucket_label(duration_ms)
+        entry['histogram'][bucket] = entry['histogram'].get(bucket, 0) + 1
+
+    slow = duration_ms >= QUERY_METRICS_SLOW_MS
+    if slow or error or QUERY_METRICS_LOG_ALL:
+        event = {
+            'event': 'supabase_query',
+            'table': table,
+            'fingerprint': fingerprint,
+            'duration_ms': round(duration_ms, 1),
+            'rows': rows,
+            'bytes': payload_bytes,
+            'retries': retries,
+        }
+        if error:
+            event['error'] = error
+        level = logging.WARNING if slow or error else logging.INFO
+        logger.log(level, json.dumps(event, sort_keys=True))
+
+
+def get_query_metrics(top: int = 25, sort_by: str = 'total_ms') -> dict:
+    """Aggregated stats per (table, fingerprint), heaviest first."""
+    with _lock:
+        rows = [
+            {
+                'table': table,
+                'fingerprint': fingerprint,
+                **{name: (dict(value) if isinstance(value, dict) else value) for name, value in entry.items()},
+            }
+            for (table, fingerprint), entry in _stats.items()
+        ]
+
+    for row in rows:
+        row['avg_ms'] = round(row['total_ms'] / row['count'], 1) if row['count'] else 0.0
+        row['total_ms'] = round(row['total_ms'], 1)
+        row['max_ms'] = round(row['max_ms'], 1)
+
+    if sort_by not in {'total_ms', 'count', 'avg_ms', 'max_ms', 'rows', 'bytes', 'retries', 'errors'}:
+        sort_by = 'total_ms'
+    rows.sort(key=lambda row: row[sort_by], reverse=True)
+
+    return {
+        'fingerprints': len(rows),
+        'queries': sum(row['count'] for row in rows),
+        'buckets_ms': list(LATENCY_BUCKETS_MS),
+        'top': rows[:max(int(top), 0)] if top is not None else rows,
+    }
+
+
+def log_query_metrics_summary(top: int = 10) -> None:
+    summary = get_query_metrics(top=top)
+    if not summary['queries']:
+        return
+    logger.info(json.dumps({'event': 'supabase_query_summary', **summary}, sort_keys=True, default=str))
+
+
+def reset_query_metrics() -> None:
+    with _lock:
+        _stats.clear()
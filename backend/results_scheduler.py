@@ -0,0 +1,97 @@
+"""
+Results Poll Scheduler Module
+Decides which races to fetch results for, and when, from the post times already stored in
+hranalyzer_races: a race is first polled a few minutes after post, then retried with back-off until its
+results are verified. Races that exhaust their retries, or have no usable post time, are left to the
+periodic broad results sweep, which now runs only as a reconciliation pass.
+"""
+
+import logging
+import os
+import threading
+from datetime import timedelta
+
+logger = logging.getLogger(__name__)
+
+# Charts typically land a few minutes after the race goes off.
+RESULTS_FIRST_POLL_DELAY_MINUTES = int(os.getenv("RESULTS_FIRST_POLL_DELAY_MINUTES", "6"))
+RESULTS_RETRY_BACKOFF_MINUTES = tuple(
+    int(value) for value in os.getenv("RESULTS_RETRY_BACKOFF_MINUTES", "4,8,15,30").split(",") if value.strip()
+)
+RESULTS_POLL_MAX_ATTEMPTS = int(os.getenv("RESULTS_POLL_MAX_ATTEMPTS", "8"))
+
+
+class ResultsPollScheduler:
+    """
+    Per-race poll deadlines keyed by `(race_date, track_code, race_number)`. `update_races` takes
+    `(key, post_datetime, verified)` triples; post_datetime is timezone-aware or None when unknown.
+    """
+
+    def __init__(
+        self,
+        first_delay_minutes=RESULTS_FIRST_POLL_DELAY_MINUTES,
+        backoff_minutes=RESULTS_RETRY_BACKOFF_MINUTES,
+        max_attempts=RESULTS_POLL_MAX_ATTEMPTS,
+    ):
+        self.first_delay = timedelta(minutes=first_delay_minutes)
+        self.backoff = [timedelta(minutes=minutes) for minutes in backoff_minutes] or [timedelta(minutes=10)]
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+        self._races = {}
+        self._attempts = {}
+
+    def update_races(self, races):
+        with self._lock:
+            pending = {}
+            for key, post_dt, verified in races or []:
+                if verified or post_dt is None:
+                    continue
+                pending[key] = post_dt
+            self._races = pending
+            # Verified races and races that left the window drop their retry state.
+            self._attempts = {key: state for key, state in self._attempts.items() if key in pending}
+
+    def _next_due_at(self, key, post_dt):
+        attempts, last_attempt_at = self._attempts.get(key, (0, None))
+        if attempts >= self.max_attempts:
+            return None
+        if last_attempt_at is None:
+            return post_dt + self.first_delay
+        step = self.backoff[min(attempts - 1, len(self.backoff) - 1)]
+        return max(last_attempt_at + step, post_dt + self.first_delay)
+
+    def due_races(self, now):
+        """Keys of races whose poll deadline has passed, oldest post time first."""
+        with self._lock:
+            due = []
+            for key, post_dt in self._races.items():
+                due_at = self._next_due_at(key, post_dt)
+                if due_at is not None and due_at <= now:
+                    due.append((post_dt, key))
+        return [key for _, key in sorted(due)]
+
+    def mark_attempted(self, keys, now):
+        with self._lock:
+            for key in keys:
+                attempts, _ = self._attempts.get(key, (0, None))
+                self._attempts[key] = (attempts + 1, now)
+
+    def exhausted_races(self):
+        """Races that used every retry without verifying; the broad sweep picks these up."""
+        with self._lock:
+            return sorted(
+                key for key in self._races if self._attempts.get(key, (0, None))[0] >= self.max_attempts
+            )
+
+    def seconds_until_next_due(self, now):
+        """Seconds until the next race is due, 0 when one is due already, None when nothing is queued."""
+        with self._lock:
+            deadlines = [self._next_due_at(key, post_dt) for key, post_dt in self._races.items()]
+        deadlines = [deadline for deadline in deadlines if deadline is not None]
+        if not deadlines:
+            return None
+        return max(min((deadline - now).total_seconds() for deadline in deadlines), 0.0)
+
+    def pending_count(self):
+        with self._lock:
+            return len(self._races)
@@ -2,6 +2,7 @@ import json
 import logging
 import os
 import tempfile
+import threading
 from copy import deepcopy
 from datetime import UTC, date, datetime, timedelta
 from pathlib import Path
@@ -23,6 +24,9 @@ ALERT_DISPATCH_TIMEOUT_SECONDS = 10
 
 logger = logging.getLogger(__name__)
 
+# Scheduler jobs run on worker threads; serialize read-modify-write of the shared state file.
+_state_lock = threading.RLock()
+
 
 def utc_now():
     return datetime.now(UTC).replace(microsecond=0).isoformat().replace("+00:00", "Z")
@@ -75,6 +79,8 @@ def _empty_state():
         "crawl_status": {},
         "scratch_activity": {},
         "database_health": {},
+        "scheduler_jobs": {},
+        "startup_backfill": {},
         "dashboard_summaries": {},
         "api_snapshots": {},
         "summary_failures": {},
@@ -100,17 +106,19 @@ def load_state():
 def save_state(state):
     state = deepcopy(state)
     state["version"] = STATE_VERSION
-    STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
-    tmp_path = STATE_FILE.with_suffix(".tmp")
-    with tmp_path.open("w", encoding="utf-8") as fh:
-        json.dump(state, fh, indent=2, sort_keys=True)
-    tmp_path.replace(STATE_FILE)
+    with _state_lock:
+        STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = STATE_FILE.with_suffix(".tmp")
+        with tmp_path.open("w", encoding="utf-8") as fh:
+            json.dump(state, fh, indent=2, sort_keys=True)
+        tmp_path.replace(STATE_FILE)
 
 
 def update_state(mutator):
-    state = load_state()
-    mutator(state)
-    save_state(state)
+    with _state_lock:
+        state = load_state()
+        mutator(state)
+        save_state(state)
 
 
 def snapshot_dashboard_summary(target_date, payload):
@@ -167,6 +175,61 @@ def get_database_health_snapshot():
     return snapshot if isinstance(snapshot, dict) else {}
 
 
+def update_scheduler_jobs_snapshot(jobs):
+    jobs = dict(jobs or {})
+
+    def mutator(state):
+        state["scheduler_jobs"] = {
+            "jobs": jobs,
+            "updated_at": utc_now(),
+        }
+
+    update_state(mutator)
+
+
+def get_scheduler_jobs_snapshot():
+    state = load_state()
+    snapshot = state.get("scheduler_jobs") or {}
+    return snapshot if isinstance(snapshot, dict) else {}
+
+
+def start_startup_backfill(phases):
+    def mutator(state):
+        state["startup_backfill"] = {
+            "started_at": utc_now(),
+            "completed_at": None,
+            "phases": {phase: {"status": "pending"} for phase in phases},
+        }
+
+    update_state(mutator)
+
+
+def update_startup_backfill_phase(phase, status, error=None):
+    """Record a backfill phase moving to running/done/failed/skipped; stamps completion once all are settled."""
+
+    def mutator(state):
+        backfill = state.setdefault("startup_backfill", {})
+        phases = backfill.setdefault("phases", {})
+        entry = phases.setdefault(phase, {})
+        entry["status"] = status
+        if status == "running":
+            entry["started_at"] = utc_now()
+        else:
+            entry["finished_at"] = utc_now()
+        if error:
+            entry["error"] = error
+        if all(item.get("status") in {"done", "failed", "skipped"} for item in phases.values()):
+            backfill["completed_at"] = utc_now()
+
+    update_state(mutator)
+
+
+def get_startup_backfill_snapshot():
+    state = load_state()
+    snapshot = state.get("startup_backfill") or {}
+    return snapshot if isinstance(snapshot, dict) else {}
+
+
 def record_dashboard_summary_failure(target_date, message):
     target_date = str(target_date)
     now = utc_now()
@@ -478,7 +541,7 @@ def dispatch_pending_alert_notifications():
 
     state = load_state()
     alerts = state.get("alerts", [])
-    changed = False
+    delivered = []
 
     for alert in alerts:
         should_send_open = alert.get("status") == "open" and not alert.get("notified_open")
@@ -494,14 +557,23 @@ def dispatch_pending_alert_notifications():
             logger.warning("Failed to dispatch alert %s to Discord webhook: %s", alert.get("key"), exc)
             continue
 
-        if should_send_open:
-            alert["notified_open"] = True
-        if should_send_resolved:
-            alert["notified_resolved"] = True
-        changed = True
+        delivered.append((alert.get("key"), alert.get("status"), should_send_open, should_send_resolved))
 
-    if changed:
-        save_state(state)
+    if not delivered:
+        return
+
+    # Re-apply the flags onto fresh state so updates made while posting are not overwritten.
+    def mutator(fresh_state):
+        for key, status, sent_open, sent_resolved in delivered:
+            for alert in fresh_state.get("alerts", []):
+                if alert.get("key") != key or alert.get("status") != status:
+                    continue
+                if sent_open:
+                    alert["notified_open"] = True
+                if sent_resolved:
+                    alert["notified_resolved"] = True
+
+    update_state(mutator)
 
 
 def raise_alert(key, severity, message, details=None):
@@ -0,0 +1,6 @@
+-- Add card_fingerprint to races table
+-- The entries crawler stores a digest of the parsed card (race fields plus one per entry)
+-- and skips the race/entry writes on refreshes where nothing changed.
+
+ALTER TABLE hranalyzer_races
+ADD COLUMN IF NOT EXISTS card_fingerprint JSONB;
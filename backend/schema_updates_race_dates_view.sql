@@ -0,0 +1,10 @@
+-- Distinct race dates, one row per date
+-- The filter-options endpoint lists every date with races. Reading it from this view
+-- returns a few hundred rows instead of paging through one row per race.
+
+CREATE OR REPLACE VIEW hranalyzer_race_dates
+WITH (security_invoker = true) AS
+SELECT DISTINCT race_date
+FROM hranalyzer_races;
+
+REVOKE ALL ON hranalyzer_race_dates FROM anon, authenticated;
@@ -0,0 +1,130 @@
+"""
+Scratch Poll Scheduler Module
+Decides which tracks' late-change feeds to poll, and when, from the post times already stored
+in hranalyzer_races: tracks with a race near post are polled every couple of minutes, tracks whose
+next race is hours away every fifteen minutes, and finished cards only occasionally.
+"""
+
+import logging
+import os
+import threading
+from datetime import timedelta
+
+logger = logging.getLogger(__name__)
+
+SCRATCH_POLL_HOT_MINUTES = int(os.getenv("SCRATCH_POLL_HOT_MINUTES", "30"))
+SCRATCH_POLL_WARM_MINUTES = int(os.getenv("SCRATCH_POLL_WARM_MINUTES", "60"))
+# A race stays "near post" until it has been off this long (delayed posts still take scratches).
+SCRATCH_POLL_POST_GRACE_MINUTES = int(os.getenv("SCRATCH_POLL_POST_GRACE_MINUTES", "20"))
+SCRATCH_POLL_INTERVALS = {
+    "hot": int(os.getenv("SCRATCH_POLL_HOT_SECONDS", "120")),
+    "warm": int(os.getenv("SCRATCH_POLL_WARM_SECONDS", "240")),
+    "cold": int(os.getenv("SCRATCH_POLL_COLD_SECONDS", "900")),
+    "unknown": int(os.getenv("SCRATCH_POLL_UNKNOWN_SECONDS", "300")),
+    "finished": int(os.getenv("SCRATCH_POLL_FINISHED_SECONDS", "1800")),
+}
+# Index page and OTB cover every track at once, so they run on their own slower cadence.
+SCRATCH_BROAD_SWEEP_SECONDS = int(os.getenv("SCRATCH_BROAD_SWEEP_SECONDS", "600"))
+TIER_ORDER = ("hot", "warm", "unknown", "cold", "finished")
+
+
+class ScratchPollScheduler:
+    """
+    Per-track poll deadlines. `post_times` maps a track code to a list of
+    `(post_datetime, finished)` pairs; post_datetime is timezone-aware or None when unknown.
+    """
+
+    def __init__(self, intervals=None, broad_sweep_seconds=SCRATCH_BROAD_SWEEP_SECONDS):
+        self.intervals = dict(SCRATCH_POLL_INTERVALS, **(intervals or {}))
+        self.broad_sweep_seconds = broad_sweep_seconds
+        self._lock = threading.Lock()
+        self._post_times = {}
+        self._last_polled = {}
+        self._last_broad_sweep = None
+
+    def update_post_times(self, post_times):
+        with self._lock:
+            self._post_times = {
+                (track or "").strip().upper(): list(races or [])
+                for track, races in (post_times or {}).items()
+                if track
+            }
+            # Forget tracks that left the card so their deadlines do not linger.
+            self._last_polled = {
+                track: polled_at for track, polled_at in self._last_polled.items() if track in self._post_times
+            }
+
+    def tracks(self):
+        with self._lock:
+            return sorted(self._post_times)
+
+    def tier_for(self, track, now):
+        with self._lock:
+            races = self._post_times.get(track, [])
+        return self._tier(races, now)
+
+    def _tier(self, races, now):
+        open_races = [(post_dt, finished) for post_dt, finished in races if not finished]
+        if races and not open_races:
+            return "finished"
+
+        grace = timedelta(minutes=SCRATCH_POLL_POST_GRACE_MINUTES)
+        upcoming = [post_dt for post_dt, _ in open_races if post_dt is not None and post_dt + grace > now]
+        if not upcoming:
+            # Open races without a usable post time: keep the old flat cadence.
+            if any(post_dt is None for post_dt, _ in open_races) or not races:
+                return "unknown"
+            return "finished"
+
+        minutes_to_post = (min(upcoming) - now).total_seconds() / 60
+        if minutes_to_post <= SCRATCH_POLL_HOT_MINUTES:
+            return "hot"
+        if minutes_to_post <= SCRATCH_POLL_WARM_MINUTES:
+            return "warm"
+        return "cold"
+
+    def _next_due_at(self, track, races, now):
+        last = self._last_polled.get(track)
+        if last is None:
+            return now
+        return last + timedelta(seconds=self.intervals[self._tier(races, now)])
+
+    def due_tracks(self, now):
+        """Tracks whose poll deadline has passed, most urgent tier first."""
+        with self._lock:
+            due = []
+            for track, races in self._post_times.items():
+                if self._next_due_at(track, races, now) <= now:
+                    due.append((TIER_ORDER.index(self._tier(races, now)), track))
+        return [track for _, track in sorted(due)]
+
+    def broad_sweep_due(self, now):
+        with self._lock:
+            last = self._last_broad_sweep
+        return last is None or (now - last).total_seconds() >= self.broad_sweep_seconds
+
+    def mark_polled(self, tracks, now, broad_sweep=False):
+        with self._lock:
+            for track in tracks:
+                self._last_polled[track] = now
+            if broad_sweep:
+                self._last_broad_sweep = now
+
+    def seconds_until_next_due(self, now):
+        """Seconds until the next track (or broad sweep) is due; 0 when something is due already."""
+        with self._lock:
+            deadlines = [self._next_due_at(track, races, now) for track, races in self._post_times.items()]
+            if self._last_broad_sweep is None:
+                deadlines.append(now)
+            else:
+                deadlines.append(self._last_broad_sweep + timedelta(seconds=self.broad_sweep_seconds))
+        return max(min((deadline - now).total_seconds() for deadline in deadlines), 0.0)
+
+    def tier_counts(self, now):
+        with self._lock:
+            races_by_track = dict(self._post_times)
+        counts = {}
+        for races in races_by_track.values():
+            tier = self._tier(races, now)
+            counts[tier] = counts.get(tier, 0) + 1
+        return counts
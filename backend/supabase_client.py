@@ -1,16 +1,33 @@
 """
 Supabase Client Helper Module
-Provides a singleton Supabase client for database operations
+Provides a pooled, self-healing Supabase client for database operations
 """
 
+import asyncio
+import copy
+import inspect
+import logging
 import os
+import threading
 import time
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable
 
 import httpx
 from dotenv import load_dotenv
 from supabase import Client, create_client
 
+from query_metrics import (
+    begin_payload_capture,
+    count_rows,
+    end_payload_capture,
+    fingerprint_operations,
+    httpx_response_hook,
+    is_write_chain,
+    record_query,
+)
+
 try:
     from supabase.lib.client_options import SyncClientOptions
 except Exception:  # pragma: no cover - test stubs may not expose submodules
@@ -33,10 +50,31 @@ SUPABASE_HTTPX_MAX_KEEPALIVE_CONNECTIONS = max(
 SUPABASE_HTTPX_KEEPALIVE_EXPIRY_SECONDS = float(
     os.getenv('SUPABASE_HTTPX_KEEPALIVE_EXPIRY_SECONDS', '15')
 )
+SUPABASE_CLIENT_POOL_SIZE = max(int(os.getenv('SUPABASE_CLIENT_POOL_SIZE', '2')), 1)
+# Rows per page for transparent pagination; keep at or below the PostgREST max-rows setting
+# (1000 on Supabase) so a short page reliably means the result set is exhausted.
+SUPABASE_PAGE_SIZE = max(int(os.getenv('SUPABASE_PAGE_SIZE', '1000')), 1)
+SUPABASE_READ_COALESCING = os.getenv('SUPABASE_READ_COALESCING', 'true').lower() in {'1', 'true', 'yes', 'on'}
+SUPABASE_READ_CACHE_TTL_SECONDS = max(float(os.getenv('SUPABASE_READ_CACHE_TTL_SECONDS', '0')), 0.0)
+SUPABASE_CONCURRENT_QUERY_WORKERS = max(int(os.getenv('SUPABASE_CONCURRENT_QUERY_WORKERS', '4')), 1)
+QUERY_WORKER_THREAD_PREFIX = "supabase-query"
+
+logger = logging.getLogger(__name__)
 
-# Singleton client instance
-_supabase_client: Client = None
-_supabase_client_created_at: float = 0.0
+# Shared client pool, created lazily on first use
+_client_pool: "SupabaseClientPool" = None
+_client_pool_lock = threading.Lock()
+
+# Single-flight registry for identical read chains, plus the optional micro-TTL cache
+_read_flights: dict = {}
+_read_cache: dict = {}
+_table_generations: dict = {}
+_read_coalesce_lock = threading.Lock()
+_read_coalesce_counters = {"coalesced": 0, "cache_hits": 0, "invalidations": 0}
+
+# Shared worker pool for fanning out independent queries
+_query_executor: ThreadPoolExecutor = None
+_query_executor_lock = threading.Lock()
 
 
 def _is_retryable_database_error(exc: Exception) -> bool:
@@ -62,6 +100,7 @@ def _build_httpx_client() -> httpx.Client:
         follow_redirects=True,
         http2=False,
         trust_env=False,
+        event_hooks={"response": [httpx_response_hook]},
         limits=httpx.Limits(
             max_connections=SUPABASE_HTTPX_MAX_CONNECTIONS,
             max_keepalive_connections=SUPABASE_HTTPX_MAX_KEEPALIVE_CONNECTIONS,
@@ -88,8 +127,7 @@ class ResilientTableQuery:
 
         return recorder
 
-    def _materialize(self, force_refresh: bool = False):
-        client = _get_raw_supabase_client(force_refresh=force_refresh)
+    def _materialize(self, client: Client):
         raw_table = getattr(client, "_trackdata_raw_table", client.table)
         builder = raw_table(self._table_name)
         for kind, name, args, kwargs in self._operations:
@@ -102,22 +140,297 @@ class ResilientTableQuery:
         return builder
 
     def execute(self):
+        if is_write_chain(self._operations):
+            try:
+                return self._execute_instrumented()
+            finally:
+                invalidate_read_cache(self._table_name)
+
+        if not SUPABASE_READ_COALESCING:
+            return self._execute_instrumented()
+
+        return _execute_single_flight(self._table_name, repr(self._operations), self._execute_instrumented)
+
+    def iter_rows(self, page_size: int = None):
+        """
+        Yield every matching row, fetching `page_size` rows per request with .range().
+
+        An explicit .limit() on the chain caps the total; any .range() is replaced.
+        Chains should carry an .order() so pages are stable between requests.
+        """
+        page_size = max(int(page_size or SUPABASE_PAGE_SIZE), 1)
+        max_rows = None
+        base_operations = []
+        for operation in self._operations:
+            kind, name, args, _kwargs = operation
+            if kind == "call" and name == "limit":
+                max_rows = int(args[0]) if args else None
+                continue
+            if kind == "call" and name == "range":
+                continue
+            base_operations.append(operation)
+
+        start = 0
+        while max_rows is None or start < max_rows:
+            end = start + page_size - 1
+            if max_rows is not None:
+                end = min(end, max_rows - 1)
+            page = ResilientTableQuery(self._table_name)
+            page._operations = base_operations + [("call", "range", (start, end), {})]
+            rows = page.execute().data or []
+            yield from rows
+            if len(rows) < (end - start + 1):
+                return
+            start = end + 1
+
+    def fetch_all(self, page_size: int = None) -> list:
+        """Every matching row as a list, fetched page by page."""
+        return list(self.iter_rows(page_size=page_size))
+
+    def _execute_instrumented(self):
+        started = time.perf_counter()
+        begin_payload_capture()
+        outcome = {"retries": 0}
+        response = None
+        error = None
+        try:
+            response = self._execute_with_retry(outcome)
+            return response
+        except Exception as exc:
+            error = type(exc).__name__
+            raise
+        finally:
+            record_query(
+                self._table_name,
+                fingerprint_operations(self._operations),
+                (time.perf_counter() - started) * 1000,
+                rows=count_rows(response),
+                payload_bytes=end_payload_capture(),
+                retries=outcome["retries"],
+                error=error,
+            )
+
+    def _execute_with_retry(self, outcome: dict):
         attempts = SUPABASE_QUERY_RETRY_ATTEMPTS + 1
         last_error = None
+        pool = _get_client_pool()
 
         for attempt_index in range(attempts):
+            pooled = pool.acquire()
             try:
-                builder = self._materialize(force_refresh=attempt_index > 0)
-                return builder.execute()
+                builder = self._materialize(pooled.client)
+                response = builder.execute()
             except Exception as exc:  # pragma: no cover - exercised through callers
                 last_error = exc
                 if attempt_index >= attempts - 1 or not _is_retryable_database_error(exc):
                     raise
-                reset_supabase_client()
+                # Only the client that failed is rotated; queries in flight elsewhere keep theirs.
+                pool.rotate(pooled, reason=type(exc).__name__)
+                pool.record_retry()
+                outcome["retries"] += 1
+            else:
+                pool.record_success(pooled)
+                return response
+            finally:
+                pool.release(pooled)
 
         raise last_error
 
 
+class _ReadFlight:
+    """One in-flight read shared by every caller that issued the identical chain."""
+
+    def __init__(self, generation: int):
+        self.event = threading.Event()
+        self.generation = generation
+        self.followers = 0
+        self.snapshot = None
+        self.error = None
+
+
+def _execute_single_flight(table_name: str, chain_key: str, run: Callable[[], Any]):
+    key = (table_name, chain_key)
+
+    with _read_coalesce_lock:
+        cached = _read_cache.get(key)
+        if cached is not None:
+            expires_at, snapshot = cached
+            if expires_at > time.monotonic():
+                _read_coalesce_counters["cache_hits"] += 1
+                flight = None
+            else:
+                _read_cache.pop(key, None)
+                cached = None
+
+        if cached is None:
+            generation = _table_generations.get(table_name, 0)
+            flight = _read_flights.get(key)
+            if flight is not None and flight.generation != generation:
+                # Started before a write to this table; callers after the write must not see it.
+                flight = None
+            is_leader = flight is None
+            if is_leader:
+                flight = _ReadFlight(generation)
+                _read_flights[key] = flight
+            else:
+                flight.followers += 1
+                _read_coalesce_counters["coalesced"] += 1
+
+    if cached is not None:
+        return copy.deepcopy(snapshot)
+
+    if not is_leader:
+        flight.event.wait()
+        if flight.error is not None:
+            raise flight.error
+        return copy.deepcopy(flight.snapshot)
+
+    response = None
+    try:
+        response = run()
+        return response
+    except Exception as exc:
+        flight.error = exc
+        raise
+    finally:
+        with _read_coalesce_lock:
+            if _read_flights.get(key) is flight:
+                _read_flights.pop(key)
+            # No new followers can join now; snapshot before the leader's caller can mutate it.
+            cacheable = (
+                flight.error is None
+                and SUPABASE_READ_CACHE_TTL_SECONDS > 0
+                and _table_generations.get(table_name, 0) == flight.generation
+            )
+            if flight.error is None and (flight.followers or cacheable):
+                flight.snapshot = copy.deepcopy(response)
+            if cacheable:
+                _read_cache[key] = (time.monotonic() + SUPABASE_READ_CACHE_TTL_SECONDS, flight.snapshot)
+        flight.event.set()
+
+
+def invalidate_read_cache(table_name: str = None) -> None:
+    """Drop micro-TTL entries for `table_name` (or every table) after a write."""
+    with _read_coalesce_lock:
+        if table_name is None:
+            for name in list(_table_generations):
+                _table_generations[name] += 1
+            _read_cache.clear()
+        else:
+            _table_generations[table_name] = _table_generations.get(table_name, 0) + 1
+            for key in [key for key in _read_cache if key[0] == table_name]:
+                _read_cache.pop(key, None)
+        _read_coalesce_counters["invalidations"] += 1
+
+
+def get_read_coalescing_metrics() -> dict:
+    with _read_coalesce_lock:
+        return {
+            "enabled": SUPABASE_READ_COALESCING,
+            "cache_ttl_seconds": SUPABASE_READ_CACHE_TTL_SECONDS,
+            "in_flight": len(_read_flights),
+            "cached": len(_read_cache),
+            **_read_coalesce_counters,
+        }
+
+
+class AsyncResilientTableQuery(ResilientTableQuery):
+    """Awaitable variant of ResilientTableQuery; retries behave exactly like the sync path."""
+
+    async def execute(self):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_query_executor(), super().execute)
+
+
+class AsyncSupabaseClient:
+    """Async table facade for fanning out independent PostgREST reads."""
+
+    def table(self, table_name: str) -> AsyncResilientTableQuery:
+        return AsyncResilientTableQuery(table_name)
+
+    async def gather(self, *queries, return_exceptions: bool = False) -> list:
+        return await gather_queries(*queries, return_exceptions=return_exceptions)
+
+
+def _get_query_executor() -> ThreadPoolExecutor:
+    global _query_executor
+
+    if _query_executor is None:
+        with _query_executor_lock:
+            if _query_executor is None:
+                _query_executor = ThreadPoolExecutor(
+                    max_workers=SUPABASE_CONCURRENT_QUERY_WORKERS,
+                    thread_name_prefix=QUERY_WORKER_THREAD_PREFIX,
+                )
+    return _query_executor
+
+
+def _in_query_worker() -> bool:
+    return threading.current_thread().name.startswith(QUERY_WORKER_THREAD_PREFIX)
+
+
+async def gather_queries(*queries, return_exceptions: bool = False) -> list:
+    """Await independent query chains together; results keep the order of `queries`."""
+    loop = asyncio.get_running_loop()
+    awaitables = []
+    for query in queries:
+        if inspect.iscoroutinefunction(query.execute):
+            awaitables.append(query.execute())
+        else:
+            awaitables.append(loop.run_in_executor(_get_query_executor(), query.execute))
+    return await asyncio.gather(*awaitables, return_exceptions=return_exceptions)
+
+
+def run_concurrently(*calls: Callable[[], Any], return_exceptions: bool = False) -> list:
+    """
+    Run independent zero-argument callables on the shared query pool.
+
+    Latency becomes the slowest call instead of the sum of all calls. Nested use from
+    inside a pool worker runs inline so fan-outs can never starve the pool.
+    """
+    if len(calls) <= 1 or _in_query_worker():
+        futures = None
+    else:
+        executor = _get_query_executor()
+        futures = [executor.submit(call) for call in calls]
+
+    results = []
+    for index, call in enumerate(calls):
+        try:
+            results.append(futures[index].result() if futures else call())
+        except Exception as exc:
+            if not return_exceptions:
+                raise
+            results.append(exc)
+    return results
+
+
+def execute_concurrently(*queries, return_exceptions: bool = False) -> list:
+    """Execute independent query chains concurrently and return responses in order."""
+    return run_concurrently(*(query.execute for query in queries), return_exceptions=return_exceptions)
+
+
+def iter_query_rows(query, page_size: int = None):
+    """Stream rows from any query chain, paging with .range() until a short page."""
+    if isinstance(query, ResilientTableQuery):
+        yield from query.iter_rows(page_size=page_size)
+        return
+
+    page_size = max(int(page_size or SUPABASE_PAGE_SIZE), 1)
+    start = 0
+    while True:
+        rows = query.range(start, start + page_size - 1).execute().data or []
+        yield from rows
+        if len(rows) < page_size:
+            return
+        start += page_size
+
+
+def fetch_all_rows(query, page_size: int = None) -> list:
+    """Every row of `query`, fetched in bounded pages."""
+    return list(iter_query_rows(query, page_size=page_size))
+
+
 def _close_client(client: Client) -> None:
     try:
         client.postgrest.aclose()
@@ -125,15 +438,6 @@ def _close_client(client: Client) -> None:
         pass
 
 
-def reset_supabase_client() -> None:
-    global _supabase_client, _supabase_client_created_at
-
-    if _supabase_client is not None:
-        _close_client(_supabase_client)
-    _supabase_client = None
-    _supabase_client_created_at = 0.0
-
-
 def _build_client_kwargs():
     client_kwargs = {}
 
@@ -165,39 +469,235 @@ def _patch_client(client: Client) -> Client:
     return client
 
 
-def _get_raw_supabase_client(force_refresh: bool = False) -> Client:
-    global _supabase_client, _supabase_client_created_at
-
-    should_refresh = force_refresh
-    if _supabase_client is not None and SUPABASE_CLIENT_MAX_AGE_SECONDS > 0:
-        should_refresh = should_refresh or (
-            (time.time() - _supabase_client_created_at) >= SUPABASE_CLIENT_MAX_AGE_SECONDS
+def _create_raw_client() -> Client:
+    if not SUPABASE_SERVICE_KEY:
+        raise ValueError(
+            "SUPABASE_SERVICE_KEY (or SUPABASE_SERVICE_ROLE) environment variable is not set. "
+            "Please check your .env file."
         )
 
-    if should_refresh:
-        reset_supabase_client()
+    client_kwargs = _build_client_kwargs()
+    return create_client(
+        SUPABASE_URL,
+        SUPABASE_SERVICE_KEY,
+        **client_kwargs,
+    )
+
 
-    if _supabase_client is None:
-        if not SUPABASE_SERVICE_KEY:
-            raise ValueError(
-                "SUPABASE_SERVICE_KEY (or SUPABASE_SERVICE_ROLE) environment variable is not set. "
-                "Please check your .env file."
-            )
+class PooledClient:
+    """One Supabase client (and its httpx connection pool) plus its lease bookkeeping."""
 
-        client_kwargs = _build_client_kwargs()
-        _supabase_client = create_client(
-            SUPABASE_URL,
-            SUPABASE_SERVICE_KEY,
-            **client_kwargs,
-        )
-        _supabase_client_created_at = time.time()
+    def __init__(self, client: Client, slot: int):
+        self.client = client
+        self.slot = slot
+        self.created_at = time.time()
+        self.in_use = 0
+        self.failures = 0
+        self.retired = False
+
+
+class SupabaseClientPool:
+    """
+    Bounded set of Supabase clients leased per query.
 
-    return _supabase_client
+    Slots fill lazily, so a single-threaded process only ever builds one client.
+    A failing or expired client is retired on its own: leases already holding it
+    finish normally and the client is closed once the last one is released.
+    """
+
+    def __init__(self, size: int = SUPABASE_CLIENT_POOL_SIZE):
+        self.size = max(int(size), 1)
+        self._slots: list = [None] * self.size
+        self._draining: list[PooledClient] = []
+        self._lock = threading.Lock()
+        self._counters = {
+            "created": 0,
+            "rotations": 0,
+            "retries": 0,
+            "health_checks": 0,
+            "health_check_failures": 0,
+        }
+
+    def _create_slot(self, slot: int) -> PooledClient:
+        pooled = PooledClient(_patch_client(_create_raw_client()), slot)
+        self._slots[slot] = pooled
+        self._counters["created"] += 1
+        return pooled
+
+    def _retire_locked(self, pooled: PooledClient) -> None:
+        if pooled.retired:
+            return
+        pooled.retired = True
+        if self._slots[pooled.slot] is pooled:
+            self._slots[pooled.slot] = None
+        self._counters["rotations"] += 1
+        if pooled.in_use > 0:
+            self._draining.append(pooled)
+        else:
+            _close_client(pooled.client)
+
+    def _is_expired(self, pooled: PooledClient) -> bool:
+        if SUPABASE_CLIENT_MAX_AGE_SECONDS <= 0:
+            return False
+        return (time.time() - pooled.created_at) >= SUPABASE_CLIENT_MAX_AGE_SECONDS
+
+    def _select_locked(self, force_refresh: bool = False) -> PooledClient:
+        populated = [pooled for pooled in self._slots if pooled is not None]
+        empty_slots = [index for index, pooled in enumerate(self._slots) if pooled is None]
+
+        if not populated:
+            return self._create_slot(empty_slots[0])
+
+        pooled = min(populated, key=lambda candidate: candidate.in_use)
+        if pooled.in_use > 0 and empty_slots:
+            # Every live client is busy; grow instead of queueing behind one connection pool.
+            return self._create_slot(empty_slots[0])
+
+        if force_refresh or self._is_expired(pooled):
+            slot = pooled.slot
+            self._retire_locked(pooled)
+            return self._create_slot(slot)
+
+        return pooled
+
+    def acquire(self, force_refresh: bool = False) -> PooledClient:
+        with self._lock:
+            pooled = self._select_locked(force_refresh=force_refresh)
+            pooled.in_use += 1
+            return pooled
+
+    def peek(self, force_refresh: bool = False) -> PooledClient:
+        with self._lock:
+            return self._select_locked(force_refresh=force_refresh)
+
+    def release(self, pooled: PooledClient) -> None:
+        with self._lock:
+            pooled.in_use = max(pooled.in_use - 1, 0)
+            if pooled.retired and pooled.in_use == 0 and pooled in self._draining:
+                self._draining.remove(pooled)
+                _close_client(pooled.client)
+
+    def rotate(self, pooled: PooledClient, reason: str = "") -> None:
+        with self._lock:
+            pooled.failures += 1
+            if not pooled.retired:
+                logger.info("Rotating Supabase client slot %s (%s)", pooled.slot, reason or "requested")
+            self._retire_locked(pooled)
+
+    def record_success(self, pooled: PooledClient) -> None:
+        pooled.failures = 0
+
+    def record_retry(self) -> None:
+        with self._lock:
+            self._counters["retries"] += 1
+
+    def retire_all(self) -> None:
+        with self._lock:
+            for pooled in list(self._slots):
+                if pooled is not None:
+                    self._retire_locked(pooled)
+
+    def trim_idle(self, keep: int = 1) -> int:
+        """Close idle clients beyond `keep`; returns how many were released."""
+        released = 0
+        with self._lock:
+            live = [pooled for pooled in self._slots if pooled is not None]
+            for pooled in live[max(keep, 0):]:
+                if pooled.in_use == 0:
+                    self._slots[pooled.slot] = None
+                    pooled.retired = True
+                    _close_client(pooled.client)
+                    released += 1
+        return released
+
+    def check_health(self) -> dict:
+        """Probe each idle client with a trivial read and rotate the ones that fail."""
+        with self._lock:
+            candidates = [pooled for pooled in self._slots if pooled is not None and pooled.in_use == 0]
+            for pooled in candidates:
+                pooled.in_use += 1
+
+        healthy = 0
+        rotated = 0
+        for pooled in candidates:
+            try:
+                ResilientTableQuery("hranalyzer_tracks").select("id").limit(1)._materialize(pooled.client).execute()
+                healthy += 1
+                self.record_success(pooled)
+            except Exception as exc:
+                logger.warning("Supabase client slot %s failed health check: %s", pooled.slot, exc)
+                self.rotate(pooled, reason="health check")
+                rotated += 1
+            finally:
+                self.release(pooled)
+
+        with self._lock:
+            self._counters["health_checks"] += len(candidates)
+            self._counters["health_check_failures"] += rotated
+
+        return {"checked": len(candidates), "healthy": healthy, "rotated": rotated}
+
+    def metrics(self) -> dict:
+        with self._lock:
+            live = [pooled for pooled in self._slots if pooled is not None]
+            return {
+                "pool_size": self.size,
+                "clients": len(live),
+                "in_use": sum(pooled.in_use for pooled in live) + sum(p.in_use for p in self._draining),
+                "idle": sum(1 for pooled in live if pooled.in_use == 0),
+                "draining": len(self._draining),
+                **self._counters,
+            }
+
+
+def _get_client_pool() -> SupabaseClientPool:
+    global _client_pool
+
+    if _client_pool is None:
+        with _client_pool_lock:
+            if _client_pool is None:
+                _client_pool = SupabaseClientPool(SUPABASE_CLIENT_POOL_SIZE)
+    return _client_pool
+
+
+def reset_supabase_client() -> None:
+    """Retire every pooled client; in-flight queries finish on the client they already hold."""
+    if _client_pool is not None:
+        _client_pool.retire_all()
+
+
+def release_idle_supabase_clients(keep: int = 1) -> int:
+    """Close idle pooled clients beyond `keep` without touching clients that are in use."""
+    if _client_pool is None:
+        return 0
+    return _client_pool.trim_idle(keep=keep)
+
+
+def check_supabase_pool_health() -> dict:
+    """Probe idle pooled clients and rotate any that fail."""
+    return _get_client_pool().check_health()
+
+
+def get_supabase_pool_metrics() -> dict:
+    """Snapshot of pool occupancy and rotation/retry counters."""
+    if _client_pool is None:
+        return SupabaseClientPool(SUPABASE_CLIENT_POOL_SIZE).metrics()
+    return _client_pool.metrics()
+
+
+def _get_raw_supabase_client(force_refresh: bool = False) -> Client:
+    return _get_client_pool().peek(force_refresh=force_refresh).client
 
 
 def get_supabase_client(force_refresh: bool = False) -> Client:
     """
-    Get or create the Supabase client singleton
+    Get a Supabase client from the shared pool
+
+    Table queries built from the returned client lease a pooled client per execute,
+    so `.table(...)` is safe to share across threads. Anything else on the object (rpc,
+    storage, auth, postgrest) talks to the peeked client directly without a lease, and
+    that client may be closed by `rotate`/`trim_idle`; do not hold it for such calls,
+    use `lease_supabase_client()` instead.
 
     Returns:
         Client: Supabase client instance
@@ -205,7 +705,31 @@ def get_supabase_client(force_refresh: bool = False) -> Client:
     Raises:
         ValueError: If SUPABASE_SERVICE_KEY is not set
     """
-    return _patch_client(_get_raw_supabase_client(force_refresh=force_refresh))
+    return _get_raw_supabase_client(force_refresh=force_refresh)
+
+
+@contextmanager
+def lease_supabase_client(force_refresh: bool = False):
+    """
+    Lease a pooled client for direct (non-table) use. The client is counted as in use, so the
+    pool will not close it until the block exits; do not keep a reference past the block.
+    """
+    pool = _get_client_pool()
+    pooled = pool.acquire(force_refresh=force_refresh)
+    try:
+        yield pooled.client
+    finally:
+        pool.release(pooled)
+
+
+def get_async_supabase_client() -> AsyncSupabaseClient:
+    """
+    Get an async facade over the shared Supabase client
+
+    Returns:
+        AsyncSupabaseClient: facade whose table queries expose `await query.execute()`
+    """
+    return AsyncSupabaseClient()
 
 
 def test_connection():
@@ -0,0 +1,208 @@
+"""
+Task Scheduler Module
+Runs the live crawler's job types (scratches, results, entries, bet resolution, maintenance) on
+independent cadences instead of one serial loop, so a slow results sweep no longer delays scratch polls.
+
+Each job has an interval (seconds, or a callable returning seconds for adaptive cadences), a priority
+used to order jobs that come due together, and a lane: jobs sharing a lane never run at the same time,
+which keeps the heavy Equibase work isolated to one child process at a time. A job that comes due
+while its previous run is still active skips that slot instead of queueing behind itself. A job can
+also wait on an event (e.g. the startup backfill phase doing the same work) before its first run.
+"""
+
+import logging
+import os
+import threading
+import time
+from datetime import UTC, datetime
+
+logger = logging.getLogger(__name__)
+
+# Floor for adaptive intervals so a callable returning 0 cannot spin a job.
+TASK_SCHEDULER_MIN_INTERVAL_SECONDS = float(os.getenv("TASK_SCHEDULER_MIN_INTERVAL_SECONDS", "5"))
+
+
+def _iso(epoch_seconds):
+    if epoch_seconds is None:
+        return None
+    return datetime.fromtimestamp(epoch_seconds, UTC).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+class ScheduledJob:
+    """One job type with its cadence, priority, lane, and run metrics."""
+
+    def __init__(
+        self, name, func, interval, priority=100, lane=None, max_runtime_seconds=None, first_run_at=None, wait_for=None
+    ):
+        self.name = name
+        self.func = func
+        self.interval = interval
+        self.priority = priority
+        self.lane = lane or name
+        self.max_runtime_seconds = max_runtime_seconds
+        self.next_run_at = first_run_at
+        self.wait_for = wait_for
+        self.running = False
+        self.scheduled_at = None
+        self.last_started_at = None
+        self.last_finished_at = None
+        self.last_duration_seconds = None
+        self.last_lag_seconds = None
+        self.max_lag_seconds = 0.0
+        self.last_error = None
+        self.runs = 0
+        self.failures = 0
+        self.skipped_overlaps = 0
+
+    def is_gated(self):
+        return self.wait_for is not None and not self.wait_for.is_set()
+
+    def interval_seconds(self):
+        interval = self.interval() if callable(self.interval) else self.interval
+        return max(float(interval), TASK_SCHEDULER_MIN_INTERVAL_SECONDS)
+
+
+class TaskScheduler:
+    """
+    Dispatches due jobs onto worker threads. Call `run_pending()` from the main loop and sleep for
+    `seconds_until_next_run()` between calls. Each job has at most one run in flight, so there is never
+    more than one thread per job; threads are daemonic so a shutdown signal is not held up by a sweep.
+    """
+
+    def __init__(self, clock=time.time):
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._jobs = {}
+        self._busy_lanes = set()
+
+    def add_job(
+        self, name, func, interval, priority=100, lane=None, max_runtime_seconds=None, first_run_at=None, wait_for=None
+    ):
+        """`wait_for` is an optional threading.Event; the job does not run until it is set."""
+        job = ScheduledJob(
+            name,
+            func,
+            interval,
+            priority=priority,
+            lane=lane,
+            max_runtime_seconds=max_runtime_seconds,
+            first_run_at=self.clock() if first_run_at is None else first_run_at,
+            wait_for=wait_for,
+        )
+        with self._lock:
+            self._jobs[name] = job
+        return job
+
+    def run_now(self, name):
+        """Make a job due immediately (it still respects its lane and overlap rules)."""
+        with self._lock:
+            self._jobs[name].next_run_at = self.clock()
+
+    def run_pending(self):
+        """Start every due job whose lane is free, most urgent priority first. Returns started job names."""
+        now = self.clock()
+        started = []
+        with self._lock:
+            due = sorted(
+                (job for job in self._jobs.values() if job.next_run_at <= now),
+                key=lambda job: (job.priority, job.next_run_at),
+            )
+            for job in due:
+                if job.running:
+                    job.skipped_overlaps += 1
+                    job.next_run_at = now + job.interval_seconds()
+                    logger.warning(
+                        "Skipping scheduled %s run: previous run still active after %.0fs",
+                        job.name,
+                        now - job.last_started_at,
+                    )
+                    continue
+                if job.is_gated():
+                    # Held back rather than late: lag is measured from when the gate opens.
+                    job.next_run_at = now
+                    continue
+                if job.lane in self._busy_lanes:
+                    # Stays due; its lag keeps growing until the lane frees up.
+                    continue
+
+                job.running = True
+                job.scheduled_at = job.next_run_at
+                job.last_started_at = now
+                job.last_lag_seconds = max(now - job.scheduled_at, 0.0)
+                job.max_lag_seconds = max(job.max_lag_seconds, job.last_lag_seconds)
+                # Fixed rate from the scheduled slot, but never immediately again after a long lane wait.
+                job.next_run_at = max(job.scheduled_at + job.interval_seconds(), now + TASK_SCHEDULER_MIN_INTERVAL_SECONDS)
+                self._busy_lanes.add(job.lane)
+                started.append(job)
+
+        for job in started:
+            threading.Thread(target=self._run_job, args=(job,), name=f"scheduler-{job.name}", daemon=True).start()
+        return [job.name for job in started]
+
+    def _run_job(self, job):
+        error = None
+        try:
+            job.func()
+        except Exception as exc:
+            error = exc
+            logger.error("Scheduled job %s failed: %s", job.name, exc)
+
+        finished_at = self.clock()
+        with self._lock:
+            job.running = False
+            job.runs += 1
+            job.last_finished_at = finished_at
+            job.last_duration_seconds = finished_at - job.last_started_at
+            if error is not None:
+                job.failures += 1
+                job.last_error = str(error)
+            else:
+                job.last_error = None
+            if callable(job.interval):
+                # Adaptive cadences (e.g. scratch polls) are re-evaluated once the run has finished.
+                job.next_run_at = finished_at + job.interval_seconds()
+            self._busy_lanes.discard(job.lane)
+
+    def seconds_until_next_run(self):
+        """Seconds until the earliest idle job is due; 0 when one is due already."""
+        now = self.clock()
+        with self._lock:
+            pending = [job.next_run_at for job in self._jobs.values() if not job.running and not job.is_gated()]
+        if not pending:
+            return None
+        return max(min(pending) - now, 0.0)
+
+    def snapshot(self):
+        """Per-job next-run, lag and outcome metrics, suitable for runtime state."""
+        now = self.clock()
+        jobs = {}
+        with self._lock:
+            for job in sorted(self._jobs.values(), key=lambda item: item.priority):
+                running_for = now - job.last_started_at if job.running else None
+                jobs[job.name] = {
+                    "priority": job.priority,
+                    "lane": job.lane,
+                    "running": job.running,
+                    "waiting_for_gate": job.is_gated(),
+                    "running_for_seconds": round(running_for, 1) if running_for is not None else None,
+                    "overrunning": bool(
+                        running_for is not None
+                        and job.max_runtime_seconds is not None
+                        and running_for > job.max_runtime_seconds
+                    ),
+                    "next_run_at": _iso(job.next_run_at),
+                    "next_run_in_seconds": round(job.next_run_at - now, 1),
+                    "current_lag_seconds": round(max(now - job.next_run_at, 0.0), 1) if not job.running else 0.0,
+                    "last_lag_seconds": round(job.last_lag_seconds, 1) if job.last_lag_seconds is not None else None,
+                    "max_lag_seconds": round(job.max_lag_seconds, 1),
+                    "last_started_at": _iso(job.last_started_at),
+                    "last_finished_at": _iso(job.last_finished_at),
+                    "last_duration_seconds": (
+                        round(job.last_duration_seconds, 1) if job.last_duration_seconds is not None else None
+                    ),
+                    "last_error": job.last_error,
+                    "runs": job.runs,
+                    "failures": job.failures,
+                    "skipped_overlaps": job.skipped_overlaps,
+                }
+        return jobs
@@ -70,6 +70,42 @@ class FakeSupabaseClient:
         return FakeSupabaseQuery(self)
 
 
+class PagedDateQuery:
+    def __init__(self, client, table_name):
+        self.client = client
+        self.table_name = table_name
+
+    def select(self, *args):
+        return self
+
+    def lte(self, *args):
+        return self
+
+    def order(self, *args, **kwargs):
+        return self
+
+    def range(self, start, end):
+        self.window = (start, end)
+        return self
+
+    def execute(self):
+        self.client.reads.append((self.table_name, self.window))
+        if self.table_name in self.client.missing_tables:
+            raise RuntimeError(f"relation {self.table_name} does not exist")
+        rows = self.client.rows[self.table_name]
+        return types.SimpleNamespace(data=rows[self.window[0]:self.window[1] + 1])
+
+
+class PagedDateClient:
+    def __init__(self, rows, missing_tables=()):
+        self.rows = rows
+        self.missing_tables = set(missing_tables)
+        self.reads = []
+
+    def table(self, table_name):
+        return PagedDateQuery(self, table_name)
+
+
 class TestBackendFeedRoutes(unittest.TestCase):
     def setUp(self):
         self.client = backend_module.app.test_client()
@@ -111,6 +147,25 @@ class TestBackendFeedRoutes(unittest.TestCase):
 
         self.assertIn({"name": "Woodbine", "code": "WO"}, tracks)
 
+    def test_race_dates_come_from_the_date_level_view(self):
+        race_rows = [{"race_date": "2026-04-03"}] * 5 + [{"race_date": "2026-04-02"}] * 5
+        client = PagedDateClient(
+            {
+                "hranalyzer_race_dates": [{"race_date": "2026-04-03"}, {"race_date": "2026-04-02"}],
+                "hranalyzer_races": race_rows,
+            }
+        )
+
+        self.assertEqual(backend_module._fetch_race_dates(client, "2026-04-03", page_size=3), ["2026-04-03", "2026-04-02"])
+        self.assertEqual(client.reads, [("hranalyzer_race_dates", (0, 2))])
+
+    def test_race_dates_fall_back_to_race_rows_without_the_view(self):
+        race_rows = [{"race_date": "2026-04-03"}] * 2 + [{"race_date": "2026-04-02"}]
+        client = PagedDateClient({"hranalyzer_races": race_rows}, missing_tables={"hranalyzer_race_dates"})
+
+        self.assertEqual(backend_module._fetch_race_dates(client, "2026-04-03", page_size=2), ["2026-04-03", "2026-04-02"])
+        self.assertEqual([table for table, _window in client.reads].count("hranalyzer_races"), 2)
+
     def test_upload_drf_queues_background_parse(self):
         fake_supabase = FakeSupabaseClient()
 
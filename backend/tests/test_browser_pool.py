@@ -0,0 +1,85 @@
+import os
+import sys
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import browser_pool
+import crawl_scratches
+
+
+class FakeBrowsers:
+    def __init__(self):
+        self.launched = []
+        self.closed = []
+
+    def launch(self):
+        browser = {"id": len(self.launched), "thread": threading.get_ident()}
+        self.launched.append(browser)
+        return browser
+
+    def close(self, browser):
+        self.closed.append(browser["id"])
+
+
+class BrowserPoolTests(unittest.TestCase):
+    def setUp(self):
+        self.browsers = FakeBrowsers()
+
+    def _pool(self, **options):
+        pool = browser_pool.BrowserPool(
+            "test", launch=self.browsers.launch, close=self.browsers.close, **options
+        )
+        self.addCleanup(pool.shutdown)
+        return pool
+
+    def test_warm_browser_is_reused_on_its_own_thread(self):
+        pool = self._pool(max_uses=10)
+        seen = [pool.run(lambda browser: (browser["id"], threading.get_ident()), timeout=5) for _ in range(3)]
+
+        self.assertEqual(len(self.browsers.launched), 1)
+        self.assertEqual({browser_id for browser_id, _ in seen}, {0})
+        self.assertEqual({thread for _, thread in seen}, {self.browsers.launched[0]["thread"]})
+        self.assertNotEqual(seen[0][1], threading.get_ident())
+
+    def test_browser_is_recycled_after_max_uses_and_on_errors(self):
+        pool = self._pool(max_uses=2)
+        ids = [pool.run(lambda browser: browser["id"], timeout=5) for _ in range(3)]
+        self.assertEqual(ids, [0, 0, 1])
+
+        def explode(_browser):
+            raise RuntimeError("page crashed")
+
+        with self.assertRaises(RuntimeError):
+            pool.run(explode, timeout=5)
+        self.assertEqual(pool.run(lambda browser: browser["id"], timeout=5), 2)
+        self.assertEqual(self.browsers.closed, [0, 1])
+        self.assertEqual(pool.metrics()["launches"], 3)
+
+    def test_headroom_gate_blocks_launch(self):
+        pool = self._pool(admit=lambda: False)
+        with self.assertRaises(browser_pool.BrowserUnavailable):
+            pool.run(lambda browser: browser, timeout=5)
+        self.assertEqual(self.browsers.launched, [])
+
+
+class ScratchBrowserFallbackTests(unittest.TestCase):
+    def test_selenium_fetch_borrows_shared_session_instead_of_launching(self):
+        driver = MagicMock()
+        driver.page_source = "<html><body>" + ("late changes " * 60) + "</body></html>"
+        shared = MagicMock(return_value=driver)
+        # Patch the module crawl_scratches actually imported from (other tests may reload crawl_equibase).
+        equibase_globals = crawl_scratches.lease_shared_equibase_webdriver.__wrapped__.__globals__
+        with patch.dict(equibase_globals, {"get_shared_equibase_webdriver": shared}), \
+                patch.object(crawl_scratches, "warm_equibase_browser_session", return_value=True):
+            html = crawl_scratches.fetch_page_via_selenium("https://example.test/latechanges")
+
+        self.assertEqual(html, driver.page_source)
+        shared.assert_called_once()
+        driver.quit.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
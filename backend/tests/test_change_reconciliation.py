@@ -0,0 +1,232 @@
+import os
+import sys
+import unittest
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import patch
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import crawl_scratches
+from crawl_scratches import ChangeReconciler, merge_change_description
+
+
+class RecordingQuery:
+    def __init__(self, owner, table):
+        self.owner = owner
+        self.table = table
+        self.filters = []
+        self.write = None
+        self.window = None
+
+    def select(self, *_args, **_kwargs):
+        return self
+
+    def order(self, *_args, **_kwargs):
+        return self
+
+    def in_(self, field, values):
+        self.filters.append((field, set(values)))
+        return self
+
+    def range(self, start, end):
+        self.window = (start, end)
+        return self
+
+    def insert(self, payload):
+        self.write = ("insert", payload)
+        return self
+
+    def upsert(self, payload):
+        self.write = ("upsert", payload)
+        return self
+
+    def update(self, payload):
+        self.write = ("update", payload)
+        return self
+
+    def execute(self):
+        if self.write is not None:
+            self.owner.writes.append((self.table, self.write[0], self.write[1], self.filters))
+            return SimpleNamespace(data=[])
+
+        self.owner.reads.append(self.table)
+        rows = [
+            row for row in self.owner.tables.get(self.table, [])
+            if all(row.get(field) in values for field, values in self.filters)
+        ]
+        if self.window is not None:
+            rows = rows[self.window[0]:self.window[1] + 1]
+        return SimpleNamespace(data=rows)
+
+
+class RecordingSupabase:
+    def __init__(self, tables):
+        self.tables = tables
+        self.reads = []
+        self.writes = []
+
+    def table(self, name):
+        return RecordingQuery(self, name)
+
+
+class _FailingWrites(list):
+    """Write log that raises for one (table, kind) pair, standing in for a failed statement."""
+
+    def __init__(self, failing_write):
+        super().__init__()
+        self.failing_write = failing_write
+
+    def append(self, item):
+        if item[:2] == self.failing_write:
+            raise RuntimeError("statement timeout")
+        super().append(item)
+
+
+def _change(race_number, change_type, description, program_number=None, horse_name=None):
+    return {
+        "race_number": race_number,
+        "change_type": change_type,
+        "description": description,
+        "program_number": program_number,
+        "horse_name": horse_name,
+    }
+
+
+class ChangeReconcilerTests(unittest.TestCase):
+    def setUp(self):
+        self.supabase = RecordingSupabase(
+            {
+                "hranalyzer_races": [
+                    {"id": "race-1", "race_key": "GP-20260403-1", "race_status": "upcoming"},
+                    {"id": "race-2", "race_key": "GP-20260403-2", "race_status": "completed"},
+                ],
+                "hranalyzer_race_entries": [
+                    {"id": "e-1", "race_id": "race-1", "program_number": "1", "scratched": False,
+                     "finish_position": None, "hranalyzer_horses": {"horse_name": "Alpha"}},
+                    {"id": "e-2", "race_id": "race-1", "program_number": "2", "scratched": False,
+                     "finish_position": None, "hranalyzer_horses": {"horse_name": "Bravo Star"}},
+                    {"id": "e-3", "race_id": "race-2", "program_number": "1", "scratched": False,
+                     "finish_position": 1, "hranalyzer_horses": {"horse_name": "Charlie"}},
+                ],
+                "hranalyzer_changes": [
+                    {"id": "c-1", "race_id": "race-1", "entry_id": "e-1", "change_type": "Scratch",
+                     "description": "Reason Unavailable"},
+                ],
+            }
+        )
+
+    def _reconcile(self, changes):
+        reconciler = ChangeReconciler(self.supabase, "GP", date(2026, 4, 3))
+        reconciler.preload(changes)
+        for item in changes:
+            reconciler.apply(item)
+        count, failed_steps = reconciler.commit()
+        self.failed_steps = failed_steps
+        return reconciler, count
+
+    def test_preloads_once_and_commits_in_bulk(self):
+        changes = [
+            _change(1, "Scratch", "Veterinarian", program_number="1"),
+            _change(1, "Scratch", "Trainer", horse_name="bravostar"),
+            _change(1, "Jockey Change", "Now J. Smith", program_number="2"),
+            _change(2, "Race Cancelled", "Race Cancelled"),
+        ]
+
+        reconciler, count = self._reconcile(changes)
+
+        self.assertEqual(self.supabase.reads, ["hranalyzer_races", "hranalyzer_race_entries", "hranalyzer_changes"])
+        writes = {(table, kind): (payload, filters) for table, kind, payload, filters in self.supabase.writes}
+
+        inserted, _ = writes[("hranalyzer_changes", "insert")]
+        self.assertEqual(
+            sorted((row["entry_id"] or "", row["change_type"]) for row in inserted),
+            [("", "Race Cancelled"), ("e-2", "Jockey Change"), ("e-2", "Scratch")],
+        )
+        upserted, _ = writes[("hranalyzer_changes", "upsert")]
+        self.assertEqual(upserted, [{
+            "id": "c-1", "race_id": "race-1", "entry_id": "e-1",
+            "change_type": "Scratch", "description": "Veterinarian",
+        }])
+
+        scratch_payload, scratch_filters = writes[("hranalyzer_race_entries", "update")]
+        self.assertEqual(scratch_payload, {"scratched": True})
+        self.assertEqual(scratch_filters, [("id", {"e-1", "e-2"})])
+
+        # Race 2 already has results, so it is only flagged, never moved to cancelled.
+        race_payload, race_filters = writes[("hranalyzer_races", "update")]
+        self.assertNotIn("race_status", race_payload)
+        self.assertTrue(race_payload["is_cancelled"])
+        self.assertEqual(race_filters, [("id", {"race-2"})])
+
+        self.assertEqual(count, 4)
+        self.assertEqual(reconciler.scratches_marked, 2)
+
+    def test_duplicates_within_a_batch_merge_into_one_insert(self):
+        changes = [
+            _change(1, "Jockey Change", "Reason Unavailable", program_number="2"),
+            _change(1, "Jockey Change", "Now J. Smith", program_number="2"),
+            _change(1, "Equipment Change", "Blinkers On", program_number="9"),
+        ]
+
+        _, count = self._reconcile(changes)
+
+        inserts = [payload for table, kind, payload, _ in self.supabase.writes if kind == "insert"]
+        self.assertEqual(len(inserts), 1)
+        self.assertEqual(inserts[0], [{
+            "race_id": "race-1", "entry_id": "e-2",
+            "change_type": "Jockey Change", "description": "Now J. Smith",
+        }])
+        self.assertEqual(count, 1)
+
+    def test_failed_step_does_not_drop_later_steps_or_count_unwritten_rows(self):
+        changes = [
+            _change(1, "Scratch", "Veterinarian", program_number="1"),
+            _change(2, "Race Cancelled", "Race Cancelled"),
+        ]
+        self.supabase.writes = _FailingWrites(("hranalyzer_changes", "upsert"))
+        _, count = self._reconcile(changes)
+
+        written = {(table, kind) for table, kind, _payload, _filters in self.supabase.writes}
+        self.assertIn(("hranalyzer_race_entries", "update"), written)
+        self.assertIn(("hranalyzer_races", "update"), written)
+        self.assertEqual(self.failed_steps, {"inserts": False, "updates": True, "scratches": False, "races": False})
+        # Only the race-wide cancellation insert reached the database.
+        self.assertEqual(count, 1)
+
+    def test_changes_waiting_for_their_card_are_reported_so_the_feed_is_retried(self):
+        self.supabase.tables["hranalyzer_races"].append({"id": "race-3", "race_key": "GP-20260403-3", "race_status": "upcoming"})
+        with patch.object(crawl_scratches, "get_supabase_client", return_value=self.supabase):
+            # Race 9 is not stored yet, and race 3 has no entries yet.
+            _count, unknown_card_ok = crawl_scratches.reconcile_changes(
+                "GP", date(2026, 4, 3), [_change(9, "Race Cancelled", "Race Cancelled")]
+            )
+            _count, no_entries_ok = crawl_scratches.reconcile_changes(
+                "GP", date(2026, 4, 3), [_change(3, "Scratch", "Vet", program_number="4")]
+            )
+
+        self.assertFalse(unknown_card_ok)
+        self.assertFalse(no_entries_ok)
+
+    def test_orphans_against_a_loaded_card_do_not_hold_the_feed(self):
+        changes = [
+            _change(1, "Scratch", "Veterinarian", program_number="1"),
+            _change(1, "Scratch", "Trainer", program_number="9"),
+            _change(7, "Race Cancelled", "Race Cancelled"),
+        ]
+        with patch.object(crawl_scratches, "get_supabase_client", return_value=self.supabase):
+            count, ok = crawl_scratches.reconcile_changes("GP", date(2026, 4, 3), changes)
+
+        self.assertTrue(ok)
+        self.assertEqual(count, 1)
+        self.assertIn(("hranalyzer_race_entries", "update"), {(table, kind) for table, kind, _p, _f in self.supabase.writes})
+
+    def test_merge_rules(self):
+        self.assertEqual(merge_change_description("Reason Unavailable", "Vet"), "Vet")
+        self.assertIsNone(merge_change_description("Vet", "Reason Unavailable"))
+        self.assertIsNone(merge_change_description("Vet", "Vet"))
+        self.assertEqual(merge_change_description("Vet", "Sick"), "Vet; Sick")
+
+
+if __name__ == "__main__":
+    unittest.main()
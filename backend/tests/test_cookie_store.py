@@ -0,0 +1,62 @@
+import json
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import cookie_store
+
+WWW_URL = "https://www.equibase.com/static/chart/pdf/GP011826USA.pdf"
+TVG_URL = "https://tvg.equibase.com/static/entry/GP011826USA-EQB.html"
+
+
+class CookieStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp_dir.name) / "cookie_store.json"
+        patcher = patch.object(cookie_store, "COOKIE_STORE_FILE", self.path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.temp_dir.cleanup)
+
+    def test_jar_is_shared_across_subdomains_of_a_site(self):
+        cookie_store.store_cookies(WWW_URL, {"visid_incap": "abc", "incap_ses": "xyz"})
+
+        self.assertEqual(cookie_store.load_cookies(TVG_URL), {"visid_incap": "abc", "incap_ses": "xyz"})
+        self.assertIsNone(cookie_store.load_cookies("https://www1.drf.com/Entries/RacingDates.do"))
+
+    def test_expired_jar_is_not_replayed(self):
+        cookie_store.store_cookies(WWW_URL, {"visid_incap": "abc"}, fetched_at=time.time() - 120)
+
+        self.assertIsNone(cookie_store.load_cookies(WWW_URL, ttl_seconds=60))
+        self.assertEqual(cookie_store.load_cookies(WWW_URL, ttl_seconds=600), {"visid_incap": "abc"})
+
+    def test_writes_from_another_process_are_picked_up(self):
+        cookie_store.store_cookies(WWW_URL, {"visid_incap": "old"})
+        self.assertEqual(cookie_store.load_cookies(WWW_URL), {"visid_incap": "old"})
+
+        # Simulate a second crawler process rewriting the shared file.
+        payload = {"equibase.com": {"cookies": {"visid_incap": "new"}, "fetched_at": time.time()}}
+        self.path.write_text(json.dumps(payload))
+        future = time.time() + 5
+        os.utime(self.path, (future, future))
+
+        self.assertEqual(cookie_store.load_cookies(WWW_URL), {"visid_incap": "new"})
+
+    def test_clear_cookies_drops_one_site(self):
+        cookie_store.store_cookies(WWW_URL, {"a": "1"})
+        cookie_store.store_cookies("https://www.example.com/", {"b": "2"})
+
+        cookie_store.clear_cookies(TVG_URL)
+
+        self.assertIsNone(cookie_store.load_cookies(WWW_URL))
+        self.assertEqual(cookie_store.load_cookies("https://example.com"), {"b": "2"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,12 +1,17 @@
+import json
 import os
 import sys
+import tempfile
+import time
 import types
 import unittest
 from datetime import date
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
+_real_supabase_client = sys.modules.get("supabase_client")
 supabase_client_stub = types.ModuleType("supabase_client")
 supabase_client_stub.get_supabase_client = MagicMock()
 sys.modules["supabase_client"] = supabase_client_stub
@@ -16,12 +21,24 @@ crawl_equibase_stub.get_or_create_track = MagicMock()
 crawl_equibase_stub.get_or_create_participant = MagicMock()
 crawl_equibase_stub.normalize_pgm = lambda value: value
 crawl_equibase_stub.COMMON_TRACKS = []
+crawl_equibase_stub.ENABLE_POWERSHELL_FALLBACK = True
+crawl_equibase_stub.POWERSHELL_MIN_HEADROOM_BYTES = 0
+crawl_equibase_stub.has_heavy_fallback_headroom = MagicMock(return_value=True)
+crawl_equibase_stub.heavy_fallback_available = MagicMock(return_value=True)
+crawl_equibase_stub.record_heavy_fallback_success = MagicMock()
+crawl_equibase_stub.record_heavy_fallback_failure = MagicMock()
+crawl_equibase_stub.run_bounded_subprocess = MagicMock()
 sys.modules["crawl_equibase"] = crawl_equibase_stub
 
 import crawl_entries
 
 # Allow other test modules to import the real crawl_equibase module later.
 sys.modules.pop("crawl_equibase", None)
+# Restore the real supabase_client for modules that need its query helpers.
+if _real_supabase_client is not None:
+    sys.modules["supabase_client"] = _real_supabase_client
+else:
+    sys.modules.pop("supabase_client", None)
 
 
 class TestCrawlEntries(unittest.TestCase):
@@ -90,7 +107,8 @@ class TestCrawlEntries(unittest.TestCase):
         """
         response = types.SimpleNamespace(status_code=200, text=html)
 
-        with patch.object(crawl_entries.requests, "get", return_value=response):
+        client = types.SimpleNamespace(get=MagicMock(return_value=response))
+        with patch.object(crawl_entries, "get_http_client", return_value=client):
             races = crawl_entries.fetch_hrn_entries("TUP", date.fromisoformat("2026-04-02"))
 
         self.assertEqual(len(races), 1)
@@ -127,7 +145,8 @@ class TestCrawlEntries(unittest.TestCase):
         """
         response = types.SimpleNamespace(status_code=200, text=html)
 
-        with patch.object(crawl_entries.requests, "get", return_value=response):
+        client = types.SimpleNamespace(get=MagicMock(return_value=response))
+        with patch.object(crawl_entries, "get_http_client", return_value=client):
             races = crawl_entries.fetch_hrn_entries("GP", date.fromisoformat("2026-04-02"))
 
         self.assertEqual(len(races), 1)
@@ -172,6 +191,343 @@ class TestCrawlEntries(unittest.TestCase):
         self.assertEqual(stats["tracks_skipped_no_card"], 1)
         self.assertEqual(stats["races_found"], 0)
 
+    def test_crawl_entries_for_dates_fans_out_with_one_schedule_and_session(self):
+        supabase = MagicMock()
+        days = [date.fromisoformat("2026-04-03"), date.fromisoformat("2026-04-04")]
+        sessions = set()
+
+        def fake_card(track_code, race_date, session=None, limiter=None):
+            sessions.add(id(session))
+            self.assertIsNotNone(limiter)
+            if track_code == "GP":
+                return {"status": "success", "races": [{"race_number": 1}, {"race_number": 2}], "source": "hrn_entries"}
+            return {"status": "empty", "races": [], "source": None}
+
+        with patch.object(crawl_entries, "get_supabase_client", return_value=supabase), \
+             patch.object(crawl_entries, "fetch_drf_racing_dates", return_value={}) as drf_mock, \
+             patch.object(crawl_entries, "fetch_entry_card", side_effect=fake_card) as card_mock, \
+             patch.object(crawl_entries, "insert_upcoming_race", return_value=True) as insert_mock:
+            stats = crawl_entries.crawl_entries_for_dates({day: ["GP", "SA"] for day in days})
+
+        drf_mock.assert_called_once()
+        self.assertEqual(card_mock.call_count, 4)
+        self.assertEqual(len(sessions), 1)
+        self.assertEqual(insert_mock.call_count, 4)
+        for day in days:
+            self.assertEqual(stats[day]["races_found"], 2)
+            self.assertEqual(stats[day]["races_inserted"], 2)
+
+    def test_host_rate_limiter_spaces_request_starts_per_host(self):
+        limiter = crawl_entries.HostRateLimiter(concurrency=2, min_interval=5.0)
+        sleeps = []
+
+        with patch.object(crawl_entries.time, "sleep", side_effect=sleeps.append), \
+             patch.object(crawl_entries.time, "monotonic", return_value=100.0):
+            for url in ("https://tvg.equibase.com/a", "https://tvg.equibase.com/b", "https://entries.horseracingnation.com/c"):
+                with limiter.slot(url):
+                    pass
+
+        # Second tvg request waits out the interval; the HRN host has its own budget.
+        self.assertEqual(sleeps, [5.0])
+
+    def test_insert_upcoming_race_skips_writes_for_unchanged_card(self):
+        race = {
+            "race_number": 3,
+            "post_time": "1:30 PM",
+            "source": "hrn_entries",
+            "entries": [
+                {"program_number": "1", "horse_name": "Alpha", "jockey": "J One", "morning_line_odds": "5/2"},
+                {"program_number": "2", "horse_name": "Bravo", "jockey": "J Two", "morning_line_odds": "3/1"},
+            ],
+        }
+        fingerprint = crawl_entries.card_fingerprint(race)
+        supabase = _FakeSupabase({"id": "race-1", "race_status": "upcoming", "card_fingerprint": fingerprint})
+        stats = {}
+
+        ok = crawl_entries.insert_upcoming_race(supabase, "GP", date.fromisoformat("2026-04-03"), race, stats=stats)
+
+        self.assertTrue(ok)
+        self.assertEqual(supabase.writes, [])
+        self.assertEqual(stats["races_unchanged"], 1)
+
+    def test_insert_upcoming_race_writes_only_changed_entries(self):
+        race = {
+            "race_number": 3,
+            "post_time": "1:30 PM",
+            "source": "hrn_entries",
+            "entries": [
+                {"program_number": "1", "horse_name": "Alpha", "jockey": "J One", "morning_line_odds": "5/2"},
+                {"program_number": "2", "horse_name": "Bravo", "jockey": "J Two", "morning_line_odds": "3/1"},
+            ],
+        }
+        stored = crawl_entries.card_fingerprint(race)
+        race["entries"][1] = dict(race["entries"][1], scratched=True)
+        supabase = _FakeSupabase({"id": "race-1", "race_status": "upcoming", "card_fingerprint": stored})
+        stats = {}
+
+        with patch.object(crawl_entries, "get_or_create_track", return_value="track-1"), \
+             patch.object(crawl_entries, "get_or_create_participant", return_value="person-1"):
+            ok = crawl_entries.insert_upcoming_race(supabase, "GP", date.fromisoformat("2026-04-03"), race, stats=stats)
+
+        self.assertTrue(ok)
+        upserts = [payload for table, op, payload in supabase.writes if op == "upsert"]
+        self.assertEqual([payload["program_number"] for payload in upserts], ["2"])
+        race_updates = [payload for table, op, payload in supabase.writes if table == "hranalyzer_races"]
+        # Race fields are unchanged, so only the new fingerprint is written back.
+        self.assertEqual(race_updates, [{"card_fingerprint": crawl_entries.card_fingerprint(race)}])
+        self.assertEqual(stats["entries_written"], 1)
+
+    def test_fetch_static_page_keeps_blocked_pages_off_the_heavy_path_until_last(self):
+        blocked = {"status": "blocked", "content": "incapsula", "size": 9}
+        calls = []
+
+        def fetcher(name, result):
+            def fetch(url):
+                calls.append(name)
+                return result
+            return fetch
+
+        with patch.object(crawl_entries, "fetch_static_page_via_cookie_replay", return_value=None), \
+             patch.object(crawl_entries, "record_fetch"), \
+             patch.object(crawl_entries, "order_fetchers", side_effect=lambda url, chain: chain), \
+             patch.object(crawl_entries, "STATIC_PAGE_FETCHERS", (("curl_cffi", fetcher("curl_cffi", blocked)), ("cloudscraper", fetcher("cloudscraper", None)))), \
+             patch.object(crawl_entries, "HEAVY_STATIC_PAGE_FETCHERS", (("powershell", fetcher("powershell", {"status": "success", "content": "<html/>", "size": 9000})),)):
+            result = crawl_entries.fetch_static_page("https://tvg.equibase.com/static/entry/GP040326USA-EQB.html", retries=1)
+
+        self.assertEqual(calls, ["curl_cffi", "cloudscraper", "powershell"])
+        self.assertEqual(result["status"], "success")
+
+    def test_fetch_static_page_does_not_score_gate_refusals(self):
+        success = {"status": "success", "content": "<html/>", "size": 9000}
+
+        with patch.object(crawl_entries, "fetch_static_page_via_cookie_replay", return_value=None), \
+             patch.object(crawl_entries, "record_fetch") as record_mock, \
+             patch.object(crawl_entries, "order_fetchers", side_effect=lambda url, chain: chain), \
+             patch.object(crawl_entries, "STATIC_PAGE_FETCHERS", (("curl_cffi", lambda url: crawl_entries.skip_fetch()),)), \
+             patch.object(crawl_entries, "HEAVY_STATIC_PAGE_FETCHERS", (("powershell", lambda url: success),)):
+            result = crawl_entries.fetch_static_page("https://tvg.equibase.com/static/entry/GP040326USA-EQB.html", retries=1)
+
+        self.assertEqual(result, success)
+        self.assertEqual([call.args[1] for call in record_mock.call_args_list], ["powershell"])
+
+    def test_cookie_replay_drops_a_jar_that_comes_back_blocked(self):
+        url = "https://tvg.equibase.com/static/entry/GP040326USA-EQB.html"
+        session = MagicMock()
+        session.get.return_value = MagicMock(status_code=200, text="Request unsuccessful. Incapsula")
+
+        with patch.object(crawl_entries, "load_cookies", return_value={"visid_incap": "stale"}), \
+             patch.object(crawl_entries, "get_requests_session", return_value=session), \
+             patch.object(crawl_entries, "clear_cookies") as clear_mock:
+            self.assertIsNone(crawl_entries.fetch_static_page_via_cookie_replay(url))
+
+        clear_mock.assert_called_once_with(url)
+
+    def test_classify_fetched_page_keeps_static_page_semantics(self):
+        self.assertEqual(crawl_entries._classify_fetched_page(200, "x" * 6000)["status"], "success")
+        self.assertEqual(crawl_entries._classify_fetched_page(200, "Request unsuccessful. Incapsula")["status"], "blocked")
+        self.assertEqual(crawl_entries._classify_fetched_page(200, "<title>404 - File or directory not found")["status"], "no_card")
+        self.assertEqual(crawl_entries._classify_fetched_page(404, "")["status"], "no_card")
+        self.assertIsNone(crawl_entries._classify_fetched_page(503, "x" * 6000))
+
+    def test_powershell_fetch_reads_stdout_without_temp_files(self):
+        completed = types.SimpleNamespace(returncode=0, stdout="y" * 7000, stderr="")
+
+        with patch.object(crawl_entries.shutil, "which", return_value="/usr/bin/pwsh"), \
+             patch.object(crawl_entries, "has_heavy_fallback_headroom", return_value=True), \
+             patch.object(crawl_entries, "run_bounded_subprocess", return_value=completed) as run_mock, \
+             patch.object(crawl_entries, "record_heavy_fallback_success") as success_mock:
+            result = crawl_entries.fetch_static_page_via_powershell("https://tvg.equibase.com/static/entry/x.html")
+
+        self.assertEqual(result["status"], "success")
+        self.assertNotIn("-OutFile", run_mock.call_args.args[0][-1])
+        success_mock.assert_called_once_with("powershell")
+
+    def test_powershell_failures_feed_the_circuit_breaker(self):
+        failed = types.SimpleNamespace(returncode=1, stdout="", stderr="boom")
+        blocked = types.SimpleNamespace(returncode=0, stdout="Request unsuccessful. Incapsula", stderr="")
+
+        with patch.object(crawl_entries.shutil, "which", return_value="/usr/bin/pwsh"), \
+             patch.object(crawl_entries, "has_heavy_fallback_headroom", return_value=True), \
+             patch.object(crawl_entries, "run_bounded_subprocess", side_effect=[failed, blocked]), \
+             patch.object(crawl_entries, "record_heavy_fallback_failure") as failure_mock:
+            self.assertIsNone(crawl_entries.fetch_static_page_via_powershell("https://tvg.equibase.com/x.html"))
+            self.assertEqual(crawl_entries.fetch_static_page_via_powershell("https://tvg.equibase.com/x.html")["status"], "blocked")
+
+        self.assertEqual(failure_mock.call_count, 2)
+
+    def test_powershell_fetch_respects_headroom_gate(self):
+        with patch.object(crawl_entries.shutil, "which", return_value="/usr/bin/pwsh"), \
+             patch.object(crawl_entries, "has_heavy_fallback_headroom", return_value=False), \
+             patch.object(crawl_entries, "run_bounded_subprocess") as run_mock:
+            self.assertIsNone(crawl_entries.fetch_static_page_via_powershell("https://tvg.equibase.com/x.html"))
+
+        run_mock.assert_not_called()
+
+
+    def test_parse_entries_html_matches_synthetic_equibase_fixture(self):
+        races = crawl_entries.parse_entries_html(_read_fixture("equibase_entries_gp.html"), "GP", date(2026, 4, 3))
+
+        self.assertEqual(races, _expected_fixture_output()["equibase"])
+
+    def test_parse_hrn_entries_html_matches_synthetic_hrn_fixture(self):
+        races = crawl_entries.parse_hrn_entries_html(_read_fixture("hrn_entries_gp.html"))
+
+        self.assertEqual(races, _expected_fixture_output()["hrn"])
+
+    @unittest.skipUnless(crawl_entries.HTML_PARSER == "lxml", "lxml not installed")
+    def test_lxml_and_html_parser_backends_agree_on_fixtures(self):
+        equibase_html = _read_fixture("equibase_entries_gp.html")
+        hrn_html = _read_fixture("hrn_entries_gp.html")
+        with_lxml = (
+            crawl_entries.parse_entries_html(equibase_html, "GP", date(2026, 4, 3)),
+            crawl_entries.parse_hrn_entries_html(hrn_html),
+        )
+        with patch.object(crawl_entries, "HTML_PARSER", "html.parser"):
+            with_html_parser = (
+                crawl_entries.parse_entries_html(equibase_html, "GP", date(2026, 4, 3)),
+                crawl_entries.parse_hrn_entries_html(hrn_html),
+            )
+
+        self.assertEqual(with_lxml, with_html_parser)
+
+
+    def test_drf_schedule_cache_persists_to_disk_and_serves_fresh_schedule(self):
+        with _DrfCacheSandbox() as cache_file, \
+             patch.object(crawl_entries, "get_http_client", return_value=_drf_client(DRF_PAGE)) as client_mock:
+            first = crawl_entries.fetch_drf_racing_dates()
+            # A new process starts with an empty memory cache and should reuse the file.
+            crawl_entries._drf_schedule_cache = None
+            second = crawl_entries.fetch_drf_racing_dates()
+
+            self.assertTrue(cache_file.exists())
+
+        self.assertEqual(client_mock.call_count, 1)
+        self.assertEqual(first, second)
+        self.assertEqual(second["MVR"], [(date(2026, 3, 1), date(2026, 4, 30))])
+
+    def test_drf_schedule_failure_is_negatively_cached_and_keeps_last_good_schedule(self):
+        with _DrfCacheSandbox():
+            with patch.object(crawl_entries, "get_http_client", return_value=_drf_client(DRF_PAGE)):
+                good = crawl_entries.fetch_drf_racing_dates()
+
+            later = time.time() + crawl_entries.DRF_SCHEDULE_TTL_SECONDS + 1
+            failing = _drf_client(None)
+            with patch.object(crawl_entries.time, "time", return_value=later), \
+                 patch.object(crawl_entries, "get_http_client", return_value=failing):
+                # Stale: served immediately while a single background refresh runs (and fails).
+                self.assertEqual(crawl_entries.fetch_drf_racing_dates(), good)
+                _wait_for_drf_refresh()
+                self.assertEqual(crawl_entries.fetch_drf_racing_dates(), good)
+                self.assertEqual(crawl_entries.fetch_drf_racing_dates(), good)
+
+        self.assertEqual(failing.get.call_count, 1)
+
+    def test_drf_schedule_past_max_stale_age_is_dropped_so_checks_are_unknown(self):
+        with _DrfCacheSandbox():
+            with patch.object(crawl_entries, "get_http_client", return_value=_drf_client(DRF_PAGE)):
+                crawl_entries.fetch_drf_racing_dates()
+
+            much_later = time.time() + crawl_entries.DRF_SCHEDULE_MAX_STALE_SECONDS + 1
+            with patch.object(crawl_entries.time, "time", return_value=much_later), \
+                 patch.object(crawl_entries, "get_http_client", return_value=_drf_client(None)):
+                self.assertEqual(crawl_entries.fetch_drf_racing_dates(), {})
+                self.assertIsNone(crawl_entries.track_has_card_via_drf("MVR", date(2026, 6, 1)))
+                _wait_for_drf_refresh()
+                crawl_entries._drf_schedule_cache = None
+                self.assertEqual(crawl_entries.fetch_drf_racing_dates(), {})
+
+
+DRF_PAGE = "<table><tr><td>Mountaineer</td><td>MVR</td><td>03/01/2026 - 04/30/2026</td></tr></table>"
+
+
+def _drf_client(text):
+    client = MagicMock()
+    if text is None:
+        client.get.side_effect = RuntimeError("DRF down")
+    else:
+        client.get.return_value = types.SimpleNamespace(text=text, raise_for_status=lambda: None)
+    return client
+
+
+class _DrfCacheSandbox:
+    def __enter__(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        cache_file = Path(self._tmp.name) / "drf_racing_dates.json"
+        self._patch = patch.object(crawl_entries, "DRF_SCHEDULE_CACHE_FILE", cache_file)
+        self._patch.start()
+        crawl_entries._drf_schedule_cache = None
+        return cache_file
+
+    def __exit__(self, *exc):
+        _wait_for_drf_refresh()
+        crawl_entries._drf_schedule_cache = None
+        self._patch.stop()
+        self._tmp.cleanup()
+        return False
+
+
+def _wait_for_drf_refresh(timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while crawl_entries._drf_refresh_in_flight and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+# The entries pages under fixtures/ are generated, not saved from the live sites: they copy the
+# Equibase Race<N> and HRN table markup the parsers read and pad it with placeholder scripts and
+# nav links. entries_gp_expected.json is the previous parser's output on them. Replace them with
+# saved pages when real ones are captured.
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def _read_fixture(name):
+    with open(os.path.join(FIXTURES_DIR, name), "r", encoding="utf-8") as fh:
+        return fh.read()
+
+
+def _expected_fixture_output():
+    return json.loads(_read_fixture("entries_gp_expected.json"))
+
+class _FakeQuery:
+    def __init__(self, db, table):
+        self.db = db
+        self.table = table
+        self.op = "select"
+        self.payload = None
+
+    def select(self, *_args):
+        return self
+
+    def eq(self, *_args):
+        return self
+
+    def insert(self, payload):
+        self.op, self.payload = "insert", payload
+        return self
+
+    def update(self, payload):
+        self.op, self.payload = "update", payload
+        return self
+
+    def upsert(self, payload, **_kwargs):
+        self.op, self.payload = "upsert", payload
+        return self
+
+    def execute(self):
+        if self.op != "select":
+            self.db.writes.append((self.table, self.op, self.payload))
+            return types.SimpleNamespace(data=[{"id": f"{self.table}-new"}])
+        if self.table == "hranalyzer_races":
+            return types.SimpleNamespace(data=[self.db.race_row])
+        return types.SimpleNamespace(data=[{"id": f"{self.table}-existing"}])
+
+
+class _FakeSupabase:
+    def __init__(self, race_row):
+        self.race_row = race_row
+        self.writes = []
+
+    def table(self, name):
+        return _FakeQuery(self, name)
+
 
 if __name__ == "__main__":
     unittest.main()
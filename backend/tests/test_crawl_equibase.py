@@ -1,8 +1,10 @@
 import os
 import sys
+import tempfile
 import types
 import time
 import unittest
+from pathlib import Path
 from textwrap import dedent
 from unittest.mock import MagicMock, patch
 
@@ -30,7 +32,9 @@ curl_cffi_stub = types.ModuleType("curl_cffi")
 curl_cffi_stub.requests = curl_requests_stub
 sys.modules.setdefault("curl_cffi", curl_cffi_stub)
 
+import cookie_store
 import crawl_equibase
+import fetcher_stats
 
 
 class TestCrawlEquibase(unittest.TestCase):
@@ -41,6 +45,12 @@ class TestCrawlEquibase(unittest.TestCase):
             state['failures'] = 0
             state['cooldown_until'] = 0.0
         crawl_equibase.close_shared_equibase_webdriver()
+        fetcher_stats.reset_fetcher_stats()
+        cookie_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cookie_dir.cleanup)
+        cookie_patch = patch.object(cookie_store, "COOKIE_STORE_FILE", Path(cookie_dir.name) / "cookies.json")
+        cookie_patch.start()
+        self.addCleanup(cookie_patch.stop)
 
     def test_build_race_map_indexes_valid_races_only(self):
         race_map = crawl_equibase.build_race_map([
@@ -140,6 +150,25 @@ class TestCrawlEquibase(unittest.TestCase):
         self.assertEqual(content, b"%PDF from cookie replay")
         self.assertEqual(requests_get.call_args.kwargs["cookies"], {"visid": "abc"})
 
+    def test_browser_cookies_persisted_by_another_process_skip_the_browser(self):
+        cookie_store.store_cookies("https://www.equibase.com/", {"visid_incap": "shared"})
+
+        with patch.object(crawl_equibase, "get_shared_equibase_webdriver") as shared_driver:
+            cookies = crawl_equibase.get_equibase_browser_cookies("https://www.equibase.com/static/chart/pdf/x.pdf")
+
+        self.assertEqual(cookies, {"visid_incap": "shared"})
+        shared_driver.assert_not_called()
+
+    def test_lightweight_pdf_download_replays_stored_cookies(self):
+        cookie_store.store_cookies("https://www.equibase.com/", {"visid_incap": "shared"})
+        response = types.SimpleNamespace(status_code=200, content=b"%PDF ok", headers={})
+
+        with patch.object(crawl_equibase.requests, "get", return_value=response) as requests_get:
+            content = crawl_equibase.download_pdf_via_requests("https://tvg.equibase.com/static/chart/pdf/x.pdf")
+
+        self.assertEqual(content, b"%PDF ok")
+        self.assertEqual(requests_get.call_args.kwargs["cookies"], {"visid_incap": "shared"})
+
     def test_download_pdf_via_selenium_prefers_browser_context(self):
         fake_driver = MagicMock()
         fake_driver.get_cookies.return_value = []
@@ -187,6 +216,23 @@ class TestCrawlEquibase(unittest.TestCase):
         self.assertIsNone(content)
         cookie_replay.assert_not_called()
 
+    def test_idle_shared_browser_is_closed_but_a_recently_leased_one_is_kept(self):
+        fake_driver = MagicMock()
+
+        with patch.object(crawl_equibase, "has_heavy_fallback_headroom", return_value=True), \
+             patch.object(crawl_equibase, "create_equibase_webdriver", return_value=fake_driver):
+            with crawl_equibase.lease_shared_equibase_webdriver(timeout=5) as driver:
+                self.assertIs(driver, fake_driver)
+
+        self.assertFalse(crawl_equibase.close_idle_shared_equibase_webdriver(idle_seconds=60))
+        fake_driver.quit.assert_not_called()
+
+        crawl_equibase._equibase_browser_session['last_used_at'] -= 120
+        self.assertTrue(crawl_equibase.close_idle_shared_equibase_webdriver(idle_seconds=60))
+        fake_driver.quit.assert_called_once()
+        self.assertIsNone(crawl_equibase._equibase_browser_session['driver'])
+        self.assertFalse(crawl_equibase.close_idle_shared_equibase_webdriver(idle_seconds=0))
+
     def test_parse_equibase_static_pdf_url_extracts_metadata(self):
         parsed = crawl_equibase.parse_equibase_static_pdf_url(
             "https://www.equibase.com/static/chart/pdf/PRX033126USA7.pdf"
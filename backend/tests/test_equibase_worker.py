@@ -0,0 +1,83 @@
+import os
+import sys
+import time
+import unittest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from equibase_worker import EquibaseWorker
+
+
+def _fake_runner(task_name, payload):
+    if task_name == "echo":
+        return {"pid": os.getpid(), "payload": payload}
+    if task_name == "boom":
+        raise ValueError("chart parse failed")
+    if task_name == "hang":
+        time.sleep(30)
+    if task_name == "die":
+        os._exit(3)
+    raise ValueError(f"Unsupported Equibase task: {task_name}")
+
+
+class EquibaseWorkerTests(unittest.TestCase):
+    def _worker(self, **kwargs):
+        worker = EquibaseWorker(runner=_fake_runner, **kwargs)
+        self.addCleanup(worker.shutdown)
+        return worker
+
+    def test_worker_process_is_reused_across_tasks(self):
+        worker = self._worker(max_tasks=10)
+
+        first = worker.run_task("echo", target_date="2026-04-03")
+        second = worker.run_task("echo", target_date="2026-04-04")
+
+        self.assertEqual(first["payload"], {"target_date": "2026-04-03"})
+        self.assertEqual(first["pid"], second["pid"])
+        self.assertNotEqual(first["pid"], os.getpid())
+        self.assertEqual(worker.stats()["workers_started"], 1)
+
+    def test_worker_recycles_after_task_limit(self):
+        worker = self._worker(max_tasks=2)
+
+        pids = [worker.run_task("echo")["pid"] for _ in range(3)]
+
+        self.assertEqual(pids[0], pids[1])
+        self.assertNotEqual(pids[1], pids[2])
+        self.assertEqual(worker.stats()["recycles"], {"max_tasks": 1})
+
+    def test_worker_recycles_when_rss_crosses_threshold(self):
+        worker = self._worker(max_tasks=10, max_rss_bytes=1)
+
+        first = worker.run_task("echo")["pid"]
+        second = worker.run_task("echo")["pid"]
+
+        self.assertNotEqual(first, second)
+        self.assertEqual(worker.stats()["recycles"], {"max_rss": 2})
+
+    def test_task_errors_keep_the_worker_but_crashes_and_timeouts_replace_it(self):
+        worker = self._worker(max_tasks=10, task_timeout=1)
+        pid = worker.run_task("echo")["pid"]
+
+        with self.assertRaisesRegex(RuntimeError, "chart parse failed"):
+            worker.run_task("boom")
+        self.assertEqual(worker.run_task("echo")["pid"], pid)
+
+        with self.assertRaisesRegex(RuntimeError, "exitcode=3"):
+            worker.run_task("die")
+        with self.assertRaisesRegex(RuntimeError, "exited without a result"):
+            worker.run_task("hang")
+
+        self.assertNotEqual(worker.run_task("echo")["pid"], pid)
+        self.assertEqual(worker.stats()["recycles"], {"crashed": 1, "timeout": 1})
+
+    def test_idle_worker_is_stopped(self):
+        worker = self._worker(idle_seconds=0)
+        worker.run_task("echo")
+
+        self.assertTrue(worker.recycle_if_idle())
+        self.assertFalse(worker.stats()["alive"])
+
+
+if __name__ == "__main__":
+    unittest.main()
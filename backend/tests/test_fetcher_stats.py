@@ -0,0 +1,96 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import fetcher_stats
+
+CHAIN = [("requests", "r"), ("cloudscraper", "c"), ("curl_cffi", "u")]
+URL = "https://www.equibase.com/static/latechanges/html/latechangesGP-USA.html"
+
+
+def _names(chain):
+    return [name for name, _ in chain]
+
+
+class FetcherStatsTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp_dir.name) / "fetcher_stats.json"
+        self.stats = fetcher_stats.FetcherStats(self.path)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_default_order_until_enough_samples(self):
+        self.stats.record(URL, "requests", False, 0.5)
+        self.stats.record(URL, "curl_cffi", True, 0.5)
+
+        self.assertEqual(_names(self.stats.order(URL, CHAIN)), ["requests", "cloudscraper", "curl_cffi"])
+
+    def test_working_fetcher_is_promoted_and_failing_one_demoted(self):
+        for _ in range(fetcher_stats.FETCHER_STATS_MIN_SAMPLES):
+            self.stats.record(URL, "requests", False, 2.0)
+            self.stats.record(URL, "curl_cffi", True, 1.0)
+
+        self.assertEqual(_names(self.stats.order(URL, CHAIN)), ["curl_cffi", "cloudscraper", "requests"])
+        # Stats are per host: another host keeps the static chain.
+        self.assertEqual(_names(self.stats.order("https://tvg.equibase.com/x", CHAIN)), _names(CHAIN))
+
+    def test_periodic_exploration_uses_default_order(self):
+        for _ in range(fetcher_stats.FETCHER_STATS_MIN_SAMPLES):
+            self.stats.record(URL, "requests", False, 1.0)
+
+        with patch.object(fetcher_stats, "FETCHER_EXPLORE_EVERY", 3):
+            orders = [_names(self.stats.order(URL, CHAIN)) for _ in range(3)]
+
+        self.assertEqual(orders[0][-1], "requests")
+        self.assertEqual(orders[1][-1], "requests")
+        self.assertEqual(orders[2], _names(CHAIN))
+
+    def test_stats_persist_across_instances(self):
+        for _ in range(fetcher_stats.FETCHER_STATS_MIN_SAMPLES):
+            self.stats.record(URL, "cloudscraper", True, 0.2)
+        self.stats.flush()
+
+        persisted = json.loads(self.path.read_text())
+        self.assertEqual(persisted["www.equibase.com"]["cloudscraper"]["successes"], 3)
+
+        reloaded = fetcher_stats.FetcherStats(self.path)
+        self.assertEqual(_names(reloaded.order(URL, CHAIN))[0], "cloudscraper")
+
+    def test_processes_sharing_the_file_merge_instead_of_overwriting(self):
+        scheduler = self.stats
+        worker = fetcher_stats.FetcherStats(self.path)
+
+        scheduler.record(URL, "requests", True, 0.5)
+        scheduler.flush()
+        worker.record(URL, "curl_cffi", False, 1.0)
+        worker.record(URL, "requests", False, 1.0)
+        worker.flush()
+
+        persisted = json.loads(self.path.read_text())["www.equibase.com"]
+        self.assertEqual(persisted["curl_cffi"]["attempts"], 1)
+        self.assertEqual((persisted["requests"]["attempts"], persisted["requests"]["successes"]), (2, 1))
+        # The scheduler picks up the worker's samples once the file changes.
+        self.assertEqual(scheduler.snapshot()["www.equibase.com"]["requests"]["attempts"], 2)
+
+        scheduler.record(URL, "requests", True, 0.5)
+        scheduler.flush()
+        persisted = json.loads(self.path.read_text())["www.equibase.com"]
+        self.assertEqual(persisted["requests"]["attempts"], 3)
+        self.assertEqual(persisted["curl_cffi"]["attempts"], 1)
+
+    def test_call_fetcher_reports_gate_refusals_as_not_run(self):
+        self.assertEqual(fetcher_stats.call_fetcher(lambda url: fetcher_stats.skip_fetch(), URL)[::2], (None, False))
+        self.assertEqual(fetcher_stats.call_fetcher(lambda url: None, URL)[::2], (None, True))
+        self.assertEqual(fetcher_stats.call_fetcher(lambda url, timeout: url, URL, timeout=5)[::2], (URL, True))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import http_sessions
+
+
+class HttpSessionsTests(unittest.TestCase):
+    def tearDown(self):
+        http_sessions.close_http_sessions()
+
+    def test_clients_are_pooled_per_host(self):
+        first = http_sessions.get_http_client("https://entries.horseracingnation.com/entries-results/a/2026-04-03")
+        second = http_sessions.get_http_client("https://entries.horseracingnation.com/entries-results/b/2026-04-04")
+        other = http_sessions.get_http_client("https://www1.drf.com/Entries/RacingDates.do")
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+
+    def test_closed_client_is_replaced(self):
+        client = http_sessions.get_http_client("https://www.equibase.com/")
+        http_sessions.close_http_sessions()
+
+        self.assertTrue(client.is_closed)
+        self.assertIsNot(http_sessions.get_http_client("https://www.equibase.com/"), client)
+
+    def test_requests_session_pool_is_bounded_and_blocking(self):
+        session = http_sessions.get_requests_session("https://tvg.equibase.com/static/entry/x.html")
+        adapter = session.get_adapter("https://tvg.equibase.com/")
+
+        self.assertIs(session, http_sessions.get_requests_session("tvg.equibase.com"))
+        self.assertEqual(adapter._pool_maxsize, http_sessions.HTTP_POOL_MAX_CONNECTIONS)
+        self.assertTrue(adapter._pool_block)
+
+
+    @unittest.skipIf(getattr(http_sessions.cloudscraper, "CloudScraper", None) is None, "cloudscraper not installed")
+    def test_cloudscraper_session_is_pooled_per_host_and_keeps_its_tls_adapter(self):
+        scraper = http_sessions.get_cloudscraper_session("https://tvg.equibase.com/static/entry/x.html")
+        adapter = scraper.get_adapter("https://tvg.equibase.com/")
+
+        self.assertIs(scraper, http_sessions.get_cloudscraper_session("tvg.equibase.com"))
+        self.assertIsNot(scraper, http_sessions.get_cloudscraper_session("www.equibase.com"))
+        self.assertEqual(type(adapter).__name__, "CipherSuiteAdapter")
+        self.assertEqual(adapter._pool_maxsize, http_sessions.HTTP_POOL_MAX_CONNECTIONS)
+        self.assertTrue(adapter._pool_block)
+
+    @unittest.skipIf(getattr(http_sessions.curl_requests, "Session", None) is None, "curl_cffi not installed")
+    def test_curl_session_is_shared_per_host_and_bounded(self):
+        with patch.object(http_sessions, "HTTP_POOL_MAX_CONNECTIONS", 1):
+            with http_sessions.lease_curl_session("https://tvg.equibase.com/a") as first:
+                _session, slots = http_sessions._curl_sessions["tvg.equibase.com"]
+                self.assertFalse(slots.acquire(blocking=False))
+            with http_sessions.lease_curl_session("tvg.equibase.com") as second:
+                pass
+
+        self.assertIs(first, second)
+        self.assertTrue(slots.acquire(blocking=False))
+
+
+if __name__ == "__main__":
+    unittest.main()
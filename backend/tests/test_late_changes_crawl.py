@@ -0,0 +1,413 @@
+import asyncio
+import os
+import sys
+import unittest
+from datetime import date
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import httpx
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(os.path.dirname(__file__))
+
+import crawl_scratches
+from test_change_reconciliation import RecordingSupabase
+
+RSS_FIXTURE = Path(__file__).resolve().parents[2] / "dump_rss.xml"
+RSS_BODY = '<?xml version="1.0"?><rss><channel></channel></rss>'
+HTML_BODY = "<html><body>" + ("late changes " * 60) + "</body></html>"
+
+
+class ConcurrentLateChangesFetchTests(unittest.TestCase):
+    def setUp(self):
+        crawl_scratches.clear_feed_cache()
+
+    def _mock_client_factory(self, handler):
+        def build():
+            return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return build
+
+    def test_tracks_are_fetched_concurrently_under_the_limit(self):
+        in_flight = {"now": 0, "peak": 0}
+
+        async def handler(request):
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            await asyncio.sleep(0.02)
+            in_flight["now"] -= 1
+            if request.url.path.endswith(".rss"):
+                return httpx.Response(200, text=RSS_BODY)
+            return httpx.Response(200, text=HTML_BODY)
+
+        processed = []
+
+        def fake_process(track_code, race_date, prefetched, telemetry, collector=None):
+            processed.append((track_code, prefetched["rss"] == RSS_BODY, prefetched["direct_html"] == HTML_BODY))
+            return {"rss": 1, "direct_html": 2, "mobile_html": 0}
+
+        telemetry = {}
+        with patch.object(crawl_scratches, "_build_async_feed_client", self._mock_client_factory(handler)), \
+                patch.object(crawl_scratches, "LATE_CHANGES_FETCH_CONCURRENCY", 3), \
+                patch.object(crawl_scratches, "process_track_late_changes", side_effect=fake_process):
+            results = crawl_scratches.crawl_tracks_concurrently({"GP", "AQU", "SA", "KEE"}, date(2026, 4, 3), telemetry)
+
+        self.assertEqual(set(results), {"GP", "AQU", "SA", "KEE"})
+        self.assertTrue(all(counts["direct_html"] == 2 for counts in results.values()))
+        self.assertEqual(sorted(processed), [(code, True, True) for code in ("AQU", "GP", "KEE", "SA")])
+        self.assertGreater(in_flight["peak"], 1)
+        self.assertLessEqual(in_flight["peak"], 3)
+        self.assertEqual(telemetry["successes_by_fetcher"]["httpx_async"], 4)
+
+    def test_missing_tvg_page_falls_back_to_legacy_host(self):
+        requested = []
+
+        def handler(request):
+            requested.append(str(request.url))
+            if "tvg.equibase.com" in request.url.host:
+                return httpx.Response(404, text="")
+            if request.url.path.endswith(".rss"):
+                return httpx.Response(404, text="")
+            return httpx.Response(200, text=HTML_BODY)
+
+        captured = {}
+
+        def fake_process(track_code, race_date, prefetched, telemetry, collector=None):
+            captured.update(prefetched)
+            return {}
+
+        with patch.object(crawl_scratches, "_build_async_feed_client", self._mock_client_factory(handler)), \
+                patch.object(crawl_scratches, "process_track_late_changes", side_effect=fake_process):
+            crawl_scratches.crawl_tracks_concurrently({"GP"}, date(2026, 4, 3))
+
+        self.assertIsNone(captured["rss"])
+        self.assertEqual(captured["direct_url"], crawl_scratches.LEGACY_LATE_CHANGES_TRACK_URL.format(track_code="GP"))
+        self.assertIn(crawl_scratches.TVG_LATE_CHANGES_TRACK_URL.format(track_code="GP"), requested)
+
+    def test_prefetched_bodies_skip_synchronous_fetchers(self):
+        with patch.object(crawl_scratches, "fetch_rss_feed") as fetch_rss, \
+                patch.object(crawl_scratches, "fetch_direct_track_changes_page") as fetch_direct, \
+                patch.object(crawl_scratches, "parse_rss_changes", return_value=[]), \
+                patch.object(crawl_scratches, "parse_track_changes", return_value=[{"race_number": 1}]), \
+                patch.object(crawl_scratches, "reconcile_changes", return_value=(1, True)) as reconcile:
+            counts = crawl_scratches.process_track_late_changes(
+                "GP",
+                date(2026, 4, 3),
+                {"rss": RSS_BODY, "direct_html": HTML_BODY, "direct_url": "https://example.test/gp"},
+            )
+
+        fetch_rss.assert_not_called()
+        fetch_direct.assert_not_called()
+        self.assertEqual(counts["direct_html"], 1)
+        self.assertEqual(reconcile.call_args_list[-1].args[0], "GP")
+
+
+class ConditionalFeedFetchTests(unittest.TestCase):
+    URL = "https://example.test/latechangesGP-USA.html"
+
+    def setUp(self):
+        crawl_scratches.clear_feed_cache()
+
+    def test_identical_body_skips_handler_and_reports_skip(self):
+        calls = []
+
+        def handler(body):
+            calls.append(body)
+            return 2, True, 3
+
+        telemetry = {}
+        first = crawl_scratches._process_feed_body(self.URL, date(2026, 4, 3), HTML_BODY, handler, telemetry, "requests")
+        second = crawl_scratches._process_feed_body(self.URL, date(2026, 4, 3), HTML_BODY, handler, telemetry, "requests")
+
+        self.assertEqual(first, (2, 3))
+        self.assertEqual(second, (0, 3))
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(telemetry["feed_checks_by_fetcher"], {"requests": 2})
+        self.assertEqual(telemetry["unchanged_by_fetcher"], {"requests": 1})
+        self.assertEqual(crawl_scratches._summarize_feed_skips(telemetry), "1/2 unchanged (50% skipped)")
+
+    def test_failed_reconcile_is_not_remembered(self):
+        outcomes = iter([(0, False, 3), (3, True, 3)])
+        handler = lambda _body: next(outcomes)
+
+        crawl_scratches._process_feed_body(self.URL, date(2026, 4, 3), HTML_BODY, handler)
+        retried = crawl_scratches._process_feed_body(self.URL, date(2026, 4, 3), HTML_BODY, handler)
+
+        self.assertEqual(retried, (3, 3))
+
+    def test_validators_are_sent_and_304_short_circuits(self):
+        seen_headers = []
+
+        def handler(request):
+            seen_headers.append(dict(request.headers))
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, text=HTML_BODY, headers={"ETag": '"v1"'})
+
+        async def fetch():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                return await crawl_scratches._fetch_feed_async(
+                    client, asyncio.Semaphore(1), self.URL, {}, crawl_scratches._html_response_is_usable, date(2026, 4, 3)
+                )
+
+        body, meta = asyncio.run(fetch())
+        crawl_scratches._process_feed_body(self.URL, date(2026, 4, 3), body, lambda _b: (1, True, 1), feed_meta=meta)
+
+        body, meta = asyncio.run(fetch())
+        parser_calls = []
+        result = crawl_scratches._process_feed_body(
+            self.URL, date(2026, 4, 3), body, lambda _b: parser_calls.append(1), feed_meta=meta
+        )
+
+        self.assertIsNone(body)
+        self.assertTrue(meta["not_modified"])
+        self.assertEqual(seen_headers[1].get("if-none-match"), '"v1"')
+        self.assertEqual(result, (0, 1))
+        self.assertEqual(parser_calls, [])
+
+
+    def test_replayed_cookies_that_hit_the_interstitial_are_dropped(self):
+        blocked = "<html><body>Pardon Our Interruption" + (" " * 600) + "</body></html>"
+
+        async def fetch():
+            transport = httpx.MockTransport(lambda _request: httpx.Response(200, text=blocked))
+            async with httpx.AsyncClient(transport=transport) as client:
+                return await crawl_scratches._fetch_feed_async(
+                    client, asyncio.Semaphore(1), self.URL, {}, crawl_scratches._html_response_is_usable
+                )
+
+        with patch.object(crawl_scratches, "load_cookies", return_value={"visid_incap": "stale"}), \
+                patch.object(crawl_scratches, "clear_cookies") as clear_mock:
+            body, _meta = asyncio.run(fetch())
+
+        self.assertIsNone(body)
+        clear_mock.assert_called_once_with(self.URL)
+
+class FetchChainStatsTests(unittest.TestCase):
+    def test_gated_fetchers_are_not_scored_as_failures(self):
+        url = "https://www.equibase.com/static/latechanges/html/latechangesGP-USA.html"
+        chain = (
+            ("powershell", lambda _url: crawl_scratches.skip_fetch()),
+            ("requests", lambda _url: None),
+            ("playwright", lambda _url: HTML_BODY),
+        )
+        telemetry = {}
+        with patch.object(crawl_scratches, "_fetcher_chain", return_value=chain), \
+             patch.object(crawl_scratches, "order_fetchers", side_effect=lambda _url, fetchers: fetchers), \
+             patch.object(crawl_scratches, "record_fetch") as record_fetch:
+            html = crawl_scratches.fetch_static_page(url, retries=1, telemetry=telemetry)
+
+        self.assertEqual(html, HTML_BODY)
+        self.assertEqual(
+            [(call.args[1], call.args[2]) for call in record_fetch.call_args_list],
+            [("requests", False), ("playwright", True)],
+        )
+
+
+
+class BroadSweepTests(unittest.TestCase):
+    INDEX_URL = "https://www.equibase.com/static/latechanges/html/latechangesGP-USA.html"
+
+    def test_broad_sweep_with_no_tracks_due_still_reads_the_index(self):
+        supabase = MagicMock()
+        supabase.table.return_value.select.return_value.like.return_value.execute.return_value.data = []
+
+        with patch.object(crawl_scratches, "get_supabase_client", return_value=supabase), \
+                patch.object(crawl_scratches, "crawl_tracks_concurrently", return_value={}) as scan, \
+                patch.object(
+                    crawl_scratches,
+                    "parse_late_changes_index",
+                    return_value=[{"track_code": "GP", "url": self.INDEX_URL}],
+                ), \
+                patch.object(crawl_scratches, "fetch_static_page", return_value=None) as fetch_page, \
+                patch.object(crawl_scratches, "crawl_otb_changes", return_value=0) as otb:
+            crawl_scratches.crawl_late_changes(preferred_tracks=[], include_broad_sources=True)
+
+        self.assertEqual(scan.call_args.args[0], set())
+        self.assertEqual(fetch_page.call_args.args[0], self.INDEX_URL)
+        otb.assert_called_once()
+
+class LateChangeCollectorTests(unittest.TestCase):
+    RACE_DATE = date(2026, 4, 3)
+
+    def setUp(self):
+        crawl_scratches.clear_feed_cache()
+
+    @staticmethod
+    def _change(change_type, description, program_number=None, horse_name=None, race_number=1):
+        return {
+            "race_number": race_number,
+            "change_type": change_type,
+            "description": description,
+            "program_number": program_number,
+            "horse_name": horse_name,
+        }
+
+    def test_copies_from_every_source_merge_into_one_write_per_track(self):
+        collector = crawl_scratches.LateChangeCollector()
+        self.assertEqual(collector.add("GP", self.RACE_DATE, [
+            self._change("Scratch", "Reason Unavailable", program_number="3", horse_name="alpha"),
+            self._change("Race Cancelled", "Race Cancelled", race_number=5),
+        ], "rss"), 2)
+        self.assertEqual(collector.add("GP", self.RACE_DATE, [
+            self._change("Scratch", "Veterinarian", program_number="3"),
+            self._change("Race Cancelled", "Race Cancelled", race_number=5),
+        ], "direct_html"), 0)
+        # OTB only knows the horse by name; the alias from the RSS copy still matches it.
+        self.assertEqual(collector.add("GP", self.RACE_DATE, [
+            self._change("Scratch", "Sick", horse_name="alpha"),
+        ], "otb"), 0)
+        collector.add("SA", self.RACE_DATE, [self._change("Scratch", "Trainer", program_number="1")], "otb")
+
+        with patch.object(crawl_scratches, "reconcile_changes", return_value=(1, True)) as reconcile:
+            written, ok = collector.flush()
+
+        self.assertEqual((written, ok), (2, True))
+        self.assertEqual([call.args[0] for call in reconcile.call_args_list], ["GP", "SA"])
+        gp_changes = reconcile.call_args_list[0].args[2]
+        self.assertEqual(len(gp_changes), 2)
+        self.assertEqual(gp_changes[0]["description"], "Veterinarian; Sick")
+        self.assertEqual(gp_changes[0]["program_number"], "3")
+        self.assertNotIn("source", gp_changes[0])
+        self.assertEqual((collector.received, collector.merged), (6, 3))
+
+    def test_feed_validators_wait_for_a_clean_flush(self):
+        url = "https://example.test/latechangesGP-USA.html"
+        collector = crawl_scratches.LateChangeCollector()
+
+        def handler(_body):
+            return collector.add("GP", self.RACE_DATE, [self._change("Scratch", "Vet", program_number="1")], "index_html"), True, 1
+
+        crawl_scratches._process_feed_body(url, self.RACE_DATE, HTML_BODY, handler, collector=collector)
+        self.assertIsNone(crawl_scratches.get_feed_cache_entry(url, self.RACE_DATE))
+
+        with patch.object(crawl_scratches, "reconcile_changes", return_value=(0, False)):
+            collector.flush()
+        self.assertIsNone(crawl_scratches.get_feed_cache_entry(url, self.RACE_DATE))
+
+        crawl_scratches._process_feed_body(url, self.RACE_DATE, HTML_BODY, handler, collector=collector)
+        with patch.object(crawl_scratches, "reconcile_changes", return_value=(1, True)):
+            collector.flush()
+        self.assertIsNotNone(crawl_scratches.get_feed_cache_entry(url, self.RACE_DATE))
+
+    def test_each_feed_is_remembered_on_its_own_tracks_outcome(self):
+        urls = {track: f"https://example.test/latechanges{track}-USA.html" for track in ("GP", "SA", "AQU")}
+        supabase = RecordingSupabase(
+            {
+                "hranalyzer_races": [
+                    {"id": "gp-1", "race_key": "GP-20260403-1", "race_status": "upcoming"},
+                    {"id": "sa-1", "race_key": "SA-20260403-1", "race_status": "upcoming"},
+                ],
+                "hranalyzer_race_entries": [
+                    {"id": "gp-e1", "race_id": "gp-1", "program_number": "1", "scratched": False,
+                     "finish_position": None, "hranalyzer_horses": {"horse_name": "Alpha"}},
+                    {"id": "sa-e1", "race_id": "sa-1", "program_number": "1", "scratched": False,
+                     "finish_position": None, "hranalyzer_horses": {"horse_name": "Bravo"}},
+                ],
+                "hranalyzer_changes": [],
+            }
+        )
+        collector = crawl_scratches.LateChangeCollector()
+
+        def handler_for(track_code, program_number):
+            def handler(_body):
+                change = self._change("Scratch", "Vet", program_number=program_number)
+                return collector.add(track_code, self.RACE_DATE, [change], "direct_html"), True, 1
+            return handler
+
+        # GP matches; SA names a horse that is not on its loaded card (orphan);
+        # AQU's card has not been crawled yet.
+        for track, program_number in (("GP", "1"), ("SA", "99"), ("AQU", "1")):
+            crawl_scratches._process_feed_body(
+                urls[track], self.RACE_DATE, HTML_BODY, handler_for(track, program_number), collector=collector
+            )
+        with patch.object(crawl_scratches, "get_supabase_client", return_value=supabase):
+            self.assertEqual(collector.flush(), (1, False))
+
+        self.assertIsNotNone(crawl_scratches.get_feed_cache_entry(urls["GP"], self.RACE_DATE))
+        self.assertIsNotNone(crawl_scratches.get_feed_cache_entry(urls["SA"], self.RACE_DATE))
+        self.assertIsNone(crawl_scratches.get_feed_cache_entry(urls["AQU"], self.RACE_DATE))
+
+    def test_feed_cache_entries_expire_so_unchanged_feeds_are_reconciled_again(self):
+        url = "https://example.test/latechangesGP-USA.html"
+        crawl_scratches.remember_feed(url, self.RACE_DATE, "digest", etag='"v1"', parsed_items=1)
+        self.assertEqual(crawl_scratches.conditional_request_headers(url, self.RACE_DATE), {"If-None-Match": '"v1"'})
+
+        stored_at = crawl_scratches._feed_cache[(url, self.RACE_DATE.isoformat())]["stored_at"]
+        with patch.object(
+            crawl_scratches.time,
+            "monotonic",
+            return_value=stored_at + crawl_scratches.LATE_CHANGES_FEED_CACHE_MAX_AGE_SECONDS + 1,
+        ):
+            self.assertIsNone(crawl_scratches.get_feed_cache_entry(url, self.RACE_DATE))
+        self.assertEqual(crawl_scratches.conditional_request_headers(url, self.RACE_DATE), {})
+
+
+class _FixtureDay(date):
+    @classmethod
+    def today(cls):
+        return cls(2026, 1, 18)
+
+
+class StreamingRssParseTests(unittest.TestCase):
+    def setUp(self):
+        self.xml = RSS_FIXTURE.read_text(encoding="utf-8")
+
+    def test_streaming_items_match_soup_items_on_fixture(self):
+        self.assertEqual(
+            list(crawl_scratches._iter_rss_items_streaming(self.xml)),
+            list(crawl_scratches._iter_rss_items_soup(self.xml)),
+        )
+
+    def test_parse_output_matches_soup_path(self):
+        with patch.object(crawl_scratches, "date", _FixtureDay):
+            streamed = crawl_scratches.parse_rss_changes(self.xml, "AQU")
+            with patch.object(crawl_scratches, "_iter_rss_items_streaming", side_effect=ValueError("forced")):
+                via_soup = crawl_scratches.parse_rss_changes(self.xml, "AQU")
+
+        self.assertTrue(streamed)
+        self.assertEqual(streamed, via_soup)
+
+    def test_items_are_yielded_before_the_rest_of_the_feed_is_parsed(self):
+        first_item = next(iter(crawl_scratches._iter_rss_items_soup(self.xml)))
+        # Garbage after the first item only surfaces once the parser reaches it.
+        cut = self.xml.index("</item>") + len("</item>")
+        truncated = self.xml[:cut] + "<item><<" + " " * 4096
+
+        with patch.object(crawl_scratches, "RSS_PARSE_CHUNK_CHARS", 256):
+            items = crawl_scratches._iter_rss_items_streaming(truncated)
+            self.assertEqual(next(items), first_item)
+            with self.assertRaises(Exception):
+                list(items)
+
+    def test_items_are_parsed_as_they_stream_and_a_late_error_restarts_on_soup(self):
+        consumed = []
+
+        def stream(_xml):
+            for item in crawl_scratches._iter_rss_items_soup(self.xml):
+                consumed.append(item)
+                yield item
+            raise ValueError("broken tail")
+
+        with patch.object(crawl_scratches, "date", _FixtureDay), \
+             patch.object(crawl_scratches, "_iter_rss_items_streaming", side_effect=stream), \
+             patch.object(crawl_scratches, "_rss_changes_from_items", wraps=crawl_scratches._rss_changes_from_items) as build:
+            changes = crawl_scratches.parse_rss_changes(self.xml, "AQU")
+            expected = crawl_scratches._rss_changes_from_items(crawl_scratches._iter_rss_items_soup(self.xml), _FixtureDay.today())
+
+        # The stream was consumed item by item, then the soup pass replaced its partial output.
+        self.assertTrue(consumed)
+        self.assertNotIsInstance(build.call_args_list[0].args[0], list)
+        self.assertEqual(changes, expected)
+
+    def test_malformed_feed_falls_back_to_soup(self):
+        broken = self.xml.replace("</channel>", "", 1)
+        with patch.object(crawl_scratches, "date", _FixtureDay):
+            self.assertEqual(
+                crawl_scratches.parse_rss_changes(broken, "AQU"),
+                crawl_scratches.parse_rss_changes(self.xml, "AQU"),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+import os
+import sys
+import tempfile
+import unittest
+from datetime import timedelta
+from unittest.mock import patch
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+# live_crawl opens its log file at import time.
+os.environ.setdefault("LOG_DIR", tempfile.mkdtemp(prefix="live_crawl_test_"))
+
+import live_crawl
+from results_scheduler import ResultsPollScheduler
+
+
+class DueResultsPollTests(unittest.TestCase):
+    def setUp(self):
+        self.now = live_crawl.EST.localize(live_crawl.datetime(2026, 4, 3, 15, 0))
+        self.scheduler = ResultsPollScheduler(first_delay_minutes=5)
+        patchers = [
+            patch.object(live_crawl, "_results_scheduler", self.scheduler),
+            patch.object(live_crawl, "refresh_results_schedule"),
+            patch.object(live_crawl, "mark_crawl_attempt"),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_idle_tick_does_not_refresh_results_freshness(self):
+        with patch.object(live_crawl, "record_crawl_result") as record, \
+             patch.object(live_crawl, "run_equibase_task_in_subprocess") as run_task:
+            self.assertEqual(live_crawl.run_due_results_polls(self.now), 0)
+
+        run_task.assert_not_called()
+        record.assert_not_called()
+
+    def test_targeted_poll_records_success(self):
+        key = ("2026-04-03", "GP", 5)
+        self.scheduler.update_races([(key, self.now - timedelta(minutes=10), False)])
+
+        with patch.object(live_crawl, "record_crawl_result") as record, \
+             patch.object(live_crawl, "run_equibase_task_in_subprocess", return_value={"races_inserted": 1}) as run_task:
+            self.assertEqual(live_crawl.run_due_results_polls(self.now), 1)
+
+        run_task.assert_called_once_with("specific", target_date="2026-04-03", race_targets=[("GP", 5)])
+        record.assert_called_once()
+        self.assertTrue(record.call_args.kwargs["success"])
+        self.assertEqual(record.call_args.kwargs["races_inserted"], 1)
+
+
+class StartupBackfillTests(unittest.TestCase):
+    def setUp(self):
+        self.now = live_crawl.EST.localize(live_crawl.datetime(2026, 4, 3, 15, 0))
+        self.calls = []
+        self.phases = []
+        patchers = [
+            patch.object(live_crawl, "is_results_racing_window", return_value=True),
+            patch.object(live_crawl, "run_scratches_refresh", side_effect=lambda: self.calls.append("scratches")),
+            patch.object(live_crawl, "retry_unresolved_results", return_value=[]),
+            patch.object(
+                live_crawl,
+                "refresh_results_for_date",
+                side_effect=lambda target_date, label, **_kwargs: self.calls.append(label),
+            ),
+            patch.object(live_crawl, "run_entries_refresh", side_effect=lambda _today: self.calls.append("entries")),
+            patch.object(live_crawl, "mark_crawl_attempt"),
+            patch.object(live_crawl, "record_crawl_result"),
+            patch.object(live_crawl, "evaluate_runtime_alerts"),
+            patch.object(live_crawl, "start_startup_backfill"),
+            patch.object(
+                live_crawl,
+                "update_startup_backfill_phase",
+                side_effect=lambda phase, status, **_kwargs: self.phases.append((phase, status)),
+            ),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_lanes_run_and_open_the_scheduler_gates(self):
+        coordinator = live_crawl.run_startup_backfill(self.now, wait=True)
+
+        self.assertFalse(coordinator.is_alive())
+        self.assertLess(self.calls.index("today"), self.calls.index("yesterday-backfill"))
+        self.assertEqual(sorted(self.calls), ["entries", "scratches", "today", "yesterday-backfill"])
+        self.assertEqual(
+            {phase for phase, status in self.phases if status == "done"},
+            {"scratches", "results_today", "results_yesterday", "entries"},
+        )
+        self.assertTrue(all(event.is_set() for event in live_crawl._startup_backfill_done.values()))
+
+    def test_failed_phase_still_opens_its_gate(self):
+        with patch.object(live_crawl, "run_scratches_refresh", side_effect=RuntimeError("feed down")):
+            live_crawl.run_startup_backfill(self.now, wait=True)
+
+        self.assertIn(("scratches", "failed"), self.phases)
+        self.assertTrue(live_crawl._startup_backfill_done["scratches"].is_set())
+
+    def test_scheduled_scratch_and_results_jobs_wait_for_the_backfill(self):
+        for event in live_crawl._startup_backfill_done.values():
+            event.clear()
+        scheduler = live_crawl.build_task_scheduler(backfilled=True)
+        snapshot = scheduler.snapshot()
+
+        for name in ("scratches", "results", "results_reconcile", "entries"):
+            self.assertTrue(snapshot[name]["waiting_for_gate"], name)
+        self.assertFalse(snapshot["bet_resolution"]["waiting_for_gate"])
+
+        live_crawl._startup_backfill_done["scratches"].set()
+        self.assertFalse(scheduler.snapshot()["scratches"]["waiting_for_gate"])
+        self.assertTrue(scheduler.snapshot()["results"]["waiting_for_gate"])
+
+
+if __name__ == "__main__":
+    unittest.main()
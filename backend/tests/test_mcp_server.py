@@ -1169,6 +1169,58 @@ class TestMcpServer(unittest.TestCase):
         self.assertEqual(result["count"], 0)
         self.assertEqual(result["changes"], [])
 
+    def test_get_changes_skips_a_malformed_row_instead_of_failing_the_page(self):
+        today = "2026-03-31"
+        race = {"id": "race-1", "race_date": today, "track_code": "SA"}
+        supabase = SupabaseRouterStub(
+            {
+                "hranalyzer_changes": [
+                    {
+                        "id": "chg-bad",
+                        "entry_id": None,
+                        "race_id": "race-1",
+                        "change_type": "Cancelled",
+                        "description": "Race cancelled",
+                        "created_at": "2026-03-31T12:05:00Z",
+                        "race": race,
+                    },
+                    {
+                        "id": "chg-good",
+                        "entry_id": None,
+                        "race_id": "race-1",
+                        "change_type": "Post Time",
+                        "description": "Post time changed to 2:10 PM",
+                        "created_at": "2026-03-31T12:00:00Z",
+                        "race": race,
+                    },
+                ],
+                "hranalyzer_races": [
+                    {
+                        "id": "race-1",
+                        "race_key": "SA-20260331-3",
+                        "track_code": "SA",
+                        "race_date": today,
+                        "race_number": 3,
+                        "post_time": "14:00:00",
+                        "track": {"track_name": "Santa Anita"},
+                    }
+                ],
+            }
+        )
+        build = mcp_server._build_change_record
+
+        def flaky_build(item, *args, **kwargs):
+            if item.get("id") == "chg-bad":
+                raise KeyError("race_number")
+            return build(item, *args, **kwargs)
+
+        with patch.object(mcp_server, "get_supabase_client", return_value=supabase), patch.object(
+            mcp_server, "date", FakeDate
+        ), patch.object(mcp_server, "_build_change_record", side_effect=flaky_build):
+            result = mcp_server.get_changes(track="SA", include_race_wide=True)
+
+        self.assertEqual([change["description"] for change in result["changes"]], ["Post time changed to 2:10 PM"])
+
     def test_get_changes_history_uses_incremental_paging(self):
         history_date = "2026-03-30"
         change_rows = [
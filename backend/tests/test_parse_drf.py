@@ -8,7 +8,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
 supabase_client_stub = types.ModuleType("supabase_client")
 supabase_client_stub.get_supabase_client = MagicMock()
-supabase_client_stub.reset_supabase_client = MagicMock()
+supabase_client_stub.release_idle_supabase_clients = MagicMock()
 sys.modules["supabase_client"] = supabase_client_stub
 
 import parse_drf
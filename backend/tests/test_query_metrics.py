@@ -0,0 +1,84 @@
+import os
+import sys
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import query_metrics
+
+
+class QueryMetricsTests(unittest.TestCase):
+    def setUp(self):
+        query_metrics.reset_query_metrics()
+
+    def tearDown(self):
+        query_metrics.reset_query_metrics()
+
+    def test_fingerprint_keeps_columns_and_drops_filter_values(self):
+        operations = [
+            ("call", "select", ("id, race_key",), {}),
+            ("call", "eq", ("race_date", "2026-03-01"), {}),
+            ("attr", "not_", (), {}),
+            ("call", "in_", ("race_status", ["upcoming"]), {}),
+            ("call", "limit", (5,), {}),
+        ]
+
+        fingerprint = query_metrics.fingerprint_operations(operations)
+
+        self.assertEqual(fingerprint, "select(id, race_key).eq(race_date).not_.in_(race_status).limit")
+        self.assertNotIn("2026-03-01", fingerprint)
+
+    def test_record_query_aggregates_histogram_rows_bytes_and_retries(self):
+        query_metrics.record_query("hranalyzer_races", "select(*).eq(race_date)", 12.0, rows=3, payload_bytes=400)
+        query_metrics.record_query("hranalyzer_races", "select(*).eq(race_date)", 700.0, rows=5, retries=1)
+        query_metrics.record_query("hranalyzer_tracks", "select(id).limit", 2.0, rows=1)
+
+        summary = query_metrics.get_query_metrics()
+        heaviest = summary["top"][0]
+
+        self.assertEqual(summary["queries"], 3)
+        self.assertEqual(heaviest["table"], "hranalyzer_races")
+        self.assertEqual(heaviest["count"], 2)
+        self.assertEqual(heaviest["rows"], 8)
+        self.assertEqual(heaviest["max_rows"], 5)
+        self.assertEqual(heaviest["bytes"], 400)
+        self.assertEqual(heaviest["retries"], 1)
+        self.assertEqual(heaviest["avg_ms"], 356.0)
+        self.assertEqual(heaviest["histogram"], {"le_25ms": 1, "le_1000ms": 1})
+
+    def test_slow_queries_emit_structured_warning(self):
+        with patch.object(query_metrics, "QUERY_METRICS_SLOW_MS", 100.0):
+            with self.assertLogs("query_metrics", level="WARNING") as logs:
+                query_metrics.record_query("hranalyzer_changes", "select(*)", 250.0, rows=10)
+
+        self.assertIn('"event": "supabase_query"', logs.output[0])
+        self.assertIn('"table": "hranalyzer_changes"', logs.output[0])
+
+    def test_resilient_query_execute_records_metrics(self):
+        import backend.supabase_client as supabase_client
+
+        builder = SimpleNamespace(
+            select=lambda *_args, **_kwargs: builder,
+            eq=lambda *_args, **_kwargs: builder,
+            execute=lambda: SimpleNamespace(data=[{"id": 1}, {"id": 2}]),
+        )
+        client = SimpleNamespace(table=lambda _name: builder)
+        pool = SimpleNamespace(
+            acquire=lambda: SimpleNamespace(client=client),
+            release=lambda _pooled: None,
+            record_success=lambda _pooled: None,
+        )
+
+        with patch.object(supabase_client, "_get_client_pool", return_value=pool):
+            supabase_client.ResilientTableQuery("hranalyzer_races").select("id").eq("race_date", "2026-03-01").execute()
+
+        top = query_metrics.get_query_metrics()["top"]
+        self.assertEqual(len(top), 1)
+        self.assertEqual(top[0]["fingerprint"], "select(id).eq(race_date)")
+        self.assertEqual(top[0]["rows"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
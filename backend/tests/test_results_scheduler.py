@@ -0,0 +1,78 @@
+import os
+import sys
+import unittest
+from datetime import datetime, timedelta, timezone
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from results_scheduler import ResultsPollScheduler
+
+NOW = datetime(2026, 1, 18, 17, 0, tzinfo=timezone.utc)
+
+
+def _race(track, race, post_minutes, verified=False):
+    post_dt = None if post_minutes is None else NOW + timedelta(minutes=post_minutes)
+    return (("2026-01-18", track, race), post_dt, verified)
+
+
+class ResultsPollSchedulerTests(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = ResultsPollScheduler(first_delay_minutes=6, backoff_minutes=(4, 8, 15), max_attempts=4)
+        self.scheduler.update_races([
+            _race("GP", 5, -10),
+            _race("GP", 6, -3),
+            _race("GP", 4, -40, verified=True),
+            _race("SA", 1, 90),
+            _race("FG", 2, None),
+        ])
+
+    def test_only_races_past_post_plus_delay_are_due(self):
+        self.assertEqual(self.scheduler.due_races(NOW), [("2026-01-18", "GP", 5)])
+        self.assertEqual(self.scheduler.seconds_until_next_due(NOW), 0)
+        self.assertEqual(self.scheduler.pending_count(), 3)
+
+    def test_unverified_race_backs_off_until_exhausted(self):
+        key = ("2026-01-18", "GP", 5)
+        polled_at = []
+        now = NOW
+        for _ in range(120):
+            if key in self.scheduler.due_races(now):
+                polled_at.append(int((now - NOW).total_seconds() // 60))
+                self.scheduler.mark_attempted([key], now)
+            now += timedelta(minutes=1)
+
+        self.assertEqual(polled_at, [0, 4, 12, 27])
+        self.assertEqual(self.scheduler.exhausted_races(), [key])
+
+    def test_verified_race_leaves_the_queue(self):
+        key = ("2026-01-18", "GP", 5)
+        self.scheduler.mark_attempted([key], NOW)
+        self.scheduler.update_races([_race("GP", 5, -10, verified=True), _race("GP", 6, -3)])
+
+        self.assertEqual(self.scheduler.pending_count(), 1)
+        self.assertEqual(self.scheduler.seconds_until_next_due(NOW), 180)
+
+    def test_targeted_polls_fetch_far_fewer_races_than_five_minute_sweeps(self):
+        # Eight tracks of ten races, posts every 30 minutes from 13:00; each race verifies on its second poll.
+        start = NOW.replace(hour=12)
+        races = {
+            ("2026-01-18", f"T{track}", race): start + timedelta(minutes=60 + 30 * race + 3 * track)
+            for track in range(8) for race in range(10)
+        }
+        polls = {key: 0 for key in races}
+        now = start
+        while now < start + timedelta(hours=12):
+            self.scheduler.update_races([(key, post, polls[key] >= 2) for key, post in races.items()])
+            due = self.scheduler.due_races(now)
+            for key in due:
+                polls[key] += 1
+            self.scheduler.mark_attempted(due, now)
+            now += timedelta(minutes=1)
+
+        flat_sweep_race_fetches = (12 * 60 // 5) * len(races)
+        self.assertEqual(sum(polls.values()), 2 * len(races))
+        self.assertLess(sum(polls.values()) * 20, flat_sweep_race_fetches)
+
+
+if __name__ == "__main__":
+    unittest.main()
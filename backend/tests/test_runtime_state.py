@@ -2,6 +2,7 @@ import importlib
 import os
 import sys
 import tempfile
+import threading
 import unittest
 from unittest.mock import patch
 
@@ -45,6 +46,42 @@ class TestRuntimeState(unittest.TestCase):
         self.assertEqual(freshness["entries"]["last_details"]["total_races_found"], 12)
         self.assertFalse(freshness["entries"]["stale"])
 
+    def test_concurrent_updates_from_scheduler_threads_are_not_lost(self):
+        def record(crawl_type):
+            for idx in range(10):
+                self.runtime_state.update_crawl_status(crawl_type, success=True, details={"run": idx})
+
+        threads = [threading.Thread(target=record, args=(name,)) for name in ("entries", "results", "scratches")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.runtime_state.update_scheduler_jobs_snapshot({"results": {"runs": 3, "max_lag_seconds": 12.0}})
+
+        freshness, _alerts = self.runtime_state.summarize_freshness()
+        for name in ("entries", "results", "scratches"):
+            self.assertEqual(freshness[name]["last_details"]["run"], 9)
+        snapshot = self.runtime_state.get_scheduler_jobs_snapshot()
+        self.assertEqual(snapshot["jobs"]["results"]["runs"], 3)
+        self.assertIn("updated_at", snapshot)
+
+    def test_startup_backfill_progress_completes_when_every_phase_settles(self):
+        self.runtime_state.start_startup_backfill(["scratches", "results_today", "entries"])
+        self.runtime_state.update_startup_backfill_phase("scratches", "running")
+        self.runtime_state.update_startup_backfill_phase("scratches", "done")
+        self.runtime_state.update_startup_backfill_phase("results_today", "skipped")
+
+        snapshot = self.runtime_state.get_startup_backfill_snapshot()
+        self.assertIsNone(snapshot["completed_at"])
+        self.assertEqual(snapshot["phases"]["entries"], {"status": "pending"})
+        self.assertIn("started_at", snapshot["phases"]["scratches"])
+
+        self.runtime_state.update_startup_backfill_phase("entries", "failed", error="DRF down")
+
+        snapshot = self.runtime_state.get_startup_backfill_snapshot()
+        self.assertIsNotNone(snapshot["completed_at"])
+        self.assertEqual(snapshot["phases"]["entries"]["error"], "DRF down")
+
     def test_startup_grace_suppresses_initial_stale_alerts(self):
         self.runtime_state.mark_runtime_boot("scheduler")
         freshness, _alerts = self.runtime_state.summarize_freshness()
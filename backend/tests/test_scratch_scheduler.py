@@ -0,0 +1,81 @@
+import os
+import sys
+import unittest
+from datetime import datetime, timedelta, timezone
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from scratch_scheduler import ScratchPollScheduler
+
+NOW = datetime(2026, 1, 18, 17, 0, tzinfo=timezone.utc)
+INTERVALS = {"hot": 60, "warm": 150, "cold": 600, "unknown": 300, "finished": 1800}
+
+
+def _post(minutes, finished=False):
+    return (NOW + timedelta(minutes=minutes), finished)
+
+
+class ScratchPollSchedulerTests(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = ScratchPollScheduler(intervals=INTERVALS, broad_sweep_seconds=600)
+        self.scheduler.update_post_times({
+            "GP": [_post(-40, finished=True), _post(12), _post(40)],
+            "SA": [_post(45), _post(75)],
+            "AQU": [_post(180)],
+            "TAM": [_post(-90, finished=True), _post(-60, finished=True)],
+            "FG": [(None, False)],
+        })
+
+    def test_tiers_follow_next_post_time(self):
+        tiers = {track: self.scheduler.tier_for(track, NOW) for track in self.scheduler.tracks()}
+
+        self.assertEqual(tiers, {"GP": "hot", "SA": "warm", "AQU": "cold", "TAM": "finished", "FG": "unknown"})
+
+    def test_race_just_off_post_stays_hot_within_grace(self):
+        self.scheduler.update_post_times({"PRX": [_post(-5), _post(120)]})
+
+        self.assertEqual(self.scheduler.tier_for("PRX", NOW), "hot")
+
+    def test_everything_due_first_then_only_tracks_whose_interval_elapsed(self):
+        self.assertEqual(self.scheduler.due_tracks(NOW), ["GP", "SA", "FG", "AQU", "TAM"])
+        self.scheduler.mark_polled(self.scheduler.tracks(), NOW, broad_sweep=True)
+
+        self.assertEqual(self.scheduler.due_tracks(NOW + timedelta(seconds=30)), [])
+        self.assertEqual(self.scheduler.due_tracks(NOW + timedelta(seconds=61)), ["GP"])
+        self.assertEqual(self.scheduler.due_tracks(NOW + timedelta(seconds=151)), ["GP", "SA"])
+        self.assertEqual(self.scheduler.seconds_until_next_due(NOW + timedelta(seconds=30)), 30)
+        self.assertFalse(self.scheduler.broad_sweep_due(NOW + timedelta(seconds=599)))
+        self.assertTrue(self.scheduler.broad_sweep_due(NOW + timedelta(seconds=600)))
+
+    def test_day_of_polling_favours_tracks_near_post_and_cuts_volume(self):
+        day_start = NOW.replace(hour=5)
+        card = [(day_start + timedelta(hours=7, minutes=30 * race), False) for race in range(10)]
+        night_card = [(day_start + timedelta(hours=14, minutes=25 * race), False) for race in range(9)]
+        scheduler = ScratchPollScheduler()
+        scheduler.update_post_times({"GP": card, "PEN": night_card, "TAM": [_post(-60, finished=True)]})
+
+        polls = {"GP": [], "PEN": [], "TAM": []}
+        for second in range(0, 19 * 3600, 15):
+            now = day_start + timedelta(seconds=second)
+            due = scheduler.due_tracks(now)
+            for track in due:
+                polls[track].append(now)
+            scheduler.mark_polled(due, now)
+
+        during_gp_card = [t for t in polls["GP"] if card[0][0] - timedelta(minutes=30) <= t <= card[-1][0]]
+        before_gp_card = [t for t in polls["GP"] if t < card[0][0] - timedelta(minutes=60)]
+        self.assertGreater(len(during_gp_card) / 5.0, 2 * len(before_gp_card) / 6.5)
+        self.assertLessEqual(len(polls["TAM"]), 19 * 3600 // scheduler.intervals["finished"] + 1)
+        # Old flat five-minute cadence over the same window: 228 polls per track.
+        self.assertLess(sum(len(times) for times in polls.values()), 228 * len(polls))
+
+    def test_dropped_tracks_are_forgotten(self):
+        self.scheduler.mark_polled(["GP", "SA"], NOW)
+        self.scheduler.update_post_times({"SA": [_post(45)]})
+
+        self.assertEqual(self.scheduler.tracks(), ["SA"])
+        self.assertEqual(self.scheduler.due_tracks(NOW + timedelta(seconds=10)), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
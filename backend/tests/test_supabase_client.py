@@ -1,11 +1,17 @@
+import asyncio
 import importlib
 import os
+import sys
+import threading
+import time
 import unittest
 from types import SimpleNamespace
 from unittest.mock import patch
 
 import httpx
 
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
 
 class SupabaseClientConfigTests(unittest.TestCase):
     @patch.dict(
@@ -116,5 +122,289 @@ class SupabaseClientConfigTests(unittest.TestCase):
             self.assertEqual(create_client.call_count, 2)
 
 
+class ClientPoolTests(unittest.TestCase):
+    def _make_client(self, closed):
+        client = SimpleNamespace()
+        client.postgrest = SimpleNamespace(aclose=lambda: closed.append(client))
+        return client
+
+    @patch.dict(
+        os.environ,
+        {
+            "SUPABASE_URL": "https://example.supabase.co",
+            "SUPABASE_SERVICE_KEY": "service-key",
+            "SUPABASE_CLIENT_POOL_SIZE": "2",
+        },
+        clear=False,
+    )
+    def test_pool_grows_only_when_clients_are_busy(self):
+        import backend.supabase_client as supabase_client
+
+        closed = []
+        clients = [self._make_client(closed), self._make_client(closed)]
+        with patch("supabase.create_client", side_effect=clients) as create_client:
+            importlib.reload(supabase_client)
+            supabase_client.SyncClientOptions = None
+            pool = supabase_client._get_client_pool()
+
+            first = pool.acquire()
+            pool.release(first)
+            again = pool.acquire()
+            self.assertIs(again, first)
+            self.assertEqual(create_client.call_count, 1)
+
+            second = pool.acquire()
+            self.assertIsNot(second, first)
+            self.assertEqual(create_client.call_count, 2)
+
+            metrics = supabase_client.get_supabase_pool_metrics()
+            self.assertEqual(metrics["clients"], 2)
+            self.assertEqual(metrics["in_use"], 2)
+            self.assertEqual(metrics["idle"], 0)
+
+    @patch.dict(
+        os.environ,
+        {
+            "SUPABASE_URL": "https://example.supabase.co",
+            "SUPABASE_SERVICE_KEY": "service-key",
+            "SUPABASE_CLIENT_POOL_SIZE": "2",
+        },
+        clear=False,
+    )
+    def test_rotation_drains_failing_client_without_touching_others(self):
+        import backend.supabase_client as supabase_client
+
+        closed = []
+        clients = [self._make_client(closed) for _ in range(3)]
+        with patch("supabase.create_client", side_effect=clients):
+            importlib.reload(supabase_client)
+            supabase_client.SyncClientOptions = None
+            pool = supabase_client._get_client_pool()
+
+            failing = pool.acquire()
+            healthy = pool.acquire()
+            pool.rotate(failing, reason="ReadTimeout")
+
+            # The failing lease is still in flight, so its client is only closed on release.
+            self.assertEqual(closed, [])
+            pool.release(failing)
+            self.assertEqual(closed, [clients[0]])
+
+            replacement = pool.acquire()
+            self.assertIs(replacement.client, clients[2])
+            self.assertFalse(healthy.retired)
+            self.assertEqual(supabase_client.get_supabase_pool_metrics()["rotations"], 1)
+
+            supabase_client.reset_supabase_client()
+            self.assertEqual(closed, [clients[0]])
+            pool.release(healthy)
+            pool.release(replacement)
+            self.assertEqual(closed, [clients[0], clients[1], clients[2]])
+
+    @patch.dict(
+        os.environ,
+        {
+            "SUPABASE_URL": "https://example.supabase.co",
+            "SUPABASE_SERVICE_KEY": "service-key",
+            "SUPABASE_CLIENT_POOL_SIZE": "1",
+        },
+        clear=False,
+    )
+    def test_leased_client_is_not_closed_by_trim_or_rotate_until_released(self):
+        import backend.supabase_client as supabase_client
+
+        closed = []
+        clients = [self._make_client(closed) for _ in range(2)]
+        with patch("supabase.create_client", side_effect=clients):
+            importlib.reload(supabase_client)
+            supabase_client.SyncClientOptions = None
+
+            with supabase_client.lease_supabase_client() as client:
+                self.assertIs(client, clients[0])
+                self.assertEqual(supabase_client.release_idle_supabase_clients(keep=0), 0)
+                supabase_client.reset_supabase_client()
+                self.assertEqual(closed, [])
+
+            self.assertEqual(closed, [clients[0]])
+            self.assertEqual(supabase_client.get_supabase_pool_metrics()["in_use"], 0)
+
+
+class ReadCoalescingTests(unittest.TestCase):
+    def setUp(self):
+        import backend.supabase_client as supabase_client
+
+        self.supabase_client = supabase_client
+        supabase_client.invalidate_read_cache()
+
+    def _wait_for(self, predicate, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while not predicate():
+            if time.monotonic() > deadline:
+                self.fail("condition not reached")
+            time.sleep(0.005)
+
+    def test_identical_concurrent_reads_share_one_call(self):
+        supabase_client = self.supabase_client
+        release_leader = threading.Event()
+        calls = []
+
+        def slow_read():
+            calls.append(1)
+            release_leader.wait(5)
+            return SimpleNamespace(data=[{"race_key": "GP-1"}])
+
+        results = []
+
+        def reader():
+            results.append(supabase_client._execute_single_flight("hranalyzer_races", "same-chain", slow_read))
+
+        threads = [threading.Thread(target=reader) for _ in range(3)]
+        threads[0].start()
+        self._wait_for(lambda: supabase_client._read_flights)
+        for thread in threads[1:]:
+            thread.start()
+        self._wait_for(lambda: next(iter(supabase_client._read_flights.values())).followers == 2)
+        release_leader.set()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual([result.data for result in results], [[{"race_key": "GP-1"}]] * 3)
+        # Followers receive copies, so one caller mutating its rows cannot leak into another.
+        self.assertEqual(len({id(result) for result in results}), 3)
+
+    def test_micro_ttl_serves_reads_until_a_write_invalidates(self):
+        supabase_client = self.supabase_client
+        calls = []
+
+        def read():
+            calls.append(1)
+            return SimpleNamespace(data=[len(calls)])
+
+        with patch.object(supabase_client, "SUPABASE_READ_CACHE_TTL_SECONDS", 30.0):
+            first = supabase_client._execute_single_flight("hranalyzer_races", "chain", read)
+            second = supabase_client._execute_single_flight("hranalyzer_races", "chain", read)
+            supabase_client.invalidate_read_cache("hranalyzer_races")
+            third = supabase_client._execute_single_flight("hranalyzer_races", "chain", read)
+
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(third.data, [2])
+
+    def test_write_chains_bypass_coalescing_and_invalidate(self):
+        supabase_client = self.supabase_client
+        query = supabase_client.ResilientTableQuery("hranalyzer_races").update({"race_status": "completed"})
+
+        with patch.object(
+            supabase_client.ResilientTableQuery,
+            "_execute_instrumented",
+            autospec=True,
+            return_value=SimpleNamespace(data=[]),
+        ), patch.object(supabase_client, "_execute_single_flight") as single_flight:
+            before = supabase_client.get_read_coalescing_metrics()["invalidations"]
+            query.execute()
+
+        single_flight.assert_not_called()
+        self.assertEqual(supabase_client.get_read_coalescing_metrics()["invalidations"], before + 1)
+
+
+class PaginationTests(unittest.TestCase):
+    def test_iter_rows_pages_with_range_and_honours_limit(self):
+        import backend.supabase_client as supabase_client
+
+        rows = [{"id": index} for index in range(7)]
+        requested_ranges = []
+
+        def fake_execute(query):
+            range_calls = [args for kind, name, args, _ in query._operations if name == "range"]
+            self.assertFalse(any(name == "limit" for _, name, _, _ in query._operations))
+            start, end = range_calls[-1]
+            requested_ranges.append((start, end))
+            return SimpleNamespace(data=rows[start:end + 1])
+
+        with patch.object(supabase_client.ResilientTableQuery, "execute", autospec=True, side_effect=fake_execute):
+            query = supabase_client.ResilientTableQuery("hranalyzer_bets").select("*").order("id")
+            everything = query.fetch_all(page_size=3)
+            self.assertEqual([row["id"] for row in everything], list(range(7)))
+            self.assertEqual(requested_ranges, [(0, 2), (3, 5), (6, 8)])
+
+            requested_ranges.clear()
+            capped = supabase_client.ResilientTableQuery("hranalyzer_bets").select("*").limit(4)
+            self.assertEqual([row["id"] for row in capped.iter_rows(page_size=3)], [0, 1, 2, 3])
+            self.assertEqual(requested_ranges, [(0, 2), (3, 3)])
+
+    def test_iter_query_rows_pages_plain_builders(self):
+        import backend.supabase_client as supabase_client
+
+        class Builder:
+            def __init__(self, rows):
+                self.rows = rows
+                self.window = None
+
+            def range(self, start, end):
+                self.window = (start, end)
+                return self
+
+            def execute(self):
+                start, end = self.window
+                return SimpleNamespace(data=self.rows[start:end + 1])
+
+        rows = list(range(5))
+        self.assertEqual(supabase_client.fetch_all_rows(Builder(rows), page_size=2), rows)
+
+
+class ConcurrentQueryTests(unittest.TestCase):
+    def test_execute_concurrently_overlaps_queries_and_keeps_order(self):
+        import backend.supabase_client as supabase_client
+
+        barrier = threading.Barrier(2, timeout=5)
+
+        class BlockingQuery:
+            def __init__(self, value):
+                self.value = value
+
+            def execute(self):
+                # Both queries must be in flight at the same time to pass the barrier.
+                barrier.wait()
+                return SimpleNamespace(data=[self.value])
+
+        first, second = supabase_client.execute_concurrently(BlockingQuery("a"), BlockingQuery("b"))
+
+        self.assertEqual(first.data, ["a"])
+        self.assertEqual(second.data, ["b"])
+
+    def test_execute_concurrently_can_return_exceptions(self):
+        import backend.supabase_client as supabase_client
+
+        class FailingQuery:
+            def execute(self):
+                raise RuntimeError("boom")
+
+        class OkQuery:
+            def execute(self):
+                return SimpleNamespace(data=[1])
+
+        failed, ok = supabase_client.execute_concurrently(FailingQuery(), OkQuery(), return_exceptions=True)
+
+        self.assertIsInstance(failed, RuntimeError)
+        self.assertEqual(ok.data, [1])
+
+    def test_async_facade_gathers_table_queries(self):
+        import backend.supabase_client as supabase_client
+
+        async_client = supabase_client.get_async_supabase_client()
+        queries = [async_client.table("hranalyzer_races"), async_client.table("hranalyzer_tracks")]
+
+        with patch.object(
+            supabase_client.ResilientTableQuery,
+            "execute",
+            autospec=True,
+            side_effect=lambda query: SimpleNamespace(data=[query._table_name]),
+        ):
+            results = asyncio.run(async_client.gather(*queries))
+
+        self.assertEqual([result.data for result in results], [["hranalyzer_races"], ["hranalyzer_tracks"]])
+
+
 if __name__ == "__main__":
     unittest.main()
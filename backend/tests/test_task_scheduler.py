@@ -0,0 +1,132 @@
+import os
+import sys
+import threading
+import time
+import unittest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from task_scheduler import TaskScheduler
+
+
+class FakeClock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+def _wait_idle(scheduler, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while any(job["running"] for job in scheduler.snapshot().values()):
+        if time.monotonic() > deadline:
+            raise AssertionError("scheduled jobs did not finish")
+        time.sleep(0.005)
+
+
+def _wait_idle_job(scheduler, name, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while scheduler.snapshot()[name]["running"]:
+        if time.monotonic() > deadline:
+            raise AssertionError(f"{name} did not finish")
+        time.sleep(0.005)
+
+
+class TaskSchedulerTests(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.scheduler = TaskScheduler(clock=self.clock)
+        self.release = threading.Event()
+        self.calls = []
+
+    def tearDown(self):
+        self.release.set()
+        _wait_idle(self.scheduler)
+
+    def _job(self, name, block=False):
+        def run():
+            self.calls.append(name)
+            if block:
+                self.release.wait(5)
+        return run
+
+    def test_slow_job_does_not_delay_other_job_types(self):
+        self.scheduler.add_job("results", self._job("results", block=True), 300, priority=10)
+        self.scheduler.add_job("scratches", self._job("scratches"), 60, priority=0)
+
+        self.assertEqual(self.scheduler.run_pending(), ["scratches", "results"])
+        self.clock.advance(60)
+        _wait_idle_job(self.scheduler, "scratches")
+
+        # results is still running, scratches keeps its own cadence.
+        self.assertEqual(self.scheduler.run_pending(), ["scratches"])
+        self.assertTrue(self.scheduler.snapshot()["results"]["running"])
+
+    def test_due_job_skips_slot_while_previous_run_is_active(self):
+        self.scheduler.add_job("results", self._job("results", block=True), 300)
+        self.scheduler.run_pending()
+
+        self.clock.advance(300)
+        self.assertEqual(self.scheduler.run_pending(), [])
+        snapshot = self.scheduler.snapshot()["results"]
+        self.assertEqual(snapshot["skipped_overlaps"], 1)
+        self.assertEqual(snapshot["next_run_in_seconds"], 300)
+
+        self.release.set()
+        _wait_idle(self.scheduler)
+        self.assertEqual(self.calls, ["results"])
+
+    def test_jobs_sharing_a_lane_run_one_at_a_time_and_record_lag(self):
+        self.scheduler.add_job("results", self._job("results", block=True), 300, priority=10, lane="equibase")
+        self.scheduler.add_job("targeted", self._job("targeted"), 60, priority=5, lane="equibase",
+                               first_run_at=self.clock() + 30)
+        self.assertEqual(self.scheduler.run_pending(), ["results"])
+
+        self.clock.advance(90)
+        self.assertEqual(self.scheduler.run_pending(), [])
+        self.assertEqual(self.scheduler.snapshot()["targeted"]["current_lag_seconds"], 60)
+
+        self.release.set()
+        _wait_idle(self.scheduler)
+        self.assertEqual(self.scheduler.run_pending(), ["targeted"])
+        _wait_idle(self.scheduler)
+        self.assertEqual(self.scheduler.snapshot()["targeted"]["last_lag_seconds"], 60)
+
+    def test_failures_and_adaptive_intervals_are_tracked(self):
+        def boom():
+            raise RuntimeError("feed down")
+
+        self.scheduler.add_job("scratches", boom, lambda: 45)
+        self.scheduler.run_pending()
+        _wait_idle(self.scheduler)
+
+        snapshot = self.scheduler.snapshot()["scratches"]
+        self.assertEqual((snapshot["runs"], snapshot["failures"]), (1, 1))
+        self.assertEqual(snapshot["last_error"], "feed down")
+        self.assertEqual(self.scheduler.seconds_until_next_run(), 45)
+
+    def test_gated_job_waits_for_its_event_without_accruing_lag(self):
+        backfill_done = threading.Event()
+        self.scheduler.add_job("scratches", lambda: None, 60, wait_for=backfill_done)
+        self.scheduler.add_job("bets", lambda: None, 60)
+
+        self.assertEqual(self.scheduler.run_pending(), ["bets"])
+        self.assertTrue(self.scheduler.snapshot()["scratches"]["waiting_for_gate"])
+        _wait_idle(self.scheduler)
+        # Only the ungated job counts toward the next wake-up.
+        self.assertEqual(self.scheduler.seconds_until_next_run(), 60)
+
+        self.clock.advance(30)
+        self.assertEqual(self.scheduler.run_pending(), [])
+        backfill_done.set()
+        self.assertEqual(self.scheduler.run_pending(), ["scratches"])
+        _wait_idle(self.scheduler)
+        self.assertEqual(self.scheduler.snapshot()["scratches"]["last_lag_seconds"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()